@@ -0,0 +1,192 @@
+# file: ws_transport.py
+# -*- coding: utf-8 -*-
+"""
+단일 책임(WebSocket 전송 전용):
+- `/ws/ingest` WebSocket 연결 하나로 센서 프레임을 연속 전송
+- 연결 직후 1회 인증(JWT), 서버 ack(누적 처리 수) 기반 재전송, 재연결/백오프 지원
+- 네트워크 외의 책임(센서, 직렬통신, 큐 저장 등)은 포함하지 않음
+
+RestTransport와 달리 측정값마다 HTTP 요청/헤더를 만들지 않으므로
+초당 여러 건을 보내는 가정에서 요청 오버헤드가 줄어듭니다.
+"""
+
+from __future__ import annotations
+import os
+import json
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import websockets
+from pydantic import BaseModel, Field
+
+log = logging.getLogger("ws_transport")
+if not log.handlers:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
+
+def _default_ws_url() -> str:
+    """API_BASE_URL(http/https)을 WebSocket 주소(ws/wss)로 변환"""
+    base_url = os.getenv("API_BASE_URL", "http://ec2-43-201-96-23.ap-northeast-2.compute.amazonaws.com")
+    if base_url.startswith("https://"):
+        base_url = "wss://" + base_url[len("https://"):]
+    elif base_url.startswith("http://"):
+        base_url = "ws://" + base_url[len("http://"):]
+    return base_url.rstrip("/") + "/ws/ingest"
+
+
+class WsSettings(BaseModel):
+    """
+    WebSocket 통신에 필요한 설정 값만 가짐
+    """
+    url: str = Field(default=os.getenv("WS_INGEST_URL", _default_ws_url()))
+    jwt_token: Optional[str] = Field(default=os.getenv("JWT_TOKEN"))
+    max_pending: int = Field(default=int(os.getenv("WS_MAX_PENDING", "10000")))
+    max_retries: int = Field(default=int(os.getenv("WS_MAX_RETRIES", "4")))
+    backoff_factor: float = Field(default=float(os.getenv("WS_BACKOFF_FACTOR", "0.7")))
+    ack_timeout_sec: float = Field(default=float(os.getenv("WS_ACK_TIMEOUT_SEC", "10")))
+
+
+class WsTransport:
+    """
+    - 단일 책임: `/ws/ingest` 프레임 전송만 수행
+    - 전송한 프레임은 서버 ack(`through`)를 받을 때까지 보관하고, 재연결 시 순서대로 재전송
+      (서버 기본값 on_conflict=nothing 이므로 재전송되어도 중복 적재되지 않음)
+    - on_error 콜백으로 서버가 거부한 프레임(ack.errors)을 전달받을 수 있음
+    """
+    def __init__(self, settings: Optional[WsSettings] = None,
+                 on_error: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.settings = settings or WsSettings()
+        self.on_error = on_error
+        self._ws = None
+        self._reader: Optional[asyncio.Task] = None
+        # ack 대기 중인 프레임 (전송 순서 유지)
+        self._pending: Deque[Dict[str, Any]] = deque()
+        # 현재 연결에서 서버가 처리 완료한 누적 프레임 수
+        self._acked_in_conn = 0
+        self._acked_event = asyncio.Event()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def connect(self):
+        """
+        - 단일 기능: 연결 + 인증 후 ack 수신 태스크 시작
+        - 재시도/백오프 내장, 연결되면 미확인 프레임 재전송
+        """
+        retries = 0
+        while True:
+            try:
+                self._ws = await websockets.connect(self.settings.url)
+                await self._ws.send(json.dumps({"type": "auth", "token": self.settings.jwt_token}))
+                break
+            except Exception as e:
+                retries += 1
+                if retries > self.settings.max_retries:
+                    log.error(f"[WS] 최대 재시도 초과: {e}")
+                    raise
+                sleep = min(8.0, (self.settings.backoff_factor ** retries) * 2.0)
+                log.warning(f"[WS] 연결 실패 → {sleep:.2f}s 후 재시도({retries}/{self.settings.max_retries}): {e}")
+                await asyncio.sleep(sleep)
+
+        self._acked_in_conn = 0
+        self._reader = asyncio.create_task(self._read_loop())
+        if self._pending:
+            log.info(f"[WS] 미확인 프레임 {len(self._pending)}건 재전송")
+            await self._ws.send(json.dumps(list(self._pending)))
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def send_frames(self, frames: List[Dict[str, Any]]):
+        """
+        - 단일 기능: 프레임 목록을 메시지 하나로 전송
+        - 각 프레임은 `sensor_type`과 해당 센서 `/create` 스키마 필드를 가짐
+        """
+        if len(self._pending) + len(frames) > self.settings.max_pending:
+            raise RuntimeError(f"ack 대기 프레임이 최대치({self.settings.max_pending})를 넘었습니다")
+        self._pending.extend(frames)
+        if self._ws is None:
+            await self.connect()
+            return
+        try:
+            await self._ws.send(json.dumps(frames))
+        except websockets.ConnectionClosed as e:
+            log.warning(f"[WS] 연결 끊김 → 재연결: {e}")
+            await self._reconnect()
+
+    async def send_frame(self, frame: Dict[str, Any]):
+        """단일 프레임 전송"""
+        await self.send_frames([frame])
+
+    async def flush(self):
+        """
+        - 단일 기능: 보낸 프레임이 모두 ack될 때까지 대기
+        - ack_timeout_sec 동안 진행이 없으면 재연결 후 재전송
+        """
+        while self._pending:
+            self._acked_event.clear()
+            try:
+                await asyncio.wait_for(self._acked_event.wait(), timeout=self.settings.ack_timeout_sec)
+            except asyncio.TimeoutError:
+                log.warning(f"[WS] ack 시간 초과 → 재연결 (미확인 {len(self._pending)}건)")
+                await self._reconnect()
+
+    async def _reconnect(self):
+        await self.close()
+        await self.connect()
+
+    async def _read_loop(self):
+        """ack 수신: 서버가 처리 완료한 만큼 대기 프레임을 제거"""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                through = message.get("through")
+                if through is not None and through > self._acked_in_conn:
+                    for _ in range(min(through - self._acked_in_conn, len(self._pending))):
+                        self._pending.popleft()
+                    self._acked_in_conn = through
+                    self._acked_event.set()
+
+                if message.get("type") == "error":
+                    log.error(f"[WS] 서버 오류: {message.get('detail')}")
+                for error in message.get("errors", []):
+                    if self.on_error is not None:
+                        self.on_error(error)
+                    else:
+                        log.warning(f"[WS] 거부된 프레임: {error}")
+        except websockets.ConnectionClosed as e:
+            log.warning(f"[WS] 연결 종료: {e}")
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.flush()
+        await self.close()
+
+# -------- 사용 예시(예제 실행 전용): python ws_transport.py --------
+# 아래 코드는 모듈의 사용법을 보여주는 예시이며, 실제 애플리케이션에서는
+# 다른 레이어(예: 센서 수집기, 직렬브릿지 등)에서 이 WsTransport를 호출하세요.
+if __name__ == "__main__":
+    async def _demo():
+        from datetime import datetime, timezone
+        async with WsTransport() as wt:
+            for i in range(10):
+                await wt.send_frame({
+                    "sensor_type": "mq5",
+                    "time": datetime.now(timezone.utc).isoformat(),
+                    "device_id": "device-001",
+                    "raw_payload": {"gas_ppm": 223.4 + i}
+                })
+                await asyncio.sleep(0.1)
+        print("전송 완료")
+    asyncio.run(_demo())
@@ -11,6 +11,8 @@ from app.api.v1 import edge_flame, edge_pir, edge_reed, edge_tilt
 from app.api.v1 import actuator_buzzer, actuator_irtx, actuator_relay, actuator_servo
 from app.api.v1 import device_rtc
 from app.api.v1 import home_state_snapshots, sensor_event_buttons, sensor_raw_temperatures
+from app.api.v1 import ingest, ws_ingest
+from app.api.v1 import export, cache
 
 # 메인 API 라우터
 api_router = APIRouter()
@@ -57,5 +59,18 @@ api_router.include_router(sensor_event_buttons.router, prefix="/sensor-event-but
 # Sensor Raw Temperature Group
 api_router.include_router(sensor_raw_temperatures.router, prefix="/sensor-raw-temperatures", tags=["sensor-raw-temperatures"])
 
-__all__ = ["api_router"]
+# 통합 수집 그룹
+api_router.include_router(ingest.router, prefix="/ingest", tags=["ingest"])
+
+# 대량 내보내기 그룹
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+
+# 읽기 캐시 그룹
+api_router.include_router(cache.router, prefix="/cache", tags=["cache"])
+
+# WebSocket 라우터 (/ws 하위에 등록)
+ws_router = APIRouter()
+ws_router.include_router(ws_ingest.router, tags=["ingest"])
+
+__all__ = ["api_router", "ws_router"]
 
@@ -4,29 +4,69 @@ Relay 액추에이터 로그 API
 Relay 액추에이터 로그 데이터에 대한 RESTful API 엔드포인트를 제공합니다.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Any, Dict
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from app.core.container import get_actuator_relay_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.container import container, get_actuator_relay_service
 from app.interfaces.services.actuator_service_interface import IActuatorRelayService
+from app.infrastructure.database import get_db_session
+from app.infrastructure.models import ActuatorLogRelay
+from app.infrastructure.ingest_queue import ingest_queue
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
 from app.api.v1.schemas import (
-    ActuatorRelayDataCreate, ActuatorRelayDataUpdate, ActuatorRelayDataResponse
+    ActuatorRelayDataCreate, ActuatorRelayDataUpdate, ActuatorRelayDataResponse,
+    BatchCreateResponse
 )
+from app.infrastructure.pagination import Cursor, cursor_param, set_next_cursor
 
 router = APIRouter(tags=["actuator-relay"])
 
 
+def get_actuator_relay_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """Relay 액추에이터 로그 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, ActuatorLogRelay, ActuatorRelayDataCreate)
+
+
 @router.post("/create", response_model=ActuatorRelayDataResponse, status_code=201)
 async def create_actuator_relay_data(
     data: ActuatorRelayDataCreate,
-    service: IActuatorRelayService = Depends(get_actuator_relay_service)
+    batch_service: ISensorBatchService = Depends(get_actuator_relay_batch_service)
 ) -> ActuatorRelayDataResponse:
     """Relay 액추에이터 로그 생성"""
-    return await service.create_actuator_data(data)
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(ActuatorLogRelay, data.dict()))
+    result, row = await batch_service.create_one(data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_actuator_relay_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="ActuatorRelayDataCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_actuator_relay_batch_service)
+):
+    """
+    Relay 액추에이터 로그 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
 
 
 @router.get("/list", response_model=List[ActuatorRelayDataResponse])
 async def get_actuator_relay_data_list(
+    response: Response,
     device_id: Optional[str] = Query(None, description="디바이스 ID"),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
@@ -34,18 +74,25 @@ async def get_actuator_relay_data_list(
     state: Optional[str] = Query(None, description="상태"),
     limit: int = Query(100, ge=1, le=1000, description="조회 개수"),
     offset: int = Query(0, ge=0, description="오프셋"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     service: IActuatorRelayService = Depends(get_actuator_relay_service)
 ) -> List[ActuatorRelayDataResponse]:
-    """Relay 액추에이터 로그 목록 조회"""
-    return await service.get_actuator_data_list(
+    """Relay 액추에이터 로그 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
+    items = await service.get_actuator_data_list(
         device_id=device_id,
         start_time=start_time,
         end_time=end_time,
         channel=channel,
         state=state,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=cursor
     )
+    set_next_cursor(response, items, limit)
+    return items
 
 
 @router.get("/latest/{device_id}", response_model=ActuatorRelayDataResponse)
@@ -0,0 +1,22 @@
+"""
+읽기 캐시 API
+
+Redis 읽기 캐시의 엔드포인트별 적중률을 조회합니다.
+"""
+
+from fastapi import APIRouter
+
+from app.infrastructure.read_cache import read_cache
+from app.api.v1.schemas import ReadCacheStats
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=ReadCacheStats)
+async def get_read_cache_stats():
+    """
+    읽기 캐시 통계
+    
+    엔드포인트별 적중/미적중/오류 건수와 적중률을 반환합니다.
+    """
+    return read_cache.stats()
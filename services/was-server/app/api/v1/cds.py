@@ -5,57 +5,106 @@ CDS 센서 데이터의 CRUD 작업을 처리합니다.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
 
 from app.infrastructure.database import get_db_session
+from app.infrastructure.pagination import Cursor, apply_keyset, cursor_param, set_next_cursor
 from app.infrastructure.models import SensorRawCDS
-from app.api.v1.schemas import CDSDataCreate, CDSDataResponse, CDSDataUpdate
+from app.infrastructure.ingest_queue import ingest_queue
+from app.infrastructure.device_latest import fetch_latest
+from app.core.container import container
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
+from app.api.v1.schemas import CDSDataCreate, CDSDataResponse, CDSDataUpdate, BatchCreateResponse, SensorBucketResponse
 
 router = APIRouter(tags=["CDS Sensor"])
 
 
+def get_cds_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """CDS 센서 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorRawCDS, CDSDataCreate)
+
+
 @router.post("/create", response_model=CDSDataResponse, status_code=201)
 async def create_cds_data(
     cds_data: CDSDataCreate,
-    db: AsyncSession = Depends(get_db_session)
+    batch_service: ISensorBatchService = Depends(get_cds_batch_service)
 ):
     """CDS 센서 데이터 생성"""
-    try:
-        db_cds = SensorRawCDS(
-            time=cds_data.time,
-            device_id=cds_data.device_id,
-            analog_value=cds_data.analog_value,
-            lux_value=cds_data.lux_value,
-            raw_payload=cds_data.raw_payload
-        )
-        db.add(db_cds)
-        await db.commit()
-        await db.refresh(db_cds)
-        
-        return CDSDataResponse(
-            time=db_cds.time,
-            device_id=db_cds.device_id,
-            analog_value=db_cds.analog_value,
-            lux_value=db_cds.lux_value,
-            raw_payload=db_cds.raw_payload
-        )
-    except Exception as e:
-        await db.rollback()
-        raise HTTPException(status_code=500, detail=f"CDS 데이터 생성 실패: {str(e)}")
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorRawCDS, cds_data.dict()))
+    result, row = await batch_service.create_one(cds_data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+def get_cds_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """CDS 조도 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "cds")
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_cds_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="CDSDataCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_cds_batch_service)
+):
+    """
+    CDS 센서 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_cds_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: lux_value)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_cds_bucket_service)
+):
+    """
+    CDS 조도 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: lux_value, analog_value
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 
 @router.get("/list", response_model=List[CDSDataResponse])
 async def get_cds_data_list(
+    response: Response,
     device_id: Optional[str] = Query(None, description="디바이스 ID"),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     limit: int = Query(100, description="조회 개수 제한"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     db: AsyncSession = Depends(get_db_session)
 ):
-    """CDS 센서 데이터 목록 조회"""
+    """CDS 센서 데이터 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
     try:
         query = select(SensorRawCDS)
         
@@ -70,13 +119,13 @@ async def get_cds_data_list(
                 )
             )
         
-        query = query.order_by(SensorRawCDS.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorRawCDS.time, SensorRawCDS.device_id, cursor).limit(limit)
         
         result = await db.execute(query)
         cds_list = result.scalars().all()
         
         # 결과를 리스트로 변환하여 반환
-        return [
+        items = [
             CDSDataResponse(
                 time=cds.time,
                 device_id=cds.device_id,
@@ -86,6 +135,8 @@ async def get_cds_data_list(
             )
             for cds in cds_list
         ]
+        set_next_cursor(response, items, limit)
+        return items
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"CDS 데이터 조회 실패: {str(e)}")
 
@@ -210,12 +261,7 @@ async def get_latest_cds_data(
 ):
     """특정 디바이스의 최신 CDS 센서 데이터 조회"""
     try:
-        query = select(SensorRawCDS).where(
-            SensorRawCDS.device_id == device_id
-        ).order_by(SensorRawCDS.time.desc()).limit(1)
-        
-        result = await db.execute(query)
-        cds_data = result.scalar_one_or_none()
+        cds_data = await fetch_latest(db, SensorRawCDS, device_id)
         
         if not cds_data:
             raise HTTPException(status_code=404, detail="CDS 데이터를 찾을 수 없습니다")
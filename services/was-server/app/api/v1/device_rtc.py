@@ -9,7 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.database import get_db
+from app.infrastructure.database import get_db_session
 from app.core.container import container
 from app.interfaces.services.device_rtc_service_interface import IDeviceRTCStatusService
 from app.api.v1.schemas import (
@@ -21,7 +21,7 @@ from app.api.v1.schemas import (
 router = APIRouter()
 
 
-def get_device_rtc_service(db: AsyncSession = Depends(get_db)) -> IDeviceRTCStatusService:
+def get_device_rtc_service(db: AsyncSession = Depends(get_db_session)) -> IDeviceRTCStatusService:
     """DeviceRTCStatus 서비스 의존성 주입"""
     return container.get_device_rtc_service(db)
 
@@ -11,10 +11,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas import (
     DeviceCreate, DeviceUpdate, DeviceResponse, DeviceListResponse,
-    DeviceAssignmentRequest, SuccessResponse
+    DeviceAssignmentRequest, SuccessResponse, DeviceRegistryStats
 )
 from app.core.container import container
 from app.infrastructure.database import get_db_session
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.read_cache import cached, latest_groups, read_cache
 from app.interfaces.repositories.device_repository import IDeviceRepository
 from app.interfaces.repositories.user_repository import IUserRepository
 from app.domain.entities.device import Device
@@ -64,6 +66,8 @@ async def create_device(
         
         # 리포지토리를 통한 디바이스 생성
         created_device = await device_repository.create(device)
+        device_registry.put(created_device.device_id, created_device.user_id, created_device.location_label)
+        await read_cache.invalidate("devices", *latest_groups(created_device.user_id))
         
         return DeviceResponse(
             device_id=created_device.device_id,
@@ -81,7 +85,18 @@ async def create_device(
         )
 
 
+@router.get("/registry/stats", response_model=DeviceRegistryStats)
+async def get_device_registry_stats():
+    """
+    디바이스 레지스트리 캐시 통계
+    
+    수집 경로가 DB 조회 없이 디바이스를 확인하는 캐시의 크기와 적중률을 반환합니다.
+    """
+    return device_registry.stats()
+
+
 @router.get("/{device_id}", response_model=DeviceResponse)
+@cached("devices.get", DeviceResponse, group=lambda **_: "devices", key=lambda device_id, **_: device_id)
 async def get_device(
     device_id: str,
     device_repository: IDeviceRepository = Depends(get_device_repository)
@@ -116,6 +131,12 @@ async def get_device(
 
 
 @router.get("/", response_model=DeviceListResponse)
+@cached(
+    "devices.list",
+    DeviceListResponse,
+    group=lambda **_: "devices",
+    key=lambda page, size, user_id, **_: [page, size, user_id]
+)
 async def get_devices(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
@@ -208,6 +229,8 @@ async def update_device(
         
         # 디바이스 정보 업데이트
         updated_device = await device_repository.update(device_id, update_data)
+        device_registry.put(updated_device.device_id, updated_device.user_id, updated_device.location_label)
+        await read_cache.invalidate("devices", *latest_groups(existing_device.user_id, updated_device.user_id))
         
         return DeviceResponse(
             device_id=updated_device.device_id,
@@ -246,6 +269,8 @@ async def delete_device(
         
         # 디바이스 삭제
         await device_repository.delete(device_id)
+        device_registry.invalidate(device_id)
+        await read_cache.invalidate("devices", *latest_groups(existing_device.user_id))
         
         return SuccessResponse(
             message="디바이스가 성공적으로 삭제되었습니다",
@@ -293,6 +318,8 @@ async def assign_device_to_user(
         
         # 디바이스 할당
         await device_repository.assign_to_user(device_id, str(assignment_data.user_id))
+        device_registry.put(device_id, assignment_data.user_id, device.location_label)
+        await read_cache.invalidate("devices", *latest_groups(device.user_id, assignment_data.user_id))
         
         return SuccessResponse(
             message="디바이스가 성공적으로 사용자에게 할당되었습니다",
@@ -332,6 +359,8 @@ async def unassign_device_from_user(
         
         # 디바이스 할당 해제
         await device_repository.unassign_from_user(device_id)
+        device_registry.put(device_id, None, device.location_label)
+        await read_cache.invalidate("devices", *latest_groups(device.user_id))
         
         return SuccessResponse(
             message="디바이스 할당이 성공적으로 해제되었습니다",
@@ -5,59 +5,107 @@ DHT 센서 데이터의 CRUD 작업을 처리합니다.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from app.infrastructure.database import get_db_session
+from app.infrastructure.pagination import Cursor, apply_keyset, cursor_param, set_next_cursor
 from app.infrastructure.models import SensorRawDHT
-from app.api.v1.schemas import DHTDataCreate, DHTDataResponse, DHTDataUpdate
+from app.infrastructure.sql_aggregates import summary, summary_columns
+from app.infrastructure.ingest_queue import ingest_queue
+from app.infrastructure.device_latest import fetch_latest
+from app.core.container import container
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
+from app.api.v1.schemas import DHTDataCreate, DHTDataResponse, DHTDataUpdate, BatchCreateResponse, SensorBucketResponse
 
 router = APIRouter(tags=["DHT Sensor"])
 
 
+def get_dht_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """DHT 센서 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorRawDHT, DHTDataCreate)
+
+
 @router.post("/create", response_model=DHTDataResponse, status_code=201)
 async def create_dht_data(
     dht_data: DHTDataCreate,
-    db: AsyncSession = Depends(get_db_session)
+    batch_service: ISensorBatchService = Depends(get_dht_batch_service)
 ):
     """DHT 센서 데이터 생성"""
-    try:
-        db_dht = SensorRawDHT(
-            time=dht_data.time,
-            device_id=dht_data.device_id,
-            temperature=dht_data.temperature,
-            humidity=dht_data.humidity,
-            heat_index=dht_data.heat_index,
-            raw_payload=dht_data.raw_payload
-        )
-        db.add(db_dht)
-        await db.commit()
-        await db.refresh(db_dht)
-        
-        return DHTDataResponse(
-            time=db_dht.time,
-            device_id=db_dht.device_id,
-            temperature=db_dht.temperature,
-            humidity=db_dht.humidity,
-            heat_index=db_dht.heat_index,
-            raw_payload=db_dht.raw_payload
-        )
-    except Exception as e:
-        await db.rollback()
-        raise HTTPException(status_code=500, detail=f"DHT 데이터 생성 실패: {str(e)}")
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorRawDHT, dht_data.dict()))
+    result, row = await batch_service.create_one(dht_data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+def get_dht_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """DHT 온습도 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "dht")
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_dht_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="DHTDataCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_dht_batch_service)
+):
+    """
+    DHT 센서 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_dht_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: temperature)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_dht_bucket_service)
+):
+    """
+    DHT 온습도 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: temperature, humidity, heat_index
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 
 @router.get("/", response_model=List[DHTDataResponse])
 async def get_dht_data_list(
+    response: Response,
     device_id: Optional[str] = Query(None, description="디바이스 ID"),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     limit: int = Query(100, description="조회 개수 제한"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     db: AsyncSession = Depends(get_db_session)
 ):
-    """DHT 센서 데이터 목록 조회"""
+    """DHT 센서 데이터 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
     try:
         query = select(SensorRawDHT)
         
@@ -72,12 +120,12 @@ async def get_dht_data_list(
                 )
             )
         
-        query = query.order_by(SensorRawDHT.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorRawDHT.time, SensorRawDHT.device_id, cursor).limit(limit)
         
         result = await db.execute(query)
         dht_list = result.scalars().all()
         
-        return [
+        items = [
             DHTDataResponse(
                 time=dht.time,
                 device_id=dht.device_id,
@@ -88,6 +136,8 @@ async def get_dht_data_list(
             )
             for dht in dht_list
         ]
+        set_next_cursor(response, items, limit)
+        return items
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"DHT 데이터 조회 실패: {str(e)}")
 
@@ -215,12 +265,7 @@ async def get_latest_dht_data(
 ):
     """특정 디바이스의 최신 DHT 센서 데이터 조회"""
     try:
-        query = select(SensorRawDHT).where(
-            SensorRawDHT.device_id == device_id
-        ).order_by(SensorRawDHT.time.desc()).limit(1)
-        
-        result = await db.execute(query)
-        dht_data = result.scalar_one_or_none()
+        dht_data = await fetch_latest(db, SensorRawDHT, device_id)
         
         if not dht_data:
             raise HTTPException(status_code=404, detail="DHT 데이터를 찾을 수 없습니다")
@@ -245,45 +290,30 @@ async def get_dht_stats_summary(
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     db: AsyncSession = Depends(get_db_session)
 ):
-    """DHT 센서 데이터 통계 요약"""
+    """DHT 센서 데이터 통계 요약 (DB에서 집계)"""
     try:
-        query = select(SensorRawDHT).where(
-            SensorRawDHT.device_id == device_id
-        )
-        
+        conditions = [SensorRawDHT.device_id == device_id]
         if start_time and end_time:
-            query = query.where(
-                and_(
-                    SensorRawDHT.time >= start_time,
-                    SensorRawDHT.time <= end_time
-                )
-            )
+            conditions.extend([SensorRawDHT.time >= start_time, SensorRawDHT.time <= end_time])
         
-        result = await db.execute(query)
-        dht_list = result.scalars().all()
+        result = await db.execute(
+            select(
+                func.count().label("data_count"),
+                *summary_columns(SensorRawDHT.temperature, "temperature"),
+                *summary_columns(SensorRawDHT.humidity, "humidity")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not dht_list:
+        if not row.data_count:
             raise HTTPException(status_code=404, detail="DHT 데이터를 찾을 수 없습니다")
         
-        # 온도 통계
-        temperatures = [dht.temperature for dht in dht_list if dht.temperature is not None]
-        humidity_values = [dht.humidity for dht in dht_list if dht.humidity is not None]
-        
+        empty = {"count": 0, "min": None, "max": None, "avg": None}
         stats = {
             "device_id": device_id,
-            "data_count": len(dht_list),
-            "temperature": {
-                "count": len(temperatures),
-                "min": min(temperatures) if temperatures else None,
-                "max": max(temperatures) if temperatures else None,
-                "avg": sum(temperatures) / len(temperatures) if temperatures else None
-            },
-            "humidity": {
-                "count": len(humidity_values),
-                "min": min(humidity_values) if humidity_values else None,
-                "max": max(humidity_values) if humidity_values else None,
-                "avg": sum(humidity_values) / len(humidity_values) if humidity_values else None
-            }
+            "data_count": row.data_count,
+            "temperature": summary(row, "temperature", with_count=True, empty=empty),
+            "humidity": summary(row, "humidity", with_count=True, empty=empty)
         }
         
         return stats
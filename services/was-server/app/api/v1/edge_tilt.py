@@ -4,20 +4,28 @@ Edge Tilt 센서 데이터 API
 Tilt 기울기 센서의 Edge 처리된 데이터를 관리하는 API 엔드포인트입니다.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Any, Dict
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.container import container
 from app.infrastructure.database import get_db_session
 from app.interfaces.services.sensor_service_interface import IEdgeTiltService
+from app.infrastructure.models import SensorEdgeTilt
+from app.infrastructure.ingest_queue import ingest_queue
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
 from app.api.v1.schemas import (
     EdgeTiltDataCreate,
     EdgeTiltDataUpdate,
-    EdgeTiltDataResponse
+    EdgeTiltDataResponse,
+    BatchCreateResponse,
+    SensorBucketResponse
 )
+from app.infrastructure.pagination import Cursor, cursor_param, set_next_cursor
 
 router = APIRouter(tags=["Edge Tilt 센서"])
 
@@ -27,36 +35,96 @@ def get_edge_tilt_service(db_session: AsyncSession = Depends(get_db_session)) ->
     return container.get_edge_tilt_service(db_session)
 
 
+def get_edge_tilt_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """Edge Tilt 센서 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorEdgeTilt, EdgeTiltDataCreate)
+
+
+def get_edge_tilt_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """Edge 기울기 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "edge-tilt")
+
+
 @router.post("/create", response_model=EdgeTiltDataResponse, status_code=201)
 async def create_edge_tilt_data(
     data: EdgeTiltDataCreate,
-    edge_tilt_service: IEdgeTiltService = Depends(get_edge_tilt_service)
+    batch_service: ISensorBatchService = Depends(get_edge_tilt_batch_service)
 ):
     """Edge Tilt 센서 데이터 생성"""
-    try:
-        return await edge_tilt_service.create_sensor_data(data)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorEdgeTilt, data.dict()))
+    result, row = await batch_service.create_one(data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_edge_tilt_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="EdgeTiltDataCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_edge_tilt_batch_service)
+):
+    """
+    Edge Tilt 센서 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_edge_tilt_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: tilt_angle)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_edge_tilt_bucket_service)
+):
+    """
+    Edge 기울기 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: tilt_angle, confidence
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 
 @router.get("/list", response_model=List[EdgeTiltDataResponse])
 async def get_edge_tilt_data_list(
+    response: Response,
     device_id: Optional[str] = Query(None, description="디바이스 ID"),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     limit: int = Query(100, ge=1, le=1000, description="조회 제한"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     edge_tilt_service: IEdgeTiltService = Depends(get_edge_tilt_service)
 ):
-    """Edge Tilt 센서 데이터 목록 조회"""
+    """Edge Tilt 센서 데이터 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
     try:
-        return await edge_tilt_service.get_sensor_data_list(
+        items = await edge_tilt_service.get_sensor_data_list(
             device_id=device_id,
             start_time=start_time,
             end_time=end_time,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
+        set_next_cursor(response, items, limit)
+        return items
     except HTTPException:
         raise
     except Exception as e:
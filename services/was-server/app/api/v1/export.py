@@ -0,0 +1,55 @@
+"""
+대량 내보내기 API
+
+분석/스냅샷 생성용으로 시계열 테이블의 기간 데이터를 Arrow IPC 스트림, Parquet, CSV로 내려받습니다.
+페이지 단위 JSON 조회를 반복하지 않고 서버 측 커서에서 묶음 단위로 바로 흘려보냅니다.
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.container import container
+from app.interfaces.services.export_service_interface import IExportService
+
+router = APIRouter()
+
+
+def get_export_service() -> IExportService:
+    """대량 내보내기 서비스 의존성 주입"""
+    return container.get_export_service()
+
+
+@router.get("/{table}", response_class=StreamingResponse)
+async def export_table(
+    table: str = Path(..., description="내보낼 시계열 테이블 이름 (예: sensor_raw_loadcell)"),
+    start: Optional[datetime] = Query(None, description="시작 시간 (포함)"),
+    end: Optional[datetime] = Query(None, description="종료 시간 (미포함)"),
+    device_id: Optional[str] = Query(None, description="디바이스 ID (디바이스 테이블)"),
+    user_id: Optional[UUID] = Query(None, description="사용자 ID (home_state_snapshots, 디바이스 테이블은 사용자 디바이스 전체)"),
+    export_format: str = Query("arrow", alias="format", description="형식 (arrow: Arrow IPC 스트림, parquet, csv)"),
+    export_service: IExportService = Depends(get_export_service)
+):
+    """
+    시계열 테이블 대량 내보내기
+    
+    - 행은 (time, 소유자) 순으로 정렬됩니다.
+    - 디바이스 테이블에 user_id를 지정하면 해당 사용자에게 할당된 디바이스의 행만 내보냅니다.
+    - Parquet 아카이브로 옮겨진 원시 센서 행도 구간에 포함되면 함께 내보냅니다.
+    - arrow/parquet 형식은 서버에 pyarrow가 설치되어 있어야 합니다 (없으면 501).
+    """
+    export = await export_service.export_table(
+        table_name=table,
+        export_format=export_format,
+        start_time=start,
+        end_time=end,
+        device_id=device_id,
+        user_id=user_id
+    )
+    return StreamingResponse(
+        export.body,
+        media_type=export.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}"'}
+    )
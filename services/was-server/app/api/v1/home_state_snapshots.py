@@ -1,13 +1,14 @@
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Response
 from app.core.container import get_home_state_snapshot_service
 from app.interfaces.services.home_state_snapshot_service_interface import IHomeStateSnapshotService
 from app.api.v1.schemas import (
     HomeStateSnapshotCreate, HomeStateSnapshotUpdate, 
     HomeStateSnapshotResponse, HomeStateSnapshotListResponse
 )
+from app.infrastructure.pagination import NEXT_CURSOR_HEADER, Cursor, cursor_param
 
 router = APIRouter(tags=["홈 상태 스냅샷"])
 
@@ -268,8 +269,10 @@ async def delete_home_state_snapshot(
 
 @router.get("/", response_model=HomeStateSnapshotListResponse)
 async def get_all_home_state_snapshots(
+    response: Response,
     skip: int = Query(0, ge=0, description="건너뛸 스냅샷 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 스냅샷 개수"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     snapshot_service: IHomeStateSnapshotService = Depends(get_home_state_snapshot_service)
 ):
     """전체 홈 상태 스냅샷 목록 조회 (페이지네이션)
@@ -277,6 +280,7 @@ async def get_all_home_state_snapshots(
     **쿼리 매개변수**:
     - skip: 건너뛸 스냅샷 개수 (기본값: 0)
     - limit: 조회할 스냅샷 개수 (기본값: 100, 최대: 1000)
+    - cursor: 이전 응답의 next_cursor 값 (지정하면 skip 대신 keyset으로 이어서 조회)
     
     **응답**:
     - 홈 상태 스냅샷 목록 및 페이지네이션 정보
@@ -286,7 +290,9 @@ async def get_all_home_state_snapshots(
     GET /api/home-state-snapshots/?skip=100&limit=50
     ```
     """
-    snapshots = await snapshot_service.get_all_snapshots(skip, limit)
+    snapshots = await snapshot_service.get_all_snapshots(skip, limit, cursor)
+    if snapshots.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = snapshots.next_cursor
     return snapshots
 
 @router.get("/environmental-alerts/{user_id}", response_model=List[HomeStateSnapshotResponse])
@@ -5,73 +5,107 @@ IMU 센서 데이터의 CRUD 작업을 처리합니다.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Body, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from app.infrastructure.database import get_db_session
+from app.infrastructure.pagination import Cursor, apply_keyset, cursor_param, set_next_cursor
 from app.infrastructure.models import SensorRawIMU
-from app.api.v1.schemas import IMUDataCreate, IMUDataResponse, IMUDataUpdate
+from app.infrastructure.sql_aggregates import summary, summary_columns
+from app.infrastructure.ingest_queue import ingest_queue
+from app.infrastructure.device_latest import fetch_latest
+from app.core.container import container
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
+from app.api.v1.schemas import IMUDataCreate, IMUDataResponse, IMUDataUpdate, BatchCreateResponse, SensorBucketResponse
 
 router = APIRouter(tags=["IMU Sensor"])
 
 
+def get_imu_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """IMU 센서 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorRawIMU, IMUDataCreate)
+
+
 @router.post("/create", response_model=IMUDataResponse, status_code=201)
 async def create_imu_data(
     imu_data: IMUDataCreate,
-    db: AsyncSession = Depends(get_db_session)
+    batch_service: ISensorBatchService = Depends(get_imu_batch_service)
 ):
     """IMU 센서 데이터 생성"""
-    try:
-        db_imu = SensorRawIMU(
-            time=imu_data.time,
-            device_id=imu_data.device_id,
-            accel_x=imu_data.accel_x,
-            accel_y=imu_data.accel_y,
-            accel_z=imu_data.accel_z,
-            gyro_x=imu_data.gyro_x,
-            gyro_y=imu_data.gyro_y,
-            gyro_z=imu_data.gyro_z,
-            mag_x=imu_data.mag_x,
-            mag_y=imu_data.mag_y,
-            mag_z=imu_data.mag_z,
-            temperature=imu_data.temperature,
-            raw_payload=imu_data.raw_payload
-        )
-        db.add(db_imu)
-        await db.commit()
-        await db.refresh(db_imu)
-        
-        return IMUDataResponse(
-            time=db_imu.time,
-            device_id=db_imu.device_id,
-            accel_x=db_imu.accel_x,
-            accel_y=db_imu.accel_y,
-            accel_z=db_imu.accel_z,
-            gyro_x=db_imu.gyro_x,
-            gyro_y=db_imu.gyro_y,
-            gyro_z=db_imu.gyro_z,
-            mag_x=db_imu.mag_x,
-            mag_y=db_imu.mag_y,
-            mag_z=db_imu.mag_z,
-            temperature=db_imu.temperature,
-            raw_payload=db_imu.raw_payload
-        )
-    except Exception as e:
-        await db.rollback()
-        raise HTTPException(status_code=500, detail=f"IMU 데이터 생성 실패: {str(e)}")
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorRawIMU, imu_data.dict()))
+    result, row = await batch_service.create_one(imu_data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+def get_imu_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """IMU 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "imu")
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_imu_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="IMUDataCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_imu_batch_service)
+):
+    """
+    IMU 센서 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_imu_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: accel_x)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_imu_bucket_service)
+):
+    """
+    IMU 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, mag_x, mag_y, mag_z, temperature
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 
 @router.get("/list", response_model=List[IMUDataResponse])
 async def get_imu_data_list(
+    response: Response,
     device_id: Optional[str] = Query(None, description="디바이스 ID"),
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     limit: int = Query(100, description="조회 개수 제한"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     db: AsyncSession = Depends(get_db_session)
 ):
-    """IMU 센서 데이터 목록 조회"""
+    """IMU 센서 데이터 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
     try:
         query = select(SensorRawIMU)
         
@@ -86,12 +120,12 @@ async def get_imu_data_list(
                 )
             )
         
-        query = query.order_by(SensorRawIMU.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorRawIMU.time, SensorRawIMU.device_id, cursor).limit(limit)
         
         result = await db.execute(query)
         imu_list = result.scalars().all()
         
-        return [
+        items = [
             IMUDataResponse(
                 time=imu.time,
                 device_id=imu.device_id,
@@ -105,6 +139,8 @@ async def get_imu_data_list(
             )
             for imu in imu_list
         ]
+        set_next_cursor(response, items, limit)
+        return items
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"IMU 데이터 조회 실패: {str(e)}")
 
@@ -249,12 +285,7 @@ async def get_latest_imu_data(
 ):
     """특정 디바이스의 최신 IMU 센서 데이터 조회"""
     try:
-        query = select(SensorRawIMU).where(
-            SensorRawIMU.device_id == device_id
-        ).order_by(SensorRawIMU.time.desc()).limit(1)
-        
-        result = await db.execute(query)
-        imu_data = result.scalar_one_or_none()
+        imu_data = await fetch_latest(db, SensorRawIMU, device_id)
         
         if not imu_data:
             raise HTTPException(status_code=404, detail="IMU 데이터를 찾을 수 없습니다")
@@ -283,85 +314,42 @@ async def analyze_motion_pattern(
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     db: AsyncSession = Depends(get_db_session)
 ):
-    """IMU 센서 데이터를 이용한 동작 패턴 분석"""
+    """IMU 센서 데이터를 이용한 동작 패턴 분석
+    
+    축별 개수/최소/최대/평균을 DB에서 집계하여 조회 기간 전체를 요약합니다.
+    """
     try:
-        query = select(SensorRawIMU).where(
-            SensorRawIMU.device_id == device_id
-        )
-        
+        conditions = [SensorRawIMU.device_id == device_id]
         if start_time and end_time:
-            query = query.where(
-                and_(
-                    SensorRawIMU.time >= start_time,
-                    SensorRawIMU.time <= end_time
-                )
-            )
+            conditions.extend([SensorRawIMU.time >= start_time, SensorRawIMU.time <= end_time])
         
-        query = query.order_by(SensorRawIMU.time.desc()).limit(1000)  # 최근 1000개 데이터
+        columns = [
+            func.count().label("data_count"),
+            func.min(SensorRawIMU.time).label("start"),
+            func.max(SensorRawIMU.time).label("end")
+        ]
+        for sensor in ("accel", "gyro"):
+            for axis in ("x", "y", "z"):
+                columns.extend(summary_columns(getattr(SensorRawIMU, f"{sensor}_{axis}"), f"{sensor}_{axis}"))
         
-        result = await db.execute(query)
-        imu_list = result.scalars().all()
+        result = await db.execute(select(*columns).where(and_(*conditions)))
+        row = result.one()
         
-        if not imu_list:
+        if not row.data_count:
             raise HTTPException(status_code=404, detail="IMU 데이터를 찾을 수 없습니다")
         
-        # 가속도 데이터 분석
-        accel_x_values = [imu.accel_x for imu in imu_list if imu.accel_x is not None]
-        accel_y_values = [imu.accel_y for imu in imu_list if imu.accel_y is not None]
-        accel_z_values = [imu.accel_z for imu in imu_list if imu.accel_z is not None]
-        
-        # 자이로스코프 데이터 분석
-        gyro_x_values = [imu.gyro_x for imu in imu_list if imu.gyro_x is not None]
-        gyro_y_values = [imu.gyro_y for imu in imu_list if imu.gyro_y is not None]
-        gyro_z_values = [imu.gyro_z for imu in imu_list if imu.gyro_z is not None]
+        def axis_stats(name: str) -> dict:
+            return summary(row, name, with_count=True, empty={"count": 0, "min": None, "max": None, "avg": None})
         
         analysis = {
             "device_id": device_id,
-            "data_count": len(imu_list),
+            "data_count": row.data_count,
             "time_range": {
-                "start": imu_list[-1].time if imu_list else None,
-                "end": imu_list[0].time if imu_list else None
-            },
-            "acceleration": {
-                "x_axis": {
-                    "count": len(accel_x_values),
-                    "min": min(accel_x_values) if accel_x_values else None,
-                    "max": max(accel_x_values) if accel_x_values else None,
-                    "avg": sum(accel_x_values) / len(accel_x_values) if accel_x_values else None
-                },
-                "y_axis": {
-                    "count": len(accel_y_values),
-                    "min": min(accel_y_values) if accel_y_values else None,
-                    "max": max(accel_y_values) if accel_y_values else None,
-                    "avg": sum(accel_y_values) / len(accel_y_values) if accel_y_values else None
-                },
-                "z_axis": {
-                    "count": len(accel_z_values),
-                    "min": min(accel_z_values) if accel_z_values else None,
-                    "max": max(accel_z_values) if accel_z_values else None,
-                    "avg": sum(accel_z_values) / len(accel_z_values) if accel_z_values else None
-                }
+                "start": row.start,
+                "end": row.end
             },
-            "gyroscope": {
-                "x_axis": {
-                    "count": len(gyro_x_values),
-                    "min": min(gyro_x_values) if gyro_x_values else None,
-                    "max": max(gyro_x_values) if gyro_x_values else None,
-                    "avg": sum(gyro_x_values) / len(gyro_x_values) if gyro_x_values else None
-                },
-                "y_axis": {
-                    "count": len(gyro_y_values),
-                    "min": min(gyro_y_values) if gyro_y_values else None,
-                    "max": max(gyro_y_values) if gyro_y_values else None,
-                    "avg": sum(gyro_y_values) / len(gyro_y_values) if gyro_y_values else None
-                },
-                "z_axis": {
-                    "count": len(gyro_z_values),
-                    "min": min(gyro_z_values) if gyro_z_values else None,
-                    "max": max(gyro_z_values) if gyro_z_values else None,
-                    "avg": sum(gyro_z_values) / len(gyro_z_values) if gyro_z_values else None
-                }
-            }
+            "acceleration": {f"{axis}_axis": axis_stats(f"accel_{axis}") for axis in ("x", "y", "z")},
+            "gyroscope": {f"{axis}_axis": axis_stats(f"gyro_{axis}") for axis in ("x", "y", "z")}
         }
         
         return analysis
@@ -0,0 +1,143 @@
+"""
+통합 센서 데이터 수집 API
+
+센서 타입이 섞인 프레임 배열을 한 번의 요청으로 받아 테이블별로 일괄 적재합니다.
+게이트웨이가 센서마다 다른 엔드포인트를 호출하지 않고 한 집의 측정값을 한 번에 올릴 수 있습니다.
+"""
+
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database import get_db_session
+from app.core.container import container
+from app.infrastructure.ingest_queue import ingest_queue
+from app.infrastructure.rate_limiter import ingest_rate_limiter
+from app.interfaces.services.ingest_service_interface import IIngestService
+from app.api.v1.schemas import IngestRequest, IngestResponse, IngestStreamSummary, IngestQueueMetrics, IngestRateLimitMetrics
+
+router = APIRouter()
+
+
+def get_ingest_service(db: AsyncSession = Depends(get_db_session)) -> IIngestService:
+    """통합 수집 서비스 의존성 주입"""
+    return container.get_ingest_service(db)
+
+
+@router.post(
+    "",
+    response_model=IngestResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": IngestRequest.schema()},
+                "application/msgpack": {"schema": {"type": "string", "format": "binary"}},
+                "application/cbor": {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+)
+async def ingest_frames(
+    request: Request,
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    ingest_service: IIngestService = Depends(get_ingest_service)
+):
+    """
+    센서 타입이 섞인 프레임 통합 적재
+    
+    **application/json**
+    - **frames**: `sensor_type`과 해당 센서 `/create` 스키마 필드를 가진 프레임 배열
+    
+    예: `{"sensor_type": "mq5", "time": "...", "device_id": "...", "raw_payload": {...}}`
+    
+    **application/msgpack**, **application/cbor** (압축 형식)
+    - `{"d": [device_id, ...], "f": [[code, ts_ms, device_index, v0, ...], ...]}`
+    - code는 `Iot_Serial.source` 바이트 맵(MQ5=0x01 등), ts_ms는 epoch 밀리초
+    
+    프레임을 센서 타입별 테이블로 묶어 테이블마다 다중 행 INSERT로 적재하고,
+    테이블별 집계(`tables`)와 프레임별 결과(`results`)를 반환합니다.
+    기본값(`on_conflict=nothing`)은 이미 적재된 프레임을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    content_type = request.headers.get("content-type", "application/json")
+    body = await request.body()
+
+    if not content_type.split(";")[0].strip().lower().endswith("json"):
+        return await ingest_service.ingest_compact(body, content_type, on_conflict)
+
+    try:
+        ingest_request = IngestRequest.parse_raw(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+    return await ingest_service.ingest(ingest_request.frames, on_conflict)
+
+
+@router.post(
+    "/stream",
+    response_model=IngestStreamSummary,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+            },
+        }
+    },
+)
+async def ingest_stream(
+    request: Request,
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    ingest_service: IIngestService = Depends(get_ingest_service)
+):
+    """
+    NDJSON 스트리밍 통합 적재
+    
+    **application/x-ndjson** (chunked 전송 가능)
+    - 한 줄에 프레임 하나: `{"sensor_type": "mq5", "time": "...", "device_id": "...", ...}`
+    
+    본문을 읽는 즉시 줄 단위로 검증하고 테이블별로 제한된 크기의 배치로 나누어 적재하므로,
+    오프라인 동안 쌓인 대량의 측정값을 한 번의 연결로 업로드해도 서버 메모리가 일정하게 유지됩니다.
+    기본값(`on_conflict=nothing`)이 멱등 적재이므로 이미 일부가 적재된 백로그를 그대로 재전송해도 됩니다.
+    
+    응답은 집계와 실패한 줄(`errors`, 최대 100건)만 포함합니다.
+    디바이스/센서 타입 속도 제한은 적재 버퍼(최대 500줄)마다 적용되며, 한도를 넘은 줄 수는 `rate_limited`,
+    재전송까지 기다릴 시간은 `retry_after`로 보고합니다.
+    """
+    media_type = request.headers.get("content-type", "application/x-ndjson").split(";")[0].strip().lower()
+    if media_type not in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+        raise HTTPException(status_code=415, detail=f"지원하지 않는 Content-Type입니다: {media_type}")
+    return await ingest_service.ingest_stream(request.stream(), on_conflict)
+
+
+@router.get("/types", response_model=List[Dict[str, Any]])
+async def list_ingest_types(
+    ingest_service: IIngestService = Depends(get_ingest_service)
+):
+    """
+    통합 수집에서 사용할 수 있는 센서 타입 목록
+    """
+    return ingest_service.list_sensor_types()
+
+
+@router.get("/queue/metrics", response_model=IngestQueueMetrics)
+async def get_ingest_queue_metrics():
+    """
+    write-behind 수집 큐 메트릭
+    
+    큐 깊이, 버퍼링된 행 수, 적재/거부/실패 건수와 플러시 지연(ms)을 반환합니다.
+    재시도 대기 테이블과 데드레터(ingest_dead_letter)로 보낸 행 수도 포함합니다.
+    """
+    return ingest_queue.metrics()
+
+
+@router.get("/rate-limit/metrics", response_model=IngestRateLimitMetrics)
+async def get_ingest_rate_limit_metrics(
+    top: int = Query(20, ge=1, le=1000, description="드롭 상위 디바이스/센서 타입 수")
+):
+    """
+    수집 속도 제한 메트릭
+    
+    허용/거부된 요청·측정값 수와 드롭된 측정값이 많은 디바이스/센서 타입을 반환합니다.
+    """
+    return ingest_rate_limiter.metrics(top)
@@ -5,18 +5,28 @@ Clean Architecture 원칙에 따라 로드셀 센서의 원시 데이터를 관
 """
 
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional, Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database import get_db_session
 from app.core.container import container
 from app.interfaces.services.sensor_service_interface import ILoadCellService
+from app.infrastructure.models import SensorRawLoadCell
+from app.infrastructure.ingest_queue import ingest_queue
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
 from app.api.v1.schemas import (
     SensorRawLoadCellCreate,
     SensorRawLoadCellUpdate,
-    SensorRawLoadCellResponse
+    SensorRawLoadCellResponse,
+    BatchCreateResponse,
+    SensorBucketResponse
 )
+from app.infrastructure.pagination import Cursor, cursor_param, set_next_cursor
+from app.infrastructure.row_reader import RowListResponse
 
 router = APIRouter()
 
@@ -26,10 +36,20 @@ def get_loadcell_service(db: AsyncSession = Depends(get_db_session)) -> ILoadCel
     return container.get_loadcell_service(db)
 
 
+def get_loadcell_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """로드셀 센서 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorRawLoadCell, SensorRawLoadCellCreate)
+
+
+def get_loadcell_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """로드셀 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "loadcell")
+
+
 @router.post("/create", response_model=SensorRawLoadCellResponse, status_code=201)
 async def create_loadcell_data(
     data: SensorRawLoadCellCreate,
-    loadcell_service: ILoadCellService = Depends(get_loadcell_service)
+    batch_service: ISensorBatchService = Depends(get_loadcell_batch_service)
 ):
     """
     로드셀 센서 데이터 생성
@@ -49,7 +69,54 @@ async def create_loadcell_data(
     }
     ```
     """
-    return await loadcell_service.create_sensor_data(data)
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorRawLoadCell, data.dict()))
+    result, row = await batch_service.create_one(data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_loadcell_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="SensorRawLoadCellCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_loadcell_batch_service)
+):
+    """
+    로드셀 센서 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_loadcell_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: weight_kg)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_loadcell_bucket_service)
+):
+    """
+    로드셀 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: weight_kg
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 
 @router.get("/list", response_model=List[SensorRawLoadCellResponse])
@@ -58,15 +125,24 @@ async def get_loadcell_data_list(
     start_time: Optional[datetime] = Query(None, description="시작 시간"),
     end_time: Optional[datetime] = Query(None, description="종료 시간"),
     limit_count: int = Query(100, description="조회할 데이터 개수", ge=1, le=1000),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     loadcell_service: ILoadCellService = Depends(get_loadcell_service)
 ):
-    """로드셀 센서 데이터 목록 조회"""
-    return await loadcell_service.get_sensor_data_list(
+    """로드셀 센서 데이터 목록 조회
+
+    다음 페이지가 있으면 `X-Next-Cursor` 헤더의 값을 `cursor`로 넘겨 이어서 조회합니다.
+    """
+    items = await loadcell_service.get_sensor_data_list(
         device_id=device_id,
         start_time=start_time,
         end_time=end_time,
-        limit=limit_count
+        limit=limit_count,
+        cursor=cursor
     )
+    # Core 행 딕셔너리를 그대로 직렬화 (행 단위 response_model 검증 생략, 스키마 문서는 유지)
+    rows = RowListResponse(items)
+    set_next_cursor(rows, items, limit_count)
+    return rows
 
 
 @router.get("/latest", response_model=Optional[SensorRawLoadCellResponse])
@@ -4,6 +4,7 @@ API 스키마 정의
 FastAPI 엔드포인트의 요청/응답 모델을 정의합니다.
 """
 
+import json
 from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, EmailStr, Field, validator, ConfigDict
@@ -86,6 +87,8 @@ class UserListResponse(BaseModel):
     total: int
     page: int
     size: int
+    total_estimated: bool = False
+    next_after: Optional[UUID] = None
 
 
 # ============================================================================
@@ -155,6 +158,203 @@ class PaginationParams(BaseModel):
     size: int = Field(10, ge=1, le=100, description="페이지 크기")
 
 
+# ============================================================================
+# 배치 수집 스키마
+# ============================================================================
+
+class BatchItemResult(BaseModel):
+    """배치 항목별 처리 결과 스키마"""
+    index: int = Field(..., description="요청 배열 내 항목 위치")
+    status: str = Field(..., description="처리 결과 (created, updated, duplicate, invalid, failed)")
+    device_id: Optional[str] = None
+    time: Optional[datetime] = None
+    detail: Optional[str] = None
+    user_id: Optional[str] = Field(None, description="디바이스가 할당된 사용자 ID (디바이스 레지스트리)")
+    location: Optional[str] = Field(None, description="디바이스 설치 위치 (디바이스 레지스트리)")
+    role: Optional[str] = Field(None, description="디바이스 센서 역할 (디바이스 레지스트리)")
+
+
+class BatchCreateResponse(BaseModel):
+    """배치 생성 응답 스키마"""
+    total: int
+    created: int
+    updated: int = 0
+    duplicates: int = 0
+    failed: int
+    results: List[BatchItemResult]
+
+
+class IngestRequest(BaseModel):
+    """통합 수집 요청 스키마
+
+    각 프레임은 `sensor_type` 필드와 해당 센서 `/create` 스키마의 필드를 함께 가집니다.
+    """
+    frames: List[Dict[str, Any]] = Field(..., description="센서 타입이 지정된 프레임 배열")
+
+
+class IngestTableResult(BaseModel):
+    """통합 수집 테이블별 처리 결과 스키마"""
+    sensor_type: str
+    table: str
+    received: int
+    created: int
+    updated: int = 0
+    duplicates: int = 0
+    failed: int
+
+
+class IngestResponse(BaseModel):
+    """통합 수집 응답 스키마"""
+    total: int
+    created: int
+    updated: int = 0
+    duplicates: int = 0
+    failed: int
+    tables: List[IngestTableResult]
+    results: List[BatchItemResult]
+
+
+class IngestStreamSummary(BaseModel):
+    """NDJSON 스트리밍 수집 요약 스키마
+
+    서버 메모리를 일정하게 유지하기 위해 성공한 줄의 결과는 반환하지 않고,
+    실패한 줄(`errors`)만 최대 개수까지 반환합니다.
+    """
+    lines: int = Field(..., description="처리한 줄 수 (빈 줄 제외)")
+    created: int
+    updated: int = 0
+    duplicates: int = 0
+    failed: int
+    flushes: int = Field(..., description="DB 적재(다중 행 INSERT) 횟수")
+    tables: Dict[str, int] = Field(default_factory=dict, description="테이블별 적재 행 수")
+    errors: List[BatchItemResult] = Field(default_factory=list, description="실패한 줄 결과 (index는 줄 위치)")
+    errors_truncated: bool = False
+    rate_limited: int = Field(0, description="수집 속도 제한으로 적재하지 않은 줄 수")
+    retry_after: Optional[float] = Field(None, description="rate_limited가 있으면 재전송까지 기다릴 시간(초)")
+
+
+class IngestQueueMetrics(BaseModel):
+    """write-behind 수집 큐 메트릭 스키마"""
+    enabled: bool
+    running: bool
+    queue_depth: int
+    queue_max_size: int
+    buffered_rows: int
+    enqueued_total: int
+    rejected_total: int
+    flushed_rows_total: int
+    failed_rows_total: int
+    duplicate_rows_total: int
+    retried_rows_total: int = Field(0, description="일시적 오류로 버퍼에 되돌려 재시도한 행 수 (누적)")
+    dead_letter_rows_total: int = Field(0, description="거부되어 ingest_dead_letter에 보관한 행 수")
+    retrying_tables: List[str] = Field(default_factory=list, description="재시도 대기 중인 테이블")
+    flush_count: int
+    last_flush_latency_ms: float
+    avg_flush_latency_ms: float
+    max_flush_latency_ms: float
+
+
+class DeviceRegistryStats(BaseModel):
+    """디바이스 레지스트리 캐시 통계 스키마"""
+    loaded: bool
+    size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    reloads: int
+    loaded_at: Optional[float] = None
+    refresh_interval_sec: float
+
+
+class ReadCacheEndpointStats(BaseModel):
+    """읽기 캐시 엔드포인트별 통계 스키마"""
+    hits: int
+    misses: int
+    errors: int
+    hit_ratio: float
+
+
+class ReadCacheStats(BaseModel):
+    """읽기 캐시 통계 스키마"""
+    enabled: bool
+    available: bool
+    version: int
+    ttl_sec: int
+    endpoints: Dict[str, ReadCacheEndpointStats] = Field(default_factory=dict)
+
+
+class IngestRateLimitMetrics(BaseModel):
+    """수집 속도 제한 메트릭 스키마"""
+    enabled: bool
+    device_rate: float
+    device_burst: float
+    sensor_type_rate: float
+    sensor_type_burst: float
+    allowed_requests: int
+    rejected_requests: int
+    allowed_readings: int
+    dropped_readings: int
+    tracked_devices: int
+    device_drops: Dict[str, int] = Field(..., description="드롭된 측정값이 많은 디바이스 (상위 N개)")
+    sensor_type_drops: Dict[str, int] = Field(..., description="드롭된 측정값이 많은 센서 타입 (상위 N개)")
+
+
+# ============================================================================
+# 시간 버킷 다운샘플링 스키마
+# ============================================================================
+
+class SensorBucket(BaseModel):
+    """시간 버킷별 집계 스키마"""
+    time: datetime = Field(..., description="버킷 시작 시간")
+    count: int
+    min: Optional[float] = None
+    max: Optional[float] = None
+    avg: Optional[float] = None
+
+
+class SensorPoint(BaseModel):
+    """다운샘플링된 차트 포인트 스키마"""
+    time: datetime
+    value: float
+
+
+class SensorBucketResponse(BaseModel):
+    """시간 버킷 다운샘플링 응답 스키마
+
+    `points`를 지정하지 않으면 `buckets`(버킷별 min/max/avg/count)를,
+    지정하면 LTTB로 줄인 `points`를 반환합니다.
+    """
+    sensor_type: str
+    device_id: str
+    field: str = Field(..., description="집계한 측정값 필드")
+    interval: Optional[str] = Field(None, description="버킷 간격 (points 모드에서는 None)")
+    start_time: datetime
+    end_time: datetime
+    tier: str = Field("raw", description="집계에 사용한 계층 (raw, hourly, daily)")
+    buckets: List[SensorBucket] = Field(default_factory=list)
+    points: Optional[List[SensorPoint]] = None
+
+
+class LatestReading(BaseModel):
+    """센서 테이블별 최신 측정값 스키마"""
+    sensor_type: str = Field(..., description="센서 타입 (라우터 prefix와 동일)")
+    time: datetime
+    data: Dict[str, Any] = Field(..., description="최신 행 (컬럼 이름 -> 값)")
+
+
+class DeviceLatestReadings(BaseModel):
+    """디바이스별 최신 측정값 스키마"""
+    device_id: str
+    location_label: Optional[str] = None
+    readings: List[LatestReading] = Field(default_factory=list)
+
+
+class UserLatestReadingsResponse(BaseModel):
+    """사용자(돌봄 대상) 집의 전체 디바이스 최신 측정값 응답 스키마"""
+    user_id: UUID
+    devices: List[DeviceLatestReadings] = Field(default_factory=list)
+
+
 # ============================================================================
 # 센서 데이터 스키마
 # ============================================================================
@@ -937,6 +1137,25 @@ class DeviceRTCDataResponse(BaseModel):
 # Raw 센서 스키마 (ORM 모드 문제 해결)
 # ============================================================================
 
+def payload_value(raw_payload: Optional[dict], key: str, kind: str = "number"):
+    """raw_payload 핫 키 값 (DB 생성 컬럼과 같은 규칙으로 숫자 키는 JSON 숫자일 때만 값을 채움)"""
+    item = (raw_payload or {}).get(key)
+    if kind == "number":
+        return item if isinstance(item, (int, float)) and not isinstance(item, bool) else None
+    if item is None or isinstance(item, str):
+        return item
+    return json.dumps(item)
+
+
+def payload_field(key: str, kind: str = "number"):
+    """raw_payload 핫 키를 타입이 있는 응답 필드로 노출하는 validator"""
+    def extract(cls, value, values):
+        if value is not None:
+            return value
+        return payload_value(values.get("raw_payload"), key, kind)
+    return validator(key, always=True, allow_reuse=True)(extract)
+
+
 # Raw CDS 센서 스키마
 class SensorRawCDSCreate(BaseModel):
     """Raw CDS 센서 데이터 생성 스키마"""
@@ -977,6 +1196,9 @@ class SensorRawLoadCellResponse(BaseModel):
     time: datetime
     device_id: str
     raw_payload: Optional[dict] = None
+    weight_kg: Optional[float] = Field(None, description="raw_payload.weight_kg (무게 (kg))")
+
+    _weight_kg = payload_field("weight_kg")
 
     class Config:
         from_attributes = True
@@ -1001,6 +1223,9 @@ class SensorRawMQ5Response(BaseModel):
     time: datetime
     device_id: str
     raw_payload: Optional[dict] = None
+    gas_level: Optional[float] = Field(None, description="raw_payload.gas_level (가스 농도)")
+
+    _gas_level = payload_field("gas_level")
 
     class Config:
         from_attributes = True
@@ -1025,6 +1250,9 @@ class SensorRawMQ7Response(BaseModel):
     time: datetime
     device_id: str
     raw_payload: Optional[dict] = None
+    co_level: Optional[float] = Field(None, description="raw_payload.co_level (CO 농도)")
+
+    _co_level = payload_field("co_level")
 
     class Config:
         from_attributes = True
@@ -1049,6 +1277,9 @@ class SensorRawRFIDResponse(BaseModel):
     time: datetime
     device_id: str
     raw_payload: Optional[dict] = None
+    card_id: Optional[str] = Field(None, description="raw_payload.card_id (카드 ID)")
+
+    _card_id = payload_field("card_id", "text")
 
     class Config:
         from_attributes = True
@@ -1073,6 +1304,9 @@ class SensorRawSoundResponse(BaseModel):
     time: datetime
     device_id: str
     raw_payload: Optional[dict] = None
+    db_value: Optional[float] = Field(None, description="raw_payload.db_value (소음 (dB))")
+
+    _db_value = payload_field("db_value")
 
     class Config:
         from_attributes = True
@@ -1178,6 +1412,7 @@ class SensorRawTemperatureListResponse(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 # ============================================================================
 # 사용자 관계 관련 스키마
@@ -1391,6 +1626,7 @@ class HomeStateSnapshotListResponse(BaseModel):
     page: int
     size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 # ============================================================================
 # 버튼 이벤트 센서 스키마
@@ -1442,4 +1678,5 @@ class SensorEventButtonListResponse(BaseModel):
     total: int
     page: int
     size: int
-    pages: int 
\ No newline at end of file
+    pages: int
+    next_cursor: Optional[str] = None
@@ -1,19 +1,34 @@
-from typing import List, Optional
+from typing import List, Optional, Any, Dict
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
-from app.core.container import get_sensor_raw_temperature_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.container import container, get_sensor_raw_temperature_service
 from app.interfaces.services.sensor_raw_temperature_service_interface import ISensorRawTemperatureService
+from app.infrastructure.database import get_db_session
+from app.infrastructure.models import SensorRawTemperature
+from app.infrastructure.ingest_queue import ingest_queue
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
 from app.api.v1.schemas import (
     SensorRawTemperatureCreate, SensorRawTemperatureUpdate,
-    SensorRawTemperatureResponse, SensorRawTemperatureListResponse
+    SensorRawTemperatureResponse, SensorRawTemperatureListResponse,
+    BatchCreateResponse,
+    SensorBucketResponse
 )
+from app.infrastructure.pagination import NEXT_CURSOR_HEADER, Cursor, cursor_param
 
 router = APIRouter(tags=["온도 센서 원시 데이터"])
 
+def get_sensor_raw_temperature_batch_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBatchService:
+    """온도 센서 원시 데이터 배치 수집 서비스 의존성 주입"""
+    return container.get_sensor_batch_service(db, SensorRawTemperature, SensorRawTemperatureCreate)
+
 @router.post("/create", response_model=SensorRawTemperatureResponse, status_code=201)
 async def create_sensor_raw_temperature(
     temperature_data: SensorRawTemperatureCreate = Body(...),
-    temperature_service: ISensorRawTemperatureService = Depends(get_sensor_raw_temperature_service)
+    batch_service: ISensorBatchService = Depends(get_sensor_raw_temperature_batch_service)
 ):
     """온도 센서 원시 데이터 생성
     
@@ -39,10 +54,56 @@ async def create_sensor_raw_temperature(
     }
     ```
     """
-    try:
-        return await temperature_service.create_temperature_data(temperature_data)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"온도 데이터 생성 실패: {str(e)}")
+    if ingest_queue.enabled:
+        return JSONResponse(status_code=202, content=await ingest_queue.enqueue(SensorRawTemperature, temperature_data.dict()))
+    result, row = await batch_service.create_one(temperature_data)
+    if result.status == "duplicate":
+        # 재전송된 행: 기본 키 충돌 오류 대신 200과 항목 결과(duplicate)로 응답
+        return JSONResponse(status_code=200, content=jsonable_encoder(result))
+    return row
+
+def get_sensor_raw_temperature_bucket_service(db: AsyncSession = Depends(get_db_session)) -> ISensorBucketService:
+    """온도 센서 시간 버킷 다운샘플링 서비스 의존성 주입"""
+    return container.get_sensor_bucket_service(db, "sensor-raw-temperatures")
+
+@router.post("/create-batch", response_model=BatchCreateResponse)
+async def create_sensor_raw_temperature_data_batch(
+    items: List[Dict[str, Any]] = Body(..., description="SensorRawTemperatureCreate 형식의 항목 배열"),
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$", description="중복 키 처리 (nothing: 무시, update: 갱신)"),
+    batch_service: ISensorBatchService = Depends(get_sensor_raw_temperature_batch_service)
+):
+    """
+    온도 센서 원시 데이터 배치 생성
+    
+    `/create`와 같은 형식의 항목 배열을 받아 항목별로 검증한 뒤,
+    유효한 항목을 다중 행 INSERT 한 번으로 적재합니다.
+    `results`에 항목별 처리 결과(created, updated, duplicate, invalid, failed)를 반환합니다.
+    
+    기본값(`on_conflict=nothing`)은 `INSERT ... ON CONFLICT DO NOTHING`으로 멱등 적재하여
+    이미 적재된 항목(디바이스 재전송)을 오류 대신 duplicate로 보고하고, `update`는 기존 행을 갱신(updated)합니다.
+    """
+    return await batch_service.create_batch(items, on_conflict)
+
+@router.get("/buckets", response_model=SensorBucketResponse)
+async def get_sensor_raw_temperature_buckets(
+    device_id: str = Query(..., description="디바이스 ID"),
+    start_time: datetime = Query(..., description="시작 시간"),
+    end_time: datetime = Query(..., description="종료 시간"),
+    interval: str = Query("5m", pattern="^(1m|5m|15m|1h|1d)$", description="버킷 간격"),
+    field: Optional[str] = Query(None, description="집계할 측정값 필드 (기본값: temperature_celsius)"),
+    points: Optional[int] = Query(None, ge=3, le=5000, description="LTTB 다운샘플링 목표 포인트 수"),
+    bucket_service: ISensorBucketService = Depends(get_sensor_raw_temperature_bucket_service)
+):
+    """
+    온도 센서 데이터 시간 버킷 집계 (차트용)
+    
+    - **interval**: 버킷 간격 (1m, 5m, 15m, 1h, 1d)
+    - **field**: temperature_celsius, humidity_percent
+    - **points**: 지정하면 버킷 대신 LTTB로 줄인 포인트를 반환 (3-5000)
+    
+    버킷별 min/max/avg/count를 DB에서 `date_bin`으로 집계하므로 기간이 길어도 응답 크기는 버킷 수로 제한됩니다.
+    """
+    return await bucket_service.get_buckets(device_id, start_time, end_time, interval, field, points)
 
 @router.get("/{time}/{device_id}", response_model=SensorRawTemperatureResponse)
 async def get_sensor_raw_temperature(
@@ -255,8 +316,10 @@ async def delete_sensor_raw_temperature(
 
 @router.get("/", response_model=SensorRawTemperatureListResponse)
 async def get_all_sensor_raw_temperatures(
+    response: Response,
     skip: int = Query(0, ge=0, description="건너뛸 데이터 개수"),
     limit: int = Query(100, ge=1, le=1000, description="조회할 데이터 개수"),
+    cursor: Optional[Cursor] = Depends(cursor_param),
     temperature_service: ISensorRawTemperatureService = Depends(get_sensor_raw_temperature_service)
 ):
     """전체 온도 데이터 목록 조회 (페이지네이션)
@@ -264,6 +327,7 @@ async def get_all_sensor_raw_temperatures(
     **쿼리 매개변수**:
     - skip: 건너뛸 데이터 개수 (기본값: 0)
     - limit: 조회할 데이터 개수 (기본값: 100, 최대: 1000)
+    - cursor: 이전 응답의 next_cursor 값 (지정하면 skip 대신 keyset으로 이어서 조회)
     
     **응답**:
     - 온도 데이터 목록 및 페이지네이션 정보
@@ -273,7 +337,9 @@ async def get_all_sensor_raw_temperatures(
     GET /api/sensor-raw-temperatures/?skip=100&limit=50
     ```
     """
-    temperatures = await temperature_service.get_all_temperature_data(skip, limit)
+    temperatures = await temperature_service.get_all_temperature_data(skip, limit, cursor)
+    if temperatures.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = temperatures.next_cursor
     return temperatures
 
 @router.get("/average/{device_id}")
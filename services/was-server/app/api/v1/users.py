@@ -12,16 +12,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas import (
     UserCreate, UserUpdate, UserResponse, UserListResponse,
-    SuccessResponse, ErrorResponse, PaginationParams
+    SuccessResponse, ErrorResponse, PaginationParams, UserLatestReadingsResponse
 )
 from app.core.container import container
 from app.infrastructure.database import get_db_session
+from app.infrastructure.read_cache import cached
 from app.interfaces.repositories.user_repository import IUserRepository
 from app.interfaces.services.user_service_interface import IUserService
+from app.interfaces.services.latest_readings_service_interface import ILatestReadingsService
 from app.domain.entities.user import User
 
 router = APIRouter(tags=["users"])
 
+# 목록 필터에 허용하는 사용자 역할
+USER_ROLES = ("admin", "caregiver", "family", "user", "care_target")
+
 
 def get_user_repository(db_session: AsyncSession = Depends(get_db_session)) -> IUserRepository:
     """사용자 리포지토리 의존성 주입"""
@@ -33,6 +38,11 @@ def get_user_service(db_session: AsyncSession = Depends(get_db_session)) -> IUse
     return container.get_user_service(db_session)
 
 
+def get_latest_readings_service() -> ILatestReadingsService:
+    """최신 측정값 일괄 조회 서비스 의존성 주입"""
+    return container.get_latest_readings_service()
+
+
 @router.post("/create", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user_data: UserCreate,
@@ -80,7 +90,9 @@ async def create_user(
 async def get_users(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기"),
-    role: Optional[str] = Query(None, description="역할별 필터링"),
+    role: Optional[str] = Query(None, pattern=f"^({'|'.join(USER_ROLES)})$", description="역할별 필터링"),
+    after: Optional[UUID] = Query(None, description="이전 페이지 마지막 user_id (지정하면 page 대신 keyset)"),
+    count: str = Query("exact", pattern="^(exact|estimated)$", description="전체 개수 계산 방식"),
     user_repository: IUserRepository = Depends(get_user_repository)
 ):
     """
@@ -88,20 +100,15 @@ async def get_users(
     
     - **page**: 페이지 번호 (기본값: 1)
     - **size**: 페이지 크기 (기본값: 10, 최대: 100)
-    - **role**: 역할별 필터링 (선택)
+    - **role**: 역할별 필터링 (선택, admin/caregiver/family/user/care_target 중 하나)
+    - **after**: 이전 응답의 `next_after` 값 (선택, 깊은 페이지도 일정한 비용)
+    - **count**: `exact`(COUNT(*)) 또는 `estimated`(PostgreSQL 통계 기반 추정치, 작은 테이블은 정확한 값이며 `total_estimated`로 구분)
     """
     try:
-        # 페이지네이션 계산
+        # 페이지와 전체 개수 모두 DB에서 계산
         offset = (page - 1) * size
-        
-        if role:
-            users = await user_repository.get_by_role(role)
-        else:
-            users = await user_repository.get_all()
-        
-        # 페이지네이션 적용
-        total = len(users)
-        paginated_users = users[offset:offset + size]
+        paginated_users = await user_repository.get_page(offset=offset, limit=size, role=role, after=after)
+        total, total_estimated = await user_repository.count(role=role, estimate=count == "estimated")
         
         # 응답 데이터 구성
         user_responses = []
@@ -133,7 +140,9 @@ async def get_users(
             users=user_responses,
             total=total,
             page=page,
-            size=size
+            size=size,
+            total_estimated=total_estimated,
+            next_after=paginated_users[-1].user_id if len(paginated_users) == size else None
         )
         
     except Exception as e:
@@ -144,6 +153,7 @@ async def get_users(
 
 
 @router.get("/{user_id}", response_model=UserResponse)
+@cached("users.get", UserResponse, group=lambda **_: "users", key=lambda user_id, **_: user_id)
 async def get_user(
     user_id: UUID,
     user_repository: IUserRepository = Depends(get_user_repository)
@@ -306,4 +316,20 @@ async def get_user_devices(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"사용자 디바이스 조회 중 오류가 발생했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        ) 
+
+
+@router.get("/{user_id}/latest-readings", response_model=UserLatestReadingsResponse)
+async def get_user_latest_readings(
+    user_id: UUID,
+    latest_readings_service: ILatestReadingsService = Depends(get_latest_readings_service)
+):
+    """
+    사용자(돌봄 대상) 집 전체의 최신 측정값 조회
+    
+    사용자에게 할당된 모든 디바이스에 대해 센서 테이블별 최신 행을 한 번에 반환합니다.
+    디바이스/센서마다 /latest를 따로 호출하지 않아도 됩니다.
+    
+    - **user_id**: 조회할 사용자의 UUID
+    """
+    return await latest_readings_service.get_user_latest_readings(user_id)
@@ -0,0 +1,273 @@
+"""
+WebSocket 센서 데이터 수집 API
+
+디바이스가 한 번 인증한 뒤 연결을 유지한 채 프레임을 계속 전송합니다.
+서버는 프레임을 모아 일정 개수/시간마다 다중 행 INSERT로 적재하고 묶음 단위로 ack를 보냅니다.
+
+프로토콜:
+- 인증: 핸드셰이크의 `Authorization: Bearer <token>` 헤더 또는 첫 메시지 `{"type": "auth", "token": "<token>"}`
+- 권한: 토큰 주체(sub)가 device_id이면 그 디바이스만, 사용자 ID이면 그 사용자에게 할당된 디바이스만 전송할 수 있습니다.
+  다른 디바이스의 프레임이 섞인 메시지는 적재하지 않고 error로 거부합니다.
+- 텍스트 메시지: `/api/ingest` 프레임 객체 하나 또는 프레임 배열
+- 바이너리 메시지: `/api/ingest` msgpack 압축 문서 (`{"d": [...], "f": [[...], ...]}`)
+- ack: `{"type": "ack", "through": <이 연결에서 처리 완료된 누적 프레임 수>, "created": ..., "errors": [...]}`
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+
+from app.core.config import settings
+from app.core.container import container
+from app.core.middleware import extract_readings, frame_readings
+from app.core.security import InvalidTokenError, verify_device_token
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.rate_limiter import ingest_rate_limiter
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# 정책 위반(인증 실패) 종료 코드
+WS_POLICY_VIOLATION = 1008
+
+
+async def _authenticate(websocket: WebSocket) -> Optional[str]:
+    """헤더 또는 첫 메시지의 토큰으로 인증 (실패 시 None)"""
+    authorization = websocket.headers.get("authorization", "")
+    token = authorization[7:].strip() if authorization.lower().startswith("bearer ") else None
+    try:
+        if token is None:
+            message = await asyncio.wait_for(
+                websocket.receive_text(), timeout=settings.WS_INGEST_AUTH_TIMEOUT_SEC
+            )
+            auth = json.loads(message)
+            if not isinstance(auth, dict) or auth.get("type") != "auth":
+                raise InvalidTokenError("첫 메시지는 {\"type\": \"auth\", \"token\": ...} 이어야 합니다")
+            token = auth.get("token")
+        return verify_device_token(token)
+    except WebSocketDisconnect:
+        return None
+    except asyncio.TimeoutError:
+        detail = "인증 시간이 초과되었습니다"
+    except (InvalidTokenError, ValueError, KeyError) as e:
+        detail = str(e) or "인증에 실패했습니다"
+
+    await websocket.send_json({"type": "error", "detail": detail})
+    await websocket.close(code=WS_POLICY_VIOLATION)
+    return None
+
+
+async def foreign_devices(subject: str, device_ids: Iterable[Optional[str]]) -> List[str]:
+    """토큰 주체에 속하지 않는 device_id 목록
+
+    주체 자신(디바이스 토큰) 또는 주체 사용자에게 할당된 디바이스(디바이스 레지스트리)만 허용합니다.
+    device_id가 없는 프레임은 여기서 거르지 않고 적재 단계의 검증 오류로 보고합니다.
+    """
+    candidates = {device_id for device_id in device_ids if device_id and device_id != subject}
+    if not candidates:
+        return []
+    await device_registry.resolve_missing(candidates)
+    foreign = []
+    for device_id in candidates:
+        context = device_registry.get(device_id)
+        if context is None or context.user_id != subject:
+            foreign.append(device_id)
+    return sorted(foreign)
+
+
+class _IngestSession:
+    """연결 하나의 프레임 버퍼와 ack 상태"""
+
+    def __init__(self, websocket: WebSocket, subject: str, on_conflict: Optional[str]):
+        self.websocket = websocket
+        self.subject = subject
+        self.on_conflict = on_conflict
+        self.max_frames = settings.WS_INGEST_ACK_MAX_FRAMES
+        self.interval = settings.WS_INGEST_ACK_INTERVAL_MS / 1000.0
+        self.pending: List[Dict[str, Any]] = []
+        self.acked = 0
+        self.last_flush = time.monotonic()
+
+    def _timeout(self) -> Optional[float]:
+        """버퍼가 비어 있으면 무한 대기, 아니면 다음 플러시까지 남은 시간"""
+        if not self.pending:
+            return None
+        return max(self.interval - (time.monotonic() - self.last_flush), 0)
+
+    async def _send_ack(self, response):
+        """적재 결과를 ack로 전송 (오류 항목의 index는 연결 기준 누적 위치)"""
+        base = self.acked
+        self.acked += response.total
+        await self.websocket.send_json({
+            "type": "ack",
+            "through": self.acked,
+            "received": response.total,
+            "created": response.created,
+            "updated": response.updated,
+            "duplicates": response.duplicates,
+            "failed": response.failed,
+            "errors": [
+                {**json.loads(result.json()), "index": base + result.index}
+                for result in response.results
+                if result.status not in ("created", "updated", "duplicate")
+            ],
+        })
+
+    async def _send_error(self, detail: Any, frames: int):
+        """요청 단위 오류 전송 (해당 프레임은 처리 완료로 간주)"""
+        self.acked += frames
+        await self.websocket.send_json({"type": "error", "through": self.acked, "detail": detail})
+
+    async def _forbidden(self, foreign: List[str], frames: int) -> bool:
+        """토큰 주체에 속하지 않는 디바이스가 있으면 해당 메시지의 프레임을 거부"""
+        if not foreign:
+            return False
+        self.acked += frames
+        await self.websocket.send_json({
+            "type": "error",
+            "through": self.acked,
+            "rejected": frames,
+            "device_ids": foreign[:20],
+            "detail": "인증된 주체에 속하지 않는 디바이스의 프레임입니다",
+        })
+        return True
+
+    async def _rate_limited(self, readings, frames: int) -> bool:
+        """속도 제한 초과 시 해당 메시지의 프레임을 거부"""
+        if not ingest_rate_limiter.enabled:
+            return False
+        retry_after = ingest_rate_limiter.acquire(readings)
+        if retry_after <= 0:
+            return False
+        self.acked += frames
+        await self.websocket.send_json({
+            "type": "error",
+            "through": self.acked,
+            "rejected": frames,
+            "retry_after": round(retry_after, 3),
+            "detail": "수집 속도 제한을 초과했습니다",
+        })
+        return True
+
+    async def flush(self, send_ack: bool = True):
+        """버퍼링된 프레임 적재"""
+        frames, self.pending = self.pending, []
+        self.last_flush = time.monotonic()
+        if not frames:
+            return
+
+        try:
+            # 장시간 연결이 커넥션을 점유하지 않도록 플러시마다 세션을 새로 염
+            async with AsyncSessionLocal() as db:
+                response = await container.get_ingest_service(db).ingest(frames, self.on_conflict)
+        except HTTPException as e:
+            if send_ack:
+                await self._send_error(e.detail, len(frames))
+            return
+
+        if send_ack:
+            await self._send_ack(response)
+        else:
+            logger.info(f"WebSocket 연결 종료 시 잔여 프레임 적재: {response.created}/{response.total}건")
+
+    async def handle_text(self, text: str):
+        """JSON 프레임(객체 또는 배열) 버퍼링"""
+        try:
+            message = json.loads(text)
+        except ValueError as e:
+            await self.websocket.send_json({"type": "error", "through": self.acked, "detail": f"JSON 파싱 실패: {e}"})
+            return
+
+        if isinstance(message, dict):
+            if message.get("type") == "ping":
+                await self.websocket.send_json({"type": "pong", "through": self.acked})
+                return
+            message = [message]
+        if not isinstance(message, list):
+            await self.websocket.send_json({"type": "error", "through": self.acked, "detail": "프레임 객체 또는 배열이어야 합니다"})
+            return
+
+        readings = frame_readings(message)
+        # 버퍼에 남은 프레임이 먼저 ack되어야 through 순서가 맞음
+        foreign = await foreign_devices(self.subject, (device_id for device_id, _ in readings))
+        if (foreign or ingest_rate_limiter.enabled) and self.pending:
+            await self.flush()
+        if await self._forbidden(foreign, len(message)):
+            return
+        if await self._rate_limited(readings, len(message)):
+            return
+
+        self.pending.extend(message)
+        if len(self.pending) >= self.max_frames:
+            await self.flush()
+
+    async def handle_bytes(self, body: bytes):
+        """msgpack 압축 문서 적재 (순서 보장을 위해 버퍼를 먼저 비움)"""
+        await self.flush()
+        readings = extract_readings("ingest", None, "application/msgpack", body)
+        foreign = await foreign_devices(self.subject, (device_id for device_id, _ in readings))
+        if await self._forbidden(foreign, len(readings)):
+            return
+        if await self._rate_limited(readings, len(readings)):
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                response = await container.get_ingest_service(db).ingest_compact(
+                    body, "application/msgpack", self.on_conflict
+                )
+        except HTTPException as e:
+            await self._send_error(e.detail, len(readings))
+            return
+        await self._send_ack(response)
+
+    async def run(self):
+        """수신 루프: 개수 또는 시간 임계값에 도달하면 적재 후 ack"""
+        while True:
+            try:
+                message = await asyncio.wait_for(self.websocket.receive(), timeout=self._timeout())
+            except asyncio.TimeoutError:
+                message = None
+
+            if message is not None:
+                if message["type"] == "websocket.disconnect":
+                    # ack를 받지 못한 프레임은 디바이스가 재전송하므로 멱등 모드에서는 중복 없이 처리됨
+                    await self.flush(send_ack=False)
+                    return
+                if message.get("bytes") is not None:
+                    await self.handle_bytes(message["bytes"])
+                elif message.get("text") is not None:
+                    await self.handle_text(message["text"])
+
+            if self.pending and time.monotonic() - self.last_flush >= self.interval:
+                await self.flush()
+
+
+@router.websocket("/ingest")
+async def websocket_ingest(
+    websocket: WebSocket,
+    on_conflict: Optional[str] = Query("nothing", pattern="^(nothing|update)$")
+):
+    """
+    WebSocket 통합 수집
+
+    재연결 후 ack를 받지 못한 프레임을 재전송해도 중복 적재되지 않도록 기본값은 `on_conflict=nothing`입니다.
+    """
+    await websocket.accept()
+    subject = await _authenticate(websocket)
+    if subject is None:
+        return
+
+    logger.info(f"WebSocket 수집 연결: {subject}")
+    session = _IngestSession(websocket, subject, on_conflict)
+    try:
+        await session.run()
+    except WebSocketDisconnect:
+        await session.flush(send_ack=False)
+    logger.info(f"WebSocket 수집 종료: {subject} (누적 {session.acked}건)")
@@ -25,6 +25,8 @@ class Settings(BaseSettings):
     DB_HOST: str = Field(..., env="DB_HOST")
     DB_PORT: int = Field(..., env="DB_PORT")
     DB_NAME: str = Field(..., env="DB_NAME")
+    DB_POOL_SIZE: int = Field(default=5, env="DB_POOL_SIZE")
+    DB_MAX_OVERFLOW: int = Field(default=10, env="DB_MAX_OVERFLOW")
     
     @property
     def DATABASE_URL(self) -> str:
@@ -40,6 +42,8 @@ class Settings(BaseSettings):
     REDIS_HOST: str = Field(..., env="REDIS_HOST")
     REDIS_PORT: int = Field(..., env="REDIS_PORT")
     REDIS_DB: int = Field(default=0, env="REDIS_DB")
+    REDIS_MAX_CONNECTIONS: int = Field(default=50, env="REDIS_MAX_CONNECTIONS")
+    REDIS_SOCKET_TIMEOUT_SEC: float = Field(default=5.0, env="REDIS_SOCKET_TIMEOUT_SEC")
     
     # Caddy 설정
     CADDY_DOMAIN: str = Field(..., env="CADDY_DOMAIN")
@@ -58,6 +62,67 @@ class Settings(BaseSettings):
     # CORS 설정
     ALLOWED_HOSTS: list = Field(default=["*"], env="ALLOWED_HOSTS")
     
+    # 수집(write-behind) 설정
+    INGEST_WRITE_BEHIND: bool = Field(default=False, env="INGEST_WRITE_BEHIND")
+    INGEST_QUEUE_MAX_SIZE: int = Field(default=10000, env="INGEST_QUEUE_MAX_SIZE")
+    INGEST_FLUSH_MAX_ROWS: int = Field(default=500, env="INGEST_FLUSH_MAX_ROWS")
+    INGEST_FLUSH_INTERVAL_MS: int = Field(default=200, env="INGEST_FLUSH_INTERVAL_MS")
+    INGEST_RETRY_BASE_MS: int = Field(default=500, env="INGEST_RETRY_BASE_MS")
+    INGEST_RETRY_MAX_MS: int = Field(default=30000, env="INGEST_RETRY_MAX_MS")
+    WS_INGEST_ACK_MAX_FRAMES: int = Field(default=200, env="WS_INGEST_ACK_MAX_FRAMES")
+    WS_INGEST_ACK_INTERVAL_MS: int = Field(default=100, env="WS_INGEST_ACK_INTERVAL_MS")
+    WS_INGEST_AUTH_TIMEOUT_SEC: float = Field(default=5.0, env="WS_INGEST_AUTH_TIMEOUT_SEC")
+
+    # 디바이스 레지스트리 캐시 재적재 주기(초, 0이면 시작 시 1회만 적재)
+    DEVICE_REGISTRY_REFRESH_SEC: float = Field(default=300.0, env="DEVICE_REGISTRY_REFRESH_SEC")
+    # 캐시에 없는 디바이스를 DB에서 찾지 못했을 때 다시 조회하지 않는 시간(초)
+    DEVICE_REGISTRY_MISS_TTL_SEC: float = Field(default=10.0, env="DEVICE_REGISTRY_MISS_TTL_SEC")
+
+    # 수집 속도 제한 설정 (초당 측정값 수 / 버스트)
+    INGEST_RATE_LIMIT_ENABLED: bool = Field(default=True, env="INGEST_RATE_LIMIT_ENABLED")
+    INGEST_DEVICE_RATE: float = Field(default=50.0, env="INGEST_DEVICE_RATE")
+    INGEST_DEVICE_BURST: float = Field(default=500.0, env="INGEST_DEVICE_BURST")
+    INGEST_SENSOR_TYPE_RATE: float = Field(default=1000.0, env="INGEST_SENSOR_TYPE_RATE")
+    INGEST_SENSOR_TYPE_BURST: float = Field(default=5000.0, env="INGEST_SENSOR_TYPE_BURST")
+
+    # 시간/일 단위 롤업 설정 (롤업 테이블 생성 후 활성화)
+    ROLLUP_ENABLED: bool = Field(default=False, env="ROLLUP_ENABLED")
+    ROLLUP_INTERVAL_SEC: float = Field(default=60.0, env="ROLLUP_INTERVAL_SEC")
+    ROLLUP_LATE_WINDOW_HOURS: int = Field(default=2, env="ROLLUP_LATE_WINDOW_HOURS")
+    ROLLUP_MAX_HOURS_PER_RUN: int = Field(default=168, env="ROLLUP_MAX_HOURS_PER_RUN")
+
+    # 디바이스 최신 측정값 테이블 사용 여부 (device_latest 테이블 생성 후 활성화)
+    LATEST_VALUES_ENABLED: bool = Field(default=False, env="LATEST_VALUES_ENABLED")
+
+    # raw_payload 핫 키 생성 컬럼 사용 여부 (create_payload_columns.py 실행 후 활성화)
+    PAYLOAD_COLUMNS_ENABLED: bool = Field(default=False, env="PAYLOAD_COLUMNS_ENABLED")
+
+    # time RANGE 파티션 관리 설정 (partition_tables.py로 변환 후 활성화, 보존 0개월은 무제한)
+    PARTITIONING_ENABLED: bool = Field(default=False, env="PARTITIONING_ENABLED")
+    PARTITION_INTERVAL_MONTHS: int = Field(default=1, env="PARTITION_INTERVAL_MONTHS")
+    PARTITION_PREMAKE: int = Field(default=3, env="PARTITION_PREMAKE")
+    PARTITION_RETENTION_MONTHS: int = Field(default=0, env="PARTITION_RETENTION_MONTHS")
+    PARTITION_EXPIRE_ACTION: str = Field(default="detach", env="PARTITION_EXPIRE_ACTION")
+    PARTITION_MAINTENANCE_INTERVAL_SEC: float = Field(default=3600.0, env="PARTITION_MAINTENANCE_INTERVAL_SEC")
+
+    # 원시 센서 데이터 Parquet 아카이브 설정 (ARCHIVE_HOT_DAYS보다 오래된 행을 옮김, pyarrow 필요)
+    ARCHIVE_ENABLED: bool = Field(default=False, env="ARCHIVE_ENABLED")
+    ARCHIVE_DIR: str = Field(default="./archive", env="ARCHIVE_DIR")
+    ARCHIVE_HOT_DAYS: int = Field(default=90, env="ARCHIVE_HOT_DAYS")
+    ARCHIVE_COMPRESSION: str = Field(default="zstd", env="ARCHIVE_COMPRESSION")
+    # 통계 조회가 아카이브 구간에 걸칠 때 허용하는 최대 일수/행 수 (초과하면 400, 긴 구간은 /buckets 롤업 사용)
+    ARCHIVE_STATS_MAX_DAYS: int = Field(default=31, env="ARCHIVE_STATS_MAX_DAYS")
+    ARCHIVE_STATS_MAX_ROWS: int = Field(default=5000, env="ARCHIVE_STATS_MAX_ROWS")
+
+    # 대량 내보내기 묶음(record batch) 행 수
+    EXPORT_BATCH_ROWS: int = Field(default=10000, env="EXPORT_BATCH_ROWS")
+
+    # Redis 읽기 캐시 설정 (응답 형식이 바뀌면 CACHE_VERSION을 올려 이전 키를 버림)
+    CACHE_ENABLED: bool = Field(default=False, env="CACHE_ENABLED")
+    CACHE_TTL_SEC: int = Field(default=60, env="CACHE_TTL_SEC")
+    CACHE_VERSION: int = Field(default=1, env="CACHE_VERSION")
+    CACHE_RETRY_SEC: float = Field(default=30.0, env="CACHE_RETRY_SEC")
+
     # 로깅 설정
     LOG_FILE_PATH: str = Field(default="./logs/app.log", env="LOG_FILE_PATH")
     LOG_MAX_SIZE: str = Field(default="100MB", env="LOG_MAX_SIZE")
@@ -4,9 +4,10 @@
 애플리케이션의 모든 의존성을 관리하고 제공합니다.
 """
 
-from typing import AsyncGenerator, Dict, Any
+from typing import AsyncGenerator, Dict, Any, Type
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
+from pydantic import BaseModel
 
 from app.infrastructure.database import get_db_session
 from app.interfaces.repositories.user_repository import IUserRepository
@@ -36,6 +37,11 @@ from app.interfaces.repositories.actuator_repository import (
     IActuatorServoRepository
 )
 from app.interfaces.repositories.device_rtc_repository import IDeviceRTCStatusRepository
+from app.interfaces.repositories.bulk_insert_repository import IBulkInsertRepository
+from app.interfaces.repositories.sensor_bucket_repository import ISensorBucketRepository
+from app.interfaces.repositories.sensor_rollup_repository import ISensorRollupRepository
+from app.interfaces.repositories.latest_readings_repository import ILatestReadingsRepository
+from app.interfaces.repositories.export_repository import IExportRepository
 from app.interfaces.services.user_service_interface import IUserService
 from app.interfaces.services.user_relationship_service_interface import IUserRelationshipService
 from app.interfaces.services.user_profile_service_interface import IUserProfileService
@@ -62,6 +68,11 @@ from app.interfaces.services.actuator_service_interface import (
     IActuatorServoService
 )
 from app.interfaces.services.device_rtc_service_interface import IDeviceRTCStatusService
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
+from app.interfaces.services.ingest_service_interface import IIngestService
+from app.interfaces.services.latest_readings_service_interface import ILatestReadingsService
+from app.interfaces.services.export_service_interface import IExportService
 
 
 class DependencyContainer:
@@ -171,6 +182,31 @@ class DependencyContainer:
         from app.infrastructure.repositories.device_rtc_repository import DeviceRTCStatusRepository
         return DeviceRTCStatusRepository(db_session)
     
+    def get_bulk_insert_repository(self, db_session: AsyncSession) -> IBulkInsertRepository:
+        """대량 적재 리포지토리 제공"""
+        from app.infrastructure.repositories.bulk_insert_repository import BulkInsertRepository
+        return BulkInsertRepository(db_session)
+    
+    def get_sensor_bucket_repository(self, db_session: AsyncSession) -> ISensorBucketRepository:
+        """시간 버킷 집계 리포지토리 제공"""
+        from app.infrastructure.repositories.sensor_bucket_repository import SensorBucketRepository
+        return SensorBucketRepository(db_session)
+    
+    def get_sensor_rollup_repository(self, db_session: AsyncSession) -> ISensorRollupRepository:
+        """센서 롤업 리포지토리 제공"""
+        from app.infrastructure.repositories.sensor_rollup_repository import SensorRollupRepository
+        return SensorRollupRepository(db_session)
+    
+    def get_latest_readings_repository(self) -> ILatestReadingsRepository:
+        """최신 측정값 일괄 조회 리포지토리 제공 (조회마다 세션을 따로 열어 동시 실행)"""
+        from app.infrastructure.repositories.latest_readings_repository import LatestReadingsRepository
+        return LatestReadingsRepository()
+    
+    def get_export_repository(self) -> IExportRepository:
+        """대량 내보내기 리포지토리 제공 (스트리밍 동안 커서를 유지하도록 세션을 따로 엶)"""
+        from app.infrastructure.repositories.export_repository import ExportRepository
+        return ExportRepository()
+    
     def get_user_service(self, db_session: AsyncSession) -> IUserService:
         """사용자 서비스 제공"""
         from app.use_cases.user_service import UserService
@@ -273,6 +309,47 @@ class DependencyContainer:
         device_rtc_repository = self.get_device_rtc_repository(db_session)
         return DeviceRTCStatusService(device_rtc_repository)
     
+    def get_sensor_batch_service(
+        self,
+        db_session: AsyncSession,
+        model: Type[Any],
+        create_schema: Type[BaseModel]
+    ) -> ISensorBatchService:
+        """센서 배치 수집 서비스 제공"""
+        from app.use_cases.sensor_batch_service import SensorBatchService
+        bulk_insert_repository = self.get_bulk_insert_repository(db_session)
+        return SensorBatchService(bulk_insert_repository, model, create_schema)
+    
+    def get_sensor_bucket_service(self, db_session: AsyncSession, sensor_type: str) -> ISensorBucketService:
+        """시간 버킷 다운샘플링 서비스 제공 (sensor_type은 센서 레지스트리 이름)
+
+        롤업 작업이 활성화되어 있으면 롤업 계층을 함께 사용합니다.
+        """
+        from app.infrastructure.rollup_worker import sensor_rollup_worker
+        from app.infrastructure.sensor_registry import get_sensor_spec
+        from app.use_cases.sensor_bucket_service import SensorBucketService
+        sensor_bucket_repository = self.get_sensor_bucket_repository(db_session)
+        sensor_rollup_repository = (
+            self.get_sensor_rollup_repository(db_session) if sensor_rollup_worker.enabled else None
+        )
+        return SensorBucketService(sensor_bucket_repository, get_sensor_spec(sensor_type), sensor_rollup_repository)
+    
+    def get_latest_readings_service(self) -> ILatestReadingsService:
+        """최신 측정값 일괄 조회 서비스 제공"""
+        from app.use_cases.latest_readings_service import LatestReadingsService
+        return LatestReadingsService(self.get_latest_readings_repository())
+    
+    def get_export_service(self) -> IExportService:
+        """대량 내보내기 서비스 제공"""
+        from app.use_cases.export_service import ExportService
+        return ExportService(self.get_export_repository())
+    
+    def get_ingest_service(self, db_session: AsyncSession) -> IIngestService:
+        """통합 수집 서비스 제공"""
+        from app.use_cases.ingest_service import IngestService
+        bulk_insert_repository = self.get_bulk_insert_repository(db_session)
+        return IngestService(bulk_insert_repository)
+    
     def get_user_relationship_repository(self, db_session: AsyncSession) -> IUserRelationshipRepository:
         """사용자 관계 리포지토리 제공"""
         from app.infrastructure.repositories.user_relationship_repository import UserRelationshipRepository
@@ -295,56 +372,38 @@ class DependencyContainer:
         user_profile_repository = self.get_user_profile_repository(db_session)
         return UserProfileService(user_profile_repository)
 
-    def get_home_state_snapshot_repository(self) -> IHomeStateSnapshotRepository:
+    def get_home_state_snapshot_repository(self, db_session: AsyncSession) -> IHomeStateSnapshotRepository:
         """홈 상태 스냅샷 리포지토리 의존성 주입"""
-        if "home_state_snapshot_repository" not in self._repositories:
-            from app.infrastructure.repositories.home_state_snapshot_repository import HomeStateSnapshotRepository
-            from app.infrastructure.database import get_db
-            db = next(get_db())
-            self._repositories["home_state_snapshot_repository"] = HomeStateSnapshotRepository(db)
-        return self._repositories["home_state_snapshot_repository"]
-    
-    def get_sensor_event_button_repository(self) -> ISensorEventButtonRepository:
+        from app.infrastructure.repositories.home_state_snapshot_repository import HomeStateSnapshotRepository
+        return HomeStateSnapshotRepository(db_session)
+    
+    def get_sensor_event_button_repository(self, db_session: AsyncSession) -> ISensorEventButtonRepository:
         """버튼 이벤트 센서 리포지토리 의존성 주입"""
-        if "sensor_event_button_repository" not in self._repositories:
-            from app.infrastructure.repositories.sensor_event_button_repository import SensorEventButtonRepository
-            from app.infrastructure.database import get_db
-            db = next(get_db())
-            self._repositories["sensor_event_button_repository"] = SensorEventButtonRepository(db)
-        return self._repositories["sensor_event_button_repository"]
-    
-    def get_home_state_snapshot_service(self) -> IHomeStateSnapshotService:
+        from app.infrastructure.repositories.sensor_event_button_repository import SensorEventButtonRepository
+        return SensorEventButtonRepository(db_session)
+    
+    def get_home_state_snapshot_service(self, db_session: AsyncSession) -> IHomeStateSnapshotService:
         """홈 상태 스냅샷 서비스 의존성 주입"""
-        if "home_state_snapshot_service" not in self._services:
-            from app.use_cases.home_state_snapshot_service import HomeStateSnapshotService
-            repository = self.get_home_state_snapshot_repository()
-            self._services["home_state_snapshot_service"] = HomeStateSnapshotService(repository)
-        return self._services["home_state_snapshot_service"]
+        from app.use_cases.home_state_snapshot_service import HomeStateSnapshotService
+        repository = self.get_home_state_snapshot_repository(db_session)
+        return HomeStateSnapshotService(repository)
     
-    def get_sensor_event_button_service(self) -> ISensorEventButtonService:
+    def get_sensor_event_button_service(self, db_session: AsyncSession) -> ISensorEventButtonService:
         """버튼 이벤트 센서 서비스 의존성 주입"""
-        if "sensor_event_button_service" not in self._services:
-            from app.use_cases.sensor_event_button_service import SensorEventButtonService
-            repository = self.get_sensor_event_button_repository()
-            self._services["sensor_event_button_service"] = SensorEventButtonService(repository)
-        return self._services["sensor_event_button_service"]
+        from app.use_cases.sensor_event_button_service import SensorEventButtonService
+        repository = self.get_sensor_event_button_repository(db_session)
+        return SensorEventButtonService(repository)
 
-    def get_sensor_raw_temperature_repository(self) -> ISensorRawTemperatureRepository:
+    def get_sensor_raw_temperature_repository(self, db_session: AsyncSession) -> ISensorRawTemperatureRepository:
         """온도 센서 원시 데이터 리포지토리 의존성 주입"""
-        if "sensor_raw_temperature_repository" not in self._repositories:
-            from app.infrastructure.repositories.sensor_raw_temperature_repository import SensorRawTemperatureRepository
-            from app.infrastructure.database import get_db
-            db = next(get_db())
-            self._repositories["sensor_raw_temperature_repository"] = SensorRawTemperatureRepository(db)
-        return self._repositories["sensor_raw_temperature_repository"]
-    
-    def get_sensor_raw_temperature_service(self) -> ISensorRawTemperatureService:
+        from app.infrastructure.repositories.sensor_raw_temperature_repository import SensorRawTemperatureRepository
+        return SensorRawTemperatureRepository(db_session)
+    
+    def get_sensor_raw_temperature_service(self, db_session: AsyncSession) -> ISensorRawTemperatureService:
         """온도 센서 원시 데이터 서비스 의존성 주입"""
-        if "sensor_raw_temperature_service" not in self._services:
-            from app.use_cases.sensor_raw_temperature_service import SensorRawTemperatureService
-            repository = self.get_sensor_raw_temperature_repository()
-            self._services["sensor_raw_temperature_service"] = SensorRawTemperatureService(repository)
-        return self._services["sensor_raw_temperature_service"]
+        from app.use_cases.sensor_raw_temperature_service import SensorRawTemperatureService
+        repository = self.get_sensor_raw_temperature_repository(db_session)
+        return SensorRawTemperatureService(repository)
 
 
 # 전역 컨테이너 인스턴스
@@ -508,34 +567,28 @@ def get_user_profile_service(db_session: AsyncSession = Depends(get_db_session))
     return container.get_user_profile_service(db_session) 
 
 # 홈 상태 스냅샷 의존성 주입 함수
-def get_home_state_snapshot_repository() -> IHomeStateSnapshotRepository:
+def get_home_state_snapshot_repository(db_session: AsyncSession = Depends(get_db_session)) -> IHomeStateSnapshotRepository:
     """홈 상태 스냅샷 리포지토리 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_home_state_snapshot_repository()
+    return container.get_home_state_snapshot_repository(db_session)
 
-def get_home_state_snapshot_service() -> IHomeStateSnapshotService:
+def get_home_state_snapshot_service(db_session: AsyncSession = Depends(get_db_session)) -> IHomeStateSnapshotService:
     """홈 상태 스냅샷 서비스 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_home_state_snapshot_service()
+    return container.get_home_state_snapshot_service(db_session)
 
 # 버튼 이벤트 센서 의존성 주입 함수
-def get_sensor_event_button_repository() -> ISensorEventButtonRepository:
+def get_sensor_event_button_repository(db_session: AsyncSession = Depends(get_db_session)) -> ISensorEventButtonRepository:
     """버튼 이벤트 센서 리포지토리 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_sensor_event_button_repository()
+    return container.get_sensor_event_button_repository(db_session)
 
-def get_sensor_event_button_service() -> ISensorEventButtonService:
+def get_sensor_event_button_service(db_session: AsyncSession = Depends(get_db_session)) -> ISensorEventButtonService:
     """버튼 이벤트 센서 서비스 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_sensor_event_button_service() 
+    return container.get_sensor_event_button_service(db_session) 
 
 # 온도 센서 원시 데이터 의존성 주입 함수
-def get_sensor_raw_temperature_repository() -> ISensorRawTemperatureRepository:
+def get_sensor_raw_temperature_repository(db_session: AsyncSession = Depends(get_db_session)) -> ISensorRawTemperatureRepository:
     """온도 센서 원시 데이터 리포지토리 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_sensor_raw_temperature_repository()
+    return container.get_sensor_raw_temperature_repository(db_session)
 
-def get_sensor_raw_temperature_service() -> ISensorRawTemperatureService:
+def get_sensor_raw_temperature_service(db_session: AsyncSession = Depends(get_db_session)) -> ISensorRawTemperatureService:
     """온도 센서 원시 데이터 서비스 의존성 주입"""
-    container = DependencyContainer()
-    return container.get_sensor_raw_temperature_service() 
\ No newline at end of file
+    return container.get_sensor_raw_temperature_service(db_session) 
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Core 미들웨어 모듈
+
+수집 라우트 앞단에서 디바이스별/센서 타입별 속도 제한을 적용합니다.
+본문을 읽어 측정값의 (device_id, sensor_type)을 세고, 한도를 넘으면
+라우트(및 DB 세션)에 도달하기 전에 429와 Retry-After로 거부합니다.
+"""
+
+import json
+import math
+from typing import Any, List, Optional, Tuple
+
+from app.infrastructure.rate_limiter import IngestRateLimiter
+
+# 속도 제한 대상 경로: /api/<센서>/create, /api/<센서>/create-batch, /api/ingest
+# (/api/ingest/stream은 본문을 버퍼링하지 않도록 제외하고 IngestService.ingest_stream이 적재 버퍼마다 확인,
+#  /ws/ingest는 메시지 단위로 확인)
+API_PREFIX = "/api/"
+
+
+def _ingest_route(path: str) -> Optional[Tuple[str, Optional[str]]]:
+    """수집 경로면 (종류, 센서 타입) 반환, 아니면 None"""
+    if not path.startswith(API_PREFIX):
+        return None
+    parts = path[len(API_PREFIX):].strip("/").split("/")
+    if parts == ["ingest"]:
+        return "ingest", None
+    if len(parts) == 2 and parts[1] in ("create", "create-batch"):
+        from app.infrastructure.sensor_registry import get_sensor_spec
+        spec = get_sensor_spec(parts[0])
+        if spec is not None:
+            return parts[1], spec.sensor_type
+    return None
+
+
+def _frame_device(frame: Any) -> Optional[str]:
+    device_id = frame.get("device_id") if isinstance(frame, dict) else None
+    return device_id if isinstance(device_id, str) else None
+
+
+def frame_readings(frames: List[Any]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """통합 수집 프레임(`sensor_type` 포함) 목록에서 (device_id, sensor_type) 목록 추출"""
+    from app.infrastructure.sensor_registry import get_sensor_spec
+
+    readings = []
+    for frame in frames:
+        frame_type = frame.get("sensor_type") if isinstance(frame, dict) else None
+        spec = get_sensor_spec(frame_type) if isinstance(frame_type, str) else None
+        readings.append((_frame_device(frame), spec.sensor_type if spec else None))
+    return readings
+
+
+def extract_readings(kind: str, sensor_type: Optional[str], content_type: str, body: bytes) -> List[Tuple[Optional[str], Optional[str]]]:
+    """요청 본문에서 (device_id, sensor_type) 목록 추출
+
+    해석할 수 없는 본문은 빈 목록을 반환하며, 검증 오류는 라우트가 보고합니다.
+    """
+    from app.infrastructure.compact_codec import COMPACT_CODES, CompactDecodeError, is_compact_content_type, unpack_body
+
+    if kind == "ingest" and is_compact_content_type(content_type):
+        try:
+            document = unpack_body(body, content_type)
+        except CompactDecodeError:
+            return []
+        if not isinstance(document, dict) or not isinstance(document.get("f"), list):
+            return []
+        devices = document.get("d") if isinstance(document.get("d"), list) else []
+        readings = []
+        for frame in document["f"]:
+            if not isinstance(frame, (list, tuple)) or len(frame) < 3:
+                continue
+            entry = COMPACT_CODES.get(frame[0])
+            index = frame[2]
+            device_id = devices[index] if isinstance(index, int) and 0 <= index < len(devices) else None
+            readings.append((device_id if isinstance(device_id, str) else None, entry.sensor_type if entry else None))
+        return readings
+
+    try:
+        document = json.loads(body)
+    except ValueError:
+        return []
+
+    if kind == "create":
+        return [(_frame_device(document), sensor_type)]
+    if kind == "create-batch":
+        return [(_frame_device(item), sensor_type) for item in document] if isinstance(document, list) else []
+
+    frames = document.get("frames") if isinstance(document, dict) else None
+    return frame_readings(frames) if isinstance(frames, list) else []
+
+
+class IngestRateLimitMiddleware:
+    """수집 라우트 토큰 버킷 속도 제한 ASGI 미들웨어"""
+
+    def __init__(self, app, limiter: IngestRateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not self.limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+        route = _ingest_route(scope["path"])
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 본문을 모두 읽은 뒤 라우트에는 같은 본문을 다시 전달
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                await self.app(scope, receive, send)
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+
+        content_type = ""
+        for name, value in scope.get("headers", []):
+            if name == b"content-type":
+                content_type = value.decode("latin-1")
+                break
+
+        retry_after = self.limiter.acquire(extract_readings(route[0], route[1], content_type, body))
+        if retry_after > 0:
+            await self._reject(send, retry_after)
+            return
+
+        replayed = False
+
+        async def replay():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay, send)
+
+    @staticmethod
+    async def _reject(send, retry_after: float):
+        """429 Too Many Requests 응답"""
+        seconds = max(1, math.ceil(retry_after))
+        content = json.dumps(
+            {"detail": f"수집 속도 제한을 초과했습니다. {seconds}초 후 다시 시도하세요", "retry_after": round(retry_after, 3)},
+            ensure_ascii=False
+        ).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(content)).encode()),
+                (b"retry-after", str(seconds).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": content})
@@ -0,0 +1,43 @@
+"""
+Core 보안 모듈
+
+디바이스 JWT 발급/검증을 담당합니다.
+토큰은 `SECRET_KEY`/`ALGORITHM` 설정으로 서명되며 `sub`에 디바이스(또는 게이트웨이) ID를 담습니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+
+class InvalidTokenError(ValueError):
+    """토큰이 없거나 유효하지 않을 때 발생"""
+
+
+def create_device_token(device_id: str, expires_minutes: Optional[int] = None) -> str:
+    """디바이스용 접근 토큰 발급
+
+    expires_minutes를 지정하지 않으면 `ACCESS_TOKEN_EXPIRE_MINUTES`를 사용합니다.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(
+        minutes=expires_minutes if expires_minutes is not None else settings.ACCESS_TOKEN_EXPIRE_MINUTES
+    )
+    return jwt.encode({"sub": device_id, "exp": expire}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def verify_device_token(token: Optional[str]) -> str:
+    """디바이스 토큰 검증 후 주체(sub) 반환"""
+    if not token:
+        raise InvalidTokenError("인증 토큰이 필요합니다")
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError as e:
+        raise InvalidTokenError(f"유효하지 않은 토큰입니다: {e}")
+
+    subject = payload.get("sub")
+    if not subject:
+        raise InvalidTokenError("토큰에 주체(sub)가 없습니다")
+    return subject
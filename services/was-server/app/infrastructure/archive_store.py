@@ -0,0 +1,438 @@
+"""
+원시 센서 데이터 Parquet 아카이브 모듈
+
+raw_payload만 가진 원시 센서 테이블(sensor_raw_mq5 등)의 오래된 행을 압축 Parquet 파일로 옮기고
+Postgres에서 삭제하여 저장 비용을 줄입니다. 파일은 `<루트>/<테이블>/day=YYYY-MM-DD/device_id=<디바이스>/data.parquet`
+(센서/일/디바이스)로 나누어 저장합니다.
+
+- 아카이브 작업(maintenance/database/archive_raw_data.py)은 ARCHIVE_HOT_DAYS보다 오래된 행을 일 단위로
+  파일에 병합 기록한 뒤 삭제하고, 테이블별 워터마크(이 시각 이전 행은 아카이브에 있음)를 올립니다.
+- 목록/통계 조회는 요청 구간이 워터마크 이전까지 걸치면 아카이브를 함께 읽습니다.
+  목록은 DB 결과가 limit보다 적을 때 아카이브 행으로 채우고,
+  통계는 아카이브 행을 임시 테이블에 배열 파라미터 INSERT 한 번으로 적재한 뒤
+  `원본 UNION ALL 임시 테이블`에서 같은 SQL로 집계합니다.
+  요청 안에서 적재하므로 아카이브 구간에 걸치는 통계는 start_time이 필요하며, 아카이브 구간이
+  ARCHIVE_STATS_MAX_DAYS일 또는 ARCHIVE_STATS_MAX_ROWS행(기본 5000)을 넘으면 `ArchiveRangeError`(400)로 거부합니다.
+  긴 과거 구간의 집계는 아카이브와 무관하게 남는 시간/일 롤업(`/buckets`)을 사용합니다.
+
+pyarrow 패키지가 필요합니다. (ARCHIVE_ENABLED=true일 때만 사용)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from urllib.parse import quote, unquote
+
+from sqlalchemy import Column, MetaData, Table, and_, delete, func, select, text, union_all
+from sqlalchemy.orm import aliased
+from sqlalchemy.schema import CreateTable
+
+from app.core.config import get_settings
+from app.infrastructure.models import (
+    SensorRawLoadCell, SensorRawMQ5, SensorRawMQ7, SensorRawRFID,
+    SensorRawSound, SensorRawTCRT5000, SensorRawUltrasonic
+)
+from app.infrastructure.pagination import Cursor
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+DAY = timedelta(days=1)
+
+# 아카이브 대상 모델 (time, device_id, raw_payload만 가진 원시 센서 테이블)
+ARCHIVED_MODELS: Tuple[Type[Any], ...] = (
+    SensorRawLoadCell, SensorRawMQ5, SensorRawMQ7, SensorRawRFID,
+    SensorRawSound, SensorRawTCRT5000, SensorRawUltrasonic,
+)
+
+WATERMARK_FILE = "_watermark"
+DATA_FILE = "data.parquet"
+
+
+class ArchiveUnavailableError(RuntimeError):
+    """아카이브를 사용할 수 없음 (pyarrow 미설치 등)"""
+
+
+class ArchiveRangeError(ValueError):
+    """통계 조회가 읽어야 할 아카이브 구간이 제한을 넘음 (서비스에서 400으로 응답)"""
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """naive 값은 UTC로 간주하여 aware 값으로 정규화 (Parquet 시각은 UTC aware)"""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def floor_day(value: datetime) -> datetime:
+    """UTC 기준 날짜 시작 시각 (naive 값은 UTC로 간주)"""
+    return as_utc(value).astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def days_between(start: datetime, end: datetime) -> List[datetime]:
+    """[start, end) 구간에 걸친 날짜 시작 시각 목록"""
+    days = []
+    day = floor_day(start)
+    while day < end:
+        days.append(day)
+        day += DAY
+    return days
+
+
+def merge_rows(existing: Iterable[Dict[str, Any]], rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """기존 파일 행과 새 행을 (time, device_id) 기준으로 병합 (같은 키는 새 행 우선, 시간순)"""
+    merged = {(row["time"], row["device_id"]): row for row in existing}
+    merged.update({(row["time"], row["device_id"]): row for row in rows})
+    return [merged[key] for key in sorted(merged)]
+
+
+def in_range(
+    row: Dict[str, Any],
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    cursor: Optional[Cursor] = None
+) -> bool:
+    """행이 조회 구간(start <= time <= end)과 커서 조건((time, device_id) < cursor)을 만족하는지 여부"""
+    time_value = row["time"]
+    if start_time is not None and time_value < start_time:
+        return False
+    if end_time is not None and time_value > end_time:
+        return False
+    if cursor is not None and (time_value, row["device_id"]) >= cursor:
+        return False
+    return True
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ArchiveUnavailableError("Parquet 아카이브를 사용하려면 pyarrow 패키지가 필요합니다")
+    return pyarrow
+
+
+class ArchiveStore:
+    """원시 센서 데이터 Parquet 아카이브 저장소
+
+    비활성화(`enabled=False`) 상태에서는 조회가 항상 Postgres만 읽습니다.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        compression: str = "zstd",
+        enabled: bool = False,
+        stats_max_days: int = 31,
+        stats_max_rows: int = 5000
+    ):
+        self.root = root
+        self.compression = compression
+        self.enabled = enabled
+        self.stats_max_days = stats_max_days
+        self.stats_max_rows = stats_max_rows
+
+    # ------------------------------------------------------------------ 파일 배치
+
+    def table_dir(self, table_name: str) -> str:
+        return os.path.join(self.root, table_name)
+
+    def day_dir(self, table_name: str, day: datetime) -> str:
+        return os.path.join(self.table_dir(table_name), f"day={day:%Y-%m-%d}")
+
+    def file_path(self, table_name: str, day: datetime, device_id: str) -> str:
+        """센서/일/디바이스 Parquet 파일 경로 (디바이스 ID는 경로에 안전하게 인코딩)"""
+        return os.path.join(self.day_dir(table_name, day), f"device_id={quote(device_id, safe='')}", DATA_FILE)
+
+    def device_ids(self, table_name: str, day: datetime) -> List[str]:
+        """해당 날짜에 아카이브된 디바이스 ID 목록"""
+        path = self.day_dir(table_name, day)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            unquote(name[len("device_id="):]) for name in os.listdir(path) if name.startswith("device_id=")
+        )
+
+    def watermark(self, table_name: str) -> Optional[datetime]:
+        """이 시각 이전 행은 아카이브에 있음 (아카이브한 적 없으면 None)"""
+        try:
+            with open(os.path.join(self.table_dir(table_name), WATERMARK_FILE), encoding="utf-8") as f:
+                return datetime.fromisoformat(f.read().strip())
+        except FileNotFoundError:
+            return None
+
+    def set_watermark(self, table_name: str, value: datetime):
+        os.makedirs(self.table_dir(table_name), exist_ok=True)
+        path = os.path.join(self.table_dir(table_name), WATERMARK_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            f.write(value.isoformat())
+        os.replace(f"{path}.tmp", path)
+
+    def advance_watermark(self, table_name: str, value: datetime):
+        """워터마크를 value까지 올림 (낮추지 않음)"""
+        watermark = self.watermark(table_name)
+        if watermark is None or watermark < value:
+            self.set_watermark(table_name, value)
+
+    def covers(self, model: Type[Any], start_time: Optional[datetime]) -> bool:
+        """조회 구간이 아카이브된 구간에 걸치는지 여부"""
+        if not self.enabled or model not in ARCHIVED_MODELS:
+            return False
+        watermark = self.watermark(model.__tablename__)
+        return watermark is not None and (start_time is None or as_utc(start_time) < watermark)
+
+    # ------------------------------------------------------------------ Parquet 읽기/쓰기
+
+    def read_file(self, path: str, decode_payload: bool = True) -> List[Dict[str, Any]]:
+        """Parquet 파일의 행 목록 (decode_payload면 raw_payload를 JSON 문자열에서 복원)"""
+        if not os.path.exists(path):
+            return []
+        pa = _pyarrow()
+        rows = pa.parquet.read_table(path).to_pylist()
+        if not decode_payload:
+            return rows
+        for row in rows:
+            if row.get("raw_payload") is not None:
+                row["raw_payload"] = json.loads(row["raw_payload"])
+        return rows
+
+    def write_file(self, path: str, rows: List[Dict[str, Any]]):
+        """행 목록을 Parquet 파일로 기록 (임시 파일에 쓴 뒤 교체)"""
+        pa = _pyarrow()
+        schema = pa.schema([
+            ("time", pa.timestamp("us", tz="UTC")),
+            ("device_id", pa.string()),
+            ("raw_payload", pa.string()),
+        ])
+        table = pa.Table.from_pylist([
+            {
+                "time": row["time"],
+                "device_id": row["device_id"],
+                "raw_payload": None if row.get("raw_payload") is None else json.dumps(row["raw_payload"], ensure_ascii=False),
+            }
+            for row in rows
+        ], schema=schema)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        pa.parquet.write_table(table, temp_path, compression=self.compression)
+        os.replace(temp_path, path)
+
+    def write_day(self, table_name: str, day: datetime, rows: List[Dict[str, Any]]) -> int:
+        """하루치 행을 디바이스별 파일에 병합 기록 (기록한 파일 수 반환, 다시 실행해도 중복되지 않음)"""
+        by_device: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_device.setdefault(row["device_id"], []).append(row)
+        for device_id, device_rows in by_device.items():
+            path = self.file_path(table_name, day, device_id)
+            self.write_file(path, merge_rows(self.read_file(path), device_rows))
+        return len(by_device)
+
+    def days(self, table_name: str) -> List[datetime]:
+        """아카이브 파일이 있는 날짜 시작 시각 목록 (오름차순)"""
+        path = self.table_dir(table_name)
+        if not os.path.isdir(path):
+            return []
+        return sorted(
+            datetime.strptime(name[len("day="):], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            for name in os.listdir(path) if name.startswith("day=")
+        )
+
+    def read_day(
+        self,
+        table_name: str,
+        day: datetime,
+        device_ids: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """하루치 아카이브 행을 (time, device_id) 오름차순으로 조회 (device_ids가 있으면 해당 디바이스만)"""
+        if device_ids is None:
+            device_ids = self.device_ids(table_name, day)
+        rows = [
+            row
+            for device_id in device_ids
+            for row in self.read_file(self.file_path(table_name, day, device_id))
+        ]
+        return sorted(rows, key=lambda row: (row["time"], row["device_id"]))
+
+    def read_rows(
+        self,
+        model: Type[Any],
+        device_id: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        cursor: Optional[Cursor] = None,
+        limit: Optional[int] = None,
+        decode_payload: bool = True
+    ) -> List[Dict[str, Any]]:
+        """아카이브 행을 (time, device_id) 내림차순으로 조회
+
+        최근 날짜부터 읽으며 limit이 있으면 그만큼 모이면 멈춥니다.
+        decode_payload=False면 raw_payload를 저장된 JSON 문자열 그대로 반환합니다.
+        """
+        table_name = model.__tablename__
+        if self.watermark(table_name) is None:
+            return []
+        start_time, end_time = as_utc(start_time), as_utc(end_time)
+        if cursor is not None:
+            cursor = (as_utc(cursor[0]), cursor[1])
+        rows: List[Dict[str, Any]] = []
+        for day in reversed(self.days(table_name)):
+            if end_time is not None and day > end_time:
+                continue
+            if start_time is not None and day + DAY <= start_time:
+                break
+            device_ids = [device_id] if device_id else self.device_ids(table_name, day)
+            day_rows = [
+                row
+                for current in device_ids
+                for row in self.read_file(self.file_path(table_name, day, current), decode_payload)
+                if in_range(row, start_time, end_time, cursor)
+            ]
+            rows.extend(sorted(day_rows, key=lambda row: (row["time"], row["device_id"]), reverse=True))
+            if limit is not None and len(rows) >= limit:
+                return rows[:limit]
+        return rows
+
+    # ------------------------------------------------------------------ 조회 연동
+
+    async def fill_rows(
+        self,
+        model: Type[Any],
+        rows: List[Dict[str, Any]],
+        device_id: Optional[str],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: int,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """DB 목록 조회 결과(Core 행 딕셔너리, 시간 역순)가 limit보다 적으면 아카이브 행으로 이어서 채움"""
+        if len(rows) >= limit or not self.covers(model, start_time):
+            return rows
+        if rows:
+            # DB 결과의 마지막 행 다음부터 (같은 페이지 안에서 순서 유지)
+            cursor = (rows[-1]["time"], rows[-1]["device_id"])
+        archived = await asyncio.to_thread(
+            self.read_rows, model, device_id, start_time, end_time, cursor, limit - len(rows)
+        )
+        return list(rows) + archived
+
+    async def source(
+        self,
+        db,
+        model: Type[Any],
+        device_id: Optional[str],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ):
+        """집계 쿼리의 원본 (아카이브 구간이 아니면 모델 그대로, 걸치면 원본 + 아카이브 행의 별칭)
+
+        아카이브 행은 트랜잭션 종료 시 삭제되는 임시 테이블에 열별 배열 파라미터(unnest) INSERT 한 번으로 적재하며,
+        raw_payload는 JSON 문자열 그대로 넘겨 Python에서 다시 파싱/직렬화하지 않습니다.
+        start_time이 없거나 아카이브 구간이 제한(일수/행 수)을 넘으면 적재하지 않고 `ArchiveRangeError`를 발생시킵니다.
+        """
+        if not self.covers(model, start_time):
+            return model
+        watermark = self.watermark(model.__tablename__)
+        if start_time is None:
+            raise ArchiveRangeError(
+                f"{watermark.isoformat()} 이전 아카이브 구간을 포함하는 통계는 start_time을 지정해야 합니다"
+            )
+        archived_end = min(as_utc(end_time), watermark) if end_time is not None else watermark
+        if archived_end - as_utc(start_time) > timedelta(days=self.stats_max_days):
+            raise ArchiveRangeError(f"아카이브 구간 통계는 최대 {self.stats_max_days}일까지 조회할 수 있습니다")
+        archived = await asyncio.to_thread(
+            self.read_rows, model, device_id, start_time, end_time, None, self.stats_max_rows + 1, False
+        )
+        if len(archived) > self.stats_max_rows:
+            raise ArchiveRangeError(
+                f"아카이브 구간의 행이 {self.stats_max_rows}개를 넘습니다. "
+                f"구간을 좁히거나 device_id를 지정하거나 /buckets 롤업을 사용하세요"
+            )
+        if not archived:
+            return model
+
+        table = model.__table__
+        temp = Table(
+            f"archive_{table.name}_{uuid.uuid4().hex[:8]}",
+            MetaData(),
+            *(Column(column.name, column.type) for column in table.columns),
+            prefixes=["TEMPORARY"],
+            postgresql_on_commit="DROP"
+        )
+        await db.execute(CreateTable(temp))
+        await db.execute(
+            text(
+                f"INSERT INTO {temp.name} (time, device_id, raw_payload) "
+                "SELECT * FROM unnest(CAST(:times AS timestamptz[]), CAST(:device_ids AS text[]), "
+                "CAST(CAST(:payloads AS text[]) AS jsonb[]))"
+            ),
+            {
+                "times": [row["time"] for row in archived],
+                "device_ids": [row["device_id"] for row in archived],
+                "payloads": [row["raw_payload"] for row in archived],
+            }
+        )
+
+        conditions = []
+        if device_id:
+            conditions.append(table.c.device_id == device_id)
+        if start_time:
+            conditions.append(table.c.time >= start_time)
+        if end_time:
+            conditions.append(table.c.time <= end_time)
+        hot = select(*table.columns).where(and_(*conditions)) if conditions else select(*table.columns)
+        combined = union_all(hot, select(*temp.columns)).subquery(table.name)
+        return aliased(model, combined)
+
+    # ------------------------------------------------------------------ 아카이브 작업
+
+    async def archive_model(self, session_factory, model: Type[Any], now: Optional[datetime] = None) -> int:
+        """hot 기간보다 오래된 행을 일 단위로 옮김 (옮긴 행 수 반환)
+
+        하루치 행을 `DELETE ... RETURNING`으로 꺼내 파일에 병합 기록한 뒤 커밋하므로, 파일 기록이 실패하면
+        삭제도 취소됩니다. 커밋 전에 중단되어 같은 행을 다시 옮겨도 파일은 같은 키를 덮어씁니다.
+        """
+        _pyarrow()
+        now = now or datetime.now(timezone.utc)
+        cutoff = floor_day(now - timedelta(days=settings.ARCHIVE_HOT_DAYS))
+        table_name = model.__tablename__
+
+        async with session_factory() as db:
+            result = await db.execute(select(func.min(model.time)).where(model.time < cutoff))
+            first = result.scalar()
+
+        moved = 0
+        for day in days_between(first, cutoff) if first is not None else []:
+            day_end = min(day + DAY, cutoff)
+            async with session_factory() as db:
+                result = await db.execute(
+                    delete(model)
+                    .where(model.time >= day, model.time < day_end)
+                    .returning(model.time, model.device_id, model.raw_payload)
+                )
+                rows = [dict(row) for row in result.mappings().all()]
+                if rows:
+                    self.write_day(table_name, day, rows)
+                await db.commit()
+            moved += len(rows)
+            self.advance_watermark(table_name, day_end)
+
+        self.advance_watermark(table_name, cutoff)
+        logger.info(f"{table_name} 아카이브 완료: {moved}행 (기준 {cutoff.isoformat()})")
+        return moved
+
+
+# 전역 아카이브 저장소 인스턴스
+archive_store = ArchiveStore(
+    root=settings.ARCHIVE_DIR,
+    compression=settings.ARCHIVE_COMPRESSION,
+    enabled=settings.ARCHIVE_ENABLED,
+    stats_max_days=settings.ARCHIVE_STATS_MAX_DAYS,
+    stats_max_rows=settings.ARCHIVE_STATS_MAX_ROWS
+)
@@ -0,0 +1,195 @@
+"""
+비동기 Redis 클라이언트 모듈
+
+redis.asyncio 기반 클라이언트로, 프로세스 전체가 하나의 연결 풀을 공유합니다.
+기존 RedisClient와 달리 명령마다 PING으로 연결을 확인하지 않고, 연결 오류가 나면 풀을 정리한 뒤 한 번 다시 시도합니다.
+(유휴 연결 확인은 풀의 health_check_interval이 담당합니다)
+
+핫 경로용 묶음 명령(mget/mset, 파이프라인, 해시 일괄 조회/설정)을 제공하여 여러 키를 왕복 1회로 처리합니다.
+연결은 첫 명령 때 만들어지므로 임포트만으로 Redis에 연결하지 않습니다.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+
+from app.core.config import get_settings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+
+class AsyncRedisClient:
+    """비동기 Redis 클라이언트 클래스
+
+    명령 실패 시 예외를 그대로 올리므로 호출하는 쪽(예: 읽기 캐시)이 DB 조회로 대체할지 결정합니다.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        max_connections: int = 50,
+        socket_timeout: float = 5.0,
+        health_check_interval: int = 30
+    ):
+        self.url = url
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.health_check_interval = health_check_interval
+        self._client: Optional[redis.Redis] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        """공유 연결 풀을 사용하는 redis.asyncio 클라이언트 (첫 사용 때 생성)"""
+        if self._client is None:
+            pool = redis.ConnectionPool.from_url(
+                self.url or f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
+                max_connections=self.max_connections,
+                decode_responses=True,  # 문자열 자동 디코딩
+                socket_connect_timeout=self.socket_timeout,
+                socket_timeout=self.socket_timeout,
+                health_check_interval=self.health_check_interval
+            )
+            self._client = redis.Redis(connection_pool=pool)
+        return self._client
+
+    async def _execute(self, command: str, *args, **kwargs) -> Any:
+        """명령 실행 (연결 오류 시 풀의 연결을 끊고 한 번 재시도)"""
+        try:
+            return await getattr(self.client, command)(*args, **kwargs)
+        except (RedisConnectionError, RedisTimeoutError) as e:
+            logger.warning(f"Redis {command.upper()} 연결 오류, 재연결 후 재시도: {e}")
+            await self.client.connection_pool.disconnect(inuse_connections=False)
+            return await getattr(self.client, command)(*args, **kwargs)
+
+    async def ping(self) -> bool:
+        """Redis 연결 상태를 확인합니다. (상태 점검용, 일반 명령 전에는 호출하지 않음)"""
+        try:
+            return await self._execute("ping")
+        except Exception:
+            return False
+
+    async def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값을 가져옵니다."""
+        return await self._execute("get", key)
+
+    async def set(self, key: str, value: str, expire: Optional[int] = None) -> bool:
+        """키-값을 설정합니다."""
+        return bool(await self._execute("set", key, value, ex=expire))
+
+    async def delete(self, *keys: str) -> int:
+        """키를 삭제하고 삭제된 수를 반환합니다."""
+        if not keys:
+            return 0
+        return await self._execute("delete", *keys)
+
+    async def exists(self, key: str) -> bool:
+        """키가 존재하는지 확인합니다."""
+        return await self._execute("exists", key) > 0
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        """키의 만료 시간을 설정합니다."""
+        return bool(await self._execute("expire", key, seconds))
+
+    async def ttl(self, key: str) -> int:
+        """키의 남은 만료 시간을 반환합니다."""
+        return await self._execute("ttl", key)
+
+    async def increment(self, key: str, amount: int = 1) -> int:
+        """키의 값을 증가시킵니다."""
+        return await self._execute("incrby", key, amount)
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        """JSON 값을 가져옵니다."""
+        value = await self.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set_json(self, key: str, value: Any, expire: Optional[int] = None) -> bool:
+        """JSON 값을 설정합니다."""
+        return await self.set(key, json.dumps(value, ensure_ascii=False), expire)
+
+    # 묶음 명령 (왕복 1회)
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 키의 값을 한 번에 가져옵니다. (없는 키는 None)"""
+        if not keys:
+            return []
+        return await self._execute("mget", keys)
+
+    async def mset(self, mapping: Mapping[str, str], expire: Optional[int] = None) -> bool:
+        """여러 키-값을 한 번에 설정합니다. (expire가 있으면 파이프라인으로 키마다 SET EX)"""
+        if not mapping:
+            return True
+        if expire is None:
+            return bool(await self._execute("mset", dict(mapping)))
+        results = await self.run_pipeline([("set", (key, value), {"ex": expire}) for key, value in mapping.items()])
+        return all(results)
+
+    async def increment_many(self, keys: Iterable[str], amount: int = 1) -> List[int]:
+        """여러 키의 값을 파이프라인으로 한 번에 증가시킵니다."""
+        return await self.run_pipeline([("incrby", (key, amount), {}) for key in keys])
+
+    async def hash_set_many(self, key: str, mapping: Mapping[str, str]) -> int:
+        """해시에 여러 필드-값을 한 번에 설정합니다."""
+        if not mapping:
+            return 0
+        return await self._execute("hset", key, mapping=dict(mapping))
+
+    async def hash_get_many(self, key: str, fields: List[str]) -> List[Optional[str]]:
+        """해시에서 여러 필드 값을 한 번에 가져옵니다."""
+        if not fields:
+            return []
+        return await self._execute("hmget", key, fields)
+
+    async def hash_get_all(self, key: str) -> Dict[str, str]:
+        """해시의 모든 필드-값을 가져옵니다."""
+        return await self._execute("hgetall", key)
+
+    async def run_pipeline(self, commands: List[tuple]) -> List[Any]:
+        """(명령, 인자, 키워드 인자) 목록을 트랜잭션 없는 파이프라인으로 한 번에 실행합니다.
+
+        연결 오류 시 한 번 재시도하므로 INCR처럼 멱등이 아닌 명령은 드물게 두 번 적용될 수 있습니다.
+        """
+        if not commands:
+            return []
+
+        async def execute():
+            async with self.client.pipeline(transaction=False) as pipe:
+                for command, args, kwargs in commands:
+                    getattr(pipe, command)(*args, **kwargs)
+                return await pipe.execute()
+
+        try:
+            return await execute()
+        except (RedisConnectionError, RedisTimeoutError) as e:
+            logger.warning(f"Redis 파이프라인 연결 오류, 재연결 후 재시도: {e}")
+            await self.client.connection_pool.disconnect(inuse_connections=False)
+            return await execute()
+
+    async def close(self):
+        """연결 풀을 닫습니다."""
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+                logger.info("비동기 Redis 연결 종료")
+            except Exception as e:
+                logger.error(f"비동기 Redis 연결 종료 오류: {e}")
+            self._client = None
+
+
+# 전역 비동기 Redis 클라이언트 인스턴스
+async_redis_client = AsyncRedisClient(
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SEC
+)
+
+
+def get_async_redis_client() -> AsyncRedisClient:
+    """비동기 Redis 클라이언트를 반환합니다."""
+    return async_redis_client
@@ -0,0 +1,149 @@
+"""
+압축(binary) 수집 프레임 코덱
+
+`application/msgpack`(선택적으로 `application/cbor`) 본문을 Pydantic을 거치지 않고
+테이블별 INSERT 행으로 바로 변환합니다.
+
+본문 형식 (v1):
+    {
+        "d": ["<device_id>", ...],                    # 디바이스 ID 테이블
+        "f": [[code, ts_ms, device_index, v0, v1, ...], ...]   # 프레임
+    }
+
+- code: `Iot_Serial.source` 바이트 맵과 동일한 센서 코드 (MQ5=0x01 등)
+- ts_ms: epoch 밀리초 타임스탬프 (UTC)
+- device_index: `d` 배열 인덱스 (긴 디바이스 ID를 프레임마다 반복하지 않음)
+- v0, v1, ...: 코드별 `fields` 순서의 값. 테이블 컬럼이면 컬럼으로,
+  그 외에는 raw_payload 키로 기록됩니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+from app.infrastructure.sensor_registry import SensorTypeSpec, get_sensor_spec
+
+MSGPACK_CONTENT_TYPES = ("application/msgpack", "application/x-msgpack")
+CBOR_CONTENT_TYPES = ("application/cbor",)
+
+
+class CompactDecodeError(ValueError):
+    """본문 전체를 해석할 수 없을 때 발생"""
+
+
+@dataclass(frozen=True)
+class CompactCode:
+    """센서 코드 메타데이터"""
+
+    code: int
+    sensor_type: str
+    fields: Tuple[str, ...]
+    payload_defaults: Dict[str, Any] = field(default_factory=dict)
+
+
+# arduino_core_controller.Iot_Serial.source 바이트 맵과 동일하게 유지
+COMPACT_CODES: Dict[int, CompactCode] = {
+    entry.code: entry for entry in [
+        CompactCode(0x00, "loadcell", ("weight_kg",)),
+        CompactCode(0x01, "mq5", ("gas_level",)),
+        CompactCode(0x02, "mq7", ("co_level",)),
+        CompactCode(0x03, "rfid", ("card_id",), {"reader_location": "main_entrance_out"}),
+        CompactCode(0x13, "rfid", ("card_id",), {"reader_location": "main_entrance_in"}),
+        CompactCode(0x04, "actuator-irtx", ("protocol", "command_hex")),
+        CompactCode(0x05, "actuator-buzzer", ("buzzer_type", "state", "freq_hz", "duration_ms")),
+        CompactCode(0x06, "sensor-raw-temperatures", ("temperature_celsius",)),
+        CompactCode(0x07, "sound", ("db_value",)),
+        CompactCode(0x08, "edge-pir", ("motion_detected", "confidence")),
+        CompactCode(0x09, "imu", ("accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z")),
+        # 0x0A(LED)는 적재 테이블이 없어 등록하지 않음
+    ]
+}
+
+
+def unpack_body(body: bytes, content_type: str) -> Any:
+    """Content-Type에 맞게 본문 역직렬화"""
+    media_type = content_type.split(";")[0].strip().lower()
+    try:
+        if media_type in MSGPACK_CONTENT_TYPES:
+            import msgpack
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        if media_type in CBOR_CONTENT_TYPES:
+            try:
+                import cbor2
+            except ImportError:
+                raise CompactDecodeError("CBOR 수집을 사용하려면 cbor2 패키지가 필요합니다")
+            return cbor2.loads(body)
+    except CompactDecodeError:
+        raise
+    except Exception as e:
+        raise CompactDecodeError(f"본문을 해석할 수 없습니다: {type(e).__name__} {e}".rstrip())
+    raise CompactDecodeError(f"지원하지 않는 Content-Type입니다: {content_type}")
+
+
+def is_compact_content_type(content_type: str) -> bool:
+    """압축 수집 Content-Type 여부"""
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type in MSGPACK_CONTENT_TYPES or media_type in CBOR_CONTENT_TYPES
+
+
+def decode_frames(document: Any):
+    """압축 문서를 테이블별 INSERT 행으로 변환
+
+    Returns:
+        groups: 센서 타입 -> (메타데이터, 원래 프레임 위치 목록, INSERT 행 목록)
+        errors: (프레임 위치, 오류 메시지) 목록
+    """
+    if not isinstance(document, dict) or not isinstance(document.get("f"), list):
+        raise CompactDecodeError("본문은 'd'(디바이스 목록)와 'f'(프레임 목록)를 가진 맵이어야 합니다")
+    devices = document.get("d") or []
+    if not isinstance(devices, list):
+        raise CompactDecodeError("'d'는 디바이스 ID 배열이어야 합니다")
+
+    groups: Dict[str, Tuple[SensorTypeSpec, List[int], List[Dict[str, Any]]]] = {}
+    errors: List[Tuple[int, str]] = []
+    columns_cache: Dict[str, frozenset] = {}
+
+    for index, frame in enumerate(document["f"]):
+        if not isinstance(frame, (list, tuple)) or len(frame) < 3:
+            errors.append((index, "프레임은 [code, ts_ms, device_index, ...] 배열이어야 합니다"))
+            continue
+
+        code, ts_ms, device_index = frame[0], frame[1], frame[2]
+        entry = COMPACT_CODES.get(code)
+        if entry is None:
+            errors.append((index, f"등록되지 않은 센서 코드입니다: {code}"))
+            continue
+        if not isinstance(ts_ms, int) or isinstance(ts_ms, bool):
+            errors.append((index, "ts_ms는 epoch 밀리초 정수여야 합니다"))
+            continue
+        if not isinstance(device_index, int) or not 0 <= device_index < len(devices):
+            errors.append((index, f"잘못된 device_index입니다: {device_index}"))
+            continue
+        values = frame[3:]
+        if len(values) > len(entry.fields):
+            errors.append((index, f"값이 너무 많습니다 (최대 {len(entry.fields)}개)"))
+            continue
+
+        spec = get_sensor_spec(entry.sensor_type)
+        columns = columns_cache.get(spec.sensor_type)
+        if columns is None:
+            columns = columns_cache[spec.sensor_type] = frozenset(spec.model.__table__.columns.keys())
+
+        row: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc),
+            "device_id": devices[device_index],
+        }
+        payload: Dict[str, Any] = dict(entry.payload_defaults)
+        for name, value in zip(entry.fields, values):
+            if name in columns:
+                row[name] = value
+            else:
+                payload[name] = value
+        if payload:
+            row["raw_payload"] = payload
+
+        _, indexes, rows = groups.setdefault(spec.sensor_type, (spec, [], []))
+        indexes.append(index)
+        rows.append(row)
+
+    return groups, errors
@@ -27,15 +27,25 @@ DATABASE_URL = settings.DATABASE_URL
 engine = create_engine(
     DATABASE_URL,
     poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=True,
     pool_recycle=3600,
     echo=settings.DEBUG,  # 개발 환경에서만 SQL 로그 출력
 )
 
-# 비동기 엔진 생성
-async_engine = None
+# 비동기 엔진 생성 (애플리케이션 전역에서 하나를 공유)
+# create_async_engine은 기본으로 asyncio 호환 풀(AsyncAdaptedQueuePool)을 사용합니다.
+ASYNC_DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=settings.DEBUG,
+)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(
@@ -44,6 +54,13 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 세션 팩토리 생성
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 # 베이스 클래스 생성 (모델 상속용)
 Base = declarative_base()
 
@@ -74,31 +91,9 @@ async def get_session() -> AsyncSession:
     """
     비동기 데이터베이스 세션을 생성하는 함수
     
-    PostgreSQL 리포지토리에서 사용됩니다.
+    공유 비동기 엔진의 커넥션 풀을 사용합니다. 호출자가 세션을 닫아야 합니다.
     """
-    global async_engine
-    
-    if async_engine is None:
-        # 동기 URL을 비동기 URL로 변환
-        async_database_url = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
-        
-        async_engine = create_async_engine(
-            async_database_url,
-            poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=settings.DEBUG,
-        )
-    
-    async_session = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    
-    return async_session()
+    return AsyncSessionLocal()
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -107,29 +102,7 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     
     FastAPI의 Depends에서 사용됩니다.
     """
-    global async_engine
-    
-    if async_engine is None:
-        # 동기 URL을 비동기 URL로 변환
-        async_database_url = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://')
-        
-        async_engine = create_async_engine(
-            async_database_url,
-            poolclass=QueuePool,
-            pool_size=5,
-            max_overflow=10,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=settings.DEBUG,
-        )
-    
-    async_session = async_sessionmaker(
-        async_engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
-    
-    async with async_session() as session:
+    async with AsyncSessionLocal() as session:
         try:
             logger.debug("비동기 데이터베이스 세션 생성")
             yield session
@@ -141,23 +114,9 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             logger.debug("비동기 데이터베이스 세션 종료")
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """
-    비동기 데이터베이스 세션을 생성하는 의존성 함수
-    
-    FastAPI의 Depends에서 사용됩니다.
-    """
-    async_session = await get_session()
-    try:
-        logger.debug("비동기 데이터베이스 세션 생성")
-        yield async_session
-    except Exception as e:
-        logger.error(f"비동기 데이터베이스 세션 오류: {e}")
-        await async_session.rollback()
-        raise
-    finally:
-        logger.debug("비동기 데이터베이스 세션 종료")
-        await async_session.close()
+async def dispose_async_engine():
+    """비동기 엔진의 커넥션 풀을 정리합니다. (애플리케이션 종료 시 호출)"""
+    await async_engine.dispose()
 
 
 def create_tables():
@@ -0,0 +1,292 @@
+"""
+디바이스 최신 측정값 저장소 모듈
+
+/latest 조회가 원본 테이블을 `ORDER BY time DESC`로 읽지 않도록 (원본 테이블, 디바이스)별
+가장 최근 행을 device_latest 테이블에 보관합니다.
+
+- 대량 적재 경로는 같은 트랜잭션에서 `record()`로 디바이스별 최신 행을 upsert합니다.
+- ORM으로 추가/수정/삭제한 행은 세션 flush 이벤트에서 같은 트랜잭션으로 반영합니다.
+  (수정/삭제는 원본 테이블에서 해당 디바이스의 최신 행을 다시 읽어 교체)
+- 조회는 기본 키 조회 1회이며, 항목이 없으면(백필 전 등) 원본 테이블에서 읽습니다.
+- ORM으로 측정값 행을 추가/수정/삭제한 세션은 커밋 후 해당 디바이스 소유자의 최신 측정값 읽기 캐시를 무효화합니다.
+  (대량 적재 경로는 `persist_accepted`/write-behind 큐가 직접 무효화)
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import Date, DateTime, Float, Numeric, Uuid, delete, event, func, inspect, literal, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.infrastructure.models import DeviceLatest, DeviceRTCStatus
+from app.infrastructure.read_cache import read_cache
+from app.infrastructure.sensor_registry import SENSOR_TYPE_SPECS
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+# 최신 값을 보관하는 원본 모델 (time, device_id 컬럼 필수)
+TRACKED_MODELS: Tuple[Type[Any], ...] = tuple(spec.model for spec in SENSOR_TYPE_SPECS) + (DeviceRTCStatus,)
+
+# 원본 테이블 이름 -> 센서 타입 이름 (라우터 prefix와 동일)
+SOURCE_SENSOR_TYPES: Dict[str, str] = {
+    **{spec.table_name: spec.sensor_type for spec in SENSOR_TYPE_SPECS},
+    DeviceRTCStatus.__tablename__: "device-rtc",
+}
+
+
+def as_utc(value: datetime) -> datetime:
+    """naive 값은 UTC로 간주하여 aware 값으로 정규화"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def encode_value(column, value: Any) -> Any:
+    """payload(JSONB)에 담을 수 있는 값으로 변환"""
+    if isinstance(value, datetime):
+        return (as_utc(value) if getattr(column.type, "timezone", False) else value).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def decode_value(column, value: Any) -> Any:
+    """payload 값을 컬럼 타입의 파이썬 값으로 복원"""
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, Float):
+        return float(value)
+    if isinstance(column_type, Numeric):
+        return Decimal(str(value))
+    if isinstance(column_type, Uuid) and column_type.as_uuid:
+        return uuid.UUID(str(value))
+    return value
+
+
+def row_payload(table, row: Dict[str, Any]) -> Dict[str, Any]:
+    """행(컬럼 이름 -> 값)을 payload로 변환 (빠진 컬럼은 스칼라 기본값 또는 None)"""
+    payload = {}
+    for column in table.columns:
+        if column.name in row:
+            value = row[column.name]
+        elif column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        else:
+            value = None
+        payload[column.name] = encode_value(column, value)
+    return payload
+
+
+def instance_row(instance: Any) -> Dict[str, Any]:
+    """ORM 인스턴스를 행(컬럼 이름 -> 값)으로 변환"""
+    mapper = inspect(instance).mapper
+    return {prop.columns[0].name: getattr(instance, prop.key) for prop in mapper.column_attrs}
+
+
+def build_instance(model: Type[Any], payload: Dict[str, Any]) -> Any:
+    """payload로 원본 모델의 (세션에 속하지 않은) 인스턴스 생성"""
+    return model(**{
+        prop.key: decode_value(prop.columns[0], payload.get(prop.columns[0].name))
+        for prop in inspect(model).column_attrs
+    })
+
+
+def latest_entries(table, rows: Iterable[Dict[str, Any]], now: datetime) -> List[Dict[str, Any]]:
+    """적재 행 중 디바이스별 가장 최근 행으로 device_latest 값 목록 생성
+
+    한 INSERT ... ON CONFLICT 문이 같은 키를 두 번 갱신할 수 없으므로 디바이스당 한 행만 남깁니다.
+    """
+    latest: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        device_id, time_value = row.get("device_id"), row.get("time")
+        if device_id is None or not isinstance(time_value, datetime):
+            continue
+        current = latest.get(device_id)
+        if current is None or as_utc(time_value) >= as_utc(current["time"]):
+            latest[device_id] = row
+    return [
+        {
+            "source_table": table.name,
+            "device_id": device_id,
+            "time": as_utc(row["time"]),
+            "payload": row_payload(table, row),
+            "updated_at": now,
+        }
+        for device_id, row in latest.items()
+    ]
+
+
+def upsert_statement(entries: List[Dict[str, Any]]):
+    """device_latest upsert 문 (기존 항목보다 이전 시각의 행은 무시)"""
+    statement = pg_insert(DeviceLatest).values(entries)
+    return statement.on_conflict_do_update(
+        index_elements=[DeviceLatest.source_table, DeviceLatest.device_id],
+        set_={
+            "time": statement.excluded.time,
+            "payload": statement.excluded.payload,
+            "updated_at": statement.excluded.updated_at,
+        },
+        where=DeviceLatest.time <= statement.excluded.time
+    )
+
+
+def refresh_statements(model: Type[Any], device_ids: Optional[Iterable[str]] = None) -> list:
+    """원본 테이블에서 디바이스별 최신 행을 다시 읽어 device_latest를 교체하는 문장들
+
+    device_ids가 None이면 테이블 전체를 백필합니다.
+    """
+    table = model.__table__
+    remove = delete(DeviceLatest).where(DeviceLatest.source_table == table.name)
+    source = (
+        select(
+            literal(table.name),
+            table.c.device_id,
+            table.c.time,
+            func.to_jsonb(literal_column(table.name)),
+            func.now()
+        )
+        .distinct(table.c.device_id)
+        .order_by(table.c.device_id, table.c.time.desc())
+    )
+    if device_ids is not None:
+        device_ids = list(device_ids)
+        remove = remove.where(DeviceLatest.device_id.in_(device_ids))
+        source = source.where(table.c.device_id.in_(device_ids))
+    refill = pg_insert(DeviceLatest).from_select(
+        ["source_table", "device_id", "time", "payload", "updated_at"], source
+    )
+    return [remove, refill]
+
+
+class DeviceLatestStore:
+    """디바이스 최신 측정값 저장소
+
+    비활성화(`enabled=False`) 상태에서는 기록하지 않고 조회는 항상 원본 테이블에서 읽습니다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        if enabled:
+            event.listen(Session, "after_flush", self._after_flush)
+
+    async def record(self, db, model: Type[Any], rows: List[Dict[str, Any]]):
+        """대량 적재한 행의 디바이스별 최신 값 기록 (호출 측 트랜잭션에서 커밋)"""
+        if not self.enabled or model not in TRACKED_MODELS or not rows:
+            return
+        entries = latest_entries(model.__table__, rows, datetime.now(timezone.utc))
+        if entries:
+            await db.execute(upsert_statement(entries))
+
+    def _after_flush(self, session: Session, flush_context):
+        """ORM으로 추가/수정/삭제한 행을 같은 트랜잭션에서 반영"""
+        added: Dict[Type[Any], List[Dict[str, Any]]] = {}
+        changed: Dict[Type[Any], set] = {}
+        for instance in session.new:
+            if isinstance(instance, TRACKED_MODELS):
+                added.setdefault(type(instance), []).append(instance_row(instance))
+        for instance in list(session.dirty) + list(session.deleted):
+            if isinstance(instance, TRACKED_MODELS):
+                changed.setdefault(type(instance), set()).add(instance.device_id)
+        if not added and not changed:
+            return
+
+        connection = session.connection()
+        now = datetime.now(timezone.utc)
+        for model, rows in added.items():
+            entries = latest_entries(model.__table__, rows, now)
+            if entries:
+                connection.execute(upsert_statement(entries))
+        for model, device_ids in changed.items():
+            for statement in refresh_statements(model, device_ids):
+                connection.execute(statement)
+
+    async def fetch(self, db, model: Type[Any], device_id: str) -> Optional[Any]:
+        """디바이스의 최신 행 조회 (device_latest 기본 키 조회, 항목이 없으면 원본 테이블)"""
+        if self.enabled:
+            result = await db.execute(
+                select(DeviceLatest.payload).where(
+                    DeviceLatest.source_table == model.__tablename__,
+                    DeviceLatest.device_id == device_id
+                )
+            )
+            payload = result.scalar_one_or_none()
+            if payload is not None:
+                return build_instance(model, payload)
+
+        result = await db.execute(
+            select(model).where(model.device_id == device_id).order_by(model.time.desc()).limit(1)
+        )
+        return result.scalars().first()
+
+
+# 전역 최신 측정값 저장소 인스턴스
+device_latest_store = DeviceLatestStore(enabled=settings.LATEST_VALUES_ENABLED)
+
+
+class LatestCacheInvalidator:
+    """ORM 세션의 측정값 쓰기를 커밋 후 최신 측정값 읽기 캐시 무효화로 연결
+
+    flush 이벤트에서 추가/수정/삭제된 측정값 행의 디바이스를 세션에 모아 두고, 커밋되면
+    `read_cache.invalidate_devices`를 이벤트 루프에서 실행합니다. 롤백되면 버립니다.
+    """
+
+    SESSION_KEY = "latest_cache_device_ids"
+
+    def __init__(self, cache=read_cache, enabled: bool = False):
+        self.cache = cache
+        self.enabled = enabled
+        self._tasks: set = set()
+        if enabled:
+            event.listen(Session, "after_flush", self._after_flush)
+            event.listen(Session, "after_commit", self._after_commit)
+            event.listen(Session, "after_rollback", self._after_rollback)
+
+    def _after_flush(self, session: Session, flush_context):
+        device_ids = {
+            instance.device_id
+            for instance in list(session.new) + list(session.dirty) + list(session.deleted)
+            if isinstance(instance, TRACKED_MODELS)
+        }
+        if device_ids:
+            session.info.setdefault(self.SESSION_KEY, set()).update(device_ids)
+
+    def _after_commit(self, session: Session):
+        device_ids = session.info.pop(self.SESSION_KEY, None)
+        if not device_ids:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self.cache.invalidate_devices(device_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _after_rollback(self, session: Session):
+        session.info.pop(self.SESSION_KEY, None)
+
+
+# 전역 최신 측정값 캐시 무효화 연결 (읽기 캐시를 사용할 때만 이벤트 등록)
+latest_cache_invalidator = LatestCacheInvalidator(enabled=settings.CACHE_ENABLED)
+
+
+async def fetch_latest(db, model: Type[Any], device_id: str) -> Optional[Any]:
+    """디바이스의 최신 행 조회"""
+    return await device_latest_store.fetch(db, model, device_id)
@@ -0,0 +1,221 @@
+"""
+디바이스 레지스트리 캐시 모듈
+
+device_id -> (user_id, 위치, 센서 역할)을 프로세스 메모리에 보관합니다.
+시작 시 devices 테이블 전체를 적재하고 디바이스 생성/수정/삭제 시 갱신하므로,
+수집 경로가 DB 조회 없이 미등록 디바이스를 걸러내고 사용자/방 정보를 붙일 수 있습니다.
+
+캐시는 워커 프로세스마다 따로 있으므로 다른 워커에서 방금 등록한 디바이스는 이 워커의 캐시에 없을 수 있습니다.
+수집 경로는 거부하기 전에 `resolve_missing`으로 캐시에 없는 디바이스만 DB에서 한 번에 조회하며,
+DB에도 없는 디바이스는 `miss_ttl_sec` 동안 다시 조회하지 않습니다 (잘못된 device_id 반복 전송 시 DB 부하 방지).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import get_settings
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.models import Device as DeviceModel
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+# 미등록 디바이스 음성 캐시 정리 기준 크기
+MAX_MISSING_ENTRIES = 10000
+
+
+@dataclass(frozen=True)
+class DeviceContext:
+    """디바이스 컨텍스트"""
+
+    device_id: str
+    user_id: Optional[str]
+    location: Optional[str]
+    role: Optional[str]
+
+
+def parse_location_label(label: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """`"<위치> - <센서 이름>"` 형식의 location_label을 (위치, 역할)로 분리
+
+    예: `"Kitchen - 무게 센서 로드셀"` -> `("Kitchen", "무게 센서 로드셀")`
+    구분자가 없으면 전체를 위치로 봅니다.
+    """
+    if not label:
+        return None, None
+    location, separator, role = label.partition(" - ")
+    if not separator:
+        return label.strip() or None, None
+    return location.strip() or None, role.strip() or None
+
+
+def build_context(device_id: str, user_id: Any, location_label: Optional[str]) -> DeviceContext:
+    """devices 행으로 컨텍스트 생성"""
+    location, role = parse_location_label(location_label)
+    return DeviceContext(
+        device_id=device_id,
+        user_id=str(user_id) if user_id else None,
+        location=location,
+        role=role
+    )
+
+
+class DeviceRegistryCache:
+    """프로세스 단위 디바이스 레지스트리 캐시
+
+    적재 전(`loaded=False`)에는 조회가 항상 None이므로 호출 측은 검증을 건너뛰어야 합니다.
+    다른 워커에서 등록된 디바이스는 `resolve_missing`(캐시 미스 시 DB 조회)로,
+    수정/삭제는 주기적 재적재(`refresh_interval_sec`)로 맞춥니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        refresh_interval_sec: float = 300.0,
+        miss_ttl_sec: float = 10.0
+    ):
+        self.session_factory = session_factory
+        self.refresh_interval_sec = refresh_interval_sec
+        self.miss_ttl_sec = miss_ttl_sec
+        self._entries: Dict[str, DeviceContext] = {}
+        # DB에도 없었던 device_id -> 다시 조회할 수 있는 시각 (time.monotonic)
+        self._missing: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.loaded = False
+        self.loaded_at: Optional[float] = None
+
+        # 메트릭
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.lookups = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def load(self):
+        """devices 테이블 전체 적재 (기존 항목 교체)"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(DeviceModel.device_id, DeviceModel.user_id, DeviceModel.location_label)
+            )
+            entries = {
+                device_id: build_context(device_id, user_id, location_label)
+                for device_id, user_id, location_label in result.all()
+            }
+        self._entries = entries
+        self._missing = {}
+        self.loaded = True
+        self.loaded_at = time.time()
+        self.reloads += 1
+        logger.info(f"디바이스 레지스트리 적재 완료: {len(entries)}개")
+
+    async def start(self):
+        """적재 후 주기적 재적재 시작"""
+        await self.load()
+        if self.refresh_interval_sec > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """주기적 재적재 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval_sec)
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error(f"디바이스 레지스트리 재적재 실패 (기존 캐시 유지): {e}")
+
+    def get(self, device_id: Optional[str]) -> Optional[DeviceContext]:
+        """디바이스 컨텍스트 조회 (DB 조회 없음)"""
+        context = self._entries.get(device_id) if device_id else None
+        if context is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return context
+
+    async def resolve_missing(self, device_ids: Iterable[Optional[str]]):
+        """캐시에 없는 디바이스를 DB에서 한 번에 조회하여 캐시에 추가
+
+        DB에도 없는 디바이스는 miss_ttl_sec 동안 다시 조회하지 않습니다.
+        조회에 실패하면 캐시를 그대로 두므로 해당 디바이스는 미등록으로 처리됩니다.
+        """
+        if not self.loaded:
+            return
+        now = time.monotonic()
+        missing = {
+            device_id for device_id in device_ids
+            if device_id and device_id not in self._entries and self._missing.get(device_id, 0.0) <= now
+        }
+        if not missing:
+            return
+
+        self.lookups += 1
+        try:
+            async with self.session_factory() as db:
+                result = await db.execute(
+                    select(DeviceModel.device_id, DeviceModel.user_id, DeviceModel.location_label)
+                    .where(DeviceModel.device_id.in_(missing))
+                )
+                rows = result.all()
+        except Exception as e:
+            logger.error(f"디바이스 레지스트리 조회 실패: {e}")
+            return
+
+        for device_id, user_id, location_label in rows:
+            self.put(device_id, user_id, location_label)
+            missing.discard(device_id)
+        if len(self._missing) > MAX_MISSING_ENTRIES:
+            # 임의의 device_id가 계속 들어와도 메모리가 커지지 않도록 만료 항목 정리
+            self._missing = {device_id: until for device_id, until in self._missing.items() if until > now}
+        for device_id in missing:
+            self._missing[device_id] = now + self.miss_ttl_sec
+
+    def put(self, device_id: str, user_id: Any, location_label: Optional[str]):
+        """디바이스 생성/수정 시 항목 갱신"""
+        self._entries[device_id] = build_context(device_id, user_id, location_label)
+        self._missing.pop(device_id, None)
+
+    def invalidate(self, device_id: str):
+        """디바이스 삭제 시 항목 제거"""
+        self._entries.pop(device_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 크기와 조회 적중률"""
+        lookups = self.hits + self.misses
+        return {
+            "loaded": self.loaded,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "reloads": self.reloads,
+            "lookups": self.lookups,
+            "negative_cached": len(self._missing),
+            "loaded_at": self.loaded_at,
+            "refresh_interval_sec": self.refresh_interval_sec,
+        }
+
+
+# 전역 디바이스 레지스트리 인스턴스
+device_registry = DeviceRegistryCache(
+    session_factory=AsyncSessionLocal,
+    refresh_interval_sec=settings.DEVICE_REGISTRY_REFRESH_SEC,
+    miss_ttl_sec=settings.DEVICE_REGISTRY_MISS_TTL_SEC
+)
@@ -0,0 +1,173 @@
+"""
+열 지향 내보내기 형식 모듈
+
+서버 측 커서에서 받은 행 묶음(record batch)을 Arrow IPC 스트림 / Parquet / CSV 바이트로 변환합니다.
+각 writer는 묶음마다 그동안 만들어진 바이트만 돌려주므로 전체 결과를 메모리에 올리지 않고 응답으로 흘려보낼 수 있습니다.
+
+Arrow/Parquet은 pyarrow 패키지가 필요하며, CSV는 표준 라이브러리만 사용합니다.
+"""
+
+import csv
+import io
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Sequence, Tuple
+
+# 형식 -> (Content-Type, 파일 확장자)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+# 내보내기 컬럼: (이름, 종류) - 종류는 timestamp, bool, int, float, json, string
+ExportColumn = Tuple[str, str]
+
+
+class ExportFormatError(RuntimeError):
+    """내보내기 형식을 사용할 수 없음 (pyarrow 미설치 등)"""
+
+
+def export_value(kind: str, value: Any) -> Any:
+    """DB 값을 내보내기 값으로 변환 (JSON은 문자열, Decimal은 float, UUID는 문자열)"""
+    if value is None:
+        return None
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ExportFormatError("Arrow/Parquet 내보내기를 사용하려면 pyarrow 패키지가 필요합니다")
+    return pyarrow
+
+
+class _ChunkSink:
+    """pyarrow writer가 쓰는 바이트를 모았다가 꺼내 가는 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class CsvBatchWriter:
+    """CSV writer (첫 묶음 앞에 헤더)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        self.columns = list(columns)
+        self._header_written = False
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if not self._header_written:
+            writer.writerow([name for name, _ in self.columns])
+            self._header_written = True
+        for row in rows:
+            writer.writerow([
+                value.isoformat() if isinstance(value, (datetime, date)) else value
+                for value in (export_value(kind, item) for (_, kind), item in zip(self.columns, row))
+            ])
+        return buffer.getvalue().encode("utf-8")
+
+    def close(self) -> bytes:
+        # 행이 없어도 헤더는 내보냄
+        return self.write([]) if not self._header_written else b""
+
+
+class _ArrowBatchWriter:
+    """Arrow 기반 writer 공통 부분 (묶음을 RecordBatch로 변환)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        self.pa = _pyarrow()
+        self.columns = list(columns)
+        types = {
+            "timestamp": self.pa.timestamp("us", tz="UTC"),
+            "bool": self.pa.bool_(),
+            "int": self.pa.int64(),
+            "float": self.pa.float64(),
+        }
+        self.schema = self.pa.schema([(name, types.get(kind, self.pa.string())) for name, kind in self.columns])
+        self.sink = _ChunkSink()
+
+    def record_batch(self, rows: Sequence[Sequence[Any]]):
+        arrays = [
+            self.pa.array([export_value(kind, row[index]) for row in rows], type=self.schema.field(index).type)
+            for index, (_, kind) in enumerate(self.columns)
+        ]
+        return self.pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class ArrowBatchWriter(_ArrowBatchWriter):
+    """Arrow IPC 스트림 writer (묶음마다 RecordBatch 메시지 1개)"""
+
+    def __init__(self, columns: Sequence[ExportColumn]):
+        super().__init__(columns)
+        self.writer = self.pa.ipc.new_stream(self.sink, self.schema)
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if rows:
+            self.writer.write_batch(self.record_batch(rows))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+class ParquetBatchWriter(_ArrowBatchWriter):
+    """Parquet writer (묶음마다 row group 1개, 닫을 때 footer)"""
+
+    def __init__(self, columns: Sequence[ExportColumn], compression: str = "zstd"):
+        super().__init__(columns)
+        self.writer = self.pa.parquet.ParquetWriter(self.sink, self.schema, compression=compression)
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if rows:
+            self.writer.write_batch(self.record_batch(rows))
+        return self.sink.drain()
+
+    def close(self) -> bytes:
+        self.writer.close()
+        return self.sink.drain()
+
+
+def create_batch_writer(export_format: str, columns: Sequence[ExportColumn]):
+    """형식에 맞는 writer 생성"""
+    if export_format == "arrow":
+        return ArrowBatchWriter(columns)
+    if export_format == "parquet":
+        return ParquetBatchWriter(columns)
+    return CsvBatchWriter(columns)
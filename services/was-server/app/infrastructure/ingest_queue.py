@@ -0,0 +1,318 @@
+"""
+Write-behind 수집 큐 모듈
+
+`/create` 요청을 DB 커밋 대신 제한된 크기의 asyncio 큐에 적재하고,
+백그라운드 플러셔가 테이블별로 모아 크기/시간 임계값에 따라 다중 행 INSERT로 기록합니다.
+
+이미 202로 수락된 행이므로 플러시가 실패해도 버리지 않습니다.
+- 일시적 오류(연결 끊김 등): 버퍼에 되돌리고 지수 백오프로 재시도합니다.
+  재시도 대기 중인 행이 큐 크기를 넘으면 큐를 비우지 않아 `/create`가 503을 받습니다.
+- 제약 조건/데이터 오류: 행 단위로 다시 기록하고 거부된 행만 ingest_dead_letter에 보관합니다.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.core.config import get_settings
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.models import IngestDeadLetter
+from app.infrastructure.read_cache import read_cache
+from app.infrastructure.repositories.bulk_insert_repository import BulkInsertRepository
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+# 종료 신호 (큐에 넣어 플러셔 루프를 끝냄)
+_STOP = object()
+
+# 재시도해도 같은 결과인 행 자체의 오류 (행 단위로 나누어 거부된 행만 데드레터로 보냄)
+REJECTED_ROW_ERRORS = (IntegrityError, DataError)
+
+
+class WriteBehindQueue:
+    """테이블별 버퍼링 후 일괄 적재하는 write-behind 큐"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        enabled: bool = False,
+        max_size: int = 10000,
+        flush_max_rows: int = 500,
+        flush_interval_ms: int = 200,
+        retry_base_ms: int = 500,
+        retry_max_ms: int = 30000
+    ):
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.max_size = max_size
+        self.flush_max_rows = flush_max_rows
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.retry_base = retry_base_ms / 1000.0
+        self.retry_max = retry_max_ms / 1000.0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 테이블 이름 -> (모델, 버퍼링된 행 목록)
+        self._buffers: Dict[str, Tuple[Type[Any], List[Dict[str, Any]]]] = {}
+        # 테이블 이름 -> (연속 실패 횟수, 다음 재시도 시각)
+        self._retry: Dict[str, Tuple[int, float]] = {}
+        self._last_flush = time.monotonic()
+        self._stopping = False
+
+        # 메트릭
+        self.enqueued_total = 0
+        self.rejected_total = 0
+        self.flushed_rows_total = 0
+        self.failed_rows_total = 0
+        self.duplicate_rows_total = 0
+        self.retried_rows_total = 0
+        self.dead_letter_rows_total = 0
+        self.flush_count = 0
+        self.flush_latency_total_ms = 0.0
+        self.last_flush_latency_ms = 0.0
+        self.max_flush_latency_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """플러셔 실행 여부"""
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        """큐와 백그라운드 플러셔 시작"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._last_flush = time.monotonic()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"write-behind 수집 큐 시작 (max_size={self.max_size}, "
+            f"flush_max_rows={self.flush_max_rows}, flush_interval={self.flush_interval}s)"
+        )
+
+    async def stop(self):
+        """남은 데이터를 모두 기록한 뒤 플러셔 종료"""
+        if not self.running:
+            return
+        self._stopping = True
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info("write-behind 수집 큐 종료 (잔여 데이터 플러시 완료)")
+
+    async def enqueue(self, model: Type[Any], row: Dict[str, Any]) -> Dict[str, Any]:
+        """검증된 행을 큐에 적재 (큐가 가득 차면 503)"""
+        if not self.running:
+            raise HTTPException(status_code=503, detail="write-behind 수집 큐가 실행 중이 아닙니다")
+        # 미등록 디바이스 행이 플러시 전체를 외래 키 위반으로 실패시키지 않도록 미리 거부
+        # (다른 워커에서 방금 등록된 디바이스는 DB에서 확인한 뒤 판단)
+        await device_registry.resolve_missing([row.get("device_id")])
+        if device_registry.loaded and device_registry.get(row.get("device_id")) is None:
+            raise HTTPException(status_code=400, detail=f"등록되지 않은 디바이스입니다: {row.get('device_id')}")
+        try:
+            self._queue.put_nowait((model, row))
+        except asyncio.QueueFull:
+            self.rejected_total += 1
+            raise HTTPException(status_code=503, detail="수집 큐가 가득 찼습니다. 잠시 후 다시 시도하세요")
+
+        self.enqueued_total += 1
+        return {"status": "accepted", "queue_depth": self._queue.qsize()}
+
+    async def _run(self):
+        """플러셔 루프: 크기 또는 시간 임계값에 도달하면 테이블별로 기록"""
+        while True:
+            if self._backlogged() and not self._stopping:
+                # 재시도 대기 행이 쌓이면 큐를 비우지 않아 수집 측에 503으로 역압을 전달
+                await asyncio.sleep(self._retry_wait())
+                await self._flush_all()
+                continue
+
+            timeout = max(self.flush_interval - (time.monotonic() - self._last_flush), 0)
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                item = None
+
+            if item is _STOP:
+                self._drain_nowait()
+                await self._flush_all(force=True)
+                self._abandon_buffers()
+                return
+
+            if item is not None:
+                model, row = item
+                _, rows = self._buffers.setdefault(model.__tablename__, (model, []))
+                rows.append(row)
+                if len(rows) >= self.flush_max_rows:
+                    await self._flush_table(model.__tablename__)
+
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                await self._flush_all()
+
+    def _drain_nowait(self):
+        """종료 시 큐에 남은 항목을 버퍼로 이동"""
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is _STOP:
+                continue
+            model, row = item
+            self._buffers.setdefault(model.__tablename__, (model, []))[1].append(row)
+
+    async def _flush_all(self, force: bool = False):
+        """모든 테이블 버퍼 기록 (force면 재시도 대기 시간 무시)"""
+        for table_name in list(self._buffers.keys()):
+            await self._flush_table(table_name, force)
+        self._last_flush = time.monotonic()
+
+    async def _flush_table(self, table_name: str, force: bool = False):
+        """한 테이블 버퍼를 다중 행 INSERT로 기록 (재시도 대기 중이면 건너뜀)"""
+        model, rows = self._buffers.get(table_name, (None, []))
+        if not rows:
+            self._buffers.pop(table_name, None)
+            return
+        if not force and time.monotonic() < self._retry.get(table_name, (0, 0.0))[1]:
+            return
+        del self._buffers[table_name]
+
+        started = time.perf_counter()
+        try:
+            await self._insert(model, rows)
+            self._retry.pop(table_name, None)
+        except REJECTED_ROW_ERRORS as e:
+            logger.warning(f"write-behind 플러시 거부 ({table_name}, {len(rows)}건), 행 단위로 다시 기록: {e}")
+            await self._insert_each(table_name, model, rows)
+        except Exception as e:
+            self._requeue(table_name, model, rows, e)
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.flush_count += 1
+        self.flush_latency_total_ms += latency_ms
+        self.last_flush_latency_ms = latency_ms
+        self.max_flush_latency_ms = max(self.max_flush_latency_ms, latency_ms)
+
+    async def _insert(self, model: Type[Any], rows: List[Dict[str, Any]]):
+        """행들을 하나의 트랜잭션으로 기록"""
+        # 재전송으로 이미 적재된 행이 섞여도 플러시 전체가 실패하지 않도록 ON CONFLICT DO NOTHING 사용
+        async with self.session_factory() as db:
+            outcomes = await BulkInsertRepository(db).upsert_many(model, rows, "nothing")
+        duplicates = sum(1 for inserted in outcomes if inserted is None)
+        self.flushed_rows_total += len(rows) - duplicates
+        self.duplicate_rows_total += duplicates
+        await read_cache.invalidate_devices(row.get("device_id") for row in rows)
+
+    async def _insert_each(self, table_name: str, model: Type[Any], rows: List[Dict[str, Any]]):
+        """거부된 배치를 행 단위로 기록하고 거부된 행만 데드레터로 보냄"""
+        rejected: List[Tuple[Dict[str, Any], Exception]] = []
+        for index, row in enumerate(rows):
+            try:
+                await self._insert(model, [row])
+            except REJECTED_ROW_ERRORS as e:
+                rejected.append((row, e))
+            except Exception as e:
+                # 도중에 일시적 오류가 나면 남은 행은 다시 재시도 대기
+                self._requeue(table_name, model, rows[index:], e)
+                break
+        else:
+            self._retry.pop(table_name, None)
+        await self._dead_letter(table_name, rejected)
+
+    def _requeue(self, table_name: str, model: Type[Any], rows: List[Dict[str, Any]], error: Exception):
+        """일시적 실패 행을 버퍼 앞에 되돌리고 지수 백오프로 다음 재시도 시각 설정"""
+        attempts = self._retry.get(table_name, (0, 0.0))[0] + 1
+        delay = min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+        self._retry[table_name] = (attempts, time.monotonic() + delay)
+        self._buffers.setdefault(table_name, (model, []))[1][:0] = rows
+        self.retried_rows_total += len(rows)
+        logger.warning(
+            f"write-behind 플러시 실패 ({table_name}, {len(rows)}건, {attempts}회째), "
+            f"{delay:.1f}초 후 재시도: {error}"
+        )
+
+    async def _dead_letter(self, table_name: str, rejected: List[Tuple[Dict[str, Any], Exception]]):
+        """거부된 행을 ingest_dead_letter에 보관 (보관도 실패하면 행 내용을 로그로 남김)"""
+        if not rejected:
+            return
+        failed_at = datetime.now(timezone.utc)
+        payloads = [jsonable_encoder(row) for row, _ in rejected]
+        try:
+            async with self.session_factory() as db:
+                db.add_all([
+                    IngestDeadLetter(table_name=table_name, payload=payload, error=f"{type(error).__name__}: {error}", failed_at=failed_at)
+                    for payload, (_, error) in zip(payloads, rejected)
+                ])
+                await db.commit()
+            self.dead_letter_rows_total += len(rejected)
+            logger.error(f"write-behind 거부 행 {len(rejected)}건을 ingest_dead_letter에 보관 ({table_name})")
+        except Exception as e:
+            self.failed_rows_total += len(rejected)
+            logger.error(
+                f"데드레터 보관 실패 ({table_name}, {len(rejected)}건): {e}; "
+                f"행: {json.dumps(payloads, ensure_ascii=False)}"
+            )
+
+    def _backlogged(self) -> bool:
+        """재시도 대기 중인 버퍼가 큐 크기 이상 쌓였는지 여부"""
+        return bool(self._retry) and sum(len(rows) for _, rows in self._buffers.values()) >= self.max_size
+
+    def _retry_wait(self) -> float:
+        """가장 빠른 재시도까지 남은 시간(초)"""
+        retry_at = [self._retry[name][1] for name in self._buffers if name in self._retry]
+        return max(min(retry_at, default=time.monotonic() + self.flush_interval) - time.monotonic(), 0)
+
+    def _abandon_buffers(self):
+        """종료 시까지 기록하지 못한 행을 내용과 함께 로그로 남김"""
+        for table_name, (_, rows) in self._buffers.items():
+            if rows:
+                self.failed_rows_total += len(rows)
+                logger.error(
+                    f"종료 시 기록하지 못한 write-behind 행 ({table_name}, {len(rows)}건): "
+                    f"{json.dumps(jsonable_encoder(rows), ensure_ascii=False)}"
+                )
+        self._buffers.clear()
+        self._retry.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """큐 깊이 및 플러시 지연 메트릭"""
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_max_size": self.max_size,
+            "buffered_rows": sum(len(rows) for _, rows in self._buffers.values()),
+            "enqueued_total": self.enqueued_total,
+            "rejected_total": self.rejected_total,
+            "flushed_rows_total": self.flushed_rows_total,
+            "failed_rows_total": self.failed_rows_total,
+            "duplicate_rows_total": self.duplicate_rows_total,
+            "retried_rows_total": self.retried_rows_total,
+            "dead_letter_rows_total": self.dead_letter_rows_total,
+            "retrying_tables": sorted(self._retry),
+            "flush_count": self.flush_count,
+            "last_flush_latency_ms": round(self.last_flush_latency_ms, 2),
+            "avg_flush_latency_ms": round(self.flush_latency_total_ms / self.flush_count, 2) if self.flush_count else 0.0,
+            "max_flush_latency_ms": round(self.max_flush_latency_ms, 2),
+        }
+
+
+# 전역 write-behind 큐 인스턴스
+ingest_queue = WriteBehindQueue(
+    session_factory=AsyncSessionLocal,
+    enabled=settings.INGEST_WRITE_BEHIND,
+    max_size=settings.INGEST_QUEUE_MAX_SIZE,
+    flush_max_rows=settings.INGEST_FLUSH_MAX_ROWS,
+    flush_interval_ms=settings.INGEST_FLUSH_INTERVAL_MS,
+    retry_base_ms=settings.INGEST_RETRY_BASE_MS,
+    retry_max_ms=settings.INGEST_RETRY_MAX_MS
+)
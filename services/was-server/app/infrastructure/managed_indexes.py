@@ -0,0 +1,142 @@
+"""
+시계열 테이블 관리 인덱스 모듈
+
+시계열 테이블은 기본 키가 `(time, device_id)`처럼 time이 앞에 있어서
+`WHERE device_id = ? ORDER BY time DESC` 형태의 디바이스별 조회가 기본 키를 제대로 타지 못합니다.
+여기에 선언한 인덱스를 관리 스크립트(maintenance/database/create_managed_indexes.py)가 생성하고,
+진단 스크립트(diagnostics/schema/check_indexes.py)가 누락/미사용 인덱스를 테이블별로 보고합니다.
+
+- 기본 키가 `(time, <소유자>)`인 테이블: `(<소유자>, time DESC)` B-tree
+- 원시 센서 테이블(sensor_raw_*): time BRIN (시간순 적재이므로 작은 크기로 범위 조회를 거름)
+- 경보/위기 행: 해당 행만 담는 부분 인덱스, 버튼 이벤트: (event_type, time DESC)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.infrastructure.models import Base
+
+# 원시 센서 테이블 접두사 (BRIN 대상)
+RAW_TABLE_PREFIX = "sensor_raw_"
+
+# 스캔 수가 이 값 이하인 인덱스를 미사용으로 보고
+UNUSED_INDEX_MAX_SCANS = 0
+
+# 순차 스캔 위주 테이블로 보고할 최소 행 수
+SEQ_SCAN_MIN_ROWS = 10000
+
+
+@dataclass(frozen=True)
+class ManagedIndex:
+    """관리 인덱스 선언"""
+
+    name: str
+    table_name: str
+    columns: str
+    method: str = "btree"
+    where: Optional[str] = None
+
+    def ddl(self, concurrently: bool = True) -> str:
+        """인덱스 생성 DDL (이미 있으면 유지)"""
+        option = " CONCURRENTLY" if concurrently else ""
+        statement = (
+            f"CREATE INDEX{option} IF NOT EXISTS {self.name} ON {self.table_name} "
+            f"USING {self.method} ({self.columns})"
+        )
+        if self.where:
+            statement += f" WHERE {self.where}"
+        return statement
+
+
+def time_series_indexes(metadata=Base.metadata) -> List[ManagedIndex]:
+    """기본 키가 (time, <소유자>)인 테이블의 소유자별 시간 역순 인덱스와 원시 테이블 BRIN 인덱스"""
+    indexes = []
+    for table in metadata.sorted_tables:
+        key_columns = [column.name for column in table.primary_key.columns]
+        if len(key_columns) != 2 or key_columns[0] != "time":
+            continue
+        owner = key_columns[1]
+        indexes.append(ManagedIndex(
+            name=f"ix_{table.name}_{owner}_time",
+            table_name=table.name,
+            columns=f"{owner}, time DESC"
+        ))
+        if table.name.startswith(RAW_TABLE_PREFIX):
+            indexes.append(ManagedIndex(
+                name=f"brin_{table.name}_time",
+                table_name=table.name,
+                columns="time",
+                method="brin"
+            ))
+    return indexes
+
+
+# 경보/이벤트 조회 인덱스 (부분 인덱스는 리포지토리의 조회 조건과 같은 식이어야 사용됩니다)
+# 위기 이벤트는 건수가 적고 가장 급하게 조회되므로 이벤트 타입 인덱스와 별도로 작은 부분 인덱스를 둡니다.
+QUERY_INDEXES: List[ManagedIndex] = [
+    ManagedIndex(
+        name="ix_home_state_snapshots_alert_user_time",
+        table_name="home_state_snapshots",
+        columns="user_id, time DESC",
+        where="alert_level IN ('Warning', 'Emergency')"
+    ),
+    ManagedIndex(
+        name="ix_sensor_event_button_event_type_time",
+        table_name="sensor_event_button",
+        columns="event_type, time DESC"
+    ),
+    ManagedIndex(
+        name="ix_sensor_event_button_crisis_time",
+        table_name="sensor_event_button",
+        columns="time DESC",
+        where="event_type = 'crisis_acknowledged'"
+    ),
+]
+
+# 관리 인덱스 전체
+MANAGED_INDEXES: List[ManagedIndex] = time_series_indexes() + QUERY_INDEXES
+
+
+def build_index_report(
+    existing_indexes: Iterable[Dict[str, Any]],
+    index_stats: Iterable[Dict[str, Any]],
+    table_stats: Iterable[Dict[str, Any]],
+    managed_indexes: Iterable[ManagedIndex] = MANAGED_INDEXES
+) -> Dict[str, Dict[str, Any]]:
+    """테이블별 인덱스 진단 보고서 생성
+
+    Args:
+        existing_indexes: pg_indexes 행 (tablename, indexname)
+        index_stats: pg_stat_user_indexes + pg_index 행 (relname, indexrelname, idx_scan, is_primary, is_unique, size_bytes)
+        table_stats: pg_stat_user_tables 행 (relname, seq_scan, idx_scan, n_live_tup)
+
+    Returns:
+        {테이블: {"missing": [관리 인덱스 이름], "unused": [{"index", "size_bytes", "managed"}], "seq_scan_heavy": bool}}
+    """
+    existing = {row["indexname"] for row in existing_indexes}
+    managed_names = set()
+    report: Dict[str, Dict[str, Any]] = {}
+
+    def entry(table_name: str) -> Dict[str, Any]:
+        return report.setdefault(table_name, {"missing": [], "unused": [], "seq_scan_heavy": False})
+
+    for index in managed_indexes:
+        managed_names.add(index.name)
+        if index.name not in existing:
+            entry(index.table_name)["missing"].append(index.name)
+
+    for row in index_stats:
+        if row["is_primary"] or row["is_unique"] or (row["idx_scan"] or 0) > UNUSED_INDEX_MAX_SCANS:
+            continue
+        entry(row["relname"])["unused"].append({
+            "index": row["indexrelname"],
+            "size_bytes": row["size_bytes"],
+            "managed": row["indexrelname"] in managed_names,
+        })
+
+    for row in table_stats:
+        seq_scan, idx_scan = row["seq_scan"] or 0, row["idx_scan"] or 0
+        if (row["n_live_tup"] or 0) >= SEQ_SCAN_MIN_ROWS and seq_scan > idx_scan:
+            entry(row["relname"])["seq_scan_heavy"] = True
+
+    return report
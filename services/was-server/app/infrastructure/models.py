@@ -6,7 +6,7 @@ SQLAlchemy ORM 모델
 
 from datetime import datetime, date
 from typing import Optional, List
-from sqlalchemy import Column, String, Integer, Numeric, Boolean, Text, SmallInteger, BigInteger
+from sqlalchemy import Column, String, Integer, Numeric, Boolean, Text, SmallInteger, BigInteger, Float
 from sqlalchemy import DateTime, UUID, ForeignKey, JSON, Date
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, Mapped
@@ -406,6 +406,96 @@ class SensorRawTemperature(Base):
     device = relationship("Device", back_populates="temperature_events")
 
 
+# 롤업(시간/일 단위 집계) 테이블
+class SensorRollupHourly(Base):
+    """센서 측정값 시간 단위 롤업 테이블 ORM 모델
+
+    (센서 타입, 측정값 필드, 디바이스, 버킷 시작 시각)별 개수/최소/최대/합계/마지막 값입니다.
+    """
+    __tablename__ = "sensor_rollup_hourly"
+    
+    sensor_type: Mapped[str] = Column(String(64), primary_key=True)
+    field: Mapped[str] = Column(String(64), primary_key=True)
+    device_id: Mapped[str] = Column(String(64), primary_key=True)
+    bucket: Mapped[datetime] = Column(DateTime(timezone=True), primary_key=True)
+    value_count: Mapped[int] = Column(BigInteger, nullable=False)
+    value_min: Mapped[Optional[float]] = Column(Float, nullable=True)
+    value_max: Mapped[Optional[float]] = Column(Float, nullable=True)
+    value_sum: Mapped[Optional[float]] = Column(Float, nullable=True)
+    last_value: Mapped[Optional[float]] = Column(Float, nullable=True)
+    last_time: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+
+
+class SensorRollupDaily(Base):
+    """센서 측정값 일 단위 롤업 테이블 ORM 모델 (시간 단위 롤업에서 집계)"""
+    __tablename__ = "sensor_rollup_daily"
+    
+    sensor_type: Mapped[str] = Column(String(64), primary_key=True)
+    field: Mapped[str] = Column(String(64), primary_key=True)
+    device_id: Mapped[str] = Column(String(64), primary_key=True)
+    bucket: Mapped[datetime] = Column(DateTime(timezone=True), primary_key=True)
+    value_count: Mapped[int] = Column(BigInteger, nullable=False)
+    value_min: Mapped[Optional[float]] = Column(Float, nullable=True)
+    value_max: Mapped[Optional[float]] = Column(Float, nullable=True)
+    value_sum: Mapped[Optional[float]] = Column(Float, nullable=True)
+    last_value: Mapped[Optional[float]] = Column(Float, nullable=True)
+    last_time: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+
+
+class SensorRollupWatermark(Base):
+    """센서 타입별 롤업 워터마크 테이블 ORM 모델
+
+    watermark 이전의 시간 버킷은 롤업이 완료된 구간입니다.
+    """
+    __tablename__ = "sensor_rollup_watermark"
+    
+    sensor_type: Mapped[str] = Column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+
+
+class SensorRollupDirty(Base):
+    """롤업 재계산 대기 시간 버킷 테이블 ORM 모델
+
+    워터마크 - 지연 허용 시간 이전 구간에 늦게 도착한 행의 시간 버킷을 적재 트랜잭션에서 기록하고,
+    잠금을 얻은 롤업 작업이 꺼내어 다시 계산합니다.
+    """
+    __tablename__ = "sensor_rollup_dirty"
+    
+    sensor_type: Mapped[str] = Column(String(64), primary_key=True)
+    bucket: Mapped[datetime] = Column(DateTime(timezone=True), primary_key=True)
+
+
+# 디바이스별 최신 측정값 테이블
+class DeviceLatest(Base):
+    """디바이스 최신 측정값 테이블 ORM 모델
+
+    (원본 테이블, 디바이스)별 가장 최근 행을 payload(컬럼 이름 -> 값)로 보관합니다.
+    """
+    __tablename__ = "device_latest"
+    
+    source_table: Mapped[str] = Column(String(64), primary_key=True)
+    device_id: Mapped[str] = Column(String(64), primary_key=True)
+    time: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+    payload: Mapped[dict] = Column(JSONB, nullable=False)
+    updated_at: Mapped[Optional[datetime]] = Column(DateTime(timezone=True), nullable=True)
+
+
+# write-behind 수집 거부 행 테이블
+class IngestDeadLetter(Base):
+    """write-behind 플러시에서 제약 조건 등으로 거부된 행 테이블 ORM 모델
+
+    이미 202로 수락된 행이므로 버리지 않고 원본 행(payload)과 오류를 보관합니다.
+    """
+    __tablename__ = "ingest_dead_letter"
+    
+    id: Mapped[int] = Column(BigInteger, primary_key=True, autoincrement=True)
+    table_name: Mapped[str] = Column(String(64), nullable=False)
+    payload: Mapped[dict] = Column(JSONB, nullable=False)
+    error: Mapped[str] = Column(Text, nullable=False)
+    failed_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+
+
 # Alembic 버전 테이블
 class AlembicVersion(Base):
     """Alembic 버전 테이블 ORM 모델"""
@@ -444,5 +534,10 @@ __all__ = [
     "HomeStateSnapshot",
     "SensorEventButton",
     "AlembicVersion",
-    "SensorRawTemperature"
+    "SensorRawTemperature",
+    "SensorRollupHourly",
+    "SensorRollupDaily",
+    "SensorRollupWatermark",
+    "DeviceLatest",
+    "IngestDeadLetter"
 ] 
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Keyset(커서) 페이지네이션 모듈
+
+시계열 테이블의 기본 키 `(time, device_id)`(스냅샷은 `(time, user_id)`)를 기준으로
+`WHERE (time, key) < (:time, :key) ORDER BY time DESC, key DESC LIMIT n` 형태로 조회합니다.
+OFFSET과 달리 기본 키 인덱스 범위 탐색만 하므로 몇 번째 페이지든 비용이 같습니다.
+
+커서는 마지막 행의 (time, key)를 base64로 감싼 불투명 문자열이며,
+목록 응답의 `X-Next-Cursor` 헤더(목록 응답 객체가 있으면 `next_cursor` 필드)로 전달됩니다.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import literal, tuple_
+
+from app.interfaces.pagination import Cursor
+
+# 다음 페이지 커서 응답 헤더
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(time: datetime, key: Any) -> str:
+    """(time, key)를 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps([time.isoformat(), str(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """커서 문자열을 (time, key)로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        time_text, key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(time_text), str(key)
+    except Exception:
+        raise ValueError("잘못된 cursor입니다")
+
+
+def cursor_param(
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 X-Next-Cursor 값)")
+) -> Optional[Cursor]:
+    """cursor 쿼리 파라미터 의존성 (잘못된 커서는 400)"""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def apply_keyset(query, time_column, key_column, cursor: Optional[Cursor]):
+    """(time, key) 내림차순 keyset 조건과 정렬 적용
+
+    기존 `order_by(time.desc())` 대신 사용하며, 같은 시각의 행도 key로 순서가 고정됩니다.
+    """
+    if cursor is not None:
+        time, key = cursor
+        # 커서 값을 컬럼 타입으로 바인딩 (UUID 키 등)
+        key_type = key_column.type
+        if key_type.python_type is not str:
+            key = key_type.python_type(key)
+        query = query.where(
+            tuple_(time_column, key_column) < tuple_(literal(time, time_column.type), literal(key, key_type))
+        )
+    return query.order_by(time_column.desc(), key_column.desc())
+
+
+def next_cursor(items: Sequence[Any], limit: int, key_attr: str = "device_id") -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 행의 커서, 아니면 None (마지막 페이지)"""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor(last["time"], last[key_attr])
+    return encode_cursor(last.time, getattr(last, key_attr))
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int, key_attr: str = "device_id") -> Optional[str]:
+    """다음 페이지 커서를 응답 헤더에 기록하고 반환"""
+    cursor = next_cursor(items, limit, key_attr)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+    return cursor
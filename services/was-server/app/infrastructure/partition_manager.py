@@ -0,0 +1,308 @@
+"""
+시계열 테이블 파티션 관리 모듈
+
+원시/엣지/액추에이터/스냅샷 테이블을 time 기준 RANGE 파티션(기본 월 단위)으로 나누어,
+오래된 데이터를 DELETE 대신 파티션 분리(DETACH)/삭제(DROP)로 정리하고 시간 범위 조회가 파티션 프루닝을 받도록 합니다.
+
+- 기존 테이블의 변환은 관리 스크립트(maintenance/database/partition_tables.py)가 수행합니다.
+  (기존 테이블은 `MINVALUE ~ 변환 시점의 다음 주기 시작` 파티션으로 그대로 붙이므로 행을 다시 쓰지 않습니다)
+- 이 모듈의 작업은 이미 파티션으로 변환된 테이블만 다루며, 주기적으로
+  앞으로 `premake`개 주기의 파티션을 미리 만들고 보존 기간이 지난 파티션을 분리 또는 삭제합니다.
+- Parquet 아카이브(ARCHIVE_ENABLED)를 사용하는 원시 센서 테이블은 아카이브 워터마크 이전 파티션만 삭제합니다.
+  아직 아카이브되지 않은 행이 있는 파티션은 아카이브가 따라올 때까지 그대로 둡니다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.infrastructure.archive_store import ARCHIVED_MODELS, archive_store
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.models import Base
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+# 파티션 대상 테이블 접두사/이름
+PARTITIONED_TABLE_PREFIXES = ("sensor_raw_", "sensor_edge_", "actuator_log_")
+PARTITIONED_EXTRA_TABLES = ("home_state_snapshots",)
+
+# 보존 기간이 지난 파티션 처리 방식
+EXPIRE_ACTIONS = ("detach", "drop")
+
+# 파티션 경계식의 상한 값 (예: FOR VALUES FROM (MINVALUE) TO ('2025-02-01 00:00:00+00'))
+_UPPER_BOUND_PATTERN = re.compile(r"TO \('([^']+)'\)")
+
+
+def partitioned_tables(metadata=Base.metadata) -> List[Any]:
+    """파티션 대상 테이블 (기본 키에 time이 포함된 원시/엣지/액추에이터/스냅샷 테이블)"""
+    return [
+        table for table in metadata.sorted_tables
+        if (table.name.startswith(PARTITIONED_TABLE_PREFIXES) or table.name in PARTITIONED_EXTRA_TABLES)
+        and "time" in table.primary_key.columns
+    ]
+
+
+def period_start(value: datetime, interval_months: int = 1) -> datetime:
+    """value가 속한 주기(interval_months 개월, 1월 기준 정렬)의 UTC 시작 시각"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    index = (value.year * 12 + value.month - 1) // interval_months * interval_months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """월 시작 시각에 months 개월을 더함"""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table_name: str, start: datetime) -> str:
+    """파티션 테이블 이름 (<테이블>_pYYYYMM)"""
+    return f"{table_name}_p{start:%Y%m}"
+
+
+def parse_upper_bound(bound: str) -> Optional[datetime]:
+    """pg_get_expr(relpartbound) 결과에서 상한 시각 추출 (DEFAULT/MAXVALUE는 None)"""
+    match = _UPPER_BOUND_PATTERN.search(bound or "")
+    if match is None:
+        return None
+    value = match.group(1)
+    if re.search(r"[+-]\d{2}$", value):
+        value += ":00"
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def plan_partitions(
+    upper_bounds: Sequence[Optional[datetime]],
+    now: datetime,
+    interval_months: int = 1,
+    premake: int = 3
+) -> List[Tuple[datetime, datetime]]:
+    """새로 만들 파티션 구간 [start, end) 목록
+
+    기존 파티션의 가장 큰 상한(없으면 현재 주기 시작)부터 현재 주기 이후 premake개 주기까지 이어서 만듭니다.
+    """
+    current = period_start(now, interval_months)
+    target = add_months(current, interval_months * (premake + 1))
+    bounds = [bound for bound in upper_bounds if bound is not None]
+    start = max(bounds) if bounds else current
+    ranges = []
+    while start < target:
+        end = add_months(period_start(start, interval_months), interval_months)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def expired_partitions(
+    partitions: Sequence[Tuple[str, Optional[datetime]]],
+    now: datetime,
+    interval_months: int = 1,
+    retention_months: int = 0
+) -> List[str]:
+    """상한이 보존 기간 시작 이하인 (모든 행이 만료된) 파티션 이름 목록 (retention_months=0이면 보존 무제한)"""
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(period_start(now, interval_months), -retention_months)
+    return [name for name, upper in partitions if upper is not None and upper <= cutoff]
+
+
+def archived_partitions(
+    partitions: Sequence[Tuple[str, Optional[datetime]]],
+    names: Sequence[str],
+    watermark: Optional[datetime]
+) -> List[str]:
+    """names 중 상한이 아카이브 워터마크 이하인 (모든 행이 아카이브된) 파티션 이름 목록"""
+    if watermark is None:
+        return []
+    upper_bounds = dict(partitions)
+    return [name for name in names if upper_bounds.get(name) is not None and upper_bounds[name] <= watermark]
+
+
+class PartitionManager:
+    """파티션 사전 생성/만료 처리 작업
+
+    테이블마다 별도 트랜잭션으로 처리하며, 여러 프로세스가 동시에 같은 테이블을 다루지 않도록
+    트랜잭션 단위 advisory lock을 잡습니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        table_names: Optional[List[str]] = None,
+        interval_months: int = 1,
+        premake: int = 3,
+        retention_months: int = 0,
+        expire_action: str = "detach",
+        interval_sec: float = 3600.0,
+        enabled: bool = False,
+        archive: Optional[Any] = None
+    ):
+        if expire_action not in EXPIRE_ACTIONS:
+            raise ValueError(f"expire_action은 {', '.join(EXPIRE_ACTIONS)} 중 하나여야 합니다")
+        self.session_factory = session_factory
+        self.table_names = table_names if table_names is not None else [table.name for table in partitioned_tables()]
+        self.interval_months = interval_months
+        self.premake = premake
+        self.retention_months = retention_months
+        self.expire_action = expire_action
+        self.interval_sec = interval_sec
+        self.enabled = enabled
+        self.archive = archive
+        self._archived_tables = {model.__tablename__ for model in ARCHIVED_MODELS}
+        self._task: Optional[asyncio.Task] = None
+
+        # 메트릭
+        self.runs = 0
+        self.failed_runs = 0
+        self.created_partitions = 0
+        self.expired_partitions = 0
+        self.last_run_at: Optional[float] = None
+        self.last_run_latency_ms = 0.0
+
+    async def _partitions(self, db, table_name: str) -> List[Tuple[str, Optional[datetime]]]:
+        result = await db.execute(
+            text(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+                "FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table_name"
+            ),
+            {"table_name": table_name}
+        )
+        return [(name, parse_upper_bound(bound)) for name, bound in result.all()]
+
+    async def is_partitioned(self, db, table_name: str) -> bool:
+        """테이블이 파티션 테이블로 변환되었는지 여부"""
+        result = await db.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+                "WHERE c.relname = :table_name"
+            ),
+            {"table_name": table_name}
+        )
+        return result.first() is not None
+
+    async def create_partitions(self, db, table_name: str, now: datetime) -> int:
+        """앞으로 premake개 주기까지 파티션 생성 (생성한 수 반환)"""
+        partitions = await self._partitions(db, table_name)
+        ranges = plan_partitions([upper for _, upper in partitions], now, self.interval_months, self.premake)
+        for start, end in ranges:
+            await db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, start)} PARTITION OF {table_name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            ))
+        return len(ranges)
+
+    async def expire_partitions(self, db, table_name: str, now: datetime) -> List[str]:
+        """보존 기간이 지난 파티션 분리(및 삭제) (처리한 파티션 이름 반환)"""
+        partitions = await self._partitions(db, table_name)
+        names = expired_partitions(partitions, now, self.interval_months, self.retention_months)
+        if self.expire_action == "drop" and self._archives(table_name):
+            # 아카이브에 옮겨지지 않은 행이 있는 파티션은 삭제하지 않고 다음 실행에서 다시 확인
+            droppable = archived_partitions(partitions, names, self.archive.watermark(table_name))
+            skipped = [name for name in names if name not in droppable]
+            if skipped:
+                logger.warning(f"{table_name} 아카이브 워터마크 이후 행이 있어 파티션 삭제 보류: {', '.join(skipped)}")
+            names = droppable
+        for name in names:
+            await db.execute(text(f"ALTER TABLE {table_name} DETACH PARTITION {name}"))
+            if self.expire_action == "drop":
+                await db.execute(text(f"DROP TABLE {name}"))
+        return names
+
+    def _archives(self, table_name: str) -> bool:
+        """테이블이 Parquet 아카이브 대상인지 여부 (아카이브 사용 시)"""
+        return self.archive is not None and self.archive.enabled and table_name in self._archived_tables
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """모든 대상 테이블의 파티션 1회 관리 (테이블별 생성/만료 결과 반환)"""
+        now = now or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        summary: Dict[str, Any] = {}
+        for table_name in self.table_names:
+            async with self.session_factory() as db:
+                try:
+                    locked = await db.execute(
+                        text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                        {"key": f"partition_manager:{table_name}"}
+                    )
+                    if not locked.scalar() or not await self.is_partitioned(db, table_name):
+                        await db.rollback()
+                        continue
+                    created = await self.create_partitions(db, table_name, now)
+                    expired = await self.expire_partitions(db, table_name, now)
+                    await db.commit()
+                    self.created_partitions += created
+                    self.expired_partitions += len(expired)
+                    summary[table_name] = {"created": created, "expired": expired}
+                except Exception as e:
+                    await db.rollback()
+                    self.failed_runs += 1
+                    logger.error(f"{table_name} 파티션 관리 실패: {e}")
+        self.runs += 1
+        self.last_run_at = time.time()
+        self.last_run_latency_ms = (time.perf_counter() - started) * 1000
+        return summary
+
+    async def start(self):
+        """주기적 파티션 관리 시작"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        """주기적 파티션 관리 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"파티션 관리 실패: {e}")
+            await asyncio.sleep(self.interval_sec)
+
+    def stats(self) -> Dict[str, Any]:
+        """파티션 관리 작업 상태"""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "created_partitions": self.created_partitions,
+            "expired_partitions": self.expired_partitions,
+            "last_run_at": self.last_run_at,
+            "last_run_latency_ms": round(self.last_run_latency_ms, 3),
+        }
+
+
+# 전역 파티션 관리 작업 인스턴스
+partition_manager = PartitionManager(
+    session_factory=AsyncSessionLocal,
+    interval_months=settings.PARTITION_INTERVAL_MONTHS,
+    premake=settings.PARTITION_PREMAKE,
+    retention_months=settings.PARTITION_RETENTION_MONTHS,
+    expire_action=settings.PARTITION_EXPIRE_ACTION,
+    interval_sec=settings.PARTITION_MAINTENANCE_INTERVAL_SEC,
+    enabled=settings.PARTITIONING_ENABLED,
+    archive=archive_store
+)
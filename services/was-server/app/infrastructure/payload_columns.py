@@ -0,0 +1,96 @@
+"""
+raw_payload 핫 키 생성 컬럼 모듈
+
+원시 센서 테이블은 측정값을 JSONB raw_payload에만 보관하므로, 임계값/범위 조회가
+행마다 JSON을 풀어야 하고 인덱스를 탈 수 없습니다.
+자주 조회하는 키를 여기에 선언하면 관리 스크립트(maintenance/database/create_payload_columns.py)가
+타입이 있는 STORED 생성 컬럼과 (device_id, 컬럼) 부분 인덱스를 만들고,
+PAYLOAD_COLUMNS_ENABLED=true이면 `sql_aggregates`의 raw_payload 표현식이 JSON 추출 대신 이 컬럼을 사용합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import Float, Text, column
+
+from app.core.config import get_settings
+from app.infrastructure.models import (
+    SensorRawLoadCell, SensorRawMQ5, SensorRawMQ7, SensorRawRFID, SensorRawSound
+)
+
+# 설정 가져오기
+settings = get_settings()
+
+# 컬럼 종류별 (SQL 타입, SQLAlchemy 타입)
+PAYLOAD_COLUMN_KINDS = {
+    "number": ("double precision", Float),
+    "text": ("text", Text),
+}
+
+
+@dataclass(frozen=True)
+class PayloadColumn:
+    """raw_payload 키를 옮긴 생성 컬럼 선언 (컬럼 이름은 키 이름과 동일)"""
+
+    model: Type[Any]
+    key: str
+    kind: str = "number"
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    @property
+    def index_name(self) -> str:
+        return f"ix_{self.table_name}_{self.key}"
+
+    def generated_expression(self) -> str:
+        """생성 컬럼 식 (숫자는 JSON 숫자일 때만 값, 그 외 NULL)"""
+        if self.kind == "number":
+            return (
+                f"CASE WHEN jsonb_typeof(raw_payload -> '{self.key}') = 'number' "
+                f"THEN (raw_payload ->> '{self.key}')::double precision END"
+            )
+        return f"raw_payload ->> '{self.key}'"
+
+    def column_ddl(self) -> str:
+        sql_type = PAYLOAD_COLUMN_KINDS[self.kind][0]
+        return (
+            f"ALTER TABLE {self.table_name} ADD COLUMN IF NOT EXISTS {self.key} {sql_type} "
+            f"GENERATED ALWAYS AS ({self.generated_expression()}) STORED"
+        )
+
+    def index_ddl(self) -> str:
+        return (
+            f"CREATE INDEX IF NOT EXISTS {self.index_name} ON {self.table_name} "
+            f"(device_id, {self.key}) WHERE {self.key} IS NOT NULL"
+        )
+
+    def expression(self):
+        """쿼리에서 사용할 생성 컬럼 참조"""
+        return column(self.key, PAYLOAD_COLUMN_KINDS[self.kind][1], _selectable=self.model.__table__)
+
+
+# 생성 컬럼으로 관리하는 raw_payload 핫 키 (디바이스가 실제로 전송하는 키 이름)
+PAYLOAD_COLUMNS: List[PayloadColumn] = [
+    PayloadColumn(SensorRawMQ5, "gas_level"),
+    PayloadColumn(SensorRawMQ7, "co_level"),
+    PayloadColumn(SensorRawSound, "db_value"),
+    PayloadColumn(SensorRawLoadCell, "weight_kg"),
+    PayloadColumn(SensorRawRFID, "card_id", "text"),
+]
+
+_COLUMNS_BY_KEY: Dict[Tuple[str, str], PayloadColumn] = {
+    (item.table_name, item.key): item for item in PAYLOAD_COLUMNS
+}
+
+
+def get_payload_column(model: Type[Any], key: str, kind: str) -> Optional[PayloadColumn]:
+    """활성화된 경우 모델/키/종류에 맞는 생성 컬럼 선언 반환 (없으면 None)
+
+    별칭(아카이브 합집합 등)은 생성 컬럼이 없을 수 있으므로 항상 None입니다.
+    """
+    if not settings.PAYLOAD_COLUMNS_ENABLED or not isinstance(model, type):
+        return None
+    item = _COLUMNS_BY_KEY.get((model.__tablename__, key))
+    return item if item is not None and item.kind == kind else None
@@ -0,0 +1,176 @@
+"""
+수집 속도 제한 모듈
+
+디바이스별/센서 타입별 토큰 버킷으로 수집 요청을 제한합니다.
+고장 난 디바이스가 짧은 루프로 데이터를 쏟아내도 공유 DB 커넥션 풀이 고갈되지 않도록
+미들웨어(`app.core.middleware.IngestRateLimitMiddleware`)가 적재 전에 이 제한기를 확인합니다.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import get_settings
+
+# 설정 가져오기
+settings = get_settings()
+
+# 추적하는 버킷 수가 이 값을 넘으면 가득 찬(유휴) 버킷을 정리
+MAX_TRACKED_BUCKETS = 10000
+
+
+class TokenBucket:
+    """초당 rate개씩 최대 capacity개까지 채워지는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float):
+        """경과 시간만큼 토큰 보충"""
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def cost_of(self, count: int) -> float:
+        """소모할 토큰 수
+
+        버스트보다 큰 요청은 버킷이 가득 찼을 때만 허용되고 버킷을 모두 비웁니다.
+        """
+        return min(float(count), self.capacity)
+
+    def wait_time(self, count: int) -> float:
+        """count개를 소모할 수 있을 때까지 남은 시간(초), 지금 가능하면 0"""
+        deficit = self.cost_of(count) - self.tokens
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def consume(self, count: int):
+        """토큰 소모 (wait_time이 0인지 먼저 확인해야 함)"""
+        self.tokens -= self.cost_of(count)
+
+
+class IngestRateLimiter:
+    """디바이스별/센서 타입별 토큰 버킷 수집 제한기"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        device_rate: float = 50.0,
+        device_burst: float = 500.0,
+        sensor_type_rate: float = 1000.0,
+        sensor_type_burst: float = 5000.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.enabled = enabled
+        self.device_rate = device_rate
+        self.device_burst = device_burst
+        self.sensor_type_rate = sensor_type_rate
+        self.sensor_type_burst = sensor_type_burst
+        self.clock = clock
+
+        self._device_buckets: Dict[str, TokenBucket] = {}
+        self._sensor_type_buckets: Dict[str, TokenBucket] = {}
+
+        # 메트릭
+        self.allowed_requests = 0
+        self.rejected_requests = 0
+        self.allowed_readings = 0
+        self.dropped_readings = 0
+        self.device_drops: Dict[str, int] = {}
+        self.sensor_type_drops: Dict[str, int] = {}
+
+    def _bucket(self, buckets: Dict[str, TokenBucket], key: str, rate: float, capacity: float, now: float) -> TokenBucket:
+        """키별 버킷 조회 (없으면 가득 찬 상태로 생성)"""
+        bucket = buckets.get(key)
+        if bucket is None:
+            if len(buckets) >= MAX_TRACKED_BUCKETS:
+                self._prune(buckets, now)
+            bucket = buckets[key] = TokenBucket(rate, capacity, now)
+        else:
+            bucket.refill(now)
+        return bucket
+
+    @staticmethod
+    def _prune(buckets: Dict[str, TokenBucket], now: float):
+        """다시 가득 찬 버킷은 새로 만든 버킷과 같으므로 제거"""
+        for key in list(buckets.keys()):
+            bucket = buckets[key]
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del buckets[key]
+
+    def acquire(self, readings: Iterable[Tuple[Optional[str], Optional[str]]]) -> float:
+        """요청에 포함된 측정값만큼 토큰 소모
+
+        Args:
+            readings: (device_id, sensor_type) 목록. 알 수 없는 값은 None
+        Returns:
+            0이면 허용, 그 외에는 재시도까지 기다려야 할 시간(초)
+        """
+        device_counts: Dict[str, int] = {}
+        sensor_type_counts: Dict[str, int] = {}
+        for device_id, sensor_type in readings:
+            if device_id is not None:
+                device_counts[device_id] = device_counts.get(device_id, 0) + 1
+            if sensor_type is not None:
+                sensor_type_counts[sensor_type] = sensor_type_counts.get(sensor_type, 0) + 1
+        if not device_counts and not sensor_type_counts:
+            return 0.0
+
+        now = self.clock()
+        checks = [
+            (self._bucket(self._device_buckets, key, self.device_rate, self.device_burst, now), count)
+            for key, count in device_counts.items()
+        ] + [
+            (self._bucket(self._sensor_type_buckets, key, self.sensor_type_rate, self.sensor_type_burst, now), count)
+            for key, count in sensor_type_counts.items()
+        ]
+
+        # 모든 버킷에 여유가 있을 때만 소모하여 일부 버킷만 차감되는 일이 없도록 함
+        retry_after = max(bucket.wait_time(count) for bucket, count in checks)
+        total = max(sum(device_counts.values()), sum(sensor_type_counts.values()))
+        if retry_after > 0:
+            self.rejected_requests += 1
+            self.dropped_readings += total
+            for key, count in device_counts.items():
+                self.device_drops[key] = self.device_drops.get(key, 0) + count
+            for key, count in sensor_type_counts.items():
+                self.sensor_type_drops[key] = self.sensor_type_drops.get(key, 0) + count
+            return retry_after
+
+        for bucket, count in checks:
+            bucket.consume(count)
+        self.allowed_requests += 1
+        self.allowed_readings += total
+        return 0.0
+
+    def metrics(self, top: int = 20):
+        """허용/거부 건수와 드롭이 많은 디바이스/센서 타입"""
+        def top_drops(drops: Dict[str, int]) -> Dict[str, int]:
+            return dict(sorted(drops.items(), key=lambda item: item[1], reverse=True)[:top])
+
+        return {
+            "enabled": self.enabled,
+            "device_rate": self.device_rate,
+            "device_burst": self.device_burst,
+            "sensor_type_rate": self.sensor_type_rate,
+            "sensor_type_burst": self.sensor_type_burst,
+            "allowed_requests": self.allowed_requests,
+            "rejected_requests": self.rejected_requests,
+            "allowed_readings": self.allowed_readings,
+            "dropped_readings": self.dropped_readings,
+            "tracked_devices": len(self._device_buckets),
+            "device_drops": top_drops(self.device_drops),
+            "sensor_type_drops": top_drops(self.sensor_type_drops),
+        }
+
+
+# 전역 수집 제한기 인스턴스
+ingest_rate_limiter = IngestRateLimiter(
+    enabled=settings.INGEST_RATE_LIMIT_ENABLED,
+    device_rate=settings.INGEST_DEVICE_RATE,
+    device_burst=settings.INGEST_DEVICE_BURST,
+    sensor_type_rate=settings.INGEST_SENSOR_TYPE_RATE,
+    sensor_type_burst=settings.INGEST_SENSOR_TYPE_BURST
+)
@@ -0,0 +1,220 @@
+"""
+Redis 읽기 캐시(read-through) 모듈
+
+사용자/프로필/관계/스냅샷/디바이스 조회 결과를 Redis에 JSON으로 보관하여 반복 조회가 PostgreSQL까지 가지 않도록 합니다.
+조회 함수에 `@cached(...)`를 붙여 선언하고, 쓰기 경로(서비스/수집)는 `read_cache.invalidate(...)`로 무효화합니다.
+
+- 캐시 키는 `cache:v<CACHE_VERSION>:<엔드포인트>:<그룹>:<세대>:<인자 해시>` 형식입니다.
+  응답 형식이 바뀌면 CACHE_VERSION을 올려 이전 키 전체를 버립니다.
+- 항목은 그룹(예: `profiles:<user_id>`)에 속하고, 무효화는 그룹의 세대 번호를 올립니다.
+  이전 세대 키는 더 이상 조회되지 않고 TTL로 사라지므로 목록/페이지 조회도 키를 찾아 지우지 않고 한 번에 무효화됩니다.
+  (조회 중에 쓰기가 일어나 이전 값이 저장되어도 이미 지난 세대에 저장되므로 읽히지 않습니다)
+- Redis 명령은 공유 연결 풀의 비동기 클라이언트로 보내며, 여러 그룹 무효화는 파이프라인 한 번으로 처리합니다.
+- Redis에 연결할 수 없으면 CACHE_RETRY_SEC 동안 캐시를 건너뛰고 DB에서 바로 조회합니다.
+  그동안의 무효화는 유실될 수 있으므로 항목 TTL(CACHE_TTL_SEC)이 최대 지연 시간입니다.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from pydantic import parse_raw_as
+from pydantic.json import pydantic_encoder
+
+from app.core.config import get_settings
+from app.infrastructure.async_redis_client import AsyncRedisClient, async_redis_client
+from app.infrastructure.device_registry import device_registry
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+
+def latest_groups(*user_ids: Any) -> List[str]:
+    """사용자별 최신 측정값 캐시 그룹 (소유자가 없는 디바이스는 제외)"""
+    return [f"latest:{user_id}" for user_id in dict.fromkeys(str(user_id) for user_id in user_ids if user_id)]
+
+
+class RedisCacheBackend:
+    """비동기 Redis 클라이언트(공유 연결 풀)를 사용하는 캐시 저장소"""
+
+    def __init__(self, client: AsyncRedisClient):
+        self.client = client
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: str, ttl_sec: int) -> bool:
+        return await self.client.set(key, value, ttl_sec)
+
+    async def incr_many(self, keys: List[str]) -> List[int]:
+        return await self.client.increment_many(keys)
+
+
+class ReadCache:
+    """세대 번호 기반 읽기 캐시"""
+
+    def __init__(
+        self,
+        backend: Any,
+        enabled: bool = False,
+        ttl_sec: int = 60,
+        version: int = 1,
+        retry_sec: float = 30.0,
+        namespace: str = "cache"
+    ):
+        self.backend = backend
+        self.enabled = enabled
+        self.ttl_sec = ttl_sec
+        self.version = version
+        self.retry_sec = retry_sec
+        self.namespace = namespace
+        self._unavailable_until = 0.0
+
+        # 엔드포인트별 메트릭
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def generation_key(self, group: str) -> str:
+        """그룹 세대 번호 키"""
+        return f"{self.namespace}:v{self.version}:gen:{group}"
+
+    def entry_key(self, endpoint: str, group: str, generation: Any, key: Any) -> str:
+        """캐시 항목 키 (인자는 JSON 직렬화 후 해시)"""
+        digest = hashlib.sha1(json.dumps(key, default=str, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return f"{self.namespace}:v{self.version}:{endpoint}:{group}:{generation}:{digest}"
+
+    def _available(self) -> bool:
+        return self.enabled and time.monotonic() >= self._unavailable_until
+
+    def _failed(self, e: Exception):
+        logger.warning(f"읽기 캐시 사용 불가, {self.retry_sec}초 동안 DB에서 바로 조회합니다: {e}")
+        self._unavailable_until = time.monotonic() + self.retry_sec
+
+    def _endpoint_stats(self, endpoint: str) -> Dict[str, int]:
+        return self._stats.setdefault(endpoint, {"hits": 0, "misses": 0, "errors": 0})
+
+    async def get_or_load(
+        self,
+        endpoint: str,
+        group: str,
+        key: Any,
+        loader: Callable[[], Awaitable[Any]],
+        model: Any,
+        ttl_sec: Optional[int] = None
+    ) -> Any:
+        """캐시에 있으면 model로 복원하여 반환하고, 없으면 loader 결과를 저장 후 반환"""
+        if not self._available():
+            return await loader()
+
+        stats = self._endpoint_stats(endpoint)
+        try:
+            generation = await self.backend.get(self.generation_key(group)) or 0
+            entry_key = self.entry_key(endpoint, group, generation, key)
+            cached_value = await self.backend.get(entry_key)
+        except Exception as e:
+            stats["errors"] += 1
+            self._failed(e)
+            return await loader()
+
+        if cached_value is not None:
+            stats["hits"] += 1
+            return parse_raw_as(model, cached_value)
+
+        stats["misses"] += 1
+        value = await loader()
+        try:
+            await self.backend.set(
+                entry_key,
+                json.dumps(value, default=pydantic_encoder, ensure_ascii=False),
+                ttl_sec or self.ttl_sec
+            )
+        except Exception as e:
+            stats["errors"] += 1
+            self._failed(e)
+        return value
+
+    async def invalidate(self, *groups: str):
+        """그룹의 세대 번호를 올려 캐시 항목 무효화 (여러 그룹은 파이프라인 1회)"""
+        if not self.enabled or not groups:
+            return
+        try:
+            await self.backend.incr_many([self.generation_key(group) for group in dict.fromkeys(groups)])
+        except Exception as e:
+            self._failed(e)
+
+    async def invalidate_devices(self, device_ids: Iterable[Optional[str]]):
+        """수집된 디바이스 소유자의 최신 측정값 캐시 무효화 (디바이스 레지스트리로 사용자 확인)"""
+        if not self.enabled:
+            return
+        device_ids = set(device_ids)
+        # 다른 워커에서 방금 등록된 디바이스도 소유자를 찾도록 캐시에 없는 디바이스는 조회
+        await device_registry.resolve_missing(device_ids)
+        contexts = (device_registry.get(device_id) for device_id in device_ids)
+        await self.invalidate(*latest_groups(*(context.user_id for context in contexts if context is not None)))
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 적중/실패 메트릭"""
+        endpoints = {}
+        for endpoint, counts in sorted(self._stats.items()):
+            lookups = counts["hits"] + counts["misses"]
+            endpoints[endpoint] = {
+                **counts,
+                "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+            }
+        return {
+            "enabled": self.enabled,
+            "available": self._available(),
+            "version": self.version,
+            "ttl_sec": self.ttl_sec,
+            "endpoints": endpoints,
+        }
+
+
+# 전역 읽기 캐시 인스턴스
+read_cache = ReadCache(
+    backend=RedisCacheBackend(async_redis_client),
+    enabled=settings.CACHE_ENABLED,
+    ttl_sec=settings.CACHE_TTL_SEC,
+    version=settings.CACHE_VERSION,
+    retry_sec=settings.CACHE_RETRY_SEC
+)
+
+
+def cached(
+    endpoint: str,
+    model: Any,
+    group: Callable[..., str],
+    key: Callable[..., Any],
+    ttl_sec: Optional[int] = None
+):
+    """비동기 조회 함수의 결과를 읽기 캐시에 보관하는 데코레이터
+
+    group/key는 조회 함수의 인자를 이름으로 받습니다 (예: `lambda user_id, **_: f"profiles:{user_id}"`).
+    model은 캐시 값을 복원할 타입입니다 (예: `Optional[UserProfileResponse]`, `List[...]`).
+    서비스 메서드와 라우터 함수 모두에 사용할 수 있으며, 함수 시그니처는 그대로 유지됩니다.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return await read_cache.get_or_load(
+                endpoint,
+                group(**bound.arguments),
+                key(**bound.arguments),
+                lambda: func(*args, **kwargs),
+                model,
+                ttl_sec
+            )
+
+        return wrapper
+
+    return decorator
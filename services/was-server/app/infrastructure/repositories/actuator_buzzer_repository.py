@@ -10,6 +10,8 @@ from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.models import ActuatorLogBuzzer
 from app.interfaces.repositories.actuator_repository import IActuatorBuzzerRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.device_latest import fetch_latest
 
 
 class ActuatorBuzzerRepository(IActuatorBuzzerRepository):
@@ -38,11 +40,7 @@ class ActuatorBuzzerRepository(IActuatorBuzzerRepository):
     
     async def get_latest(self, device_id: str) -> Optional[ActuatorLogBuzzer]:
         """최신 Buzzer 액추에이터 로그 조회"""
-        query = select(ActuatorLogBuzzer).where(
-            ActuatorLogBuzzer.device_id == device_id
-        ).order_by(ActuatorLogBuzzer.time.desc()).limit(1)
-        result = await self.db_session.execute(query)
-        return result.scalar_one_or_none()
+        return await fetch_latest(self.db_session, ActuatorLogBuzzer, device_id)
     
     async def get_list(
         self, 
@@ -52,7 +50,8 @@ class ActuatorBuzzerRepository(IActuatorBuzzerRepository):
         buzzer_type: Optional[str] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogBuzzer]:
         """Buzzer 액추에이터 로그 목록 조회"""
         conditions = []
@@ -72,7 +71,7 @@ class ActuatorBuzzerRepository(IActuatorBuzzerRepository):
         if conditions:
             query = query.where(and_(*conditions))
         
-        query = query.order_by(ActuatorLogBuzzer.time.desc()).limit(limit).offset(offset)
+        query = apply_keyset(query, ActuatorLogBuzzer.time, ActuatorLogBuzzer.device_id, cursor).limit(limit).offset(offset)
         result = await self.db_session.execute(query)
         return result.scalars().all()
     
@@ -10,6 +10,8 @@ from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.models import ActuatorLogRelay
 from app.interfaces.repositories.actuator_repository import IActuatorRelayRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.device_latest import fetch_latest
 
 
 class ActuatorRelayRepository(IActuatorRelayRepository):
@@ -38,11 +40,7 @@ class ActuatorRelayRepository(IActuatorRelayRepository):
     
     async def get_latest(self, device_id: str) -> Optional[ActuatorLogRelay]:
         """최신 Relay 액추에이터 로그 조회"""
-        query = select(ActuatorLogRelay).where(
-            ActuatorLogRelay.device_id == device_id
-        ).order_by(ActuatorLogRelay.time.desc()).limit(1)
-        result = await self.db_session.execute(query)
-        return result.scalar_one_or_none()
+        return await fetch_latest(self.db_session, ActuatorLogRelay, device_id)
     
     async def get_list(
         self, 
@@ -52,7 +50,8 @@ class ActuatorRelayRepository(IActuatorRelayRepository):
         channel: Optional[int] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogRelay]:
         """Relay 액추에이터 로그 목록 조회"""
         conditions = []
@@ -72,7 +71,7 @@ class ActuatorRelayRepository(IActuatorRelayRepository):
         if conditions:
             query = query.where(and_(*conditions))
         
-        query = query.order_by(ActuatorLogRelay.time.desc()).limit(limit).offset(offset)
+        query = apply_keyset(query, ActuatorLogRelay.time, ActuatorLogRelay.device_id, cursor).limit(limit).offset(offset)
         result = await self.db_session.execute(query)
         return result.scalars().all()
     
@@ -10,6 +10,8 @@ from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.models import ActuatorLogServo
 from app.interfaces.repositories.actuator_repository import IActuatorServoRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.device_latest import fetch_latest
 
 
 class ActuatorServoRepository(IActuatorServoRepository):
@@ -38,11 +40,7 @@ class ActuatorServoRepository(IActuatorServoRepository):
     
     async def get_latest(self, device_id: str) -> Optional[ActuatorLogServo]:
         """최신 Servo 액추에이터 로그 조회"""
-        query = select(ActuatorLogServo).where(
-            ActuatorLogServo.device_id == device_id
-        ).order_by(ActuatorLogServo.time.desc()).limit(1)
-        result = await self.db_session.execute(query)
-        return result.scalar_one_or_none()
+        return await fetch_latest(self.db_session, ActuatorLogServo, device_id)
     
     async def get_list(
         self, 
@@ -52,7 +50,8 @@ class ActuatorServoRepository(IActuatorServoRepository):
         channel: Optional[int] = None,
         angle_deg: Optional[float] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogServo]:
         """Servo 액추에이터 로그 목록 조회"""
         conditions = []
@@ -72,7 +71,7 @@ class ActuatorServoRepository(IActuatorServoRepository):
         if conditions:
             query = query.where(and_(*conditions))
         
-        query = query.order_by(ActuatorLogServo.time.desc()).limit(limit).offset(offset)
+        query = apply_keyset(query, ActuatorLogServo.time, ActuatorLogServo.device_id, cursor).limit(limit).offset(offset)
         result = await self.db_session.execute(query)
         return result.scalars().all()
     
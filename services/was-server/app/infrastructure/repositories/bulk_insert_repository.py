@@ -0,0 +1,143 @@
+"""
+대량 적재 리포지토리 구현체
+
+센서 데이터를 행 단위 add/commit/refresh 대신 다중 행 INSERT 한 번으로 기록합니다.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type
+from sqlalchemy import insert, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.interfaces.repositories.bulk_insert_repository import IBulkInsertRepository
+from app.infrastructure.device_latest import device_latest_store
+from app.infrastructure.rollup_worker import sensor_rollup_worker
+
+
+# 한 INSERT 문에 담을 최대 행 수 (드라이버 파라미터 한도 보호)
+INSERT_CHUNK_SIZE = 1000
+
+
+class BulkInsertRepository(IBulkInsertRepository):
+    """다중 행 INSERT 기반 대량 적재 리포지토리"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    def _filter_columns(self, table, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """테이블에 존재하는 컬럼만 남기고 모든 행의 키를 맞춤
+
+        다중 행 INSERT는 행마다 같은 컬럼 목록이 필요하므로 빠진 값은 None으로 채웁니다.
+        """
+        column_names = set(table.columns.keys())
+        keys = list(dict.fromkeys(key for row in rows for key in row if key in column_names))
+        return [{key: row.get(key) for key in keys} for row in rows]
+
+    async def insert_many(self, model: Type[Any], rows: List[Dict[str, Any]]) -> int:
+        """여러 행을 다중 행 INSERT로 기록 (하나의 트랜잭션)"""
+        if not rows:
+            return 0
+
+        table = model.__table__
+        values = self._filter_columns(table, rows)
+
+        try:
+            for start in range(0, len(values), INSERT_CHUNK_SIZE):
+                chunk = values[start:start + INSERT_CHUNK_SIZE]
+                await self.db_session.execute(insert(table).values(chunk))
+            await device_latest_store.record(self.db_session, model, values)
+            # 이미 롤업된 구간에 늦게 도착한 행은 해당 시간 버킷만 다시 계산
+            await sensor_rollup_worker.mark_dirty(self.db_session, model, values)
+            await self.db_session.commit()
+        except Exception:
+            await self.db_session.rollback()
+            raise
+
+        return len(values)
+
+    def _utc(self, value: Any) -> Any:
+        """기본 키 비교를 위해 datetime을 UTC aware 값으로 정규화 (naive 값은 UTC로 간주)"""
+        if isinstance(value, datetime):
+            return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+        return value
+
+    async def upsert_many(
+        self, model: Type[Any], rows: List[Dict[str, Any]], on_conflict: str = "nothing"
+    ) -> List[Optional[bool]]:
+        """INSERT ... ON CONFLICT로 여러 행을 멱등 기록 (하나의 트랜잭션)
+
+        중복 키가 있어도 문장 전체가 실패하지 않으므로 디바이스 재전송이 비용 없는 no-op이 됩니다.
+        RETURNING으로 돌려받은 기본 키를 입력 행과 맞춰 행별 결과를 만듭니다.
+        """
+        if on_conflict not in ("nothing", "update"):
+            raise ValueError(f"지원하지 않는 on_conflict 모드입니다: {on_conflict}")
+        if not rows:
+            return []
+
+        table = model.__table__
+        key_columns = list(table.primary_key.columns)
+        key_names = [column.name for column in key_columns]
+        values = self._filter_columns(table, rows)
+        # 기본 키의 naive datetime은 UTC로 기록하여 저장값과 RETURNING 비교 기준을 일치시킴
+        for row in values:
+            for name in key_names:
+                row[name] = self._utc(row.get(name))
+        # xmax = 0 이면 이번 문장에서 새로 삽입된 행, 아니면 기존 행을 갱신한 것
+        inserted_flag = literal_column("(xmax = 0)").label("inserted")
+        written: Dict[Tuple[Any, ...], bool] = {}
+
+        try:
+            for start in range(0, len(values), INSERT_CHUNK_SIZE):
+                chunk = values[start:start + INSERT_CHUNK_SIZE]
+                statement = pg_insert(table).values(chunk)
+                update_columns = {
+                    name: statement.excluded[name]
+                    for name in chunk[0].keys()
+                    if name not in key_names
+                }
+                if on_conflict == "update" and update_columns:
+                    statement = statement.on_conflict_do_update(index_elements=key_columns, set_=update_columns)
+                else:
+                    statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+
+                result = await self.db_session.execute(statement.returning(*key_columns, inserted_flag))
+                for returned in result.all():
+                    key = tuple(self._utc(value) for value in returned[:-1])
+                    written[key] = bool(returned[-1])
+            await device_latest_store.record(self.db_session, model, values)
+            await sensor_rollup_worker.mark_dirty(self.db_session, model, values)
+            await self.db_session.commit()
+        except Exception:
+            await self.db_session.rollback()
+            raise
+
+        return [written.get(tuple(row[name] for name in key_names)) for row in values]
+
+    async def insert_returning(self, model: Type[Any], row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """단건을 INSERT ... ON CONFLICT DO NOTHING으로 기록하고 저장된 행을 반환
+
+        RETURNING으로 DB 기본값이 채워진 행 전체를 돌려받으며, 이미 존재하는 키이면 None을 반환합니다.
+        """
+        table = model.__table__
+        key_columns = list(table.primary_key.columns)
+        values = self._filter_columns(table, [row])
+        for column in key_columns:
+            values[0][column.name] = self._utc(values[0].get(column.name))
+        statement = (
+            pg_insert(table).values(values)
+            .on_conflict_do_nothing(index_elements=key_columns)
+            .returning(*table.columns)
+        )
+
+        try:
+            result = await self.db_session.execute(statement)
+            stored = result.mappings().first()
+            await device_latest_store.record(self.db_session, model, values)
+            await sensor_rollup_worker.mark_dirty(self.db_session, model, values)
+            await self.db_session.commit()
+        except Exception:
+            await self.db_session.rollback()
+            raise
+
+        return dict(stored) if stored is not None else None
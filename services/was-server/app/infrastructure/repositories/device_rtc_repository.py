@@ -7,7 +7,7 @@ Clean Architecture 원칙에 따라 디바이스 RTC 상태 데이터에 대한
 from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import case, select, and_, func
 
 from app.interfaces.repositories.device_rtc_repository import IDeviceRTCStatusRepository
 from app.infrastructure.models import DeviceRTCStatus
@@ -16,6 +16,8 @@ from app.api.v1.schemas import (
     DeviceRTCDataUpdate,
     DeviceRTCDataResponse
 )
+from app.infrastructure.sql_aggregates import group_counts, range_conditions, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
 
 
 class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
@@ -28,8 +30,8 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
         """RTC 상태 데이터 생성"""
         db_data = DeviceRTCStatus(**data.dict())
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return DeviceRTCDataResponse.from_orm(db_data)
     
     async def get_by_id(
@@ -45,7 +47,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -54,14 +56,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
     
     async def get_latest(self, device_id: str) -> Optional[DeviceRTCDataResponse]:
         """최신 RTC 상태 데이터 조회"""
-        query = (
-            select(DeviceRTCStatus)
-            .where(DeviceRTCStatus.device_id == device_id)
-            .order_by(DeviceRTCStatus.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, DeviceRTCStatus, device_id)
         
         if data:
             return DeviceRTCDataResponse.from_orm(data)
@@ -88,7 +83,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
         # 시간 역순으로 정렬하고 제한
         query = query.order_by(DeviceRTCStatus.time.desc()).limit(limit_count)
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data_list = result.scalars().all()
         
         # 결과를 리스트로 변환하여 반환
@@ -108,7 +103,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -132,7 +127,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -148,18 +143,17 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """동기화 통계 정보 조회"""
-        query = select(DeviceRTCStatus).where(DeviceRTCStatus.device_id == device_id)
-        
-        if start_time:
-            query = query.where(DeviceRTCStatus.time >= start_time)
-        if end_time:
-            query = query.where(DeviceRTCStatus.time <= end_time)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
+        """동기화 통계 정보 조회 (DB에서 집계)"""
+        conditions = range_conditions(DeviceRTCStatus, device_id, start_time, end_time)
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                *summary_columns(DeviceRTCStatus.drift_ms, "drift")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -169,22 +163,14 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
                 "min_drift_ms": 0
             }
         
-        # 통계 계산
-        drift_values = [data.drift_ms for data in data_list if data.drift_ms is not None]
-        sync_sources = {}
-        
-        for data in data_list:
-            if data.sync_source:
-                sync_sources[data.sync_source] = sync_sources.get(data.sync_source, 0) + 1
-        
         return {
             "device_id": device_id,
-            "total_records": len(data_list),
-            "sync_sources": sync_sources,
-            "avg_drift_ms": sum(drift_values) / len(drift_values) if drift_values else 0,
-            "max_drift_ms": max(drift_values) if drift_values else 0,
-            "min_drift_ms": min(drift_values) if drift_values else 0,
-            "drift_samples": len(drift_values)
+            "total_records": row.total_records,
+            "sync_sources": await group_counts(self.db, DeviceRTCStatus.sync_source, conditions),
+            "avg_drift_ms": to_number(row.drift_avg) if row.drift_count else 0,
+            "max_drift_ms": row.drift_max if row.drift_count else 0,
+            "min_drift_ms": row.drift_min if row.drift_count else 0,
+            "drift_samples": row.drift_count
         }
     
     async def get_drift_analysis(
@@ -193,18 +179,30 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """시간 드리프트 분석 정보 조회"""
-        query = select(DeviceRTCStatus).where(DeviceRTCStatus.device_id == device_id)
-        
-        if start_time:
-            query = query.where(DeviceRTCStatus.time >= start_time)
-        if end_time:
-            query = query.where(DeviceRTCStatus.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """시간 드리프트 분석 정보 조회 (DB에서 집계)
+        
+        인접 레코드 간 드리프트 변화율(ms/h)을 윈도 함수(lag)로 구해 평균/표준편차만 가져옵니다.
+        """
+        steps = select(
+            DeviceRTCStatus.drift_ms.label("drift"),
+            func.lag(DeviceRTCStatus.drift_ms).over(order_by=DeviceRTCStatus.time).label("previous_drift"),
+            (func.extract("epoch", DeviceRTCStatus.time - func.lag(DeviceRTCStatus.time).over(order_by=DeviceRTCStatus.time))
+             / 3600).label("hours")
+        ).where(and_(*range_conditions(DeviceRTCStatus, device_id, start_time, end_time))).subquery()
+        # 시간 간격이 0보다 큰 경우만 변화율 계산 (드리프트가 없으면 NULL)
+        drift_rate = case((steps.c.hours > 0, (steps.c.drift - steps.c.previous_drift) / steps.c.hours))
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                func.count(steps.c.drift).label("drift_samples"),
+                func.count(drift_rate).label("rate_samples"),
+                func.avg(drift_rate).label("avg_drift_rate"),
+                func.stddev_pop(drift_rate).label("std_dev")
+            ).select_from(steps)
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "drift_trend": "stable",
@@ -214,8 +212,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
             }
         
         # 드리프트 트렌드 분석
-        drift_values = [data.drift_ms for data in data_list if data.drift_ms is not None]
-        if len(drift_values) < 2:
+        if row.drift_samples < 2:
             return {
                 "device_id": device_id,
                 "drift_trend": "insufficient_data",
@@ -224,22 +221,7 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
                 "recommendations": ["더 많은 데이터가 필요합니다"]
             }
         
-        # 시간 간격별 드리프트 변화율 계산
-        sorted_data = sorted(data_list, key=lambda x: x.time)
-        drift_changes = []
-        time_intervals = []
-        
-        for i in range(1, len(sorted_data)):
-            if sorted_data[i].drift_ms is not None and sorted_data[i-1].drift_ms is not None:
-                drift_diff = sorted_data[i].drift_ms - sorted_data[i-1].drift_ms
-                time_diff = (sorted_data[i].time - sorted_data[i-1].time).total_seconds() / 3600  # 시간 단위
-                
-                if time_diff > 0:
-                    drift_rate = drift_diff / time_diff
-                    drift_changes.append(drift_rate)
-                    time_intervals.append(time_diff)
-        
-        if not drift_changes:
+        if not row.rate_samples:
             return {
                 "device_id": device_id,
                 "drift_trend": "stable",
@@ -248,11 +230,10 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
                 "recommendations": ["드리프트 변화가 없습니다"]
             }
         
-        avg_drift_rate = sum(drift_changes) / len(drift_changes)
+        avg_drift_rate = to_number(row.avg_drift_rate)
         
         # 안정성 점수 계산 (드리프트 변화의 표준편차 기반)
-        variance = sum((x - avg_drift_rate) ** 2 for x in drift_changes) / len(drift_changes)
-        std_dev = variance ** 0.5
+        std_dev = to_number(row.std_dev)
         
         if std_dev < 10:
             stability_score = 90
@@ -283,6 +264,6 @@ class DeviceRTCStatusRepository(IDeviceRTCStatusRepository):
             "drift_rate_ms_per_hour": round(avg_drift_rate, 2),
             "stability_score": stability_score,
             "std_deviation": round(std_dev, 2),
-            "total_samples": len(drift_changes),
+            "total_samples": row.rate_samples,
             "recommendations": recommendations
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
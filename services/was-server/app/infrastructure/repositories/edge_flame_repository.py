@@ -13,6 +13,9 @@ from sqlalchemy.orm import selectinload
 from app.infrastructure.models import SensorEdgeFlame
 from app.interfaces.repositories.sensor_repository import IEdgeFlameRepository
 from app.api.v1.schemas import EdgeFlameDataCreate, EdgeFlameDataUpdate, EdgeFlameDataResponse
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.sql_aggregates import count_if, range_conditions, to_number
+from app.infrastructure.device_latest import fetch_latest
 
 
 class EdgeFlameRepository(IEdgeFlameRepository):
@@ -71,13 +74,7 @@ class EdgeFlameRepository(IEdgeFlameRepository):
 
     async def get_latest(self, device_id: str) -> Optional[EdgeFlameDataResponse]:
         """최신 Edge Flame 센서 데이터 조회"""
-        result = await self.db_session.execute(
-            select(SensorEdgeFlame).where(
-                SensorEdgeFlame.device_id == device_id
-            ).order_by(SensorEdgeFlame.time.desc()).limit(1)
-        )
-        
-        db_data = result.scalar_one_or_none()
+        db_data = await fetch_latest(self.db_session, SensorEdgeFlame, device_id)
         if not db_data:
             return None
             
@@ -95,7 +92,8 @@ class EdgeFlameRepository(IEdgeFlameRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgeFlameDataResponse]:
         """Edge Flame 센서 데이터 목록 조회"""
         query = select(SensorEdgeFlame)
@@ -109,7 +107,7 @@ class EdgeFlameRepository(IEdgeFlameRepository):
         if end_time:
             query = query.where(SensorEdgeFlame.time <= end_time)
         
-        query = query.order_by(SensorEdgeFlame.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorEdgeFlame.time, SensorEdgeFlame.device_id, cursor).limit(limit)
         
         result = await self.db_session.execute(query)
         db_data_list = result.scalars().all()
@@ -194,18 +192,20 @@ class EdgeFlameRepository(IEdgeFlameRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """Edge Flame 센서 데이터 통계 조회"""
-        query = select(SensorEdgeFlame).where(SensorEdgeFlame.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorEdgeFlame.time >= start_time)
-        if end_time:
-            query = query.where(SensorEdgeFlame.time <= end_time)
+        """Edge Flame 센서 데이터 통계 조회 (DB에서 집계)"""
+        conditions = range_conditions(SensorEdgeFlame, device_id, start_time, end_time)
         
-        result = await self.db_session.execute(query)
-        data_list = result.scalars().all()
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(SensorEdgeFlame.flame_detected).label("flame_detected_count"),
+                func.avg(SensorEdgeFlame.confidence).label("avg_confidence"),
+                count_if(SensorEdgeFlame.alert_level == "high").label("high_alert_count")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "total_records": 0,
                 "flame_detected_count": 0,
@@ -215,25 +215,16 @@ class EdgeFlameRepository(IEdgeFlameRepository):
                 "processing_time_stats": {}
             }
         
-        total_records = len(data_list)
-        flame_detected_count = sum(1 for data in data_list if data.flame_detected)
-        flame_detected_rate = (flame_detected_count / total_records) * 100 if total_records > 0 else 0
-        
-        confidence_values = [data.confidence for data in data_list if data.confidence is not None]
-        avg_confidence = sum(confidence_values) / len(confidence_values) if confidence_values else 0
-        
-        high_alert_count = sum(1 for data in data_list if data.alert_level == "high")
-        
-        # processing_time은 Edge Flame 센서에서 사용하지 않음
-        processing_time_stats = {}
+        flame_detected_rate = (row.flame_detected_count / row.total_records) * 100
         
         return {
-            "total_records": total_records,
-            "flame_detected_count": flame_detected_count,
+            "total_records": row.total_records,
+            "flame_detected_count": row.flame_detected_count,
             "flame_detected_rate": round(flame_detected_rate, 2),
-            "avg_confidence": round(avg_confidence, 2),
-            "high_alert_count": high_alert_count,
-            "processing_time_stats": processing_time_stats
+            "avg_confidence": round(to_number(row.avg_confidence or 0), 2),
+            "high_alert_count": row.high_alert_count,
+            # processing_time은 Edge Flame 센서에서 사용하지 않음
+            "processing_time_stats": {}
         }
 
     async def get_flame_detection_alerts(
@@ -12,6 +12,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.infrastructure.models import SensorEdgePIR
 from app.interfaces.repositories.sensor_repository import IEdgePIRRepository
 from app.api.v1.schemas import EdgePIRDataCreate, EdgePIRDataUpdate, EdgePIRDataResponse
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.sql_aggregates import count_if, group_counts, peak_hours, range_conditions, summary, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
 
 
 class EdgePIRRepository(IEdgePIRRepository):
@@ -73,13 +76,7 @@ class EdgePIRRepository(IEdgePIRRepository):
 
     async def get_latest(self, device_id: str) -> Optional[EdgePIRDataResponse]:
         """최신 Edge PIR 센서 데이터 조회"""
-        result = await self.db_session.execute(
-            select(SensorEdgePIR).where(
-                SensorEdgePIR.device_id == device_id
-            ).order_by(SensorEdgePIR.time.desc()).limit(1)
-        )
-        
-        db_data = result.scalar_one_or_none()
+        db_data = await fetch_latest(self.db_session, SensorEdgePIR, device_id)
         if not db_data:
             return None
             
@@ -98,7 +95,8 @@ class EdgePIRRepository(IEdgePIRRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgePIRDataResponse]:
         """Edge PIR 센서 데이터 목록 조회"""
         query = select(SensorEdgePIR)
@@ -112,7 +110,7 @@ class EdgePIRRepository(IEdgePIRRepository):
         if end_time:
             query = query.where(SensorEdgePIR.time <= end_time)
         
-        query = query.order_by(SensorEdgePIR.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorEdgePIR.time, SensorEdgePIR.device_id, cursor).limit(limit)
         
         result = await self.db_session.execute(query)
         db_data_list = result.scalars().all()
@@ -201,18 +199,21 @@ class EdgePIRRepository(IEdgePIRRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """Edge PIR 센서 데이터 통계 조회"""
-        query = select(SensorEdgePIR).where(SensorEdgePIR.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorEdgePIR.time >= start_time)
-        if end_time:
-            query = query.where(SensorEdgePIR.time <= end_time)
+        """Edge PIR 센서 데이터 통계 조회 (DB에서 집계)"""
+        conditions = range_conditions(SensorEdgePIR, device_id, start_time, end_time)
         
-        result = await self.db_session.execute(query)
-        data_list = result.scalars().all()
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(SensorEdgePIR.motion_detected).label("motion_detected_count"),
+                func.avg(SensorEdgePIR.confidence).label("avg_confidence"),
+                *summary_columns(SensorEdgePIR.motion_speed, "motion_speed"),
+                *summary_columns(SensorEdgePIR.processing_time, "processing_time")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "total_records": 0,
                 "motion_detected_count": 0,
@@ -223,47 +224,16 @@ class EdgePIRRepository(IEdgePIRRepository):
                 "processing_time_stats": {}
             }
         
-        total_records = len(data_list)
-        motion_detected_count = sum(1 for data in data_list if data.motion_detected)
-        motion_detected_rate = (motion_detected_count / total_records) * 100 if total_records > 0 else 0
-        
-        confidence_values = [data.confidence for data in data_list if data.confidence is not None]
-        avg_confidence = sum(confidence_values) / len(confidence_values) if confidence_values else 0
-        
-        # 모션 방향 통계
-        direction_counts = {}
-        for data in data_list:
-            if data.motion_direction:
-                direction_counts[data.motion_direction] = direction_counts.get(data.motion_direction, 0) + 1
-        
-        # 모션 속도 통계
-        speed_values = [data.motion_speed for data in data_list if data.motion_speed is not None]
-        speed_stats = {}
-        if speed_values:
-            speed_stats = {
-                "min": min(speed_values),
-                "max": max(speed_values),
-                "avg": sum(speed_values) / len(speed_values)
-            }
-        
-        # 처리 시간 통계
-        processing_times = [data.processing_time for data in data_list if data.processing_time is not None]
-        processing_time_stats = {}
-        if processing_times:
-            processing_time_stats = {
-                "min": min(processing_times),
-                "max": max(processing_times),
-                "avg": sum(processing_times) / len(processing_times)
-            }
+        motion_detected_rate = (row.motion_detected_count / row.total_records) * 100
         
         return {
-            "total_records": total_records,
-            "motion_detected_count": motion_detected_count,
+            "total_records": row.total_records,
+            "motion_detected_count": row.motion_detected_count,
             "motion_detected_rate": round(motion_detected_rate, 2),
-            "avg_confidence": round(avg_confidence, 2),
-            "motion_direction_stats": direction_counts,
-            "motion_speed_stats": speed_stats,
-            "processing_time_stats": processing_time_stats
+            "avg_confidence": round(to_number(row.avg_confidence or 0), 2),
+            "motion_direction_stats": await group_counts(self.db_session, SensorEdgePIR.motion_direction, conditions),
+            "motion_speed_stats": summary(row, "motion_speed", empty={}),
+            "processing_time_stats": summary(row, "processing_time", empty={})
         }
 
     async def analyze_motion_patterns(
@@ -271,25 +241,27 @@ class EdgePIRRepository(IEdgePIRRepository):
         device_id: str,
         analysis_window: int = 3600
     ) -> dict:
-        """모션 패턴 분석"""
+        """모션 패턴 분석 (DB에서 집계)"""
         from datetime import timedelta
         
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(seconds=analysis_window)
+        conditions = range_conditions(SensorEdgePIR, device_id, start_time, end_time)
+        conditions.append(SensorEdgePIR.motion_detected == True)
         
-        query = select(SensorEdgePIR).where(
-            and_(
-                SensorEdgePIR.device_id == device_id,
-                SensorEdgePIR.time >= start_time,
-                SensorEdgePIR.time <= end_time,
-                SensorEdgePIR.motion_detected == True
-            )
-        ).order_by(SensorEdgePIR.time)
-        
-        result = await self.db_session.execute(query)
-        motion_data_list = result.scalars().all()
+        # 속도 구간별 개수까지 한 번에 집계
+        speed = SensorEdgePIR.motion_speed
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_motions"),
+                count_if(speed < 1.0).label("slow"),
+                count_if(and_(speed >= 1.0, speed < 3.0)).label("medium"),
+                count_if(speed >= 3.0).label("fast")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not motion_data_list:
+        if not row.total_motions:
             return {
                 "analysis_window_seconds": analysis_window,
                 "total_motions": 0,
@@ -299,40 +271,13 @@ class EdgePIRRepository(IEdgePIRRepository):
                 "speed_patterns": {}
             }
         
-        total_motions = len(motion_data_list)
-        motion_frequency = total_motions / (analysis_window / 3600)  # 시간당 모션 수
-        
-        # 시간대별 모션 분포
-        hour_counts = {}
-        for data in motion_data_list:
-            hour = data.time.hour
-            hour_counts[hour] = hour_counts.get(hour, 0) + 1
-        
-        peak_hours = sorted(hour_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        peak_hours = [{"hour": hour, "count": count} for hour, count in peak_hours]
-        
-        # 방향 패턴
-        direction_patterns = {}
-        for data in motion_data_list:
-            if data.motion_direction:
-                direction_patterns[data.motion_direction] = direction_patterns.get(data.motion_direction, 0) + 1
-        
-        # 속도 패턴
-        speed_ranges = {"slow": 0, "medium": 0, "fast": 0}
-        for data in motion_data_list:
-            if data.motion_speed is not None:
-                if data.motion_speed < 1.0:
-                    speed_ranges["slow"] += 1
-                elif data.motion_speed < 3.0:
-                    speed_ranges["medium"] += 1
-                else:
-                    speed_ranges["fast"] += 1
+        motion_frequency = row.total_motions / (analysis_window / 3600)  # 시간당 모션 수
         
         return {
             "analysis_window_seconds": analysis_window,
-            "total_motions": total_motions,
+            "total_motions": row.total_motions,
             "motion_frequency": round(motion_frequency, 2),
-            "peak_hours": peak_hours,
-            "direction_patterns": direction_patterns,
-            "speed_patterns": speed_ranges
+            "peak_hours": await peak_hours(self.db_session, SensorEdgePIR.time, conditions),
+            "direction_patterns": await group_counts(self.db_session, SensorEdgePIR.motion_direction, conditions),
+            "speed_patterns": {"slow": row.slow, "medium": row.medium, "fast": row.fast}
         }
@@ -6,12 +6,15 @@ Reed 스위치 센서의 Edge 처리된 데이터를 관리합니다.
 
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.models import SensorEdgeReed
 from app.interfaces.repositories.sensor_repository import IEdgeReedRepository
 from app.api.v1.schemas import EdgeReedDataCreate, EdgeReedDataUpdate, EdgeReedDataResponse
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.sql_aggregates import count_if, range_conditions, summary, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
 
 
 class EdgeReedRepository(IEdgeReedRepository):
@@ -70,13 +73,7 @@ class EdgeReedRepository(IEdgeReedRepository):
 
     async def get_latest(self, device_id: str) -> Optional[EdgeReedDataResponse]:
         """최신 Edge Reed 센서 데이터 조회"""
-        result = await self.db_session.execute(
-            select(SensorEdgeReed).where(
-                SensorEdgeReed.device_id == device_id
-            ).order_by(SensorEdgeReed.time.desc()).limit(1)
-        )
-        
-        db_data = result.scalar_one_or_none()
+        db_data = await fetch_latest(self.db_session, SensorEdgeReed, device_id)
         if not db_data:
             return None
             
@@ -94,7 +91,8 @@ class EdgeReedRepository(IEdgeReedRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgeReedDataResponse]:
         """Edge Reed 센서 데이터 목록 조회"""
         query = select(SensorEdgeReed)
@@ -108,7 +106,7 @@ class EdgeReedRepository(IEdgeReedRepository):
         if end_time:
             query = query.where(SensorEdgeReed.time <= end_time)
         
-        query = query.order_by(SensorEdgeReed.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorEdgeReed.time, SensorEdgeReed.device_id, cursor).limit(limit)
         
         result = await self.db_session.execute(query)
         db_data_list = result.scalars().all()
@@ -193,18 +191,21 @@ class EdgeReedRepository(IEdgeReedRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """Edge Reed 센서 데이터 통계 조회"""
-        query = select(SensorEdgeReed).where(SensorEdgeReed.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorEdgeReed.time >= start_time)
-        if end_time:
-            query = query.where(SensorEdgeReed.time <= end_time)
+        """Edge Reed 센서 데이터 통계 조회 (DB에서 집계)"""
+        conditions = range_conditions(SensorEdgeReed, device_id, start_time, end_time)
         
-        result = await self.db_session.execute(query)
-        data_list = result.scalars().all()
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(SensorEdgeReed.switch_state).label("switch_activations"),
+                func.avg(SensorEdgeReed.confidence).label("avg_confidence"),
+                *summary_columns(SensorEdgeReed.magnetic_strength, "magnetic_strength"),
+                *summary_columns(SensorEdgeReed.processing_time, "processing_time")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "total_records": 0,
                 "switch_activations": 0,
@@ -214,40 +215,15 @@ class EdgeReedRepository(IEdgeReedRepository):
                 "processing_time_stats": {}
             }
         
-        total_records = len(data_list)
-        switch_activations = sum(1 for data in data_list if data.switch_state)
-        activation_rate = (switch_activations / total_records) * 100 if total_records > 0 else 0
-        
-        confidence_values = [data.confidence for data in data_list if data.confidence is not None]
-        avg_confidence = sum(confidence_values) / len(confidence_values) if confidence_values else 0
-        
-        # 자기장 강도 통계
-        magnetic_values = [data.magnetic_strength for data in data_list if data.magnetic_strength is not None]
-        magnetic_stats = {}
-        if magnetic_values:
-            magnetic_stats = {
-                "min": min(magnetic_values),
-                "max": max(magnetic_values),
-                "avg": sum(magnetic_values) / len(magnetic_values)
-            }
-        
-        # 처리 시간 통계
-        processing_times = [data.processing_time for data in data_list if data.processing_time is not None]
-        processing_time_stats = {}
-        if processing_times:
-            processing_time_stats = {
-                "min": min(processing_times),
-                "max": max(processing_times),
-                "avg": sum(processing_times) / len(processing_times)
-            }
+        activation_rate = (row.switch_activations / row.total_records) * 100
         
         return {
-            "total_records": total_records,
-            "switch_activations": switch_activations,
+            "total_records": row.total_records,
+            "switch_activations": row.switch_activations,
             "activation_rate": round(activation_rate, 2),
-            "avg_confidence": round(avg_confidence, 2),
-            "magnetic_strength_stats": magnetic_stats,
-            "processing_time_stats": processing_time_stats
+            "avg_confidence": round(to_number(row.avg_confidence or 0), 2),
+            "magnetic_strength_stats": summary(row, "magnetic_strength", empty={}),
+            "processing_time_stats": summary(row, "processing_time", empty={})
         }
 
     async def get_switch_activation_history(
@@ -6,12 +6,15 @@ Tilt 기울기 센서의 Edge 처리된 데이터를 관리합니다.
 
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.models import SensorEdgeTilt
 from app.interfaces.repositories.sensor_repository import IEdgeTiltRepository
 from app.api.v1.schemas import EdgeTiltDataCreate, EdgeTiltDataUpdate, EdgeTiltDataResponse
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.sql_aggregates import count_if, group_counts, peak_hours, range_conditions, summary, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
 
 
 class EdgeTiltRepository(IEdgeTiltRepository):
@@ -73,13 +76,7 @@ class EdgeTiltRepository(IEdgeTiltRepository):
 
     async def get_latest(self, device_id: str) -> Optional[EdgeTiltDataResponse]:
         """최신 Edge Tilt 센서 데이터 조회"""
-        result = await self.db_session.execute(
-            select(SensorEdgeTilt).where(
-                SensorEdgeTilt.device_id == device_id
-            ).order_by(SensorEdgeTilt.time.desc()).limit(1)
-        )
-        
-        db_data = result.scalar_one_or_none()
+        db_data = await fetch_latest(self.db_session, SensorEdgeTilt, device_id)
         if not db_data:
             return None
             
@@ -98,7 +95,8 @@ class EdgeTiltRepository(IEdgeTiltRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgeTiltDataResponse]:
         """Edge Tilt 센서 데이터 목록 조회"""
         query = select(SensorEdgeTilt)
@@ -112,7 +110,7 @@ class EdgeTiltRepository(IEdgeTiltRepository):
         if end_time:
             query = query.where(SensorEdgeTilt.time <= end_time)
         
-        query = query.order_by(SensorEdgeTilt.time.desc()).limit(limit)
+        query = apply_keyset(query, SensorEdgeTilt.time, SensorEdgeTilt.device_id, cursor).limit(limit)
         
         result = await self.db_session.execute(query)
         db_data_list = result.scalars().all()
@@ -201,18 +199,21 @@ class EdgeTiltRepository(IEdgeTiltRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """Edge Tilt 센서 데이터 통계 조회"""
-        query = select(SensorEdgeTilt).where(SensorEdgeTilt.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorEdgeTilt.time >= start_time)
-        if end_time:
-            query = query.where(SensorEdgeTilt.time <= end_time)
+        """Edge Tilt 센서 데이터 통계 조회 (DB에서 집계)"""
+        conditions = range_conditions(SensorEdgeTilt, device_id, start_time, end_time)
         
-        result = await self.db_session.execute(query)
-        data_list = result.scalars().all()
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(SensorEdgeTilt.tilt_detected).label("tilt_detected_count"),
+                func.avg(SensorEdgeTilt.confidence).label("avg_confidence"),
+                *summary_columns(SensorEdgeTilt.tilt_angle, "tilt_angle"),
+                *summary_columns(SensorEdgeTilt.processing_time, "processing_time")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "total_records": 0,
                 "tilt_detected_count": 0,
@@ -223,47 +224,16 @@ class EdgeTiltRepository(IEdgeTiltRepository):
                 "processing_time_stats": {}
             }
         
-        total_records = len(data_list)
-        tilt_detected_count = sum(1 for data in data_list if data.tilt_detected)
-        tilt_detected_rate = (tilt_detected_count / total_records) * 100 if total_records > 0 else 0
-        
-        confidence_values = [data.confidence for data in data_list if data.confidence is not None]
-        avg_confidence = sum(confidence_values) / len(confidence_values) if confidence_values else 0
-        
-        # 기울기 각도 통계
-        angle_values = [data.tilt_angle for data in data_list if data.tilt_angle is not None]
-        angle_stats = {}
-        if angle_values:
-            angle_stats = {
-                "min": min(angle_values),
-                "max": max(angle_values),
-                "avg": sum(angle_values) / len(angle_values)
-            }
-        
-        # 기울기 방향 통계
-        direction_counts = {}
-        for data in data_list:
-            if data.tilt_direction:
-                direction_counts[data.tilt_direction] = direction_counts.get(data.tilt_direction, 0) + 1
-        
-        # 처리 시간 통계
-        processing_times = [data.processing_time for data in data_list if data.processing_time is not None]
-        processing_time_stats = {}
-        if processing_times:
-            processing_time_stats = {
-                "min": min(processing_times),
-                "max": max(processing_times),
-                "avg": sum(processing_times) / len(processing_times)
-            }
+        tilt_detected_rate = (row.tilt_detected_count / row.total_records) * 100
         
         return {
-            "total_records": total_records,
-            "tilt_detected_count": tilt_detected_count,
+            "total_records": row.total_records,
+            "tilt_detected_count": row.tilt_detected_count,
             "tilt_detected_rate": round(tilt_detected_rate, 2),
-            "avg_confidence": round(avg_confidence, 2),
-            "tilt_angle_stats": angle_stats,
-            "tilt_direction_stats": direction_counts,
-            "processing_time_stats": processing_time_stats
+            "avg_confidence": round(to_number(row.avg_confidence or 0), 2),
+            "tilt_angle_stats": summary(row, "tilt_angle", empty={}),
+            "tilt_direction_stats": await group_counts(self.db_session, SensorEdgeTilt.tilt_direction, conditions),
+            "processing_time_stats": summary(row, "processing_time", empty={})
         }
 
     async def analyze_tilt_trends(
@@ -271,25 +241,27 @@ class EdgeTiltRepository(IEdgeTiltRepository):
         device_id: str,
         analysis_window: int = 3600
     ) -> dict:
-        """기울기 트렌드 분석"""
+        """기울기 트렌드 분석 (DB에서 집계)"""
         from datetime import timedelta
         
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(seconds=analysis_window)
+        conditions = range_conditions(SensorEdgeTilt, device_id, start_time, end_time)
+        conditions.append(SensorEdgeTilt.tilt_detected == True)
         
-        query = select(SensorEdgeTilt).where(
-            and_(
-                SensorEdgeTilt.device_id == device_id,
-                SensorEdgeTilt.time >= start_time,
-                SensorEdgeTilt.time <= end_time,
-                SensorEdgeTilt.tilt_detected == True
-            )
-        ).order_by(SensorEdgeTilt.time)
-        
-        result = await self.db_session.execute(query)
-        tilt_data_list = result.scalars().all()
+        # 각도 구간별 개수까지 한 번에 집계
+        angle = SensorEdgeTilt.tilt_angle
+        result = await self.db_session.execute(
+            select(
+                func.count().label("total_tilts"),
+                count_if(angle < 15).label("low"),
+                count_if(and_(angle >= 15, angle < 45)).label("medium"),
+                count_if(angle >= 45).label("high")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not tilt_data_list:
+        if not row.total_tilts:
             return {
                 "analysis_window_seconds": analysis_window,
                 "total_tilts": 0,
@@ -299,40 +271,13 @@ class EdgeTiltRepository(IEdgeTiltRepository):
                 "direction_patterns": {}
             }
         
-        total_tilts = len(tilt_data_list)
-        tilt_frequency = total_tilts / (analysis_window / 3600)  # 시간당 기울기 수
-        
-        # 시간대별 기울기 분포
-        hour_counts = {}
-        for data in tilt_data_list:
-            hour = data.time.hour
-            hour_counts[hour] = hour_counts.get(hour, 0) + 1
-        
-        peak_hours = sorted(hour_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        peak_hours = [{"hour": hour, "count": count} for hour, count in peak_hours]
-        
-        # 각도 트렌드
-        angle_ranges = {"low": 0, "medium": 0, "high": 0}
-        for data in tilt_data_list:
-            if data.tilt_angle is not None:
-                if data.tilt_angle < 15:
-                    angle_ranges["low"] += 1
-                elif data.tilt_angle < 45:
-                    angle_ranges["medium"] += 1
-                else:
-                    angle_ranges["high"] += 1
-        
-        # 방향 패턴
-        direction_patterns = {}
-        for data in tilt_data_list:
-            if data.tilt_direction:
-                direction_patterns[data.tilt_direction] = direction_patterns.get(data.tilt_direction, 0) + 1
+        tilt_frequency = row.total_tilts / (analysis_window / 3600)  # 시간당 기울기 수
         
         return {
             "analysis_window_seconds": analysis_window,
-            "total_tilts": total_tilts,
+            "total_tilts": row.total_tilts,
             "tilt_frequency": round(tilt_frequency, 2),
-            "peak_hours": peak_hours,
-            "angle_trends": angle_ranges,
-            "direction_patterns": direction_patterns
+            "peak_hours": await peak_hours(self.db_session, SensorEdgeTilt.time, conditions),
+            "angle_trends": {"low": row.low, "medium": row.medium, "high": row.high},
+            "direction_patterns": await group_counts(self.db_session, SensorEdgeTilt.tilt_direction, conditions)
         }
@@ -0,0 +1,168 @@
+"""
+대량 내보내기 리포지토리 구현체
+
+기본 키가 `(time, <소유자>)`인 시계열 테이블을 서버 측 커서(`AsyncSession.stream`)로 읽어
+묶음 단위로 내보냅니다. 결과 전체를 메모리에 올리지 않으며, 기간 조건은 기본 키 범위 탐색과 파티션 프루닝을 받습니다.
+
+Parquet 아카이브 대상 테이블은 요청 구간이 아카이브 워터마크 이전에 걸치면 아카이브 행을 하루치씩 읽어
+DB 행과 (time, 소유자) 순으로 병합합니다. (워터마크 이후 늦게 들어온 과거 행도 순서대로 섞입니다)
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import JSON, BigInteger, Boolean, DateTime, Float, Integer, Numeric, SmallInteger, and_, select
+
+from app.interfaces.repositories.export_repository import IExportRepository
+from app.infrastructure.archive_store import ARCHIVED_MODELS, DAY, ArchiveStore, archive_store, as_utc
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.models import Base, Device
+
+
+def export_tables(metadata=Base.metadata) -> Dict[str, Any]:
+    """내보낼 수 있는 테이블 (기본 키가 (time, <소유자>)인 시계열 테이블)"""
+    tables = {}
+    for table in metadata.sorted_tables:
+        key_columns = [column.name for column in table.primary_key.columns]
+        if len(key_columns) == 2 and key_columns[0] == "time":
+            tables[table.name] = table
+    return tables
+
+
+def column_kind(column) -> str:
+    """컬럼 타입의 내보내기 종류"""
+    column_type = column.type
+    if isinstance(column_type, DateTime):
+        return "timestamp"
+    if isinstance(column_type, Boolean):
+        return "bool"
+    if isinstance(column_type, (Integer, SmallInteger, BigInteger)):
+        return "int"
+    if isinstance(column_type, (Float, Numeric)):
+        return "float"
+    if isinstance(column_type, JSON):
+        return "json"
+    return "string"
+
+
+async def merge_sorted(first: AsyncIterator[Any], second: AsyncIterator[Any], key: Callable[[Any], Any]) -> AsyncIterator[Any]:
+    """key 순으로 정렬된 두 비동기 스트림을 하나의 정렬된 스트림으로 병합"""
+    end = object()
+    left = await anext(first, end)
+    right = await anext(second, end)
+    while left is not end or right is not end:
+        if right is end or (left is not end and key(left) <= key(right)):
+            yield left
+            left = await anext(first, end)
+        else:
+            yield right
+            right = await anext(second, end)
+
+
+# 내보낼 수 있는 테이블 이름 -> Table
+EXPORT_TABLES = export_tables()
+
+# 아카이브 대상 테이블 이름 -> 모델
+ARCHIVED_TABLES = {model.__tablename__: model for model in ARCHIVED_MODELS}
+
+
+class ExportRepository(IExportRepository):
+    """대량 내보내기 리포지토리 구현체
+
+    응답을 보내는 동안 커서를 유지해야 하므로 요청 세션 대신 `session_factory`로 세션을 따로 엽니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = AsyncSessionLocal,
+        archive: Optional[ArchiveStore] = archive_store
+    ):
+        self.session_factory = session_factory
+        self.archive = archive
+
+    def get_columns(self, table_name: str) -> Optional[List[Tuple[str, str]]]:
+        table = EXPORT_TABLES.get(table_name)
+        if table is None:
+            return None
+        return [(column.name, column_kind(column)) for column in table.columns]
+
+    def get_owner_column(self, table_name: str) -> str:
+        return list(EXPORT_TABLES[table_name].primary_key.columns)[1].name
+
+    async def stream_batches(
+        self,
+        table_name: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        owner_id: Optional[Any],
+        batch_size: int,
+        user_id: Optional[UUID] = None
+    ) -> AsyncIterator[Sequence[Sequence[Any]]]:
+        table = EXPORT_TABLES[table_name]
+        owner = table.c[self.get_owner_column(table_name)]
+        conditions = []
+        if owner_id is not None:
+            conditions.append(owner == owner_id)
+        if user_id is not None and owner.name == "device_id":
+            conditions.append(owner.in_(select(Device.device_id).where(Device.user_id == user_id)))
+        if start_time is not None:
+            conditions.append(table.c.time >= start_time)
+        if end_time is not None:
+            conditions.append(table.c.time < end_time)
+
+        statement = (
+            select(*table.columns)
+            .where(and_(*conditions))
+            .order_by(table.c.time, owner)
+            .execution_options(yield_per=batch_size)
+        )
+        model = ARCHIVED_TABLES.get(table_name)
+        async with self.session_factory() as db:
+            if model is None or self.archive is None or not self.archive.covers(model, start_time):
+                result = await db.stream(statement)
+                async for rows in result.partitions(batch_size):
+                    yield [tuple(row) for row in rows]
+                return
+
+            device_ids = None
+            if owner_id is not None:
+                device_ids = [owner_id]
+            elif user_id is not None:
+                device_ids = list(await db.scalars(select(Device.device_id).where(Device.user_id == user_id)))
+            owner_index = list(table.columns).index(owner)
+            result = await db.stream(statement)
+            rows = []
+            async for row in merge_sorted(
+                self._archived_rows(table, start_time, end_time, device_ids),
+                (tuple(row) async for row in result),
+                key=lambda row: (row[0], row[owner_index])
+            ):
+                rows.append(row)
+                if len(rows) >= batch_size:
+                    yield rows
+                    rows = []
+            if rows:
+                yield rows
+
+    async def _archived_rows(
+        self,
+        table,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        device_ids: Optional[List[str]]
+    ) -> AsyncIterator[Tuple[Any, ...]]:
+        """워터마크 이전 구간의 아카이브 행을 (time, device_id) 순 값 튜플로 내보냄 (하루치씩 읽음)"""
+        start_time, end_time = as_utc(start_time), as_utc(end_time)
+        watermark = self.archive.watermark(table.name)
+        if end_time is None or end_time > watermark:
+            end_time = watermark
+        for day in await asyncio.to_thread(self.archive.days, table.name):
+            if start_time is not None and day + DAY <= start_time:
+                continue
+            if day >= end_time:
+                break
+            for row in await asyncio.to_thread(self.archive.read_day, table.name, day, device_ids):
+                if (start_time is None or row["time"] >= start_time) and row["time"] < end_time:
+                    yield tuple(row.get(column.name) for column in table.columns)
@@ -6,6 +6,7 @@ from sqlalchemy import select, update, delete, func
 from app.domain.entities.home_state_snapshot import HomeStateSnapshot
 from app.infrastructure.models import HomeStateSnapshot as HomeStateSnapshotModel
 from app.interfaces.repositories.home_state_snapshot_repository import IHomeStateSnapshotRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
 
 
 class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
@@ -51,8 +52,8 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         )
         
         self.db.add(db_snapshot)
-        self.db.commit()
-        self.db.refresh(db_snapshot)
+        await self.db.commit()
+        await self.db.refresh(db_snapshot)
         
         return self._to_domain_entity(db_snapshot)
     
@@ -60,7 +61,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, time: datetime, user_id: UUID
     ) -> Optional[HomeStateSnapshot]:
         """특정 시간과 사용자의 스냅샷 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.time == time,
                 HomeStateSnapshotModel.user_id == user_id
@@ -74,7 +75,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
     
     async def get_latest_snapshot_by_user(self, user_id: UUID) -> Optional[HomeStateSnapshot]:
         """사용자의 최신 스냅샷 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.user_id == user_id
             ).order_by(HomeStateSnapshotModel.time.desc()).limit(1)
@@ -89,7 +90,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, user_id: UUID, limit: int = 100
     ) -> List[HomeStateSnapshot]:
         """사용자의 스냅샷 목록 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.user_id == user_id
             ).order_by(HomeStateSnapshotModel.time.desc()).limit(limit)
@@ -102,7 +103,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, user_id: UUID, start_time: datetime, end_time: datetime
     ) -> List[HomeStateSnapshot]:
         """특정 시간 범위의 스냅샷 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.user_id == user_id,
                 HomeStateSnapshotModel.time >= start_time,
@@ -117,7 +118,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, user_id: UUID, alert_level: str
     ) -> List[HomeStateSnapshot]:
         """특정 경보 수준의 스냅샷 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.user_id == user_id,
                 HomeStateSnapshotModel.alert_level == alert_level
@@ -131,7 +132,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, time: datetime, user_id: UUID, snapshot_data: dict
     ) -> Optional[HomeStateSnapshot]:
         """스냅샷 업데이트"""
-        result = self.db.execute(
+        result = await self.db.execute(
             update(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.time == time,
                 HomeStateSnapshotModel.user_id == user_id
@@ -139,13 +140,13 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return await self.get_snapshot_by_time_and_user(time, user_id)
         return None
     
     async def delete_snapshot(self, time: datetime, user_id: UUID) -> bool:
         """스냅샷 삭제"""
-        result = self.db.execute(
+        result = await self.db.execute(
             delete(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.time == time,
                 HomeStateSnapshotModel.user_id == user_id
@@ -153,26 +154,28 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return True
         return False
     
     async def get_all_snapshots(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[HomeStateSnapshot]:
-        """전체 스냅샷 목록 조회 (페이지네이션)"""
-        result = self.db.execute(
-            select(HomeStateSnapshotModel).order_by(
-                HomeStateSnapshotModel.time.desc()
-            ).offset(skip).limit(limit)
-        )
+        """전체 스냅샷 목록 조회 (페이지네이션)
+
+        cursor가 있으면 skip 대신 (time, user_id) keyset 조건으로 이어서 조회합니다.
+        """
+        query = apply_keyset(select(HomeStateSnapshotModel), HomeStateSnapshotModel.time, HomeStateSnapshotModel.user_id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
         data_list = result.scalars().all()
         
         return [self._to_domain_entity(data) for data in data_list]
     
     async def count_snapshots_by_user(self, user_id: UUID) -> int:
         """사용자의 스냅샷 개수 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(func.count(HomeStateSnapshotModel.time)).where(
                 HomeStateSnapshotModel.user_id == user_id
             )
@@ -183,7 +186,7 @@ class HomeStateSnapshotRepository(IHomeStateSnapshotRepository):
         self, user_id: UUID, start_time: datetime, end_time: datetime
     ) -> List[HomeStateSnapshot]:
         """환경 관련 경보가 있는 스냅샷 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(HomeStateSnapshotModel).where(
                 HomeStateSnapshotModel.user_id == user_id,
                 HomeStateSnapshotModel.time >= start_time,
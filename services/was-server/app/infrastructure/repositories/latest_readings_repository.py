@@ -0,0 +1,132 @@
+"""
+최신 측정값 일괄 조회 리포지토리 구현체
+
+사용자 디바이스의 센서 테이블별 최신 행을 집합 단위 쿼리로 조회합니다.
+
+- device_latest 테이블을 사용하면 기본 키 범위 조회 1회로 모든 테이블의 최신 행을 읽습니다.
+  device_latest에 항목이 하나도 없는 디바이스와 테이블(백필 전, 새로 추적하는 테이블 등)만
+  원본 테이블에서 읽어 보충합니다.
+- 사용하지 않으면 테이블마다 `DISTINCT ON (device_id) ... ORDER BY device_id, time DESC`를
+  UNION ALL로 묶은 쿼리 몇 개를 각자의 세션에서 동시에 실행합니다.
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Sequence, Type
+from uuid import UUID
+
+from sqlalchemy import String, column, exists, func, literal, literal_column, select, union_all, values
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.interfaces.repositories.latest_readings_repository import ILatestReadingsRepository
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.device_latest import TRACKED_MODELS, device_latest_store
+from app.infrastructure.models import Device, DeviceLatest, User
+
+
+# 원본 테이블을 직접 읽을 때 동시에 실행할 쿼리 수 (테이블을 나누어 UNION ALL로 묶음)
+LATEST_QUERY_GROUPS = 3
+
+
+def user_device_ids(user_id: UUID):
+    """사용자에게 할당된 device_id 서브쿼리"""
+    return select(Device.device_id).where(Device.user_id == user_id)
+
+
+def latest_rows_query(models: Sequence[Type[Any]], device_ids):
+    """테이블별 `DISTINCT ON (device_id)` 최신 행을 UNION ALL로 묶은 쿼리 (device_ids는 서브쿼리 또는 목록)"""
+    parts = []
+    for model in models:
+        table = model.__table__
+        parts.append(
+            select(
+                literal(table.name, String).label("source_table"),
+                table.c.device_id,
+                table.c.time,
+                func.to_jsonb(literal_column(table.name), type_=JSONB).label("payload")
+            )
+            .where(table.c.device_id.in_(device_ids))
+            .distinct(table.c.device_id)
+            .order_by(table.c.device_id, table.c.time.desc())
+            .subquery()
+        )
+    return union_all(*[select(part) for part in parts])
+
+
+def untracked_tables_query():
+    """device_latest에 항목이 하나도 없는 추적 대상 테이블 조회 (테이블마다 기본 키 선두 컬럼 탐색 1회)"""
+    tables = values(column("source_table", String), name="tracked_tables").data(
+        [(model.__tablename__,) for model in TRACKED_MODELS]
+    )
+    return select(tables.c.source_table).where(
+        ~exists().where(DeviceLatest.source_table == tables.c.source_table)
+    )
+
+
+class LatestReadingsRepository(ILatestReadingsRepository):
+    """최신 측정값 일괄 조회 리포지토리 구현체
+
+    조회를 동시에 실행할 수 있도록 메서드마다 `session_factory`로 세션을 따로 엽니다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Any] = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def _fetch(self, statement) -> List[Dict[str, Any]]:
+        async with self.session_factory() as db:
+            result = await db.execute(statement)
+            return [dict(row) for row in result.mappings().all()]
+
+    async def get_user_devices(self, user_id: UUID) -> List[Dict[str, Any]]:
+        """사용자의 디바이스 목록 조회"""
+        return await self._fetch(
+            select(Device.device_id, Device.location_label)
+            .where(Device.user_id == user_id)
+            .order_by(Device.device_id)
+        )
+
+    async def _fetch_from_sources(self, models: Sequence[Type[Any]], device_ids) -> List[Dict[str, Any]]:
+        """원본 테이블들을 나누어 동시에 최신 행 조회"""
+        groups = [models[i::LATEST_QUERY_GROUPS] for i in range(LATEST_QUERY_GROUPS)]
+        results = await asyncio.gather(
+            *(self._fetch(latest_rows_query(group, device_ids)) for group in groups if group)
+        )
+        return [row for rows in results for row in rows]
+
+    async def get_latest_rows(self, user_id: UUID) -> List[Dict[str, Any]]:
+        """사용자 디바이스의 (센서 테이블, 디바이스)별 최신 행 조회"""
+        if not device_latest_store.enabled:
+            return await self._fetch_from_sources(TRACKED_MODELS, user_device_ids(user_id))
+
+        rows, devices, untracked_tables = await asyncio.gather(
+            self._fetch(
+                select(DeviceLatest.source_table, DeviceLatest.device_id, DeviceLatest.time, DeviceLatest.payload)
+                .where(DeviceLatest.device_id.in_(user_device_ids(user_id)))
+            ),
+            self._fetch(user_device_ids(user_id)),
+            self._fetch(untracked_tables_query())
+        )
+
+        # device_latest가 모르는 디바이스는 모든 테이블, 모르는 테이블은 모든 사용자 디바이스를 원본에서 보충
+        fallback = []
+        tracked_devices = {row["device_id"] for row in rows}
+        device_ids = [row["device_id"] for row in devices if row["device_id"] not in tracked_devices]
+        if device_ids:
+            fallback.append(self._fetch_from_sources(TRACKED_MODELS, device_ids))
+        table_names = {row["source_table"] for row in untracked_tables}
+        models = tuple(model for model in TRACKED_MODELS if model.__tablename__ in table_names)
+        if models:
+            fallback.append(self._fetch_from_sources(models, user_device_ids(user_id)))
+
+        seen = {(row["source_table"], row["device_id"]) for row in rows}
+        for fetched in await asyncio.gather(*fallback):
+            for row in fetched:
+                key = (row["source_table"], row["device_id"])
+                if key not in seen:
+                    seen.add(key)
+                    rows.append(row)
+        return rows
+
+    async def user_exists(self, user_id: UUID) -> bool:
+        """사용자 존재 여부 조회"""
+        rows = await self._fetch(select(User.user_id).where(User.user_id == user_id))
+        return bool(rows)
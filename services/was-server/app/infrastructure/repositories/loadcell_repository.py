@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 LoadCell 센서 데이터에 대한 데이
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 
 from app.interfaces.repositories.sensor_repository import ILoadCellRepository
@@ -17,6 +17,11 @@ from app.api.v1.schemas import (
     SensorRawLoadCellUpdate,
     SensorRawLoadCellResponse
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import count_if, payload_bool, payload_number, range_conditions, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class LoadCellRepository(ILoadCellRepository):
@@ -55,7 +60,7 @@ class LoadCellRepository(ILoadCellRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -64,14 +69,7 @@ class LoadCellRepository(ILoadCellRepository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawLoadCellResponse]:
         """최신 로드셀 센서 데이터 조회"""
-        query = (
-            select(SensorRawLoadCell)
-            .where(SensorRawLoadCell.device_id == device_id)
-            .order_by(SensorRawLoadCell.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawLoadCell, device_id)
         
         if data:
             return SensorRawLoadCellResponse.from_orm(data)
@@ -82,28 +80,13 @@ class LoadCellRepository(ILoadCellRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawLoadCellResponse]:
-        """로드셀 센서 데이터 목록 조회"""
-        print(f"device_id: {device_id}, start_time: {start_time}, end_time: {end_time}, limit_count: {limit_count}")
-        query = select(SensorRawLoadCell)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawLoadCell.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawLoadCell.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawLoadCell.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawLoadCell.time.desc()).limit(limit_count)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawLoadCellResponse.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """로드셀 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawLoadCell, SensorRawLoadCellResponse, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -119,7 +102,7 @@ class LoadCellRepository(ILoadCellRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -143,7 +126,7 @@ class LoadCellRepository(ILoadCellRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -168,18 +151,22 @@ class LoadCellRepository(ILoadCellRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """로드셀 센서의 무게 통계 정보 조회"""
-        query = select(SensorRawLoadCell).where(SensorRawLoadCell.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawLoadCell.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawLoadCell.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """로드셀 센서의 무게 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 weight_kg/calibrated 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawLoadCell, device_id, start_time, end_time)
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                *summary_columns(payload_number(source, "weight_kg"), "weight"),
+                count_if(payload_bool(source, "calibrated")).label("calibrated_count")
+            ).where(and_(*range_conditions(source, device_id, start_time, end_time)))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -187,23 +174,19 @@ class LoadCellRepository(ILoadCellRepository):
                 "calibration_status": None
             }
         
-        # 무게 데이터가 있는 레코드만 필터링
-        weight_data = [d.weight_kg for d in data_list if d.weight_kg is not None]
-        calibrated_count = sum(1 for d in data_list if d.calibrated)
-        
         stats = {
             "device_id": device_id,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "weight_stats": {
-                "count": len(weight_data),
-                "min": min(weight_data) if weight_data else None,
-                "max": max(weight_data) if weight_data else None,
-                "avg": sum(weight_data) / len(weight_data) if weight_data else None
+                "count": row.weight_count,
+                "min": row.weight_min,
+                "max": row.weight_max,
+                "avg": to_number(row.weight_avg)
             },
             "calibration_status": {
-                "calibrated_count": calibrated_count,
-                "total_count": len(data_list),
-                "calibration_rate": calibrated_count / len(data_list) if data_list else 0
+                "calibrated_count": row.calibrated_count,
+                "total_count": row.total_records,
+                "calibration_rate": row.calibrated_count / row.total_records
             }
         }
         
@@ -5,7 +5,7 @@
 실제 데이터베이스 대신 메모리에 데이터를 저장합니다.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from app.domain.entities.user import User
 from app.interfaces.repositories.user_repository import IUserRepository
@@ -51,6 +51,22 @@ class MemoryUserRepository(IUserRepository):
         """역할별 사용자를 조회합니다."""
         return [user for user in self._users.values() if user.user_role == role]
     
+    async def get_page(
+        self, offset: int = 0, limit: int = 10, role: Optional[str] = None, after: Optional[UUID] = None
+    ) -> List[User]:
+        """사용자 한 페이지를 user_id 순으로 조회합니다."""
+        users = await (self.get_by_role(role) if role else self.get_all())
+        users.sort(key=lambda user: str(user.user_id))
+        if after is not None:
+            return [user for user in users if str(user.user_id) > str(after)][:limit]
+        return users[offset:offset + limit]
+    
+    async def count(self, role: Optional[str] = None, estimate: bool = False) -> Tuple[int, bool]:
+        """사용자 수를 조회합니다. (메모리 저장소는 항상 정확한 값)"""
+        if role:
+            return len(await self.get_by_role(role)), False
+        return len(self._users), False
+    
     async def update(self, user: User) -> User:
         """사용자 정보를 업데이트합니다."""
         if user.user_id not in self._users:
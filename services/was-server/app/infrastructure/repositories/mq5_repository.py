@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 MQ5 가스 센서 데이터에 대한 데이
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 
 from app.interfaces.repositories.sensor_repository import IMQ5Repository
@@ -17,6 +17,11 @@ from app.api.v1.schemas import (
     SensorRawMQ5Update,
     SensorRawMQ5Response
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import count_if, payload_number, payload_text, range_conditions
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class MQ5Repository(IMQ5Repository):
@@ -36,8 +41,8 @@ class MQ5Repository(IMQ5Repository):
         
         db_data = SensorRawMQ5(**orm_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawMQ5Response.from_orm(data)
     
     async def get_by_id(
@@ -53,7 +58,7 @@ class MQ5Repository(IMQ5Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -62,14 +67,7 @@ class MQ5Repository(IMQ5Repository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawMQ5Response]:
         """최신 MQ5 가스 센서 데이터 조회"""
-        query = (
-            select(SensorRawMQ5)
-            .where(SensorRawMQ5.device_id == device_id)
-            .order_by(SensorRawMQ5.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawMQ5, device_id)
         
         if data:
             return SensorRawMQ5Response.from_attributes(data)
@@ -80,39 +78,13 @@ class MQ5Repository(IMQ5Repository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawMQ5Response]:
-        print("repository get_list 호출")
-        try:
-            query = select(SensorRawMQ5)
-            
-            # 필터 조건 추가
-            if device_id:
-                query = query.where(SensorRawMQ5.device_id == device_id)
-            if start_time:
-                query = query.where(SensorRawMQ5.time >= start_time)
-            if end_time:
-                query = query.where(SensorRawMQ5.time <= end_time)
-            
-            # 시간 역순으로 정렬하고 제한
-            query = query.order_by(SensorRawMQ5.time.desc()).limit(limit_count)
-            
-            result = self.db.execute(query)
-            # SQLAlchemy 모델 객체들의 리스트를 가져옴
-            data_list = result.scalars().all()
-
-            print("repository get_list 조회 값")
-            print(data_list)
-            
-            # SQLAlchemy 모델을 Pydantic 모델로 변환
-            # return [SensorRawMQ5Response.from_attributes(data) for data in data_list]
-            return [SensorRawMQ5Response.from_orm(data) for data in data_list]
-            # return data_list
-            
-        except Exception as e:
-            # 오류 발생 시 로깅 후 빈 리스트 반환
-            print(f"get_list 오류: {e}")
-            return []
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """MQ5 가스 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawMQ5, SensorRawMQ5Response, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -128,7 +100,7 @@ class MQ5Repository(IMQ5Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -177,18 +149,19 @@ class MQ5Repository(IMQ5Repository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """MQ5 가스 센서의 가스 농도 통계 정보 조회"""
-        query = select(SensorRawMQ5).where(SensorRawMQ5.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawMQ5.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawMQ5.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """MQ5 가스 센서의 가스 농도 통계 정보 조회 (DB에서 집계)"""
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawMQ5, device_id, start_time, end_time)
+        payload = source.raw_payload
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(and_(payload.isnot(None), payload != {})).label("has_raw_payload")
+            ).where(and_(*range_conditions(source, device_id, start_time, end_time)))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -199,10 +172,10 @@ class MQ5Repository(IMQ5Repository):
         # Raw 센서 데이터는 raw_payload만 가지고 있음
         stats = {
             "device_id": device_id,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "raw_data_stats": {
-                "total_records": len(data_list),
-                "has_raw_payload": len([d for d in data_list if d.raw_payload])
+                "total_records": row.total_records,
+                "has_raw_payload": row.has_raw_payload
             }
         }
         
@@ -215,32 +188,37 @@ class MQ5Repository(IMQ5Repository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """MQ5 가스 센서의 높은 농도 알림 조회"""
-        # Raw 센서 모델은 ppm_value 필드가 없으므로 빈 결과 반환
-        query = select(SensorRawMQ5).where(
-            and_(
-                SensorRawMQ5.device_id == device_id,
-                SensorRawMQ5.device_id == "nonexistent"  # 항상 false가 되도록
+        """MQ5 가스 센서의 높은 농도 알림 조회 (gas_level 임계값 조건은 생성 컬럼 인덱스 사용)"""
+        gas_level = payload_number(SensorRawMQ5, "gas_level")
+        result = await self.db.execute(
+            select(
+                SensorRawMQ5.time,
+                gas_level.label("gas_level"),
+                payload_number(SensorRawMQ5, "analog_value").label("analog_value"),
+                payload_text(SensorRawMQ5, "gas_type").label("gas_type")
             )
+            .where(and_(*range_conditions(SensorRawMQ5, device_id, start_time, end_time), gas_level > threshold_ppm))
+            .order_by(SensorRawMQ5.time)
         )
         
-        if start_time:
-            query = query.where(SensorRawMQ5.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawMQ5.time <= end_time)
-        
-        result = await self.db.execute(query)
-        alert_data = result.scalars().all()
+        alerts = []
+        for row in result.all():
+            alert_level = "HIGH" if row.gas_level > threshold_ppm * 2 else "MEDIUM"
+            alerts.append({
+                "timestamp": row.time,
+                "gas_level": row.gas_level,
+                "analog_value": row.analog_value,
+                "alert_level": alert_level,
+                "gas_type": row.gas_type
+            })
         
-        # Raw 센서 데이터는 ppm_value, analog_value, gas_type 필드가 없음
         return {
             "device_id": device_id,
             "threshold_ppm": threshold_ppm,
-            "total_alerts": 0,
-            "alerts": [],
+            "total_alerts": len(alerts),
+            "alerts": alerts,
             "alert_summary": {
-                "high_level": 0,
-                "medium_level": 0
-            },
-            "note": "Raw 센서 모델은 ppm_value, analog_value, gas_type 필드를 지원하지 않습니다."
+                "high_level": len([a for a in alerts if a["alert_level"] == "HIGH"]),
+                "medium_level": len([a for a in alerts if a["alert_level"] == "MEDIUM"])
+            }
         }
@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 MQ7 가스 센서 데이터에 대한 데이
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 
 from app.interfaces.repositories.sensor_repository import IMQ7Repository
@@ -17,6 +17,11 @@ from app.api.v1.schemas import (
     SensorRawMQ7Update,
     SensorRawMQ7Response
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import group_counts, payload_number, payload_text, range_conditions, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class MQ7Repository(IMQ7Repository):
@@ -36,8 +41,8 @@ class MQ7Repository(IMQ7Repository):
         
         db_data = SensorRawMQ7(**orm_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawMQ7Response.from_orm(db_data)
     
     async def get_by_id(
@@ -53,7 +58,7 @@ class MQ7Repository(IMQ7Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -62,14 +67,7 @@ class MQ7Repository(IMQ7Repository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawMQ7Response]:
         """최신 MQ7 가스 센서 데이터 조회"""
-        query = (
-            select(SensorRawMQ7)
-            .where(SensorRawMQ7.device_id == device_id)
-            .order_by(SensorRawMQ7.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawMQ7, device_id)
         
         if data:
             return SensorRawMQ7Response.from_orm(data)
@@ -80,27 +78,13 @@ class MQ7Repository(IMQ7Repository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawMQ7Response]:
-        """MQ7 가스 센서 데이터 목록 조회"""
-        query = select(SensorRawMQ7)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawMQ7.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawMQ7.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawMQ7.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawMQ7.time.desc()).limit(limit_count)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawMQ7Response.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """MQ7 가스 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawMQ7, SensorRawMQ7Response, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -116,7 +100,7 @@ class MQ7Repository(IMQ7Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -140,7 +124,7 @@ class MQ7Repository(IMQ7Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -165,18 +149,23 @@ class MQ7Repository(IMQ7Repository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """MQ7 가스 센서의 가스 농도 통계 정보 조회"""
-        query = select(SensorRawMQ7).where(SensorRawMQ7.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawMQ7.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawMQ7.time <= end_time)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
+        """MQ7 가스 센서의 가스 농도 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 co_level(디바이스 전송 키)/analog_value/gas_type 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawMQ7, device_id, start_time, end_time)
+        conditions = range_conditions(source, device_id, start_time, end_time)
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                *summary_columns(payload_number(source, "co_level"), "ppm"),
+                *summary_columns(payload_number(source, "analog_value"), "analog")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -184,30 +173,20 @@ class MQ7Repository(IMQ7Repository):
                 "gas_type_distribution": None
             }
         
-        # 가스 농도 데이터가 있는 레코드만 필터링
-        ppm_data = [d.ppm_value for d in data_list if d.ppm_value is not None]
-        analog_data = [d.analog_value for d in data_list if d.analog_value is not None]
-        
-        # 가스 타입별 분포
-        gas_types = {}
-        for data in data_list:
-            if data.gas_type:
-                gas_types[data.gas_type] = gas_types.get(data.gas_type, 0) + 1
-        
         stats = {
             "device_id": device_id,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "gas_stats": {
-                "ppm_count": len(ppm_data),
-                "ppm_min": min(ppm_data) if ppm_data else None,
-                "ppm_max": max(ppm_data) if ppm_data else None,
-                "ppm_avg": sum(ppm_data) / len(ppm_data) if ppm_data else None,
-                "analog_count": len(analog_data),
-                "analog_min": min(analog_data) if analog_data else None,
-                "analog_max": max(analog_data) if analog_data else None,
-                "analog_avg": sum(analog_data) / len(analog_data) if analog_data else None
+                "ppm_count": row.ppm_count,
+                "ppm_min": row.ppm_min,
+                "ppm_max": row.ppm_max,
+                "ppm_avg": to_number(row.ppm_avg),
+                "analog_count": row.analog_count,
+                "analog_min": row.analog_min,
+                "analog_max": row.analog_max,
+                "analog_avg": to_number(row.analog_avg)
             },
-            "gas_type_distribution": gas_types
+            "gas_type_distribution": await group_counts(self.db, payload_text(source, "gas_type"), conditions)
         }
         
         return stats
@@ -219,31 +198,28 @@ class MQ7Repository(IMQ7Repository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """MQ7 가스 센서의 높은 농도 알림 조회"""
-        query = select(SensorRawMQ7).where(
-            and_(
-                SensorRawMQ7.device_id == device_id,
-                SensorRawMQ7.ppm_value > threshold_ppm
+        """MQ7 가스 센서의 높은 농도 알림 조회 (co_level 임계값 조건은 생성 컬럼 인덱스 사용)"""
+        co_level = payload_number(SensorRawMQ7, "co_level")
+        result = await self.db.execute(
+            select(
+                SensorRawMQ7.time,
+                co_level.label("co_level"),
+                payload_number(SensorRawMQ7, "analog_value").label("analog_value"),
+                payload_text(SensorRawMQ7, "gas_type").label("gas_type")
             )
+            .where(and_(*range_conditions(SensorRawMQ7, device_id, start_time, end_time), co_level > threshold_ppm))
+            .order_by(SensorRawMQ7.time)
         )
         
-        if start_time:
-            query = query.where(SensorRawMQ7.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawMQ7.time <= end_time)
-        
-        result = self.db.execute(query)
-        alert_data = result.scalars().all()
-        
         alerts = []
-        for data in alert_data:
-            alert_level = "HIGH" if data.ppm_value > threshold_ppm * 2 else "MEDIUM"
+        for row in result.all():
+            alert_level = "HIGH" if row.co_level > threshold_ppm * 2 else "MEDIUM"
             alerts.append({
-                "timestamp": data.time,
-                "ppm_value": data.ppm_value,
-                "analog_value": data.analog_value,
+                "timestamp": row.time,
+                "co_level": row.co_level,
+                "analog_value": row.analog_value,
                 "alert_level": alert_level,
-                "gas_type": data.gas_type
+                "gas_type": row.gas_type
             })
         
         return {
@@ -4,10 +4,11 @@ PostgreSQL User 리포지토리 구현체
 실제 데이터베이스와 연동하는 User 리포지토리입니다.
 """
 
-from typing import List, Optional
-from uuid import uuid4
+import json
+from typing import List, Optional, Tuple
+from uuid import UUID, uuid4
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, text
 from sqlalchemy.orm import selectinload
 
 from app.interfaces.repositories.user_repository import IUserRepository
@@ -15,6 +16,9 @@ from app.domain.entities.user import User
 from app.infrastructure.models import User as UserModel
 from app.infrastructure.database import get_session
 
+# 추정치가 이보다 작으면 정확한 COUNT(*)도 충분히 싸므로 정확한 값을 반환
+ESTIMATE_EXACT_THRESHOLD = 10000
+
 
 class PostgreSQLUserRepository(IUserRepository):
     """PostgreSQL 기반 User 리포지토리"""
@@ -142,6 +146,80 @@ class PostgreSQLUserRepository(IUserRepository):
         
         return users
     
+    def _to_domain_entity(self, user_model: UserModel) -> User:
+        """ORM 모델을 도메인 엔티티로 변환"""
+        return User(
+            user_id=user_model.user_id,
+            user_role=user_model.user_role,
+            user_name=user_model.user_name,
+            email=user_model.email,
+            phone_number=user_model.phone_number,
+            created_at=user_model.created_at
+        )
+    
+    def _filtered(self, stmt, role: Optional[str]):
+        if role:
+            stmt = stmt.where(UserModel.user_role == role)
+        return stmt
+    
+    async def get_page(
+        self, offset: int = 0, limit: int = 10, role: Optional[str] = None, after: Optional[UUID] = None
+    ) -> List[User]:
+        """사용자 한 페이지 조회
+        
+        기본 키(user_id) 순으로 DB에서 LIMIT/OFFSET을 적용합니다.
+        after(이전 페이지 마지막 user_id)가 있으면 OFFSET 없이 기본 키 인덱스에서 바로 이어서 읽습니다.
+        """
+        session = await self._get_session()
+        
+        stmt = self._filtered(select(UserModel), role)
+        if after is not None:
+            stmt = stmt.where(UserModel.user_id > after)
+        else:
+            stmt = stmt.offset(offset)
+        stmt = stmt.order_by(UserModel.user_id).limit(limit)
+        
+        result = await session.execute(stmt)
+        return [self._to_domain_entity(user_model) for user_model in result.scalars().all()]
+    
+    async def count(self, role: Optional[str] = None, estimate: bool = False) -> Tuple[int, bool]:
+        """사용자 수와 추정치 여부 조회
+        
+        estimate=True면 테이블을 읽지 않고 플래너 통계로 추정합니다.
+        (필터 없음: pg_class.reltuples, 역할 필터: EXPLAIN의 예상 행 수)
+        통계가 없거나 추정치가 작으면 정확한 COUNT(*)를 사용하고 추정치 여부를 False로 돌려줍니다.
+        """
+        session = await self._get_session()
+        
+        if estimate:
+            estimated = await self._estimate_count(session, role)
+            if estimated is not None and estimated >= ESTIMATE_EXACT_THRESHOLD:
+                return estimated, True
+        
+        result = await session.execute(self._filtered(select(func.count()).select_from(UserModel), role))
+        return result.scalar_one(), False
+    
+    async def _estimate_count(self, session: AsyncSession, role: Optional[str]) -> Optional[int]:
+        """플래너 통계 기반 행 수 추정 (통계가 없으면 None)"""
+        if not role:
+            result = await session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": UserModel.__tablename__}
+            )
+            reltuples = result.scalar_one_or_none()
+            # 한 번도 ANALYZE되지 않은 테이블은 -1 (PostgreSQL 14+) 또는 0
+            return int(reltuples) if reltuples and reltuples > 0 else None
+        
+        # 역할 값은 SQL 문자열에 넣지 않고 바인드 파라미터로 전달
+        result = await session.execute(
+            text("EXPLAIN (FORMAT JSON) SELECT user_id FROM users WHERE user_role = :role"),
+            {"role": role}
+        )
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    
     async def update(self, user_id: str, update_data: dict) -> User:
         """사용자 정보 업데이트"""
         session = await self._get_session()
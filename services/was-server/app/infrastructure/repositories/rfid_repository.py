@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 RFID 센서 데이터에 대한 데이터 
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.orm import selectinload
 
 from app.interfaces.repositories.sensor_repository import IRFIDRepository
@@ -17,6 +17,11 @@ from app.api.v1.schemas import (
     SensorRawRFIDUpdate,
     SensorRawRFIDResponse
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import count_if, group_counts, payload_bool, payload_text, range_conditions
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class RFIDRepository(IRFIDRepository):
@@ -37,8 +42,8 @@ class RFIDRepository(IRFIDRepository):
         db_data = SensorRawRFID(**orm_data)
         print(db_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawRFIDResponse.from_orm(db_data)
     
     async def get_by_id(
@@ -54,7 +59,7 @@ class RFIDRepository(IRFIDRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -63,14 +68,7 @@ class RFIDRepository(IRFIDRepository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawRFIDResponse]:
         """최신 RFID 센서 데이터 조회"""
-        query = (
-            select(SensorRawRFID)
-            .where(SensorRawRFID.device_id == device_id)
-            .order_by(SensorRawRFID.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawRFID, device_id)
         
         if data:
             return SensorRawRFIDResponse.from_orm(data)
@@ -81,27 +79,13 @@ class RFIDRepository(IRFIDRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawRFIDResponse]:
-        """RFID 센서 데이터 목록 조회"""
-        query = select(SensorRawRFID)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawRFID.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawRFID.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawRFID.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawRFID.time.desc()).limit(limit_count)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawRFIDResponse.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """RFID 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawRFID, SensorRawRFIDResponse, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -117,7 +101,7 @@ class RFIDRepository(IRFIDRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -141,7 +125,7 @@ class RFIDRepository(IRFIDRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -166,18 +150,24 @@ class RFIDRepository(IRFIDRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """RFID 센서의 카드 통계 정보 조회"""
-        query = select(SensorRawRFID).where(SensorRawRFID.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawRFID.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawRFID.time <= end_time)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
+        """RFID 센서의 카드 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 card_id/card_type/read_success 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawRFID, device_id, start_time, end_time)
+        conditions = range_conditions(source, device_id, start_time, end_time)
+        card_id = func.nullif(payload_text(source, "card_id"), "")
+        result = await self.db.execute(
+            select(
+                func.count().label("total_reads"),
+                count_if(payload_bool(source, "read_success")).label("successful_reads"),
+                func.count(func.distinct(card_id)).label("unique_cards")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_reads:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -185,31 +175,17 @@ class RFIDRepository(IRFIDRepository):
                 "read_success_rate": None
             }
         
-        # 카드 타입별 분포
-        card_types = {}
-        for data in data_list:
-            if data.card_type:
-                card_types[data.card_type] = card_types.get(data.card_type, 0) + 1
-        
-        # 읽기 성공률 계산
-        total_reads = len(data_list)
-        successful_reads = sum(1 for d in data_list if d.read_success)
-        read_success_rate = successful_reads / total_reads if total_reads > 0 else 0
-        
-        # 고유 카드 수 계산
-        unique_cards = len(set(d.card_id for d in data_list if d.card_id))
-        
         stats = {
             "device_id": device_id,
-            "total_records": total_reads,
+            "total_records": row.total_reads,
             "card_stats": {
-                "unique_cards": unique_cards,
-                "total_reads": total_reads,
-                "successful_reads": successful_reads,
-                "failed_reads": total_reads - successful_reads
+                "unique_cards": row.unique_cards,
+                "total_reads": row.total_reads,
+                "successful_reads": row.successful_reads,
+                "failed_reads": row.total_reads - row.successful_reads
             },
-            "read_success_rate": read_success_rate,
-            "card_type_distribution": card_types
+            "read_success_rate": row.successful_reads / row.total_reads,
+            "card_type_distribution": await group_counts(self.db, payload_text(source, "card_type"), conditions)
         }
         
         return stats
@@ -221,21 +197,24 @@ class RFIDRepository(IRFIDRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """RFID 센서의 읽기 이력 조회"""
-        query = select(SensorRawRFID).where(SensorRawRFID.device_id == device_id)
-        
+        """RFID 센서의 읽기 이력 조회 (card_id 조건은 생성 컬럼 인덱스 사용)"""
+        card = payload_text(SensorRawRFID, "card_id")
+        conditions = range_conditions(SensorRawRFID, device_id, start_time, end_time)
         if card_id:
-            query = query.where(SensorRawRFID.card_id == card_id)
-        if start_time:
-            query = query.where(SensorRawRFID.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawRFID.time <= end_time)
+            conditions.append(card == card_id)
         
         # 시간 역순으로 정렬
-        query = query.order_by(SensorRawRFID.time.desc())
-        
-        result = await self.db.execute(query)
-        history_data = result.scalars().all()
+        result = await self.db.execute(
+            select(
+                SensorRawRFID.time,
+                card.label("card_id"),
+                payload_bool(SensorRawRFID, "read_success").label("read_success"),
+                payload_text(SensorRawRFID, "card_type").label("card_type")
+            )
+            .where(and_(*conditions))
+            .order_by(SensorRawRFID.time.desc())
+        )
+        history_data = result.all()
         
         # 카드별 읽기 이력
         card_history = {}
@@ -0,0 +1,61 @@
+"""
+시간 버킷 집계 리포지토리 구현체
+
+`date_bin`으로 행을 고정 간격 버킷에 배정하고 버킷별 집계만 조회합니다.
+기간 내 행 수와 관계없이 버킷 수만큼의 행만 전송됩니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Type
+from sqlalchemy import DateTime, Interval, and_, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.interfaces.repositories.sensor_bucket_repository import ISensorBucketRepository
+from app.infrastructure.sql_aggregates import range_conditions, to_number, value_column
+
+
+# 버킷 경계 기준 시각 (간격이 같으면 요청 기간과 관계없이 경계가 일정)
+BUCKET_ORIGIN = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class SensorBucketRepository(ISensorBucketRepository):
+    """date_bin 기반 시간 버킷 집계 리포지토리"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_buckets(
+        self,
+        model: Type[Any],
+        field: str,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta
+    ) -> List[Dict[str, Any]]:
+        value = value_column(model, field)
+        bucket = func.date_bin(
+            literal(width, Interval()), model.time, literal(BUCKET_ORIGIN, DateTime(timezone=True))
+        )
+        result = await self.db_session.execute(
+            select(
+                bucket.label("bucket"),
+                func.count().label("count"),
+                func.min(value).label("min"),
+                func.max(value).label("max"),
+                func.avg(value).label("avg")
+            )
+            .where(and_(*range_conditions(model, device_id, start_time, end_time)))
+            .group_by("bucket")
+            .order_by("bucket")
+        )
+        return [
+            {
+                "time": row.bucket,
+                "count": row.count,
+                "min": to_number(row.min),
+                "max": to_number(row.max),
+                "avg": to_number(row.avg)
+            }
+            for row in result.all()
+        ]
@@ -5,6 +5,8 @@ from sqlalchemy import select, update, delete, func
 from app.domain.entities.sensor_event_button import SensorEventButton
 from app.infrastructure.models import SensorEventButton as SensorEventButtonModel
 from app.interfaces.repositories.sensor_event_button_repository import ISensorEventButtonRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.device_latest import fetch_latest
 
 
 class SensorEventButtonRepository(ISensorEventButtonRepository):
@@ -25,8 +27,8 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         )
         
         self.db.add(db_button_event)
-        self.db.commit()
-        self.db.refresh(db_button_event)
+        await self.db.commit()
+        await self.db.refresh(db_button_event)
         
         return self._to_domain_entity(db_button_event)
     
@@ -34,7 +36,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, time: datetime, device_id: str
     ) -> Optional[SensorEventButton]:
         """특정 시간과 디바이스의 버튼 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.time == time,
                 SensorEventButtonModel.device_id == device_id
@@ -48,12 +50,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
     
     async def get_latest_button_event_by_device(self, device_id: str) -> Optional[SensorEventButton]:
         """디바이스의 최신 버튼 이벤트 조회"""
-        result = self.db.execute(
-            select(SensorEventButtonModel).where(
-                SensorEventButtonModel.device_id == device_id
-            ).order_by(SensorEventButtonModel.time.desc()).limit(1)
-        )
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorEventButtonModel, device_id)
         
         if data:
             return self._to_domain_entity(data)
@@ -63,7 +60,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, device_id: str, limit: int = 100
     ) -> List[SensorEventButton]:
         """디바이스의 버튼 이벤트 목록 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.device_id == device_id
             ).order_by(SensorEventButtonModel.time.desc()).limit(limit)
@@ -76,7 +73,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, event_type: str, limit: int = 100
     ) -> List[SensorEventButton]:
         """특정 이벤트 타입의 버튼 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.event_type == event_type
             ).order_by(SensorEventButtonModel.time.desc()).limit(limit)
@@ -89,7 +86,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, button_state: str, limit: int = 100
     ) -> List[SensorEventButton]:
         """특정 버튼 상태의 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.button_state == button_state
             ).order_by(SensorEventButtonModel.time.desc()).limit(limit)
@@ -102,7 +99,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, device_id: str, start_time: datetime, end_time: datetime
     ) -> List[SensorEventButton]:
         """특정 시간 범위의 버튼 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.device_id == device_id,
                 SensorEventButtonModel.time >= start_time,
@@ -117,7 +114,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, time: datetime, device_id: str, event_data: dict
     ) -> Optional[SensorEventButton]:
         """버튼 이벤트 업데이트"""
-        result = self.db.execute(
+        result = await self.db.execute(
             update(SensorEventButtonModel).where(
                 SensorEventButtonModel.time == time,
                 SensorEventButtonModel.device_id == device_id
@@ -125,13 +122,13 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return await self.get_button_event_by_time_and_device(time, device_id)
         return None
     
     async def delete_button_event(self, time: datetime, device_id: str) -> bool:
         """버튼 이벤트 삭제"""
-        result = self.db.execute(
+        result = await self.db.execute(
             delete(SensorEventButtonModel).where(
                 SensorEventButtonModel.time == time,
                 SensorEventButtonModel.device_id == device_id
@@ -139,26 +136,28 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return True
         return False
     
     async def get_all_button_events(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[SensorEventButton]:
-        """전체 버튼 이벤트 목록 조회 (페이지네이션)"""
-        result = self.db.execute(
-            select(SensorEventButtonModel).order_by(
-                SensorEventButtonModel.time.desc()
-            ).offset(skip).limit(limit)
-        )
+        """전체 버튼 이벤트 목록 조회 (페이지네이션)
+
+        cursor가 있으면 skip 대신 (time, device_id) keyset 조건으로 이어서 조회합니다.
+        """
+        query = apply_keyset(select(SensorEventButtonModel), SensorEventButtonModel.time, SensorEventButtonModel.device_id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
         data_list = result.scalars().all()
         
         return [self._to_domain_entity(data) for data in data_list]
     
     async def count_button_events_by_device(self, device_id: str) -> int:
         """디바이스의 버튼 이벤트 개수 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(func.count(SensorEventButtonModel.time)).where(
                 SensorEventButtonModel.device_id == device_id
             )
@@ -169,7 +168,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, start_time: datetime, end_time: datetime
     ) -> List[SensorEventButton]:
         """위기 상황 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.event_type == 'crisis_acknowledged',
                 SensorEventButtonModel.time >= start_time,
@@ -184,7 +183,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, start_time: datetime, end_time: datetime
     ) -> List[SensorEventButton]:
         """도움 요청 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.event_type == 'assistance_request',
                 SensorEventButtonModel.time >= start_time,
@@ -199,7 +198,7 @@ class SensorEventButtonRepository(ISensorEventButtonRepository):
         self, start_time: datetime, end_time: datetime
     ) -> List[SensorEventButton]:
         """복약 체크 이벤트 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorEventButtonModel).where(
                 SensorEventButtonModel.event_type == 'medication_check',
                 SensorEventButtonModel.time >= start_time,
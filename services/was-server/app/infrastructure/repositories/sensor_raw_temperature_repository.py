@@ -5,6 +5,8 @@ from sqlalchemy import select, update, delete, func
 from app.domain.entities.sensor_raw_temperature import SensorRawTemperature
 from app.infrastructure.models import SensorRawTemperature as SensorRawTemperatureModel
 from app.interfaces.repositories.sensor_raw_temperature_repository import ISensorRawTemperatureRepository
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.device_latest import fetch_latest
 
 
 class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
@@ -24,8 +26,8 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         )
         
         self.db.add(db_temperature)
-        self.db.commit()
-        self.db.refresh(db_temperature)
+        await self.db.commit()
+        await self.db.refresh(db_temperature)
         
         return self._to_domain_entity(db_temperature)
     
@@ -33,7 +35,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, time: datetime, device_id: str
     ) -> Optional[SensorRawTemperature]:
         """특정 시간과 디바이스의 온도 데이터 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.time == time,
                 SensorRawTemperatureModel.device_id == device_id
@@ -47,12 +49,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
     
     async def get_latest_temperature_data_by_device(self, device_id: str) -> Optional[SensorRawTemperature]:
         """디바이스의 최신 온도 데이터 조회"""
-        result = self.db.execute(
-            select(SensorRawTemperatureModel).where(
-                SensorRawTemperatureModel.device_id == device_id
-            ).order_by(SensorRawTemperatureModel.time.desc()).limit(1)
-        )
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawTemperatureModel, device_id)
         
         if data:
             return self._to_domain_entity(data)
@@ -62,7 +59,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, limit: int = 100
     ) -> List[SensorRawTemperature]:
         """디바이스의 온도 데이터 목록 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.device_id == device_id
             ).order_by(SensorRawTemperatureModel.time.desc()).limit(limit)
@@ -75,7 +72,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, start_time: datetime, end_time: datetime
     ) -> List[SensorRawTemperature]:
         """특정 시간 범위의 온도 데이터 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.device_id == device_id,
                 SensorRawTemperatureModel.time >= start_time,
@@ -90,7 +87,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, min_temp: float, max_temp: float
     ) -> List[SensorRawTemperature]:
         """특정 온도 범위의 데이터 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.device_id == device_id,
                 SensorRawTemperatureModel.temperature_celsius >= min_temp,
@@ -105,7 +102,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, limit: int = 100
     ) -> List[SensorRawTemperature]:
         """극한 온도 데이터 조회 (0°C 이하 또는 50°C 이상)"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.device_id == device_id,
                 (SensorRawTemperatureModel.temperature_celsius <= 0) | 
@@ -120,7 +117,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, time: datetime, device_id: str, temperature_data: dict
     ) -> Optional[SensorRawTemperature]:
         """온도 데이터 업데이트"""
-        result = self.db.execute(
+        result = await self.db.execute(
             update(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.time == time,
                 SensorRawTemperatureModel.device_id == device_id
@@ -128,13 +125,13 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return await self.get_temperature_data_by_time_and_device(time, device_id)
         return None
     
     async def delete_temperature_data(self, time: datetime, device_id: str) -> bool:
         """온도 데이터 삭제"""
-        result = self.db.execute(
+        result = await self.db.execute(
             delete(SensorRawTemperatureModel).where(
                 SensorRawTemperatureModel.time == time,
                 SensorRawTemperatureModel.device_id == device_id
@@ -142,26 +139,28 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         )
         
         if result.rowcount > 0:
-            self.db.commit()
+            await self.db.commit()
             return True
         return False
     
     async def get_all_temperature_data(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[SensorRawTemperature]:
-        """전체 온도 데이터 목록 조회 (페이지네이션)"""
-        result = self.db.execute(
-            select(SensorRawTemperatureModel).order_by(
-                SensorRawTemperatureModel.time.desc()
-            ).offset(skip).limit(limit)
-        )
+        """전체 온도 데이터 목록 조회 (페이지네이션)
+
+        cursor가 있으면 skip 대신 (time, device_id) keyset 조건으로 이어서 조회합니다.
+        """
+        query = apply_keyset(select(SensorRawTemperatureModel), SensorRawTemperatureModel.time, SensorRawTemperatureModel.device_id, cursor)
+        if cursor is None:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
         data_list = result.scalars().all()
         
         return [self._to_domain_entity(data) for data in data_list]
     
     async def count_temperature_data_by_device(self, device_id: str) -> int:
         """디바이스의 온도 데이터 개수 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(func.count(SensorRawTemperatureModel.time)).where(
                 SensorRawTemperatureModel.device_id == device_id
             )
@@ -172,7 +171,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, start_time: datetime, end_time: datetime
     ) -> Optional[float]:
         """디바이스의 평균 온도 조회"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(func.avg(SensorRawTemperatureModel.temperature_celsius)).where(
                 SensorRawTemperatureModel.device_id == device_id,
                 SensorRawTemperatureModel.time >= start_time,
@@ -185,7 +184,7 @@ class SensorRawTemperatureRepository(ISensorRawTemperatureRepository):
         self, device_id: str, start_time: datetime, end_time: datetime
     ) -> dict:
         """디바이스의 온도 통계 정보 조회 (최소, 최대, 평균)"""
-        result = self.db.execute(
+        result = await self.db.execute(
             select(
                 func.min(SensorRawTemperatureModel.temperature_celsius).label('min_temp'),
                 func.max(SensorRawTemperatureModel.temperature_celsius).label('max_temp'),
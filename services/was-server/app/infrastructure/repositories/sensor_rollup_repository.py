@@ -0,0 +1,199 @@
+"""
+센서 롤업 리포지토리 구현체
+
+원시 테이블을 `date_trunc`로 시간 버킷에 모아 `INSERT ... SELECT`로 시간 단위 롤업을 만들고,
+일 단위 롤업은 시간 단위 롤업을 다시 모아 만듭니다. 모든 계산은 DB 안에서 수행됩니다.
+갱신 구간은 먼저 삭제한 뒤 다시 계산하므로 늦게 도착하거나 삭제된 행도 반영됩니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import DateTime, Interval, and_, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.interfaces.repositories.sensor_rollup_repository import ISensorRollupRepository
+from app.infrastructure.models import (
+    SensorRollupDaily, SensorRollupDirty, SensorRollupHourly, SensorRollupWatermark
+)
+from app.infrastructure.repositories.sensor_bucket_repository import BUCKET_ORIGIN
+from app.infrastructure.sql_aggregates import value_column
+
+# 롤업 계층 -> 테이블
+ROLLUP_TIERS = {
+    "hourly": SensorRollupHourly,
+    "daily": SensorRollupDaily,
+}
+
+# 롤업 테이블 집계 컬럼 (INSERT ... SELECT 컬럼 순서)
+ROLLUP_COLUMNS = [
+    "sensor_type", "field", "device_id", "bucket",
+    "value_count", "value_min", "value_max", "value_sum", "last_value", "last_time",
+]
+
+
+def utc_trunc(unit: str, time_column):
+    """UTC 기준 시간/일 경계로 내림 (`date_trunc(unit, time, 'UTC')`)"""
+    return func.date_trunc(unit, time_column, "UTC")
+
+
+class SensorRollupRepository(ISensorRollupRepository):
+    """INSERT ... SELECT 기반 센서 롤업 리포지토리"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def try_lock(self, sensor_type: str) -> bool:
+        # 여러 워커 프로세스가 같은 구간을 동시에 삭제/재계산하지 않도록 트랜잭션 단위 advisory lock
+        result = await self.db_session.execute(
+            select(func.pg_try_advisory_xact_lock(func.hashtext(f"sensor_rollup:{sensor_type}")))
+        )
+        return bool(result.scalar())
+
+    async def get_watermark(self, sensor_type: str) -> Optional[datetime]:
+        result = await self.db_session.execute(
+            select(SensorRollupWatermark.watermark).where(SensorRollupWatermark.sensor_type == sensor_type)
+        )
+        return result.scalar_one_or_none()
+
+    async def set_watermark(self, sensor_type: str, watermark: datetime):
+        now = datetime.now(timezone.utc)
+        statement = pg_insert(SensorRollupWatermark).values(
+            sensor_type=sensor_type, watermark=watermark, updated_at=now
+        )
+        await self.db_session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[SensorRollupWatermark.sensor_type],
+                set_={"watermark": statement.excluded.watermark, "updated_at": statement.excluded.updated_at}
+            )
+        )
+
+    async def pop_dirty_hours(self, sensor_type: str, limit: int) -> List[datetime]:
+        dirty = SensorRollupDirty
+        oldest = (
+            select(dirty.bucket)
+            .where(dirty.sensor_type == sensor_type)
+            .order_by(dirty.bucket)
+            .limit(limit)
+        )
+        # 잠금을 얻은 트랜잭션에서 삭제하므로 재계산이 실패해 롤백되면 다시 대기 상태로 남음
+        result = await self.db_session.execute(
+            delete(dirty)
+            .where(dirty.sensor_type == sensor_type, dirty.bucket.in_(oldest))
+            .returning(dirty.bucket)
+        )
+        return list(result.scalars().all())
+
+    async def get_data_start(self, model: Any) -> Optional[datetime]:
+        result = await self.db_session.execute(select(func.min(model.time)))
+        return result.scalar_one_or_none()
+
+    async def refresh_hourly(self, spec: Any, start_time: datetime, end_time: datetime) -> int:
+        model = spec.model
+        await self.db_session.execute(
+            delete(SensorRollupHourly).where(
+                SensorRollupHourly.sensor_type == spec.sensor_type,
+                SensorRollupHourly.bucket >= start_time,
+                SensorRollupHourly.bucket < end_time
+            )
+        )
+
+        rows = 0
+        bucket = utc_trunc("hour", model.time)
+        for field in spec.value_fields:
+            value = value_column(model, field)
+            query = (
+                select(
+                    literal(spec.sensor_type).label("sensor_type"),
+                    literal(field).label("field"),
+                    model.device_id,
+                    bucket.label("bucket"),
+                    func.count(),
+                    func.min(value),
+                    func.max(value),
+                    func.sum(value),
+                    # 버킷 내 가장 늦은 측정값
+                    array_agg(aggregate_order_by(value, model.time.desc()))[1],
+                    func.max(model.time)
+                )
+                .where(model.time >= start_time, model.time < end_time, value.isnot(None))
+                .group_by(model.device_id, bucket)
+            )
+            result = await self.db_session.execute(
+                pg_insert(SensorRollupHourly).from_select(ROLLUP_COLUMNS, query)
+            )
+            rows += result.rowcount or 0
+        return rows
+
+    async def refresh_daily(self, sensor_type: str, start_time: datetime, end_time: datetime) -> int:
+        hourly = SensorRollupHourly
+        await self.db_session.execute(
+            delete(SensorRollupDaily).where(
+                SensorRollupDaily.sensor_type == sensor_type,
+                SensorRollupDaily.bucket >= start_time,
+                SensorRollupDaily.bucket < end_time
+            )
+        )
+
+        day = utc_trunc("day", hourly.bucket)
+        query = (
+            select(
+                hourly.sensor_type,
+                hourly.field,
+                hourly.device_id,
+                day.label("bucket"),
+                func.sum(hourly.value_count),
+                func.min(hourly.value_min),
+                func.max(hourly.value_max),
+                func.sum(hourly.value_sum),
+                array_agg(aggregate_order_by(hourly.last_value, hourly.bucket.desc()))[1],
+                func.max(hourly.last_time)
+            )
+            .where(hourly.sensor_type == sensor_type, hourly.bucket >= start_time, hourly.bucket < end_time)
+            .group_by(hourly.sensor_type, hourly.field, hourly.device_id, day)
+        )
+        result = await self.db_session.execute(pg_insert(SensorRollupDaily).from_select(ROLLUP_COLUMNS, query))
+        return result.rowcount or 0
+
+    async def get_buckets(
+        self,
+        tier: str,
+        sensor_type: str,
+        field: str,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta
+    ) -> List[Dict[str, Any]]:
+        rollup = ROLLUP_TIERS[tier]
+        bucket = func.date_bin(
+            literal(width, Interval()), rollup.bucket, literal(BUCKET_ORIGIN, DateTime(timezone=True))
+        )
+        result = await self.db_session.execute(
+            select(
+                bucket.label("time_bucket"),
+                func.sum(rollup.value_count).label("count"),
+                func.min(rollup.value_min).label("min"),
+                func.max(rollup.value_max).label("max"),
+                func.sum(rollup.value_sum).label("sum")
+            )
+            .where(and_(
+                rollup.sensor_type == sensor_type,
+                rollup.field == field,
+                rollup.device_id == device_id,
+                rollup.bucket >= start_time,
+                rollup.bucket < end_time
+            ))
+            .group_by("time_bucket")
+            .order_by("time_bucket")
+        )
+        return [
+            {
+                "time": row.time_bucket,
+                "count": int(row.count),
+                "min": row.min,
+                "max": row.max,
+                "avg": row.sum / row.count if row.count else None
+            }
+            for row in result.all()
+        ]
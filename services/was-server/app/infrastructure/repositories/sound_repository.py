@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 Sound 센서 데이터에 대한 데이터 
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from app.interfaces.repositories.sensor_repository import ISoundRepository
 from app.infrastructure.models import SensorRawSound
@@ -16,6 +16,11 @@ from app.api.v1.schemas import (
     SensorRawSoundUpdate,
     SensorRawSoundResponse
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import payload_number, range_conditions, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class SoundRepository(ISoundRepository):
@@ -35,8 +40,8 @@ class SoundRepository(ISoundRepository):
         
         db_data = SensorRawSound(**orm_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawSoundResponse.from_orm(db_data)
     
     async def get_by_id(
@@ -52,7 +57,7 @@ class SoundRepository(ISoundRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -61,14 +66,7 @@ class SoundRepository(ISoundRepository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawSoundResponse]:
         """최신 Sound 센서 데이터 조회"""
-        query = (
-            select(SensorRawSound)
-            .where(SensorRawSound.device_id == device_id)
-            .order_by(SensorRawSound.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawSound, device_id)
         
         if data:
             return SensorRawSoundResponse.from_orm(data)
@@ -79,27 +77,13 @@ class SoundRepository(ISoundRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawSoundResponse]:
-        """Sound 센서 데이터 목록 조회"""
-        query = select(SensorRawSound)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawSound.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawSound.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawSound.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawSound.time.desc()).limit(limit_count)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawSoundResponse.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """Sound 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawSound, SensorRawSoundResponse, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -115,7 +99,7 @@ class SoundRepository(ISoundRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -139,7 +123,7 @@ class SoundRepository(ISoundRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -164,18 +148,22 @@ class SoundRepository(ISoundRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """오디오 통계 정보 조회"""
-        query = select(SensorRawSound).where(SensorRawSound.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawSound.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawSound.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """오디오 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 db_value/analog_value 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawSound, device_id, start_time, end_time)
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                *summary_columns(payload_number(source, "db_value"), "db", median=True),
+                func.count(payload_number(source, "analog_value")).label("analog_samples")
+            ).where(and_(*range_conditions(source, device_id, start_time, end_time)))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -185,23 +173,17 @@ class SoundRepository(ISoundRepository):
                 "noise_level": "quiet"
             }
         
-        # 통계 계산
-        db_values = [data.db_value for data in data_list if data.db_value is not None]
-        analog_values = [data.analog_value for data in data_list if data.analog_value is not None]
-        
-        if not db_values:
+        if not row.db_count:
             return {
                 "device_id": device_id,
-                "total_records": len(data_list),
+                "total_records": row.total_records,
                 "avg_db": 0,
                 "max_db": 0,
                 "min_db": 0,
                 "noise_level": "unknown"
             }
         
-        avg_db = sum(db_values) / len(db_values)
-        max_db = max(db_values)
-        min_db = min(db_values)
+        avg_db = to_number(row.db_avg)
         
         # 소음 수준 분류
         if avg_db < 30:
@@ -217,13 +199,14 @@ class SoundRepository(ISoundRepository):
         
         return {
             "device_id": device_id,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "avg_db": round(avg_db, 2),
-            "max_db": round(max_db, 2),
-            "min_db": round(min_db, 2),
+            "max_db": round(row.db_max, 2),
+            "min_db": round(row.db_min, 2),
+            "median_db": round(row.db_median, 2),
             "noise_level": noise_level,
-            "db_samples": len(db_values),
-            "analog_samples": len(analog_values)
+            "db_samples": row.db_count,
+            "analog_samples": row.analog_samples
         }
     
     async def get_noise_alerts(
@@ -233,33 +216,30 @@ class SoundRepository(ISoundRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """소음 알림 조회"""
-        query = select(SensorRawSound).where(
-            and_(
-                SensorRawSound.device_id == device_id,
-                SensorRawSound.db_value > threshold_db
+        """소음 알림 조회 (db_value 임계값 조건은 생성 컬럼 인덱스 사용)"""
+        db_value = payload_number(SensorRawSound, "db_value")
+        result = await self.db.execute(
+            select(
+                SensorRawSound.time,
+                db_value.label("db_value"),
+                payload_number(SensorRawSound, "analog_value").label("analog_value")
             )
+            .where(and_(*range_conditions(SensorRawSound, device_id, start_time, end_time), db_value > threshold_db))
+            .order_by(SensorRawSound.time)
         )
-        
-        if start_time:
-            query = query.where(SensorRawSound.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawSound.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        rows = result.all()
         
         return {
             "device_id": device_id,
             "threshold_db": threshold_db,
-            "alert_count": len(data_list),
+            "alert_count": len(rows),
             "alerts": [
                 {
-                    "time": data.time.isoformat(),
-                    "db_value": data.db_value,
-                    "analog_value": data.analog_value,
-                    "exceeded_by": round(data.db_value - threshold_db, 2)
+                    "time": row.time.isoformat(),
+                    "db_value": row.db_value,
+                    "analog_value": row.analog_value,
+                    "exceeded_by": round(row.db_value - threshold_db, 2)
                 }
-                for data in data_list
+                for row in rows
             ]
-        } 
\ No newline at end of file
+        }
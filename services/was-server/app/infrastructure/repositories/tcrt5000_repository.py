@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 TCRT5000 센서 데이터에 대한 데이
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import DateTime, case, literal, select, and_, func
 
 from app.interfaces.repositories.sensor_repository import ITCRT5000Repository
 from app.infrastructure.models import SensorRawTCRT5000
@@ -16,6 +16,11 @@ from app.api.v1.schemas import (
     SensorRawTCRT5000Update,
     SensorRawTCRT5000Response
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import count_if, payload_bool, payload_number, range_conditions, to_number
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class TCRT5000Repository(ITCRT5000Repository):
@@ -35,8 +40,8 @@ class TCRT5000Repository(ITCRT5000Repository):
         
         db_data = SensorRawTCRT5000(**orm_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawTCRT5000Response.from_orm(db_data)
     
     async def get_by_id(
@@ -52,7 +57,7 @@ class TCRT5000Repository(ITCRT5000Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -61,14 +66,7 @@ class TCRT5000Repository(ITCRT5000Repository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawTCRT5000Response]:
         """최신 TCRT5000 센서 데이터 조회"""
-        query = (
-            select(SensorRawTCRT5000)
-            .where(SensorRawTCRT5000.device_id == device_id)
-            .order_by(SensorRawTCRT5000.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawTCRT5000, device_id)
         
         if data:
             return SensorRawTCRT5000Response.from_orm(data)
@@ -79,27 +77,13 @@ class TCRT5000Repository(ITCRT5000Repository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawTCRT5000Response]:
-        """TCRT5000 센서 데이터 목록 조회"""
-        query = select(SensorRawTCRT5000)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawTCRT5000.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawTCRT5000.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawTCRT5000.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawTCRT5000.time.desc()).limit(limit_count)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawTCRT5000Response.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """TCRT5000 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawTCRT5000, SensorRawTCRT5000Response, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -116,7 +100,7 @@ class TCRT5000Repository(ITCRT5000Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -140,7 +124,7 @@ class TCRT5000Repository(ITCRT5000Repository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -165,18 +149,24 @@ class TCRT5000Repository(ITCRT5000Repository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """근접 감지 통계 정보 조회"""
-        query = select(SensorRawTCRT5000).where(SensorRawTCRT5000.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawTCRT5000.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawTCRT5000.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """근접 감지 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 object_detected/analog_value 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawTCRT5000, device_id, start_time, end_time)
+        analog_value = payload_number(source, "analog_value")
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(payload_bool(source, "object_detected")).label("detection_count"),
+                func.count(analog_value).label("analog_samples"),
+                func.avg(analog_value).label("avg_analog_value")
+            ).where(and_(*range_conditions(source, device_id, start_time, end_time)))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -185,21 +175,15 @@ class TCRT5000Repository(ITCRT5000Repository):
                 "avg_analog_value": 0
             }
         
-        # 통계 계산
-        detection_count = sum(1 for data in data_list if data.object_detected)
-        total_count = len(data_list)
-        detection_rate = (detection_count / total_count) * 100 if total_count > 0 else 0
-        
-        analog_values = [data.analog_value for data in data_list if data.analog_value is not None]
-        avg_analog_value = sum(analog_values) / len(analog_values) if analog_values else 0
+        detection_rate = (row.detection_count / row.total_records) * 100
         
         return {
             "device_id": device_id,
-            "total_records": total_count,
-            "detection_count": detection_count,
+            "total_records": row.total_records,
+            "detection_count": row.detection_count,
             "detection_rate": round(detection_rate, 2),
-            "avg_analog_value": round(avg_analog_value, 2),
-            "analog_samples": len(analog_values)
+            "avg_analog_value": round(to_number(row.avg_analog_value or 0), 2),
+            "analog_samples": row.analog_samples
         }
     
     async def analyze_motion_patterns(
@@ -207,23 +191,25 @@ class TCRT5000Repository(ITCRT5000Repository):
         device_id: str,
         analysis_window: int = 3600
     ) -> dict:
-        """움직임 패턴 분석"""
+        """움직임 패턴 분석 (DB에서 집계)
+        
+        연속 감지 구간은 윈도 함수로 미감지 -> 감지 전환마다 구간 번호를 매겨 구간 단위로만 가져옵니다.
+        """
         # 분석 시간 범위 계산
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(seconds=analysis_window)
+        conditions = range_conditions(SensorRawTCRT5000, device_id, start_time, end_time)
+        detected = payload_bool(SensorRawTCRT5000, "object_detected")
+        
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                count_if(detected).label("detection_count")
+            ).where(and_(*conditions))
+        )
+        row = result.one()
         
-        query = select(SensorRawTCRT5000).where(
-            and_(
-                SensorRawTCRT5000.device_id == device_id,
-                SensorRawTCRT5000.time >= start_time,
-                SensorRawTCRT5000.time <= end_time
-            )
-        ).order_by(SensorRawTCRT5000.time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "analysis_window_seconds": analysis_window,
@@ -231,40 +217,48 @@ class TCRT5000Repository(ITCRT5000Repository):
                 "motion_pattern": "no_data"
             }
         
-        # 움직임 패턴 분석
-        detections = [data for data in data_list if data.object_detected]
-        
-        if not detections:
+        if not row.detection_count:
             return {
                 "device_id": device_id,
                 "analysis_window_seconds": analysis_window,
-                "total_records": len(data_list),
+                "total_records": row.total_records,
                 "motion_pattern": "no_motion",
                 "detection_count": 0
             }
         
-        # 연속 감지 구간 분석
-        detection_periods = []
-        current_start = None
-        
-        for data in data_list:
-            if data.object_detected and current_start is None:
-                current_start = data.time
-            elif not data.object_detected and current_start is not None:
-                detection_periods.append({
-                    "start": current_start.isoformat(),
-                    "end": data.time.isoformat(),
-                    "duration_seconds": (data.time - current_start).total_seconds()
-                })
-                current_start = None
-        
-        # 마지막 감지가 끝나지 않은 경우
-        if current_start is not None:
-            detection_periods.append({
-                "start": current_start.isoformat(),
-                "end": end_time.isoformat(),
-                "duration_seconds": (end_time - current_start).total_seconds()
-            })
+        # 연속 감지 구간 분석: 구간 = 감지 시작 행 ~ 다음 미감지 행
+        flagged = select(
+            SensorRawTCRT5000.time.label("time"),
+            detected.label("detected"),
+            func.lag(detected).over(order_by=SensorRawTCRT5000.time).label("previous")
+        ).where(and_(*conditions)).subquery()
+        starts = case((and_(flagged.c.detected, func.coalesce(flagged.c.previous, False) == False), 1), else_=0)
+        numbered = select(
+            flagged.c.time,
+            flagged.c.detected,
+            func.sum(starts).over(order_by=flagged.c.time).label("period")
+        ).subquery()
+        period_start = func.min(numbered.c.time)
+        # 마지막 감지가 끝나지 않은 경우 분석 종료 시각까지
+        period_end = func.coalesce(
+            func.min(numbered.c.time).filter(numbered.c.detected == False),
+            literal(end_time, DateTime(timezone=True))
+        )
+        result = await self.db.execute(
+            select(
+                period_start.label("start"),
+                period_end.label("end"),
+                func.extract("epoch", period_end - period_start).label("duration_seconds")
+            ).where(numbered.c.period > 0).group_by(numbered.c.period).order_by(numbered.c.period)
+        )
+        detection_periods = [
+            {
+                "start": period.start.isoformat(),
+                "end": period.end.isoformat(),
+                "duration_seconds": float(period.duration_seconds)
+            }
+            for period in result.all()
+        ]
         
         # 패턴 분석
         if len(detection_periods) == 0:
@@ -281,10 +275,10 @@ class TCRT5000Repository(ITCRT5000Repository):
         return {
             "device_id": device_id,
             "analysis_window_seconds": analysis_window,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "motion_pattern": motion_pattern,
-            "detection_count": len(detections),
+            "detection_count": row.detection_count,
             "detection_periods": len(detection_periods),
             "avg_duration_seconds": round(avg_duration, 2),
             "detection_periods_detail": detection_periods
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
@@ -5,9 +5,9 @@ Clean Architecture 원칙에 따라 Ultrasonic 센서 데이터에 대한 데이
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 
 from app.interfaces.repositories.sensor_repository import IUltrasonicRepository
 from app.infrastructure.models import SensorRawUltrasonic
@@ -16,6 +16,11 @@ from app.api.v1.schemas import (
     SensorRawUltrasonicUpdate,
     SensorRawUltrasonicResponse
 )
+from app.infrastructure.pagination import Cursor
+from app.infrastructure.sql_aggregates import count_if, payload_bool, payload_number, range_conditions, summary_columns, to_number
+from app.infrastructure.device_latest import fetch_latest
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.row_reader import fetch_list_rows
 
 
 class UltrasonicRepository(IUltrasonicRepository):
@@ -35,8 +40,8 @@ class UltrasonicRepository(IUltrasonicRepository):
         
         db_data = SensorRawUltrasonic(**orm_data)
         self.db.add(db_data)
-        self.db.commit()
-        self.db.refresh(db_data)
+        await self.db.commit()
+        await self.db.refresh(db_data)
         return SensorRawUltrasonicResponse.from_orm(db_data)
     
     async def get_by_id(
@@ -52,7 +57,7 @@ class UltrasonicRepository(IUltrasonicRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         data = result.scalar_one_or_none()
         
         if data:
@@ -61,14 +66,7 @@ class UltrasonicRepository(IUltrasonicRepository):
     
     async def get_latest(self, device_id: str) -> Optional[SensorRawUltrasonicResponse]:
         """최신 Ultrasonic 센서 데이터 조회"""
-        query = (
-            select(SensorRawUltrasonic)
-            .where(SensorRawUltrasonic.device_id == device_id)
-            .order_by(SensorRawUltrasonic.time.desc())
-        )
-        
-        result = self.db.execute(query)
-        data = result.scalars().first()
+        data = await fetch_latest(self.db, SensorRawUltrasonic, device_id)
         
         if data:
             return SensorRawUltrasonicResponse.from_orm(data)
@@ -79,27 +77,13 @@ class UltrasonicRepository(IUltrasonicRepository):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit_count: int = 100
-    ) -> List[SensorRawUltrasonicResponse]:
-        """Ultrasonic 센서 데이터 목록 조회"""
-        query = select(SensorRawUltrasonic)
-        
-        # 필터 조건 추가
-        if device_id:
-            query = query.where(SensorRawUltrasonic.device_id == device_id)
-        if start_time:
-            query = query.where(SensorRawUltrasonic.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawUltrasonic.time <= end_time)
-        
-        # 시간 역순으로 정렬하고 제한
-        query = query.order_by(SensorRawUltrasonic.time.desc()).limit(limit_count)
-        
-        result = self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        # 결과를 리스트로 변환하여 반환
-        return [SensorRawUltrasonicResponse.from_orm(data) for data in data_list]
+        limit_count: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
+        """Ultrasonic 센서 데이터 목록 조회 (ORM 인스턴스 없이 응답 필드 딕셔너리로 반환)"""
+        return await fetch_list_rows(
+            self.db, SensorRawUltrasonic, SensorRawUltrasonicResponse, device_id, start_time, end_time, limit_count, cursor
+        )
     
     async def update(
         self,
@@ -115,7 +99,7 @@ class UltrasonicRepository(IUltrasonicRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -139,7 +123,7 @@ class UltrasonicRepository(IUltrasonicRepository):
             )
         )
         
-        result = self.db.execute(query)
+        result = await self.db.execute(query)
         db_data = result.scalar_one_or_none()
         
         if not db_data:
@@ -164,18 +148,22 @@ class UltrasonicRepository(IUltrasonicRepository):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None
     ) -> dict:
-        """거리 측정 통계 정보 조회"""
-        query = select(SensorRawUltrasonic).where(SensorRawUltrasonic.device_id == device_id)
-        
-        if start_time:
-            query = query.where(SensorRawUltrasonic.time >= start_time)
-        if end_time:
-            query = query.where(SensorRawUltrasonic.time <= end_time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
+        """거리 측정 통계 정보 조회 (DB에서 집계)
+        
+        raw_payload의 distance_cm/measurement_valid 키를 집계합니다.
+        """
+        # 아카이브 구간에 걸치면 아카이브 행을 합친 원본에서 집계
+        source = await archive_store.source(self.db, SensorRawUltrasonic, device_id, start_time, end_time)
+        result = await self.db.execute(
+            select(
+                func.count().label("total_records"),
+                *summary_columns(payload_number(source, "distance_cm"), "distance", median=True),
+                count_if(payload_bool(source, "measurement_valid")).label("valid_count")
+            ).where(and_(*range_conditions(source, device_id, start_time, end_time)))
+        )
+        row = result.one()
         
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "total_records": 0,
@@ -185,32 +173,25 @@ class UltrasonicRepository(IUltrasonicRepository):
                 "measurement_valid_count": 0
             }
         
-        # 통계 계산
-        distance_values = [data.distance_cm for data in data_list if data.distance_cm is not None]
-        valid_measurements = [data for data in data_list if data.measurement_valid]
-        
-        if not distance_values:
+        if not row.distance_count:
             return {
                 "device_id": device_id,
-                "total_records": len(data_list),
+                "total_records": row.total_records,
                 "avg_distance_cm": 0,
                 "max_distance_cm": 0,
                 "min_distance_cm": 0,
-                "measurement_valid_count": len(valid_measurements)
+                "measurement_valid_count": row.valid_count
             }
         
-        avg_distance = sum(distance_values) / len(distance_values)
-        max_distance = max(distance_values)
-        min_distance = min(distance_values)
-        
         return {
             "device_id": device_id,
-            "total_records": len(data_list),
-            "avg_distance_cm": round(avg_distance, 2),
-            "max_distance_cm": round(max_distance, 2),
-            "min_distance_cm": round(min_distance, 2),
-            "measurement_valid_count": len(valid_measurements),
-            "distance_samples": len(distance_values)
+            "total_records": row.total_records,
+            "avg_distance_cm": round(to_number(row.distance_avg), 2),
+            "max_distance_cm": round(row.distance_max, 2),
+            "min_distance_cm": round(row.distance_min, 2),
+            "median_distance_cm": round(row.distance_median, 2),
+            "measurement_valid_count": row.valid_count,
+            "distance_samples": row.distance_count
         }
     
     async def analyze_distance_trends(
@@ -218,24 +199,32 @@ class UltrasonicRepository(IUltrasonicRepository):
         device_id: str,
         analysis_window: int = 3600
     ) -> dict:
-        """거리 트렌드 분석"""
+        """거리 트렌드 분석 (DB에서 집계)
+        
+        연속 측정값의 변화량을 윈도 함수(lag)로 구해 평균/표준편차만 가져옵니다.
+        """
         # 분석 시간 범위 계산
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(seconds=analysis_window)
+        conditions = range_conditions(SensorRawUltrasonic, device_id, start_time, end_time)
+        conditions.append(payload_bool(SensorRawUltrasonic, "measurement_valid"))
+        distance = payload_number(SensorRawUltrasonic, "distance_cm")
+        
+        changes = select(
+            (distance - func.lag(distance).over(order_by=SensorRawUltrasonic.time)).label("change")
+        ).where(and_(*conditions), distance.isnot(None)).subquery()
+        result = await self.db.execute(
+            select(
+                select(func.count()).select_from(SensorRawUltrasonic).where(and_(*conditions))
+                .scalar_subquery().label("total_records"),
+                func.count().label("distance_samples"),
+                func.avg(changes.c.change).label("avg_change"),
+                func.stddev_pop(changes.c.change).label("std_dev")
+            ).select_from(changes)
+        )
+        row = result.one()
         
-        query = select(SensorRawUltrasonic).where(
-            and_(
-                SensorRawUltrasonic.device_id == device_id,
-                SensorRawUltrasonic.time >= start_time,
-                SensorRawUltrasonic.time <= end_time,
-                SensorRawUltrasonic.measurement_valid == True
-            )
-        ).order_by(SensorRawUltrasonic.time)
-        
-        result = await self.db.execute(query)
-        data_list = result.scalars().all()
-        
-        if not data_list:
+        if not row.total_records:
             return {
                 "device_id": device_id,
                 "analysis_window_seconds": analysis_window,
@@ -243,31 +232,24 @@ class UltrasonicRepository(IUltrasonicRepository):
                 "trend": "no_data"
             }
         
-        if len(data_list) < 2:
+        if row.total_records < 2:
             return {
                 "device_id": device_id,
                 "analysis_window_seconds": analysis_window,
-                "total_records": len(data_list),
+                "total_records": row.total_records,
                 "trend": "insufficient_data"
             }
         
-        # 거리 변화 분석
-        distances = [data.distance_cm for data in data_list if data.distance_cm is not None]
-        if len(distances) < 2:
+        if row.distance_samples < 2:
             return {
                 "device_id": device_id,
                 "analysis_window_seconds": analysis_window,
-                "total_records": len(data_list),
+                "total_records": row.total_records,
                 "trend": "insufficient_distance_data"
             }
         
-        # 거리 변화율 계산
-        distance_changes = []
-        for i in range(1, len(distances)):
-            change = distances[i] - distances[i-1]
-            distance_changes.append(change)
-        
-        avg_change = sum(distance_changes) / len(distance_changes)
+        avg_change = to_number(row.avg_change)
+        std_dev = to_number(row.std_dev)
         
         # 트렌드 분류
         if abs(avg_change) < 1:
@@ -281,10 +263,6 @@ class UltrasonicRepository(IUltrasonicRepository):
         else:
             trend = "decreasing_slowly"
         
-        # 변동성 분석
-        variance = sum((x - avg_change) ** 2 for x in distance_changes) / len(distance_changes)
-        std_dev = variance ** 0.5
-        
         # 알림 생성
         alerts = []
         if abs(avg_change) > 10:
@@ -295,10 +273,10 @@ class UltrasonicRepository(IUltrasonicRepository):
         return {
             "device_id": device_id,
             "analysis_window_seconds": analysis_window,
-            "total_records": len(data_list),
+            "total_records": row.total_records,
             "trend": trend,
             "avg_change_cm": round(avg_change, 2),
             "std_deviation": round(std_dev, 2),
-            "distance_samples": len(distances),
+            "distance_samples": row.distance_samples,
             "alerts": alerts
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
@@ -32,8 +32,8 @@ class UserProfileRepository(IUserProfileRepository):
         )
         
         self.db.add(db_profile)
-        self.db.commit()
-        self.db.refresh(db_profile)
+        await self.db.commit()
+        await self.db.refresh(db_profile)
         
         return UserProfile(
             user_id=db_profile.user_id,
@@ -85,7 +85,7 @@ class UserProfileRepository(IUserProfileRepository):
         if result.rowcount == 0:
             return None
         
-        self.db.commit()
+        await self.db.commit()
         
         # 업데이트된 프로필을 반환
         return await self.get_profile_by_user_id(user_id)
@@ -99,7 +99,7 @@ class UserProfileRepository(IUserProfileRepository):
         if result.rowcount == 0:
             return False
         
-        self.db.commit()
+        await self.db.commit()
         return True
     
     async def get_profiles_by_gender(self, gender: str) -> List[UserProfile]:
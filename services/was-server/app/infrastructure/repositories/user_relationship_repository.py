@@ -28,8 +28,8 @@ class UserRelationshipRepository(IUserRelationshipRepository):
         )
         
         self.db.add(db_relationship)
-        self.db.commit()
-        self.db.refresh(db_relationship)
+        await self.db.commit()
+        await self.db.refresh(db_relationship)
         
         return UserRelationship(
             relationship_id=db_relationship.relationship_id,
@@ -118,7 +118,7 @@ class UserRelationshipRepository(IUserRelationshipRepository):
         if result.rowcount == 0:
             return None
         
-        self.db.commit()
+        await self.db.commit()
         
         # 업데이트된 관계를 반환
         return await self.get_relationship_by_id(relationship_id)
@@ -132,7 +132,7 @@ class UserRelationshipRepository(IUserRelationshipRepository):
         if result.rowcount == 0:
             return False
         
-        self.db.commit()
+        await self.db.commit()
         return True
     
     async def get_all_relationships(self, skip: int = 0, limit: int = 100) -> List[UserRelationship]:
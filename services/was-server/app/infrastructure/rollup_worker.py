@@ -0,0 +1,283 @@
+"""
+센서 롤업 백그라운드 작업 모듈
+
+센서 타입별 워터마크부터 시간 단위 롤업을 증분 계산하고, 갱신된 날짜의 일 단위 롤업을 다시 계산합니다.
+
+- 매 실행마다 `워터마크 - 지연 허용 시간`부터 현재 시간 버킷까지만 다시 계산합니다.
+- 지연 허용 시간보다 늦게 도착한 행은 대량 적재 경로가 같은 트랜잭션에서 해당 시간 버킷을
+  `sensor_rollup_dirty`에 기록하며, 잠금을 얻은 다음 실행이 그 버킷만 꺼내어 다시 계산합니다.
+  (어느 워커 프로세스가 적재했든 롤업을 갱신하는 프로세스가 볼 수 있음)
+  ORM으로 수정/삭제한 행(PUT/DELETE)은 세션 flush 이벤트가 같은 방식으로 기록합니다.
+- 워터마크는 현재(진행 중인) 시간 버킷의 시작이며, 조회 API는 워터마크 이전 구간만 롤업에서 읽습니다.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from sqlalchemy import DateTime, column, event, inspect, literal, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.models import SensorRollupDirty, SensorRollupWatermark
+from app.infrastructure.sensor_registry import SENSOR_TYPE_SPECS, SensorTypeSpec
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+HOUR = timedelta(hours=1)
+DAY = timedelta(days=1)
+
+
+def floor_time(value: datetime, unit: timedelta) -> datetime:
+    """UTC 기준 unit(시간/일) 경계로 내림 (naive 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    if unit >= DAY:
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def hour_ranges(hours: Iterable[datetime]) -> List[tuple]:
+    """시간 버킷 시작 시각들을 연속 구간 [start, end) 목록으로 병합"""
+    ranges: List[list] = []
+    for hour in sorted(set(hours)):
+        if ranges and ranges[-1][1] == hour:
+            ranges[-1][1] = hour + HOUR
+        else:
+            ranges.append([hour, hour + HOUR])
+    return [tuple(item) for item in ranges]
+
+
+def dirty_statement(sensor_type: str, hours: List[datetime], late_window: timedelta):
+    """DB 워터마크 - 지연 허용 시간 이전인 시간 버킷만 재계산 대기로 기록하는 문장
+
+    워터마크가 없으면(첫 롤업 전) 아무 행도 기록하지 않습니다. 첫 실행은 가장 이른 데이터부터 계산합니다.
+    """
+    late = values(column("bucket", DateTime(timezone=True)), name="late_hours").data([(hour,) for hour in hours])
+    boundary = (
+        select(SensorRollupWatermark.watermark - late_window)
+        .where(SensorRollupWatermark.sensor_type == sensor_type)
+        .scalar_subquery()
+    )
+    query = select(literal(sensor_type), late.c.bucket).where(late.c.bucket < boundary)
+    return pg_insert(SensorRollupDirty).from_select(["sensor_type", "bucket"], query).on_conflict_do_nothing()
+
+
+class SensorRollupWorker:
+    """센서 타입별 시간/일 단위 롤업 증분 갱신 작업
+
+    `repository_factory(db)`로 만든 롤업 리포지토리를 사용하며, 센서 타입마다 별도 트랜잭션으로 커밋합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        repository_factory: Optional[Callable[[Any], Any]] = None,
+        specs: Optional[List[SensorTypeSpec]] = None,
+        interval_sec: float = 60.0,
+        late_window_hours: int = 2,
+        max_hours_per_run: int = 168,
+        enabled: bool = False
+    ):
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.specs = [spec for spec in (specs if specs is not None else SENSOR_TYPE_SPECS) if spec.value_fields]
+        self.interval_sec = interval_sec
+        self.late_window = timedelta(hours=late_window_hours)
+        self.max_hours_per_run = max_hours_per_run
+        self.enabled = enabled
+        self._specs_by_model: Dict[Type[Any], SensorTypeSpec] = {spec.model: spec for spec in self.specs}
+        self._watermarks: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        # 메트릭
+        self.runs = 0
+        self.failed_runs = 0
+        self.refreshed_hours = 0
+        self.late_hours = 0
+        self.last_run_at: Optional[float] = None
+        self.last_run_latency_ms = 0.0
+
+    def _repository(self, db):
+        if self.repository_factory is not None:
+            return self.repository_factory(db)
+        from app.infrastructure.repositories.sensor_rollup_repository import SensorRollupRepository
+        return SensorRollupRepository(db)
+
+    async def mark_dirty(self, db, model: Type[Any], rows: List[Dict[str, Any]], now: Optional[datetime] = None):
+        """적재된 행 중 이미 롤업된 구간(워터마크 - 지연 허용 시간 이전)의 시간 버킷을 재계산 대기로 기록
+
+        호출 측 적재 트랜잭션에서 실행하고 커밋합니다. 워터마크는 현재 시간 버킷을 넘지 않으므로
+        지연 허용 시간 안의 행만 적재한 경우(실시간 수집)는 문장을 실행하지 않습니다.
+        """
+        statement = self.late_hours_statement(model, rows, now)
+        if statement is not None:
+            await db.execute(statement)
+
+    def late_hours_statement(self, model: Type[Any], rows: Iterable[Dict[str, Any]], now: Optional[datetime] = None):
+        """행들의 시간 중 지연 허용 시간 이전 버킷을 기록하는 문장 (기록할 버킷이 없으면 None)"""
+        spec = self._specs_by_model.get(model)
+        if not self.enabled or spec is None:
+            return None
+        boundary = floor_time(now or datetime.now(timezone.utc), HOUR) - self.late_window
+        hours = set()
+        for row in rows:
+            value = row.get("time")
+            if not isinstance(value, datetime):
+                continue
+            hour = floor_time(value, HOUR)
+            if hour < boundary:
+                hours.add(hour)
+        if not hours:
+            return None
+        return dirty_statement(spec.sensor_type, sorted(hours), self.late_window)
+
+    async def refresh_sensor(self, repository, spec: SensorTypeSpec, now: datetime) -> int:
+        """한 센서 타입의 롤업 갱신 (갱신한 시간 버킷 수 반환)"""
+        if not await repository.try_lock(spec.sensor_type):
+            return 0
+        current_hour = floor_time(now, HOUR)
+        watermark = await repository.get_watermark(spec.sensor_type)
+        if watermark is None:
+            data_start = await repository.get_data_start(spec.model)
+            if data_start is None:
+                return 0
+            start = floor_time(data_start, HOUR)
+        else:
+            start = min(floor_time(watermark, HOUR) - self.late_window, current_hour)
+
+        # 한 번에 max_hours_per_run 시간까지 (현재 진행 중인 시간 버킷 포함)
+        end = min(start + HOUR * self.max_hours_per_run, current_hour + HOUR)
+        ranges = [(start, end)]
+
+        # 지연 허용 시간보다 늦게 도착한 행의 시간 버킷 (정규 구간에 포함된 버킷은 제외)
+        dirty = await repository.pop_dirty_hours(spec.sensor_type, self.max_hours_per_run)
+        late = [floor_time(hour, HOUR) for hour in dirty if hour < start]
+        ranges.extend(hour_ranges(late))
+        self.late_hours += len(late)
+
+        hours = 0
+        days = set()
+        for range_start, range_end in ranges:
+            await repository.refresh_hourly(spec, range_start, range_end)
+            hours += int((range_end - range_start) / HOUR)
+            day = floor_time(range_start, DAY)
+            while day < range_end:
+                days.add(day)
+                day += DAY
+        for day in sorted(days):
+            await repository.refresh_daily(spec.sensor_type, day, day + DAY)
+
+        new_watermark = min(end, current_hour)
+        await repository.set_watermark(spec.sensor_type, new_watermark)
+        self._watermarks[spec.sensor_type] = new_watermark
+        return hours
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """모든 센서 타입 롤업 1회 갱신 (갱신한 시간 버킷 수 반환)"""
+        now = now or datetime.now(timezone.utc)
+        started = time.perf_counter()
+        hours = 0
+        for spec in self.specs:
+            async with self.session_factory() as db:
+                try:
+                    hours += await self.refresh_sensor(self._repository(db), spec, now)
+                    await db.commit()
+                except Exception as e:
+                    await db.rollback()
+                    self.failed_runs += 1
+                    logger.error(f"{spec.sensor_type} 롤업 갱신 실패: {e}")
+        self.runs += 1
+        self.refreshed_hours += hours
+        self.last_run_at = time.time()
+        self.last_run_latency_ms = (time.perf_counter() - started) * 1000
+        return hours
+
+    async def start(self):
+        """주기적 롤업 갱신 시작"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self):
+        """주기적 롤업 갱신 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run_loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"롤업 갱신 실패: {e}")
+            await asyncio.sleep(self.interval_sec)
+
+    def stats(self) -> Dict[str, Any]:
+        """롤업 작업 상태와 센서 타입별 워터마크"""
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "refreshed_hours": self.refreshed_hours,
+            "late_hours": self.late_hours,
+            "last_run_at": self.last_run_at,
+            "last_run_latency_ms": round(self.last_run_latency_ms, 3),
+            "watermarks": {sensor_type: value.isoformat() for sensor_type, value in self._watermarks.items()},
+        }
+
+
+# 전역 롤업 작업 인스턴스
+sensor_rollup_worker = SensorRollupWorker(
+    session_factory=AsyncSessionLocal,
+    interval_sec=settings.ROLLUP_INTERVAL_SEC,
+    late_window_hours=settings.ROLLUP_LATE_WINDOW_HOURS,
+    max_hours_per_run=settings.ROLLUP_MAX_HOURS_PER_RUN,
+    enabled=settings.ROLLUP_ENABLED
+)
+
+
+class RollupDirtyListener:
+    """ORM 세션의 측정값 추가/수정/삭제를 같은 트랜잭션의 재계산 대기 버킷 기록으로 연결
+
+    적재 경로(BulkInsertRepository)는 `mark_dirty`를 직접 호출하지만, PUT/DELETE처럼 ORM으로 바꾼 행은
+    flush 직후 바뀌기 전/후 시간의 버킷을 같은 연결로 기록하여 커밋/롤백을 함께 따릅니다.
+    """
+
+    def __init__(self, worker: SensorRollupWorker, enabled: bool = False):
+        self.worker = worker
+        self.enabled = enabled
+        if enabled:
+            event.listen(Session, "after_flush", self._after_flush)
+
+    def _after_flush(self, session: Session, flush_context):
+        rows: Dict[Type[Any], List[Dict[str, Any]]] = {}
+        for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+            model = type(instance)
+            if model not in self.worker._specs_by_model:
+                continue
+            # 기본 키(time)가 바뀐 경우 이전 시간 버킷도 함께 기록 (로드되지 않은 속성은 조회하지 않음)
+            history = inspect(instance).attrs.time.history
+            times = list(history.added or ()) + list(history.unchanged or ()) + list(history.deleted or ())
+            rows.setdefault(model, []).extend({"time": value} for value in times)
+        for model, model_rows in rows.items():
+            statement = self.worker.late_hours_statement(model, model_rows)
+            if statement is not None:
+                session.connection().execute(statement)
+
+
+# 전역 ORM 쓰기 재계산 대기 연결 (롤업을 사용할 때만 이벤트 등록)
+rollup_dirty_listener = RollupDirtyListener(sensor_rollup_worker, enabled=settings.ROLLUP_ENABLED)
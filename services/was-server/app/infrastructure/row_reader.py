@@ -0,0 +1,108 @@
+"""
+Core 행 조회 모듈 (ORM 없는 목록 조회 경로)
+
+원시 센서 목록(/list) 조회는 행마다 ORM 인스턴스를 만들고 `Response.from_orm`으로 검증한 뒤
+FastAPI가 response_model로 한 번 더 검증/변환하므로, 1000행 응답에서는 객체 생성과 검증이 지연 시간 대부분을 차지합니다.
+이 모듈은 필요한 컬럼만 SQLAlchemy Core로 조회해 응답 스키마 필드 순서의 딕셔너리로 바로 옮기고,
+`RowListResponse`가 행 단위 Pydantic 모델 없이 JSON으로 한 번에 직렬화합니다.
+
+응답 본문은 기존 경로와 같습니다 (시간은 ISO 8601, raw_payload 핫 키 필드는 `payload_value` 규칙으로 채움).
+"""
+
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from app.api.v1.schemas import payload_value
+from app.infrastructure.archive_store import archive_store
+from app.infrastructure.pagination import Cursor, apply_keyset
+from app.infrastructure.payload_columns import PAYLOAD_COLUMNS
+
+
+@lru_cache(maxsize=None)
+def row_builder(model: Type[Any], response_model: Type[BaseModel]) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """DB 행을 응답 스키마 필드 순서의 딕셔너리로 바꾸는 함수
+
+    테이블 컬럼은 그대로 옮기고, 컬럼이 아닌 필드는 raw_payload 핫 키(PAYLOAD_COLUMNS 선언)에서 채웁니다.
+    """
+    columns = set(model.__table__.columns.keys())
+    kinds = {item.key: item.kind for item in PAYLOAD_COLUMNS if item.model is model}
+    fields = [
+        (name, name in columns, kinds.get(name))
+        for name in response_model.__fields__
+        if name in columns or name in kinds
+    ]
+
+    def build(row: Mapping[str, Any]) -> Dict[str, Any]:
+        return {
+            name: row.get(name) if is_column else payload_value(row.get("raw_payload"), name, kind)
+            for name, is_column, kind in fields
+        }
+
+    return build
+
+
+async def fetch_list_rows(
+    db,
+    model: Type[Any],
+    response_model: Type[BaseModel],
+    device_id: Optional[str] = None,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    limit: int = 100,
+    cursor: Optional[Cursor] = None
+) -> List[Dict[str, Any]]:
+    """원시 센서 목록 조회 (시간 역순, keyset 커서, 아카이브 구간은 아카이브 행으로 채움)"""
+    table = model.__table__
+    query = select(*table.columns)
+
+    # 필터 조건 추가
+    if device_id:
+        query = query.where(table.c.device_id == device_id)
+    if start_time:
+        query = query.where(table.c.time >= start_time)
+    if end_time:
+        query = query.where(table.c.time <= end_time)
+
+    # 시간 역순으로 정렬하고 제한
+    query = apply_keyset(query, table.c.time, table.c.device_id, cursor).limit(limit)
+
+    result = await db.execute(query)
+    rows = await archive_store.fill_rows(
+        model, [dict(row) for row in result.mappings()], device_id, start_time, end_time, limit, cursor
+    )
+    build = row_builder(model, response_model)
+    return [build(row) for row in rows]
+
+
+def encode_value(value: Any) -> Any:
+    """JSON 기본 타입이 아닌 값 변환 (FastAPI jsonable_encoder와 같은 표기)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSON으로 직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+
+class RowListResponse(Response):
+    """딕셔너리 행 목록을 한 번에 JSON으로 직렬화하는 응답 (response_model 검증 생략)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(
+            content,
+            default=encode_value,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":")
+        ).encode("utf-8")
@@ -0,0 +1,102 @@
+"""
+센서 타입 레지스트리
+
+수집 프레임의 센서 타입 이름을 ORM 모델과 생성 스키마에 매핑합니다.
+통합 수집 엔드포인트(`/api/ingest`)가 프레임을 테이블별로 묶을 때 사용합니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from app.infrastructure.models import (
+    SensorRawCDS, SensorRawDHT, SensorRawFlame, SensorRawIMU, SensorRawLoadCell,
+    SensorRawMQ5, SensorRawMQ7, SensorRawRFID, SensorRawSound, SensorRawTCRT5000,
+    SensorRawUltrasonic, SensorRawTemperature, SensorEventButton,
+    SensorEdgeFlame, SensorEdgePIR, SensorEdgeReed, SensorEdgeTilt,
+    ActuatorLogBuzzer, ActuatorLogIRTX, ActuatorLogRelay, ActuatorLogServo
+)
+from app.api.v1.schemas import (
+    CDSDataCreate, DHTDataCreate, FlameDataCreate, IMUDataCreate,
+    SensorRawLoadCellCreate, SensorRawMQ5Create, SensorRawMQ7Create, SensorRawRFIDCreate,
+    SensorRawSoundCreate, SensorRawTCRT5000Create, SensorRawUltrasonicCreate,
+    SensorRawTemperatureCreate, SensorEventButtonCreate,
+    EdgeFlameDataCreate, EdgePIRDataCreate, EdgeReedDataCreate, EdgeTiltDataCreate,
+    ActuatorBuzzerDataCreate, ActuatorIRTXDataCreate, ActuatorRelayDataCreate, ActuatorServoDataCreate
+)
+
+
+@dataclass(frozen=True)
+class SensorTypeSpec:
+    """센서 타입 메타데이터"""
+
+    sensor_type: str
+    model: Type[Any]
+    create_schema: Type[BaseModel]
+    aliases: Tuple[str, ...] = field(default=())
+    # 차트/다운샘플링에 쓰는 숫자 측정값 필드 (첫 번째가 기본값, raw_payload 키 포함)
+    value_fields: Tuple[str, ...] = field(default=())
+
+    @property
+    def table_name(self) -> str:
+        """적재 대상 테이블 이름"""
+        return self.model.__tablename__
+
+    @property
+    def default_value_field(self) -> Optional[str]:
+        """기본 측정값 필드 (숫자 필드가 없으면 None)"""
+        return self.value_fields[0] if self.value_fields else None
+
+
+def normalize_sensor_type(name: str) -> str:
+    """센서 타입 이름 정규화 (대소문자, '-', '_' 무시)
+
+    `edge-pir`, `EdgePIR`, `edge_pir`가 모두 같은 타입으로 조회됩니다.
+    """
+    return name.replace("-", "").replace("_", "").lower()
+
+
+# 센서 타입 이름은 라우터 prefix와 동일하게 유지
+SENSOR_TYPE_SPECS: List[SensorTypeSpec] = [
+    # Raw 센서 데이터
+    SensorTypeSpec("cds", SensorRawCDS, CDSDataCreate, value_fields=("lux_value", "analog_value")),
+    SensorTypeSpec("dht", SensorRawDHT, DHTDataCreate, value_fields=("temperature", "humidity", "heat_index")),
+    SensorTypeSpec("flame", SensorRawFlame, FlameDataCreate, value_fields=("analog_value",)),
+    SensorTypeSpec("imu", SensorRawIMU, IMUDataCreate, value_fields=(
+        "accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z", "mag_x", "mag_y", "mag_z", "temperature"
+    )),
+    SensorTypeSpec("loadcell", SensorRawLoadCell, SensorRawLoadCellCreate, value_fields=("weight_kg",)),
+    # MQ5/MQ7 디바이스는 gas_level/co_level 키로 전송 (ppm_value는 환산값을 보내는 클라이언트용)
+    SensorTypeSpec("mq5", SensorRawMQ5, SensorRawMQ5Create, value_fields=("gas_level", "ppm_value", "analog_value")),
+    SensorTypeSpec("mq7", SensorRawMQ7, SensorRawMQ7Create, value_fields=("co_level", "ppm_value", "analog_value")),
+    SensorTypeSpec("rfid", SensorRawRFID, SensorRawRFIDCreate),
+    SensorTypeSpec("sound", SensorRawSound, SensorRawSoundCreate, value_fields=("db_value", "analog_value")),
+    SensorTypeSpec("tcrt5000", SensorRawTCRT5000, SensorRawTCRT5000Create, value_fields=("analog_value",)),
+    SensorTypeSpec("ultrasonic", SensorRawUltrasonic, SensorRawUltrasonicCreate, value_fields=("distance_cm",)),
+    SensorTypeSpec("sensor-raw-temperatures", SensorRawTemperature, SensorRawTemperatureCreate, ("temperature", "lm35"), value_fields=("temperature_celsius", "humidity_percent")),
+    SensorTypeSpec("sensor-event-buttons", SensorEventButton, SensorEventButtonCreate, ("button",), value_fields=("press_duration_ms",)),
+    # Edge 센서
+    SensorTypeSpec("edge-flame", SensorEdgeFlame, EdgeFlameDataCreate, value_fields=("confidence",)),
+    SensorTypeSpec("edge-pir", SensorEdgePIR, EdgePIRDataCreate, ("pir",), value_fields=("motion_speed", "confidence")),
+    SensorTypeSpec("edge-reed", SensorEdgeReed, EdgeReedDataCreate, value_fields=("magnetic_strength", "confidence")),
+    SensorTypeSpec("edge-tilt", SensorEdgeTilt, EdgeTiltDataCreate, value_fields=("tilt_angle", "confidence")),
+    # Actuator 로그
+    SensorTypeSpec("actuator-buzzer", ActuatorLogBuzzer, ActuatorBuzzerDataCreate, ("buzzer",)),
+    SensorTypeSpec("actuator-irtx", ActuatorLogIRTX, ActuatorIRTXDataCreate, ("irtx",)),
+    SensorTypeSpec("actuator-relay", ActuatorLogRelay, ActuatorRelayDataCreate, ("relay",)),
+    SensorTypeSpec("actuator-servo", ActuatorLogServo, ActuatorServoDataCreate, ("servo",)),
+]
+
+# 정규화된 이름(타입명 + 별칭) -> 메타데이터
+SENSOR_REGISTRY: Dict[str, SensorTypeSpec] = {}
+for _spec in SENSOR_TYPE_SPECS:
+    for _name in (_spec.sensor_type,) + _spec.aliases:
+        SENSOR_REGISTRY[normalize_sensor_type(_name)] = _spec
+
+
+def get_sensor_spec(sensor_type: str) -> Optional[SensorTypeSpec]:
+    """센서 타입 이름으로 메타데이터 조회 (미등록 타입은 None)"""
+    if not sensor_type:
+        return None
+    return SENSOR_REGISTRY.get(normalize_sensor_type(sensor_type))
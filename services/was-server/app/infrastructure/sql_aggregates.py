@@ -0,0 +1,128 @@
+"""
+SQL 집계 헬퍼 모듈
+
+통계/분석 조회가 기간 내 모든 행을 ORM 객체로 가져와 Python 루프로 계산하지 않도록,
+집계(`count(*) FILTER`, `min/max/avg`, `percentile_cont`, `date_part` 그룹핑, 윈도 함수)를
+DB에서 수행하고 요약 행만 받아오는 데 필요한 표현식을 제공합니다.
+기간이 길어져도 전송량과 메모리 사용량은 일정합니다.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Boolean, Float, and_, case, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.payload_columns import get_payload_column
+
+
+def range_conditions(
+    model,
+    device_id: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None
+) -> list:
+    """디바이스 + 기간 조건 목록 (기본 키 (time, device_id) 인덱스 범위 탐색)"""
+    conditions = [model.device_id == device_id]
+    if start_time:
+        conditions.append(model.time >= start_time)
+    if end_time:
+        conditions.append(model.time <= end_time)
+    return conditions
+
+
+def payload_number(model, key: str):
+    """raw_payload의 숫자 필드 (숫자가 아니거나 없으면 NULL, 생성 컬럼이 있으면 그 컬럼)"""
+    managed = get_payload_column(model, key, "number")
+    if managed is not None:
+        return managed.expression()
+    value = model.raw_payload[key]
+    return case((func.jsonb_typeof(value) == "number", cast(value.astext, Float)))
+
+
+def payload_bool(model, key: str):
+    """raw_payload의 불리언 필드 (불리언이 아니거나 없으면 false)"""
+    value = model.raw_payload[key]
+    return func.coalesce(case((func.jsonb_typeof(value) == "boolean", cast(value.astext, Boolean))), False)
+
+
+def value_column(model, field: str):
+    """측정값 필드 표현식 (모델 컬럼이면 float로 캐스트, 아니면 raw_payload 숫자 키)"""
+    column = model.__table__.columns.get(field)
+    if column is not None:
+        return cast(column, Float)
+    return payload_number(model, field)
+
+
+def payload_text(model, key: str):
+    """raw_payload의 문자열 필드 (생성 컬럼이 있으면 그 컬럼)"""
+    managed = get_payload_column(model, key, "text")
+    if managed is not None:
+        return managed.expression()
+    return model.raw_payload[key].astext
+
+
+def count_if(condition):
+    """조건을 만족하는 행 수 (`count(*) FILTER (WHERE ...)`)"""
+    return func.count().filter(condition)
+
+
+def summary_columns(expr, name: str, median: bool = False) -> list:
+    """NULL이 아닌 값의 개수/최소/최대/평균(/중앙값) 집계 컬럼"""
+    columns = [
+        func.count(expr).label(f"{name}_count"),
+        func.min(expr).label(f"{name}_min"),
+        func.max(expr).label(f"{name}_max"),
+        func.avg(expr).label(f"{name}_avg"),
+    ]
+    if median:
+        columns.append(func.percentile_cont(0.5).within_group(expr).label(f"{name}_median"))
+    return columns
+
+
+def to_number(value: Any) -> Any:
+    """Decimal 집계 결과를 float로 변환 (그 외 값은 그대로)"""
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def summary(row, name: str, with_count: bool = False, empty: Any = None) -> Any:
+    """`summary_columns` 결과를 `{"min", "max", "avg"}` 딕셔너리로 변환 (값이 없으면 empty)"""
+    count = getattr(row, f"{name}_count")
+    if not count:
+        return empty
+    stats = {}
+    if with_count:
+        stats["count"] = count
+    for key in ("min", "max", "avg", "median"):
+        if hasattr(row, f"{name}_{key}"):
+            stats[key] = to_number(getattr(row, f"{name}_{key}"))
+    return stats
+
+
+def hour_of(time_column):
+    """UTC 기준 시(hour) (Python `datetime.hour`와 동일)"""
+    return func.date_part("hour", func.timezone("UTC", time_column))
+
+
+async def group_counts(db: AsyncSession, column, conditions: list) -> Dict[Any, int]:
+    """값별 행 수 (`GROUP BY`, NULL/빈 문자열 제외)"""
+    result = await db.execute(
+        select(column, func.count())
+        .where(and_(*conditions), column.isnot(None), column != "")
+        .group_by(column)
+    )
+    return {value: count for value, count in result.all()}
+
+
+async def peak_hours(db: AsyncSession, time_column, conditions: list, top: int = 3) -> List[Dict[str, int]]:
+    """행 수가 많은 상위 시간대 `[{"hour", "count"}]`"""
+    hour = hour_of(time_column)
+    result = await db.execute(
+        select(hour.label("hour"), func.count().label("count"))
+        .where(and_(*conditions))
+        .group_by(hour)
+        .order_by(func.count().desc(), hour)
+        .limit(top)
+    )
+    return [{"hour": int(row.hour), "count": row.count} for row in result.all()]
@@ -0,0 +1,12 @@
+"""
+Keyset(커서) 페이지네이션 타입
+
+리포지토리/서비스 인터페이스가 인프라 레이어에 의존하지 않도록 디코딩된 커서 타입을 이곳에 둡니다.
+커서 인코딩/디코딩과 쿼리 적용은 `app.infrastructure.pagination`에 있습니다.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+# 디코딩된 커서: (time, key)
+Cursor = Tuple[datetime, str]
@@ -11,6 +11,7 @@ from app.infrastructure.models import (
     ActuatorLogBuzzer, ActuatorLogIRTX, 
     ActuatorLogRelay, ActuatorLogServo
 )
+from app.interfaces.pagination import Cursor
 
 
 class IActuatorBuzzerRepository(ABC):
@@ -40,7 +41,8 @@ class IActuatorBuzzerRepository(ABC):
         buzzer_type: Optional[str] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogBuzzer]:
         """Buzzer 액추에이터 로그 목록 조회"""
         pass
@@ -98,7 +100,8 @@ class IActuatorIRTXRepository(ABC):
         protocol: Optional[str] = None,
         command_hex: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogIRTX]:
         """IR TX 액추에이터 로그 목록 조회"""
         pass
@@ -156,7 +159,8 @@ class IActuatorRelayRepository(ABC):
         channel: Optional[int] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogRelay]:
         """Relay 액추에이터 로그 목록 조회"""
         pass
@@ -214,7 +218,8 @@ class IActuatorServoRepository(ABC):
         channel: Optional[int] = None,
         angle_deg: Optional[float] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorLogServo]:
         """Servo 액추에이터 로그 목록 조회"""
         pass
@@ -0,0 +1,32 @@
+"""
+대량 적재 리포지토리 인터페이스
+
+센서/엣지/액추에이터 테이블에 여러 행을 한 번에 기록하기 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type
+
+
+class IBulkInsertRepository(ABC):
+    """대량 적재 리포지토리 인터페이스"""
+    
+    @abstractmethod
+    async def insert_many(self, model: Type[Any], rows: List[Dict[str, Any]]) -> int:
+        """여러 행을 다중 행 INSERT로 기록하고 기록된 행 수를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def upsert_many(
+        self, model: Type[Any], rows: List[Dict[str, Any]], on_conflict: str = "nothing"
+    ) -> List[Optional[bool]]:
+        """기본 키 충돌을 무시(nothing)하거나 갱신(update)하며 여러 행을 기록합니다.
+        
+        입력 순서대로 신규 삽입(True), 기존 행 갱신(False), 이미 존재해 무시(None)를 반환합니다.
+        """
+        pass
+    
+    @abstractmethod
+    async def insert_returning(self, model: Type[Any], row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """단건을 기본 키 충돌 무시로 기록하고 저장된 행을 반환합니다. (이미 존재하면 None)"""
+        pass
@@ -0,0 +1,42 @@
+"""
+대량 내보내기 리포지토리 인터페이스
+
+시계열 테이블의 기간 데이터를 서버 측 커서로 묶음 단위 조회하기 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+class IExportRepository(ABC):
+    """대량 내보내기 리포지토리 인터페이스"""
+    
+    @abstractmethod
+    def get_columns(self, table_name: str) -> Optional[List[Tuple[str, str]]]:
+        """내보낼 수 있는 테이블이면 컬럼 `(이름, 종류)` 목록, 아니면 None을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    def get_owner_column(self, table_name: str) -> str:
+        """테이블의 소유자 키 컬럼 이름(device_id 또는 user_id)을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    def stream_batches(
+        self,
+        table_name: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        owner_id: Optional[Any],
+        batch_size: int,
+        user_id: Optional[UUID] = None
+    ) -> AsyncIterator[Sequence[Sequence[Any]]]:
+        """기간(start <= time < end)과 소유자 조건의 행을 (time, 소유자) 순으로 batch_size개씩 묶어 내보냅니다.
+        
+        행은 `get_columns` 순서의 값 튜플입니다. device_id 키 테이블에서 user_id가 있으면
+        해당 사용자에게 할당된 디바이스의 행만 내보냅니다.
+        아카이브 대상 테이블은 아카이브 워터마크 이전 구간의 행도 함께 내보냅니다.
+        """
+        pass
@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from app.domain.entities.home_state_snapshot import HomeStateSnapshot
+from app.interfaces.pagination import Cursor
 
 
 class IHomeStateSnapshotRepository(ABC):
@@ -60,7 +61,7 @@ class IHomeStateSnapshotRepository(ABC):
     
     @abstractmethod
     async def get_all_snapshots(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[HomeStateSnapshot]:
         """전체 스냅샷 목록 조회 (페이지네이션)"""
         pass
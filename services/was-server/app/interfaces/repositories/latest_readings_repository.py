@@ -0,0 +1,28 @@
+"""
+최신 측정값 일괄 조회 리포지토리 인터페이스
+
+사용자에게 할당된 모든 디바이스의 센서 테이블별 최신 행을 한 번에 조회하기 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+from uuid import UUID
+
+
+class ILatestReadingsRepository(ABC):
+    """최신 측정값 일괄 조회 리포지토리 인터페이스"""
+    
+    @abstractmethod
+    async def get_user_devices(self, user_id: UUID) -> List[Dict[str, Any]]:
+        """사용자의 디바이스 목록 `{"device_id", "location_label"}`을 device_id 순으로 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def get_latest_rows(self, user_id: UUID) -> List[Dict[str, Any]]:
+        """사용자 디바이스의 (센서 테이블, 디바이스)별 최신 행 `{"source_table", "device_id", "time", "payload"}`를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def user_exists(self, user_id: UUID) -> bool:
+        """사용자 존재 여부를 반환합니다."""
+        pass
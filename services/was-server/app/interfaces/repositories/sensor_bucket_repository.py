@@ -0,0 +1,29 @@
+"""
+시간 버킷 집계 리포지토리 인터페이스
+
+센서/엣지 테이블의 측정값을 고정 간격 시간 버킷으로 집계하기 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Type
+
+
+class ISensorBucketRepository(ABC):
+    """시간 버킷 집계 리포지토리 인터페이스"""
+    
+    @abstractmethod
+    async def get_buckets(
+        self,
+        model: Type[Any],
+        field: str,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta
+    ) -> List[Dict[str, Any]]:
+        """기간을 width 간격 버킷으로 나누어 버킷별 `{"time", "count", "min", "max", "avg"}`를 시간순으로 반환합니다.
+        
+        행이 없는 버킷은 반환하지 않습니다.
+        """
+        pass
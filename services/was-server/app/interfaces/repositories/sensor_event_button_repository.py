@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime
 from app.domain.entities.sensor_event_button import SensorEventButton
+from app.interfaces.pagination import Cursor
 
 
 class ISensorEventButtonRepository(ABC):
@@ -66,7 +67,7 @@ class ISensorEventButtonRepository(ABC):
     
     @abstractmethod
     async def get_all_button_events(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[SensorEventButton]:
         """전체 버튼 이벤트 목록 조회 (페이지네이션)"""
         pass
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime
 from app.domain.entities.sensor_raw_temperature import SensorRawTemperature
+from app.interfaces.pagination import Cursor
 
 
 class ISensorRawTemperatureRepository(ABC):
@@ -66,7 +67,7 @@ class ISensorRawTemperatureRepository(ABC):
     
     @abstractmethod
     async def get_all_temperature_data(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> List[SensorRawTemperature]:
         """전체 온도 데이터 목록 조회 (페이지네이션)"""
         pass
@@ -0,0 +1,62 @@
+"""
+센서 롤업 리포지토리 인터페이스
+
+센서/엣지 측정값의 시간/일 단위 롤업 테이블을 갱신하고 조회하기 위한 추상 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+
+class ISensorRollupRepository(ABC):
+    """센서 롤업 리포지토리 인터페이스"""
+    
+    @abstractmethod
+    async def try_lock(self, sensor_type: str) -> bool:
+        """현재 트랜잭션 동안 센서 타입 롤업 잠금을 시도합니다. 다른 프로세스가 갱신 중이면 False입니다."""
+        pass
+    
+    @abstractmethod
+    async def get_watermark(self, sensor_type: str) -> Optional[datetime]:
+        """롤업이 완료된 구간의 끝(시간 경계)을 반환합니다. 롤업 전이면 None입니다."""
+        pass
+    
+    @abstractmethod
+    async def set_watermark(self, sensor_type: str, watermark: datetime):
+        """워터마크를 기록합니다."""
+        pass
+    
+    @abstractmethod
+    async def pop_dirty_hours(self, sensor_type: str, limit: int) -> List[datetime]:
+        """재계산 대기 시간 버킷을 오래된 순으로 최대 limit개 꺼냅니다. (현재 트랜잭션에서 삭제)"""
+        pass
+    
+    @abstractmethod
+    async def get_data_start(self, model: Any) -> Optional[datetime]:
+        """원시 테이블의 가장 이른 측정 시각을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def refresh_hourly(self, spec: Any, start_time: datetime, end_time: datetime) -> int:
+        """[start_time, end_time) 구간의 시간 단위 롤업을 원시 테이블에서 다시 계산하고 기록된 행 수를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def refresh_daily(self, sensor_type: str, start_time: datetime, end_time: datetime) -> int:
+        """[start_time, end_time) 구간의 일 단위 롤업을 시간 단위 롤업에서 다시 계산하고 기록된 행 수를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def get_buckets(
+        self,
+        tier: str,
+        sensor_type: str,
+        field: str,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta
+    ) -> List[Dict[str, Any]]:
+        """롤업 계층(hourly | daily)에서 width 간격 버킷별 `{"time", "count", "min", "max", "avg"}`를 시간순으로 반환합니다."""
+        pass
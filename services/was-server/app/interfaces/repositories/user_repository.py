@@ -6,7 +6,7 @@ Clean Architecture의 의존성 역전 원칙을 구현합니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from app.domain.entities.user import User
 
@@ -39,6 +39,18 @@ class IUserRepository(ABC):
         """역할별 사용자를 조회합니다."""
         pass
     
+    @abstractmethod
+    async def get_page(
+        self, offset: int = 0, limit: int = 10, role: Optional[str] = None, after: Optional[UUID] = None
+    ) -> List[User]:
+        """사용자 한 페이지를 user_id 순으로 조회합니다. (after가 있으면 offset 대신 keyset)"""
+        pass
+    
+    @abstractmethod
+    async def count(self, role: Optional[str] = None, estimate: bool = False) -> Tuple[int, bool]:
+        """사용자 수와 추정치 여부를 조회합니다. (estimate=True면 통계 기반 추정치를 허용)"""
+        pass
+    
     @abstractmethod
     async def update(self, user_id: str, update_data: dict) -> User:
         """사용자 정보를 업데이트합니다."""
@@ -7,6 +7,7 @@ Actuator 로그 서비스 인터페이스
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from app.interfaces.pagination import Cursor
 
 
 class IActuatorBuzzerService(ABC):
@@ -36,7 +37,8 @@ class IActuatorBuzzerService(ABC):
         buzzer_type: Optional[str] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List["ActuatorBuzzerDataResponse"]:
         """Buzzer 액추에이터 로그 목록 조회"""
         pass
@@ -94,7 +96,8 @@ class IActuatorIRTXService(ABC):
         protocol: Optional[str] = None,
         command_hex: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List["ActuatorIRTXDataResponse"]:
         """IR TX 액추에이터 로그 목록 조회"""
         pass
@@ -152,7 +155,8 @@ class IActuatorRelayService(ABC):
         channel: Optional[int] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List["ActuatorRelayDataResponse"]:
         """Relay 액추에이터 로그 목록 조회"""
         pass
@@ -210,7 +214,8 @@ class IActuatorServoService(ABC):
         channel: Optional[int] = None,
         angle_deg: Optional[float] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List["ActuatorServoDataResponse"]:
         """Servo 액추에이터 로그 목록 조회"""
         pass
@@ -0,0 +1,36 @@
+"""
+대량 내보내기 서비스 인터페이스
+
+분석/스냅샷 생성용으로 시계열 테이블의 기간 데이터를 Arrow IPC / Parquet / CSV로 내보내는 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+
+@dataclass
+class ExportStream:
+    """내보내기 응답 (본문은 묶음 단위 바이트 스트림)"""
+    media_type: str
+    filename: str
+    body: AsyncIterator[bytes]
+
+
+class IExportService(ABC):
+    """대량 내보내기 서비스 인터페이스"""
+    
+    @abstractmethod
+    async def export_table(
+        self,
+        table_name: str,
+        export_format: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        device_id: Optional[str] = None,
+        user_id: Optional[UUID] = None
+    ) -> ExportStream:
+        """요청을 검증하고(잘못되면 HTTPException) 내보내기 스트림을 반환합니다."""
+        pass
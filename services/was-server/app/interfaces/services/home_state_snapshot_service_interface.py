@@ -6,6 +6,7 @@ from app.api.v1.schemas import (
     HomeStateSnapshotCreate, HomeStateSnapshotUpdate, 
     HomeStateSnapshotResponse, HomeStateSnapshotListResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class IHomeStateSnapshotService(ABC):
@@ -63,7 +64,7 @@ class IHomeStateSnapshotService(ABC):
     
     @abstractmethod
     async def get_all_snapshots(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> HomeStateSnapshotListResponse:
         """전체 스냅샷 목록 조회 (페이지네이션)"""
         pass
@@ -0,0 +1,38 @@
+"""
+통합 수집 서비스 인터페이스
+
+여러 센서 타입이 섞인 프레임을 한 번의 요청으로 적재하는 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.api.v1.schemas import IngestResponse, IngestStreamSummary
+
+
+class IIngestService(ABC):
+    """통합 수집 서비스 인터페이스"""
+    
+    @abstractmethod
+    async def ingest(self, frames: List[Dict[str, Any]], on_conflict: Optional[str] = "nothing") -> IngestResponse:
+        """프레임을 센서 타입별 테이블로 묶어 일괄 적재하고 프레임별 결과를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def ingest_compact(
+        self, body: bytes, content_type: str, on_conflict: Optional[str] = "nothing"
+    ) -> IngestResponse:
+        """msgpack/CBOR 압축 프레임을 해석해 테이블별로 일괄 적재하고 프레임별 결과를 반환합니다."""
+        pass
+    
+    @abstractmethod
+    async def ingest_stream(
+        self, chunks: AsyncIterator[bytes], on_conflict: Optional[str] = "nothing"
+    ) -> IngestStreamSummary:
+        """NDJSON 본문을 줄 단위로 검증하며 제한된 크기의 배치로 나누어 적재하고 요약을 반환합니다."""
+        pass
+    
+    @abstractmethod
+    def list_sensor_types(self) -> List[Dict[str, Any]]:
+        """통합 수집에서 사용할 수 있는 센서 타입 목록을 반환합니다."""
+        pass
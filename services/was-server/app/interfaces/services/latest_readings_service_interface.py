@@ -0,0 +1,19 @@
+"""
+최신 측정값 일괄 조회 서비스 인터페이스
+
+돌봄 대상 한 명의 집 전체(모든 디바이스, 모든 센서)의 최신 상태를 한 번의 호출로 조회하는 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.api.v1.schemas import UserLatestReadingsResponse
+
+
+class ILatestReadingsService(ABC):
+    """최신 측정값 일괄 조회 서비스 인터페이스"""
+    
+    @abstractmethod
+    async def get_user_latest_readings(self, user_id: UUID) -> UserLatestReadingsResponse:
+        """사용자 디바이스별로 센서 테이블별 최신 측정값을 묶어 반환합니다."""
+        pass
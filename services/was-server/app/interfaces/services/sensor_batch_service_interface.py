@@ -0,0 +1,34 @@
+"""
+센서 배치 수집 서비스 인터페이스
+
+여러 건의 센서 데이터를 한 번의 요청으로 검증하고 적재하는 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.api.v1.schemas import BatchCreateResponse, BatchItemResult
+
+
+class ISensorBatchService(ABC):
+    """센서 배치 수집 서비스 인터페이스"""
+    
+    @abstractmethod
+    async def create_batch(
+        self, items: List[Dict[str, Any]], on_conflict: Optional[str] = "nothing"
+    ) -> BatchCreateResponse:
+        """항목별로 검증한 뒤 유효한 데이터를 일괄 적재하고 항목별 결과를 반환합니다.
+        
+        on_conflict("nothing" | "update")에 따라 중복 키를 오류 대신 duplicate/updated 결과로 보고합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def create_one(self, data: BaseModel) -> Tuple[BatchItemResult, Optional[Dict[str, Any]]]:
+        """검증된 단건을 ON CONFLICT DO NOTHING으로 적재하고 (결과, 저장된 행)을 반환합니다.
+
+        결과는 created 또는 duplicate이며, duplicate이면 저장된 행은 None입니다.
+        """
+        pass
@@ -0,0 +1,31 @@
+"""
+시간 버킷 다운샘플링 서비스 인터페이스
+
+차트용으로 센서 측정값을 시간 버킷 집계 또는 LTTB 포인트로 줄여 조회하는 서비스 인터페이스입니다.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.api.v1.schemas import SensorBucketResponse
+
+
+class ISensorBucketService(ABC):
+    """시간 버킷 다운샘플링 서비스 인터페이스"""
+    
+    @abstractmethod
+    async def get_buckets(
+        self,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "5m",
+        field: Optional[str] = None,
+        points: Optional[int] = None
+    ) -> SensorBucketResponse:
+        """interval 간격 버킷별 min/max/avg/count를 반환합니다.
+        
+        points를 지정하면 LTTB(Largest-Triangle-Three-Buckets)로 약 points개의 포인트로 줄여 반환합니다.
+        """
+        pass
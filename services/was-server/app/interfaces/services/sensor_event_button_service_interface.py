@@ -5,6 +5,7 @@ from app.api.v1.schemas import (
     SensorEventButtonCreate, SensorEventButtonUpdate,
     SensorEventButtonResponse, SensorEventButtonListResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ISensorEventButtonService(ABC):
@@ -69,7 +70,7 @@ class ISensorEventButtonService(ABC):
     
     @abstractmethod
     async def get_all_button_events(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> SensorEventButtonListResponse:
         """전체 버튼 이벤트 목록 조회 (페이지네이션)"""
         pass
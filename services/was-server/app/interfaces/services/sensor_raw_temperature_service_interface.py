@@ -5,6 +5,7 @@ from app.api.v1.schemas import (
     SensorRawTemperatureCreate, SensorRawTemperatureUpdate,
     SensorRawTemperatureResponse, SensorRawTemperatureListResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ISensorRawTemperatureService(ABC):
@@ -69,7 +70,7 @@ class ISensorRawTemperatureService(ABC):
     
     @abstractmethod
     async def get_all_temperature_data(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> SensorRawTemperatureListResponse:
         """전체 온도 데이터 목록 조회 (페이지네이션)"""
         pass
@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, TypeVar, Generic
 from datetime import datetime
 from pydantic import BaseModel
+from app.interfaces.pagination import Cursor
 
 # 제네릭 타입 정의
 T = TypeVar('T')
@@ -44,7 +45,8 @@ class ISensorService(ABC, Generic[T, CreateModel, UpdateModel, ResponseModel]):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[ResponseModel]:
         """센서 데이터 목록 조회"""
         pass
@@ -10,8 +10,16 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
-from app.api import api_router
-from app.infrastructure.database import create_tables
+from app.api import api_router, ws_router
+from app.infrastructure.database import create_tables, dispose_async_engine
+from app.infrastructure.async_redis_client import async_redis_client
+from app.infrastructure.ingest_queue import ingest_queue
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.rate_limiter import ingest_rate_limiter
+from app.infrastructure.rollup_worker import sensor_rollup_worker
+from app.infrastructure.partition_manager import partition_manager
+from app.infrastructure.pagination import NEXT_CURSOR_HEADER
+from app.core.middleware import IngestRateLimitMiddleware
 
 
 @asynccontextmanager
@@ -27,10 +35,42 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"❌ 데이터베이스 테이블 생성 실패: {e}")
     
+    # 디바이스 레지스트리 캐시 적재 (실패 시 수집 경로는 디바이스 검증 없이 동작)
+    try:
+        await device_registry.start()
+        print(f"✅ 디바이스 레지스트리 적재 완료 ({len(device_registry)}개)")
+    except Exception as e:
+        print(f"❌ 디바이스 레지스트리 적재 실패: {e}")
+    
+    # write-behind 수집 큐 플러셔 시작
+    if ingest_queue.enabled:
+        await ingest_queue.start()
+        print("✅ write-behind 수집 큐 시작")
+    
+    # 시간/일 단위 롤업 증분 갱신 작업 시작
+    if sensor_rollup_worker.enabled:
+        await sensor_rollup_worker.start()
+        print("✅ 센서 롤업 작업 시작")
+    
+    # 파티션 사전 생성/만료 처리 작업 시작
+    if partition_manager.enabled:
+        await partition_manager.start()
+        print("✅ 파티션 관리 작업 시작")
+    
     yield
     
     # 종료 시 실행
     print("🛑 IoT Care 백엔드 서비스 종료 중...")
+    
+    # 큐에 남은 데이터 플러시 후 종료
+    await ingest_queue.stop()
+    await device_registry.stop()
+    await sensor_rollup_worker.stop()
+    await partition_manager.stop()
+    
+    # 비동기 커넥션 풀 정리
+    await dispose_async_engine()
+    await async_redis_client.close()
 
 
 # FastAPI 애플리케이션 생성
@@ -50,6 +90,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# 수집 속도 제한 미들웨어 (디바이스별/센서 타입별 토큰 버킷, CORS보다 안쪽에서 동작)
+app.add_middleware(IngestRateLimitMiddleware, limiter=ingest_rate_limiter)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -57,6 +100,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저 클라이언트가 keyset 페이지네이션 커서 헤더를 읽을 수 있도록 노출
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -100,6 +145,7 @@ async def root():
 
 # API 라우터 등록
 app.include_router(api_router, prefix="/api")
+app.include_router(ws_router, prefix="/ws")
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ from app.interfaces.services.actuator_service_interface import IActuatorBuzzerSe
 from app.api.v1.schemas import (
     ActuatorBuzzerDataCreate, ActuatorBuzzerDataUpdate, ActuatorBuzzerDataResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ActuatorBuzzerService(IActuatorBuzzerService):
@@ -95,7 +96,8 @@ class ActuatorBuzzerService(IActuatorBuzzerService):
         buzzer_type: Optional[str] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorBuzzerDataResponse]:
         """Buzzer 액추에이터 로그 목록 조회"""
         # 비즈니스 로직 검증
@@ -109,7 +111,8 @@ class ActuatorBuzzerService(IActuatorBuzzerService):
             buzzer_type=buzzer_type,
             state=state,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         
         # 응답 스키마로 변환
@@ -13,6 +13,7 @@ from app.interfaces.services.actuator_service_interface import IActuatorIRTXServ
 from app.api.v1.schemas import (
     ActuatorIRTXDataCreate, ActuatorIRTXDataUpdate, ActuatorIRTXDataResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ActuatorIRTXService(IActuatorIRTXService):
@@ -91,7 +92,8 @@ class ActuatorIRTXService(IActuatorIRTXService):
         protocol: Optional[str] = None,
         command_hex: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorIRTXDataResponse]:
         """IR TX 액추에이터 로그 목록 조회"""
         # 비즈니스 로직 검증
@@ -105,7 +107,8 @@ class ActuatorIRTXService(IActuatorIRTXService):
             protocol=protocol,
             command_hex=command_hex,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         
         # 응답 스키마로 변환
@@ -13,6 +13,7 @@ from app.interfaces.services.actuator_service_interface import IActuatorRelaySer
 from app.api.v1.schemas import (
     ActuatorRelayDataCreate, ActuatorRelayDataUpdate, ActuatorRelayDataResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ActuatorRelayService(IActuatorRelayService):
@@ -87,7 +88,8 @@ class ActuatorRelayService(IActuatorRelayService):
         channel: Optional[int] = None,
         state: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorRelayDataResponse]:
         """Relay 액추에이터 로그 목록 조회"""
         # 비즈니스 로직 검증
@@ -101,7 +103,8 @@ class ActuatorRelayService(IActuatorRelayService):
             channel=channel,
             state=state,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         
         # 응답 스키마로 변환
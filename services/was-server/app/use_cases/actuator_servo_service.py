@@ -13,6 +13,7 @@ from app.interfaces.services.actuator_service_interface import IActuatorServoSer
 from app.api.v1.schemas import (
     ActuatorServoDataCreate, ActuatorServoDataUpdate, ActuatorServoDataResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class ActuatorServoService(IActuatorServoService):
@@ -91,7 +92,8 @@ class ActuatorServoService(IActuatorServoService):
         channel: Optional[int] = None,
         angle_deg: Optional[float] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[Cursor] = None
     ) -> List[ActuatorServoDataResponse]:
         """Servo 액추에이터 로그 목록 조회"""
         # 비즈니스 로직 검증
@@ -105,7 +107,8 @@ class ActuatorServoService(IActuatorServoService):
             channel=channel,
             angle_deg=angle_deg,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         
         # 응답 스키마로 변환
@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from app.interfaces.services.sensor_service_interface import IEdgeFlameService
 from app.interfaces.repositories.sensor_repository import IEdgeFlameRepository
 from app.api.v1.schemas import EdgeFlameDataCreate, EdgeFlameDataUpdate, EdgeFlameDataResponse
+from app.interfaces.pagination import Cursor
 
 
 class EdgeFlameService(IEdgeFlameService):
@@ -78,7 +79,8 @@ class EdgeFlameService(IEdgeFlameService):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgeFlameDataResponse]:
         """Edge Flame 센서 데이터 목록 조회"""
         # 비즈니스 규칙 검증
@@ -99,7 +101,8 @@ class EdgeFlameService(IEdgeFlameService):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit=limit
+                limit=limit,
+                cursor=cursor
             )
         except Exception as e:
             raise HTTPException(
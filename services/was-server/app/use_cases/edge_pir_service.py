@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from app.interfaces.services.sensor_service_interface import IEdgePIRService
 from app.interfaces.repositories.sensor_repository import IEdgePIRRepository
 from app.api.v1.schemas import EdgePIRDataCreate, EdgePIRDataUpdate, EdgePIRDataResponse
+from app.interfaces.pagination import Cursor
 
 
 class EdgePIRService(IEdgePIRService):
@@ -77,7 +78,8 @@ class EdgePIRService(IEdgePIRService):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgePIRDataResponse]:
         """Edge PIR 센서 데이터 목록 조회"""
         # 비즈니스 규칙 검증
@@ -98,7 +100,8 @@ class EdgePIRService(IEdgePIRService):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit=limit
+                limit=limit,
+                cursor=cursor
             )
         except Exception as e:
             raise HTTPException(
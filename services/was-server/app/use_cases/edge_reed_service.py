@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from app.interfaces.services.sensor_service_interface import IEdgeReedService
 from app.interfaces.repositories.sensor_repository import IEdgeReedRepository
 from app.api.v1.schemas import EdgeReedDataCreate, EdgeReedDataUpdate, EdgeReedDataResponse
+from app.interfaces.pagination import Cursor
 
 
 class EdgeReedService(IEdgeReedService):
@@ -71,7 +72,8 @@ class EdgeReedService(IEdgeReedService):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
     ) -> List[EdgeReedDataResponse]:
         """Edge Reed 센서 데이터 목록 조회"""
         # 비즈니스 규칙 검증
@@ -92,7 +94,8 @@ class EdgeReedService(IEdgeReedService):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit=limit
+                limit=limit,
+                cursor=cursor
             )
         except Exception as e:
             raise HTTPException(
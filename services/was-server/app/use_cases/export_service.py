@@ -0,0 +1,97 @@
+"""
+대량 내보내기 서비스 구현체
+
+시계열 테이블의 기간 데이터를 서버 측 커서에서 묶음 단위로 받아 Arrow IPC / Parquet / CSV 바이트로 바꿔 흘려보냅니다.
+요청 검증과 writer 생성(pyarrow 확인)은 스트리밍 전에 끝내므로, 잘못된 요청은 응답 본문을 보내기 전에 오류 상태로 응답합니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import AsyncIterator, Optional
+from uuid import UUID
+from fastapi import HTTPException
+
+from app.core.config import get_settings
+from app.interfaces.services.export_service_interface import IExportService, ExportStream
+from app.interfaces.repositories.export_repository import IExportRepository
+from app.infrastructure.export_formats import EXPORT_FORMATS, ExportFormatError, create_batch_writer
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 설정 가져오기
+settings = get_settings()
+
+
+class ExportService(IExportService):
+    """대량 내보내기 서비스 구현체"""
+
+    def __init__(self, export_repository: IExportRepository, batch_size: int = settings.EXPORT_BATCH_ROWS):
+        self.export_repository = export_repository
+        self.batch_size = batch_size
+
+    async def export_table(
+        self,
+        table_name: str,
+        export_format: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        device_id: Optional[str] = None,
+        user_id: Optional[UUID] = None
+    ) -> ExportStream:
+        if export_format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 형식입니다: {export_format} (지원: {', '.join(EXPORT_FORMATS)})"
+            )
+        columns = self.export_repository.get_columns(table_name)
+        if columns is None:
+            raise HTTPException(status_code=404, detail=f"내보낼 수 없는 테이블입니다: {table_name}")
+        if start_time is not None and end_time is not None and start_time >= end_time:
+            raise HTTPException(status_code=400, detail="start는 end보다 이전이어야 합니다")
+
+        owner_column = self.export_repository.get_owner_column(table_name)
+        if owner_column == "user_id":
+            if device_id is not None:
+                raise HTTPException(status_code=400, detail=f"{table_name}은 user_id로 조회합니다")
+            owner_id, device_owner = user_id, None
+        else:
+            # 디바이스 테이블의 user_id는 사용자에게 할당된 디바이스 조건으로 변환
+            owner_id, device_owner = device_id, user_id
+
+        try:
+            writer = create_batch_writer(export_format, columns)
+        except ExportFormatError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+
+        media_type, extension = EXPORT_FORMATS[export_format]
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return ExportStream(
+            media_type=media_type,
+            filename=f"{table_name}_{stamp}.{extension}",
+            body=self._stream(writer, table_name, start_time, end_time, owner_id, device_owner)
+        )
+
+    async def _stream(
+        self,
+        writer,
+        table_name: str,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        owner_id,
+        device_owner: Optional[UUID]
+    ) -> AsyncIterator[bytes]:
+        # 응답 상태는 이미 보냈으므로 도중 실패는 로그를 남기고 연결을 끊어 불완전한 파일임을 알립니다
+        try:
+            async for rows in self.export_repository.stream_batches(
+                table_name, start_time, end_time, owner_id, self.batch_size, user_id=device_owner
+            ):
+                chunk = writer.write(rows)
+                if chunk:
+                    yield chunk
+            chunk = writer.close()
+            if chunk:
+                yield chunk
+        except Exception as e:
+            logger.error(f"{table_name} 내보내기 실패: {e}")
+            raise
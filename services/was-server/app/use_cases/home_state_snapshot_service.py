@@ -8,6 +8,9 @@ from app.api.v1.schemas import (
     HomeStateSnapshotCreate, HomeStateSnapshotUpdate,
     HomeStateSnapshotResponse, HomeStateSnapshotListResponse
 )
+from app.infrastructure.pagination import next_cursor
+from app.interfaces.pagination import Cursor
+from app.infrastructure.read_cache import cached, read_cache
 
 
 class HomeStateSnapshotService(IHomeStateSnapshotService):
@@ -55,6 +58,7 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
         
         # 리포지토리를 통해 저장
         created_snapshot = await self.snapshot_repository.create_snapshot(snapshot_entity)
+        await read_cache.invalidate(f"snapshots:{snapshot_data.user_id}")
         
         # 도메인 엔티티를 Pydantic 응답 스키마로 변환
         return HomeStateSnapshotResponse.from_orm(created_snapshot)
@@ -68,6 +72,12 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
             return HomeStateSnapshotResponse.from_orm(snapshot)
         return None
     
+    @cached(
+        "home_state_snapshots.latest",
+        Optional[HomeStateSnapshotResponse],
+        group=lambda user_id, **_: f"snapshots:{user_id}",
+        key=lambda user_id, **_: user_id
+    )
     async def get_latest_snapshot_by_user(self, user_id: UUID) -> Optional[HomeStateSnapshotResponse]:
         """사용자의 최신 스냅샷 조회"""
         snapshot = await self.snapshot_repository.get_latest_snapshot_by_user(user_id)
@@ -107,19 +117,22 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
             return None
         
         updated_snapshot = await self.snapshot_repository.update_snapshot(time, user_id, update_data)
+        await read_cache.invalidate(f"snapshots:{user_id}")
         if updated_snapshot:
             return HomeStateSnapshotResponse.from_orm(updated_snapshot)
         return None
     
     async def delete_snapshot(self, time: datetime, user_id: UUID) -> bool:
         """스냅샷 삭제"""
-        return await self.snapshot_repository.delete_snapshot(time, user_id)
+        deleted = await self.snapshot_repository.delete_snapshot(time, user_id)
+        await read_cache.invalidate(f"snapshots:{user_id}")
+        return deleted
     
     async def get_all_snapshots(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> HomeStateSnapshotListResponse:
         """전체 스냅샷 목록 조회 (페이지네이션)"""
-        snapshots = await self.snapshot_repository.get_all_snapshots(skip, limit)
+        snapshots = await self.snapshot_repository.get_all_snapshots(skip, limit, cursor)
         total = len(snapshots)  # 실제로는 전체 개수를 별도로 조회해야 함
         
         return HomeStateSnapshotListResponse(
@@ -127,7 +140,8 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
             total=total,
             page=skip // limit + 1 if limit > 0 else 1,
             size=limit,
-            pages=(total + limit - 1) // limit if limit > 0 else 1
+            pages=(total + limit - 1) // limit if limit > 0 else 1,
+            next_cursor=next_cursor(snapshots, limit, "user_id")
         )
     
     async def get_environmental_alerts(
@@ -147,6 +161,7 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
         }
         
         updated_snapshot = await self.snapshot_repository.update_snapshot(time, user_id, update_data)
+        await read_cache.invalidate(f"snapshots:{user_id}")
         if updated_snapshot:
             return HomeStateSnapshotResponse.from_orm(updated_snapshot)
         return None
@@ -166,6 +181,7 @@ class HomeStateSnapshotService(IHomeStateSnapshotService):
         # 업데이트
         update_data = {"action_log": snapshot.action_log}
         updated_snapshot = await self.snapshot_repository.update_snapshot(time, user_id, update_data)
+        await read_cache.invalidate(f"snapshots:{user_id}")
         if updated_snapshot:
             return HomeStateSnapshotResponse.from_orm(updated_snapshot)
         return None
@@ -0,0 +1,313 @@
+"""
+통합 수집 서비스 구현체
+
+센서 타입이 섞인 프레임을 레지스트리로 테이블별로 묶은 뒤,
+테이블마다 배치 수집 서비스로 검증하고 다중 행 INSERT로 적재합니다.
+"""
+
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.interfaces.services.ingest_service_interface import IIngestService
+from app.interfaces.repositories.bulk_insert_repository import IBulkInsertRepository
+from app.infrastructure.sensor_registry import SENSOR_TYPE_SPECS, SensorTypeSpec, get_sensor_spec
+from app.infrastructure.compact_codec import CompactDecodeError, decode_frames, is_compact_content_type, unpack_body
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.rate_limiter import ingest_rate_limiter
+from app.use_cases.sensor_batch_service import (
+    MAX_BATCH_SIZE, ON_CONFLICT_MODES, SensorBatchService, persist_accepted, resolve_device, summarize_results
+)
+from app.api.v1.schemas import BatchItemResult, IngestResponse, IngestStreamSummary, IngestTableResult
+
+
+# NDJSON 스트리밍 수집: 테이블 버퍼가 이 행 수에 도달하면 적재
+STREAM_FLUSH_ROWS = 500
+
+# NDJSON 스트리밍 수집: 한 줄의 최대 바이트 수 (개행 없는 본문으로 메모리가 커지는 것을 방지)
+STREAM_MAX_LINE_BYTES = 64 * 1024
+
+# NDJSON 스트리밍 수집: 요약에 포함할 최대 오류 수
+STREAM_MAX_ERRORS = 100
+
+
+class IngestService(IIngestService):
+    """통합 수집 서비스 구현체"""
+
+    def __init__(self, bulk_insert_repository: IBulkInsertRepository):
+        self.bulk_insert_repository = bulk_insert_repository
+
+    def _group_frames(self, frames: List[Dict[str, Any]]):
+        """프레임을 센서 타입별로 묶음 (원래 위치 보존)"""
+        groups: Dict[str, Tuple[SensorTypeSpec, List[int], List[Dict[str, Any]]]] = {}
+        rejected: List[BatchItemResult] = []
+
+        for index, frame in enumerate(frames):
+            if not isinstance(frame, dict):
+                rejected.append(BatchItemResult(index=index, status="invalid", detail="프레임은 객체여야 합니다"))
+                continue
+
+            sensor_type = frame.get("sensor_type")
+            spec = get_sensor_spec(sensor_type) if isinstance(sensor_type, str) else None
+            if spec is None:
+                rejected.append(BatchItemResult(
+                    index=index,
+                    status="invalid",
+                    device_id=frame.get("device_id"),
+                    detail=f"등록되지 않은 센서 타입입니다: {sensor_type}"
+                ))
+                continue
+
+            _, indexes, items = groups.setdefault(spec.sensor_type, (spec, [], []))
+            indexes.append(index)
+            items.append({key: value for key, value in frame.items() if key != "sensor_type"})
+
+        return groups, rejected
+
+    def list_sensor_types(self) -> List[Dict[str, Any]]:
+        """등록된 센서 타입 목록"""
+        return [
+            {"sensor_type": spec.sensor_type, "table": spec.table_name, "aliases": list(spec.aliases)}
+            for spec in SENSOR_TYPE_SPECS
+        ]
+
+    def _check_request(self, total: int, on_conflict: Optional[str]):
+        """요청 크기와 멱등 모드 검증"""
+        if total > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 적재할 수 있는 프레임은 최대 {MAX_BATCH_SIZE}개입니다"
+            )
+        if on_conflict is not None and on_conflict not in ON_CONFLICT_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"on_conflict는 {', '.join(ON_CONFLICT_MODES)} 중 하나여야 합니다"
+            )
+
+    def _build_response(self, total: int, tables: List[IngestTableResult], results: List[BatchItemResult]) -> IngestResponse:
+        """테이블별 집계와 프레임별 결과로 응답 생성"""
+        results.sort(key=lambda r: r.index)
+        return IngestResponse(total=total, tables=tables, results=results, **summarize_results(results))
+
+    async def ingest(self, frames: List[Dict[str, Any]], on_conflict: Optional[str] = "nothing") -> IngestResponse:
+        """센서 타입이 섞인 프레임 통합 적재"""
+        self._check_request(len(frames), on_conflict)
+
+        groups, results = self._group_frames(frames)
+        tables: List[IngestTableResult] = []
+
+        # 테이블마다 별도 트랜잭션으로 적재하여 한 테이블의 실패가 다른 테이블에 번지지 않도록 함
+        for spec, indexes, items in groups.values():
+            batch_service = SensorBatchService(self.bulk_insert_repository, spec.model, spec.create_schema)
+            batch = await batch_service.create_batch(items, on_conflict)
+
+            for result in batch.results:
+                result.index = indexes[result.index]
+                results.append(result)
+
+            tables.append(IngestTableResult(
+                sensor_type=spec.sensor_type,
+                table=spec.table_name,
+                received=batch.total,
+                created=batch.created,
+                updated=batch.updated,
+                duplicates=batch.duplicates,
+                failed=batch.failed
+            ))
+
+        return self._build_response(len(frames), tables, results)
+
+    async def ingest_compact(
+        self, body: bytes, content_type: str, on_conflict: Optional[str] = "nothing"
+    ) -> IngestResponse:
+        """msgpack/CBOR 압축 프레임 통합 적재
+
+        Pydantic 검증 없이 코덱이 만든 INSERT 행을 그대로 적재합니다.
+        """
+        if not is_compact_content_type(content_type):
+            raise HTTPException(status_code=415, detail=f"지원하지 않는 Content-Type입니다: {content_type}")
+
+        try:
+            groups, errors = decode_frames(unpack_body(body, content_type))
+        except CompactDecodeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        total = len(errors) + sum(len(indexes) for _, indexes, _ in groups.values())
+        self._check_request(total, on_conflict)
+
+        results = [BatchItemResult(index=index, status="invalid", detail=detail) for index, detail in errors]
+        tables: List[IngestTableResult] = []
+
+        await device_registry.resolve_missing(row["device_id"] for _, _, rows in groups.values() for row in rows)
+        for spec, indexes, rows in groups.values():
+            group_results: List[BatchItemResult] = []
+            accepted: List[Tuple[BatchItemResult, Dict[str, Any]]] = []
+            seen_keys = set()
+
+            for index, row in zip(indexes, rows):
+                key = (row["time"], row["device_id"])
+                if key in seen_keys:
+                    group_results.append(BatchItemResult(
+                        index=index,
+                        status="duplicate",
+                        device_id=row["device_id"],
+                        time=row["time"],
+                        detail="배치 내에 동일한 (time, device_id) 항목이 있습니다"
+                    ))
+                    continue
+                seen_keys.add(key)
+                result = BatchItemResult(index=index, status="created", device_id=row["device_id"], time=row["time"])
+                group_results.append(result)
+                if resolve_device(result):
+                    accepted.append((result, row))
+
+            await persist_accepted(self.bulk_insert_repository, spec.model, accepted, on_conflict)
+
+            results.extend(group_results)
+            tables.append(IngestTableResult(
+                sensor_type=spec.sensor_type,
+                table=spec.table_name,
+                received=len(indexes),
+                **summarize_results(group_results)
+            ))
+
+        return self._build_response(total, tables, results)
+
+    async def ingest_stream(
+        self, chunks: AsyncIterator[bytes], on_conflict: Optional[str] = "nothing"
+    ) -> IngestStreamSummary:
+        """NDJSON 스트리밍 적재
+
+        본문을 청크 단위로 읽어 줄마다 검증하고, 테이블 버퍼가 `STREAM_FLUSH_ROWS`에
+        도달할 때마다 다중 행 INSERT로 적재합니다. 본문 전체를 메모리에 올리지 않으므로
+        오프라인 동안 쌓인 대량의 측정값을 한 번의 연결로 업로드할 수 있습니다.
+
+        본문을 버퍼링하는 속도 제한 미들웨어를 거치지 않으므로 버퍼를 적재할 때마다 속도 제한을 확인하고,
+        한도를 넘은 버퍼는 적재하지 않고 `rate_limited`/`retry_after`로 보고합니다.
+        """
+        self._check_request(0, on_conflict)
+
+        summary = IngestStreamSummary(lines=0, created=0, failed=0, flushes=0)
+        # 테이블 이름 -> (메타데이터, 적재 대기 항목, 버퍼 내 (time, device_id) 키)
+        buffers: Dict[str, Tuple[SensorTypeSpec, List[Tuple[BatchItemResult, Dict[str, Any]]], set]] = {}
+
+        def record(result: BatchItemResult):
+            if result.status == "created":
+                summary.created += 1
+                return
+            if result.status == "updated":
+                summary.updated += 1
+                return
+            if result.status == "duplicate":
+                summary.duplicates += 1
+            else:
+                summary.failed += 1
+            if len(summary.errors) < STREAM_MAX_ERRORS:
+                summary.errors.append(result)
+            else:
+                summary.errors_truncated = True
+
+        async def flush(table_name: str):
+            spec, accepted, _ = buffers.pop(table_name)
+            if ingest_rate_limiter.enabled:
+                retry_after = ingest_rate_limiter.acquire(
+                    (result.device_id, spec.sensor_type) for result, _ in accepted
+                )
+                if retry_after > 0:
+                    summary.rate_limited += len(accepted)
+                    summary.retry_after = max(summary.retry_after or 0.0, round(retry_after, 3))
+                    return
+            await persist_accepted(self.bulk_insert_repository, spec.model, accepted, on_conflict)
+            summary.flushes += 1
+            summary.tables[table_name] = summary.tables.get(table_name, 0) + sum(
+                1 for result, _ in accepted if result.status in ("created", "updated")
+            )
+            for result, _ in accepted:
+                record(result)
+
+        async def handle_line(index: int, line: bytes):
+            try:
+                frame = json.loads(line)
+            except ValueError as e:
+                record(BatchItemResult(index=index, status="invalid", detail=f"JSON 파싱 실패: {e}"))
+                return
+            if not isinstance(frame, dict):
+                record(BatchItemResult(index=index, status="invalid", detail="각 줄은 JSON 객체여야 합니다"))
+                return
+
+            sensor_type = frame.pop("sensor_type", None)
+            spec = get_sensor_spec(sensor_type) if isinstance(sensor_type, str) else None
+            if spec is None:
+                record(BatchItemResult(
+                    index=index,
+                    status="invalid",
+                    device_id=frame.get("device_id"),
+                    detail=f"등록되지 않은 센서 타입입니다: {sensor_type}"
+                ))
+                return
+
+            try:
+                row = spec.create_schema.parse_obj(frame).dict()
+            except ValidationError as e:
+                record(BatchItemResult(index=index, status="invalid", device_id=frame.get("device_id"), detail=str(e)))
+                return
+
+            _, accepted, seen_keys = buffers.setdefault(spec.table_name, (spec, [], set()))
+            key = (row.get("time"), row.get("device_id"))
+            if key in seen_keys:
+                record(BatchItemResult(
+                    index=index,
+                    status="duplicate",
+                    device_id=row.get("device_id"),
+                    time=row.get("time"),
+                    detail="배치 내에 동일한 (time, device_id) 항목이 있습니다"
+                ))
+                return
+            seen_keys.add(key)
+            result = BatchItemResult(index=index, status="created", device_id=row.get("device_id"), time=row.get("time"))
+            await device_registry.resolve_missing([result.device_id])
+            if not resolve_device(result):
+                record(result)
+                return
+            accepted.append((result, row))
+            if len(accepted) >= STREAM_FLUSH_ROWS:
+                await flush(spec.table_name)
+
+        async def handle_raw(raw: bytes):
+            line = raw.strip()
+            if not line:
+                return
+            summary.lines += 1
+            await handle_line(summary.lines - 1, line)
+
+        pending = b""
+        # 너무 긴 줄을 만나면 다음 개행까지 버림
+        discarding = False
+        async for chunk in chunks:
+            if discarding:
+                if b"\n" not in chunk:
+                    continue
+                chunk = chunk.split(b"\n", 1)[1]
+                discarding = False
+
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for raw in lines:
+                await handle_raw(raw)
+
+            if len(pending) > STREAM_MAX_LINE_BYTES:
+                summary.lines += 1
+                record(BatchItemResult(
+                    index=summary.lines - 1,
+                    status="invalid",
+                    detail=f"한 줄은 최대 {STREAM_MAX_LINE_BYTES}바이트까지 허용됩니다"
+                ))
+                pending = b""
+                discarding = True
+
+        await handle_raw(pending)
+        for table_name in list(buffers.keys()):
+            await flush(table_name)
+
+        return summary
@@ -0,0 +1,60 @@
+"""
+최신 측정값 일괄 조회 서비스 구현체
+
+돌봄 대상 한 명의 집을 그리기 위해 디바이스/센서마다 /latest를 따로 호출하지 않도록,
+디바이스 목록과 센서 테이블별 최신 행을 동시에 조회하여 하나의 문서로 묶습니다.
+"""
+
+import asyncio
+from uuid import UUID
+from fastapi import HTTPException
+
+from app.interfaces.services.latest_readings_service_interface import ILatestReadingsService
+from app.interfaces.repositories.latest_readings_repository import ILatestReadingsRepository
+from app.infrastructure.device_latest import SOURCE_SENSOR_TYPES
+from app.infrastructure.read_cache import cached
+from app.api.v1.schemas import DeviceLatestReadings, LatestReading, UserLatestReadingsResponse
+
+
+class LatestReadingsService(ILatestReadingsService):
+    """최신 측정값 일괄 조회 서비스 구현체"""
+
+    def __init__(self, latest_readings_repository: ILatestReadingsRepository):
+        self.latest_readings_repository = latest_readings_repository
+
+    @cached(
+        "users.latest_readings",
+        UserLatestReadingsResponse,
+        group=lambda user_id, **_: f"latest:{user_id}",
+        key=lambda user_id, **_: user_id
+    )
+    async def get_user_latest_readings(self, user_id: UUID) -> UserLatestReadingsResponse:
+        try:
+            devices, rows = await asyncio.gather(
+                self.latest_readings_repository.get_user_devices(user_id),
+                self.latest_readings_repository.get_latest_rows(user_id)
+            )
+            if not devices and not await self.latest_readings_repository.user_exists(user_id):
+                raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"최신 측정값 조회 실패: {str(e)}")
+
+        entries = {
+            device["device_id"]: DeviceLatestReadings(
+                device_id=device["device_id"],
+                location_label=device["location_label"]
+            )
+            for device in devices
+        }
+        for row in rows:
+            entry = entries.get(row["device_id"])
+            sensor_type = SOURCE_SENSOR_TYPES.get(row["source_table"])
+            if entry is None or sensor_type is None:
+                continue
+            entry.readings.append(LatestReading(sensor_type=sensor_type, time=row["time"], data=row["payload"]))
+
+        for entry in entries.values():
+            entry.readings.sort(key=lambda reading: reading.sensor_type)
+        return UserLatestReadingsResponse(user_id=user_id, devices=list(entries.values()))
@@ -5,7 +5,7 @@ Clean Architecture 원칙에 따라 LoadCell 센서 데이터에 대한 비즈
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 
 from app.interfaces.services.sensor_service_interface import ILoadCellService
@@ -15,6 +15,7 @@ from app.api.v1.schemas import (
     SensorRawLoadCellUpdate,
     SensorRawLoadCellResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class LoadCellService(ILoadCellService):
@@ -70,8 +71,9 @@ class LoadCellService(ILoadCellService):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
-    ) -> List[SensorRawLoadCellResponse]:
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """로드셀 센서 데이터 목록 조회"""
         try:
             # 비즈니스 로직 검증
@@ -85,7 +87,8 @@ class LoadCellService(ILoadCellService):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit_count=limit
+                limit_count=limit,
+                cursor=cursor
             )
             return data_list
             
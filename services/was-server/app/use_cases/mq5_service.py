@@ -5,7 +5,7 @@ Clean Architecture 원칙에 따라 MQ5 가스 센서 데이터에 대한 비즈
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 
 from app.interfaces.services.sensor_service_interface import IMQ5Service
@@ -15,6 +15,7 @@ from app.api.v1.schemas import (
     SensorRawMQ5Update,
     SensorRawMQ5Response
 )
+from app.interfaces.pagination import Cursor
 
 
 class MQ5Service(IMQ5Service):
@@ -70,8 +71,9 @@ class MQ5Service(IMQ5Service):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
-    ) -> List[SensorRawMQ5Response]:
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """MQ5 가스 센서 데이터 목록 조회"""
         try:
             # 비즈니스 로직 검증 (기존 코드와 동일)
@@ -86,12 +88,12 @@ class MQ5Service(IMQ5Service):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit_count=limit
+                limit_count=limit,
+                cursor=cursor
             )
             
-            # 리포지토리에서 이미 Pydantic 모델 리스트를 반환하므로, 추가 변환 없이 바로 반환
+            # 리포지토리에서 이미 응답 필드 딕셔너리 목록을 반환하므로, 추가 변환 없이 바로 반환
             return data_list
-            # return [SensorRawMQ5Response.model_validate(o) for o in data_list]
                 
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
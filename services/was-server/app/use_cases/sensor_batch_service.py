@@ -0,0 +1,194 @@
+"""
+센서 배치 수집 서비스 구현체
+
+센서/엣지/액추에이터 데이터 배열을 항목별로 검증한 뒤 유효한 행만 한 번에 적재합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+
+from app.interfaces.services.sensor_batch_service_interface import ISensorBatchService
+from app.interfaces.repositories.bulk_insert_repository import IBulkInsertRepository
+from app.infrastructure.device_registry import device_registry
+from app.infrastructure.read_cache import read_cache
+from app.api.v1.schemas import BatchCreateResponse, BatchItemResult
+
+
+# 한 요청에서 허용하는 최대 항목 수
+MAX_BATCH_SIZE = 5000
+
+# 멱등 적재 모드 (INSERT ... ON CONFLICT DO NOTHING / DO UPDATE)
+ON_CONFLICT_MODES = ("nothing", "update")
+
+
+async def persist_accepted(
+    bulk_insert_repository: IBulkInsertRepository,
+    model: Type[Any],
+    accepted: List[Tuple[BatchItemResult, Dict[str, Any]]],
+    on_conflict: Optional[str] = "nothing"
+):
+    """검증을 통과한 행을 적재하고 항목별 결과 상태를 갱신
+
+    기본값은 ON CONFLICT DO NOTHING 멱등 적재이며, 이미 존재하는 행이 오류 대신 duplicate(update 모드는 updated)로 표시됩니다.
+    on_conflict=None은 일반 다중 행 INSERT로 기록합니다 (중복 키 하나가 유효 항목 전체를 실패시킴).
+    """
+    if not accepted:
+        return
+
+    rows = [row for _, row in accepted]
+    try:
+        if on_conflict is None:
+            await bulk_insert_repository.insert_many(model, rows)
+        else:
+            outcomes = await bulk_insert_repository.upsert_many(model, rows, on_conflict)
+    except Exception as e:
+        # 다중 행 INSERT는 하나의 문장이므로 실패 시 유효 항목 전체를 실패로 표시
+        for result, _ in accepted:
+            result.status = "failed"
+            result.detail = f"데이터 적재 실패: {str(e)}"
+        return
+
+    # 적재된 디바이스 소유자의 최신 측정값 캐시 무효화
+    await read_cache.invalidate_devices(row.get("device_id") for row in rows)
+    if on_conflict is None:
+        return
+
+    for (result, _), inserted in zip(accepted, outcomes):
+        if inserted is None:
+            result.status = "duplicate"
+            result.detail = "이미 적재된 (time, device_id) 항목입니다"
+        elif not inserted:
+            result.status = "updated"
+
+
+def resolve_device(result: BatchItemResult) -> bool:
+    """디바이스 레지스트리로 디바이스를 확인하고 사용자/위치 컨텍스트를 결과에 기록
+
+    미등록 디바이스 한 건이 외래 키 위반으로 다중 행 INSERT 전체를 실패시키지 않도록
+    적재 전에 invalid로 표시합니다. 레지스트리가 적재되지 않았으면 검증을 건너뜁니다.
+    다른 워커에서 방금 등록된 디바이스를 거부하지 않도록 호출 전에 `device_registry.resolve_missing`으로
+    캐시에 없는 디바이스를 조회해 두어야 합니다.
+    """
+    if not device_registry.loaded:
+        return True
+    context = device_registry.get(result.device_id)
+    if context is None:
+        result.status = "invalid"
+        result.detail = f"등록되지 않은 디바이스입니다: {result.device_id}"
+        return False
+    result.user_id = context.user_id
+    result.location = context.location
+    result.role = context.role
+    return True
+
+
+def summarize_results(results: List[BatchItemResult]) -> Dict[str, int]:
+    """항목별 결과 상태 집계"""
+    counts = {"created": 0, "updated": 0, "duplicates": 0, "failed": 0}
+    for result in results:
+        if result.status == "created":
+            counts["created"] += 1
+        elif result.status == "updated":
+            counts["updated"] += 1
+        elif result.status == "duplicate":
+            counts["duplicates"] += 1
+        else:
+            counts["failed"] += 1
+    return counts
+
+
+class SensorBatchService(ISensorBatchService):
+    """센서 배치 수집 서비스 구현체"""
+
+    def __init__(
+        self,
+        bulk_insert_repository: IBulkInsertRepository,
+        model: Type[Any],
+        create_schema: Type[BaseModel]
+    ):
+        self.bulk_insert_repository = bulk_insert_repository
+        self.model = model
+        self.create_schema = create_schema
+
+    def _validate(self, items: List[Dict[str, Any]]):
+        """항목별 스키마 검증 및 배치 내 중복 키 검출"""
+        results: List[BatchItemResult] = []
+        accepted: List[tuple] = []
+        seen_keys = set()
+
+        for index, item in enumerate(items):
+            try:
+                data = self.create_schema.parse_obj(item)
+            except ValidationError as e:
+                results.append(BatchItemResult(
+                    index=index,
+                    status="invalid",
+                    device_id=item.get("device_id") if isinstance(item, dict) else None,
+                    detail=str(e)
+                ))
+                continue
+
+            # 동일 (time, device_id) 키가 한 배치에 두 번 오면 INSERT 전체가 실패하므로 미리 제외
+            key = (data.time, data.device_id)
+            if key in seen_keys:
+                results.append(BatchItemResult(
+                    index=index,
+                    status="duplicate",
+                    device_id=data.device_id,
+                    time=data.time,
+                    detail="배치 내에 동일한 (time, device_id) 항목이 있습니다"
+                ))
+                continue
+            seen_keys.add(key)
+
+            result = BatchItemResult(index=index, status="created", device_id=data.device_id, time=data.time)
+            results.append(result)
+            if resolve_device(result):
+                accepted.append((result, data.dict()))
+
+        return results, accepted
+
+    async def create_batch(
+        self, items: List[Dict[str, Any]], on_conflict: Optional[str] = "nothing"
+    ) -> BatchCreateResponse:
+        """센서 데이터 배치 생성"""
+        if len(items) > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 적재할 수 있는 항목은 최대 {MAX_BATCH_SIZE}개입니다"
+            )
+        if on_conflict is not None and on_conflict not in ON_CONFLICT_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"on_conflict는 {', '.join(ON_CONFLICT_MODES)} 중 하나여야 합니다"
+            )
+
+        await device_registry.resolve_missing(item.get("device_id") for item in items if isinstance(item, dict))
+        results, accepted = self._validate(items)
+        await persist_accepted(self.bulk_insert_repository, self.model, accepted, on_conflict)
+
+        return BatchCreateResponse(total=len(items), results=results, **summarize_results(results))
+
+    async def create_one(self, data: BaseModel) -> Tuple[BatchItemResult, Optional[Dict[str, Any]]]:
+        """센서 데이터 단건 멱등 생성 (/create)
+
+        디바이스가 응답을 받지 못해 같은 행을 재전송해도 기본 키 충돌 오류 대신 duplicate로 보고합니다.
+        생성된 경우 RETURNING으로 돌려받은 저장된 행을 함께 반환합니다.
+        """
+        await device_registry.resolve_missing([data.device_id])
+        result = BatchItemResult(index=0, status="created", device_id=data.device_id, time=data.time)
+        if not resolve_device(result):
+            raise HTTPException(status_code=400, detail=result.detail)
+
+        try:
+            stored = await self.bulk_insert_repository.insert_returning(self.model, data.dict())
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"데이터 적재 실패: {str(e)}")
+
+        # 적재된 디바이스 소유자의 최신 측정값 캐시 무효화
+        await read_cache.invalidate_devices([data.device_id])
+        if stored is None:
+            result.status = "duplicate"
+            result.detail = "이미 적재된 (time, device_id) 항목입니다"
+        return result, stored
@@ -0,0 +1,266 @@
+"""
+시간 버킷 다운샘플링 서비스 구현체
+
+대시보드가 긴 기간을 그릴 수 있도록 측정값을 DB에서 시간 버킷으로 집계하고,
+points 모드에서는 LTTB(Largest-Triangle-Three-Buckets)로 모양을 유지하며 포인트 수를 줄입니다.
+
+버킷 간격이 1시간(1일) 이상이면 롤업 워터마크 이전 구간은 시간(일) 단위 롤업에서 읽고,
+롤업 경계에 걸치는 앞뒤 구간과 워터마크 이후 구간만 원시 테이블에서 집계합니다.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import HTTPException
+
+from app.interfaces.services.sensor_bucket_service_interface import ISensorBucketService
+from app.interfaces.repositories.sensor_bucket_repository import ISensorBucketRepository
+from app.interfaces.repositories.sensor_rollup_repository import ISensorRollupRepository
+from app.infrastructure.sensor_registry import SensorTypeSpec
+from app.api.v1.schemas import SensorBucket, SensorBucketResponse, SensorPoint
+
+
+# 지원하는 버킷 간격
+BUCKET_INTERVALS = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+
+# 한 요청에서 허용하는 최대 버킷 수 (더 긴 기간은 큰 간격이나 points 모드 사용)
+MAX_BUCKETS = 10000
+
+# points 모드에서 LTTB 입력으로 집계할 버킷 수 (목표 포인트 수 대비 배수)
+LTTB_OVERSAMPLING = 8
+
+# points 모드의 최소 버킷 간격
+MIN_LTTB_WIDTH = timedelta(seconds=1)
+
+# 롤업 계층 (버킷 간격이 계층 단위의 배수일 때 사용, 큰 계층부터)
+ROLLUP_TIER_UNITS = [
+    ("daily", timedelta(days=1)),
+    ("hourly", timedelta(hours=1)),
+]
+
+# 원시 구간 끝(포함)을 롤업 구간 시작과 겹치지 않게 당기는 간격
+RAW_END_EPSILON = timedelta(microseconds=1)
+
+
+def select_rollup_tier(width: timedelta) -> Optional[Tuple[str, timedelta]]:
+    """버킷 간격으로 롤업 계층 선택 (1시간 미만이거나 배수가 아니면 None)"""
+    for tier, unit in ROLLUP_TIER_UNITS:
+        if width >= unit and width % unit == timedelta(0):
+            return tier, unit
+    return None
+
+
+def merge_buckets(buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """같은 시각의 버킷(원시/롤업 구간 경계)을 합쳐 시간순으로 반환"""
+    merged: Dict[datetime, Dict[str, Any]] = {}
+    for bucket in buckets:
+        current = merged.get(bucket["time"])
+        if current is None:
+            merged[bucket["time"]] = dict(bucket)
+            continue
+        count = current["count"] + bucket["count"]
+        values = [item for item in (current, bucket) if item["avg"] is not None]
+        current["min"] = min((item["min"] for item in values), default=None)
+        current["max"] = max((item["max"] for item in values), default=None)
+        weight = sum(item["count"] for item in values)
+        current["avg"] = sum(item["avg"] * item["count"] for item in values) / weight if weight else None
+        current["count"] = count
+    return [merged[time] for time in sorted(merged)]
+
+
+def as_utc(value: datetime) -> datetime:
+    """naive 값은 UTC로 간주하여 aware 값으로 정규화"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def ceil_time(value: datetime, unit: timedelta) -> datetime:
+    """epoch 기준 unit 경계로 올림"""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    remainder = (value - epoch) % unit
+    return value if remainder == timedelta(0) else value + (unit - remainder)
+
+
+def floor_time(value: datetime, unit: timedelta) -> datetime:
+    """epoch 기준 unit 경계로 내림"""
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return value - (value - epoch) % unit
+
+
+def lttb(points: List[Tuple[datetime, float]], threshold: int) -> List[Tuple[datetime, float]]:
+    """Largest-Triangle-Three-Buckets 다운샘플링
+
+    첫/마지막 포인트를 유지하고, 나머지를 threshold-2개 구간으로 나누어 구간마다
+    직전 선택 포인트와 다음 구간 평균점으로 만든 삼각형의 넓이가 가장 큰 포인트를 고릅니다.
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(points)
+
+    xs = [time.timestamp() for time, _ in points]
+    sampled = [points[0]]
+    every = (count - 2) / (threshold - 2)
+    selected = 0
+
+    for i in range(threshold - 2):
+        # 다음 구간 평균점
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, count)
+        avg_x = sum(xs[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(value for _, value in points[avg_start:avg_end]) / (avg_end - avg_start)
+
+        # 현재 구간에서 삼각형 넓이가 가장 큰 포인트 선택
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        selected_x, selected_y = xs[selected], points[selected][1]
+        max_area = -1.0
+        next_selected = range_start
+        for j in range(range_start, range_end):
+            area = abs(
+                (selected_x - avg_x) * (points[j][1] - selected_y)
+                - (selected_x - xs[j]) * (avg_y - selected_y)
+            )
+            if area > max_area:
+                max_area = area
+                next_selected = j
+
+        sampled.append(points[next_selected])
+        selected = next_selected
+
+    sampled.append(points[-1])
+    return sampled
+
+
+class SensorBucketService(ISensorBucketService):
+    """시간 버킷 다운샘플링 서비스 구현체"""
+
+    def __init__(
+        self,
+        sensor_bucket_repository: ISensorBucketRepository,
+        spec: SensorTypeSpec,
+        sensor_rollup_repository: Optional[ISensorRollupRepository] = None
+    ):
+        self.sensor_bucket_repository = sensor_bucket_repository
+        self.spec = spec
+        self.sensor_rollup_repository = sensor_rollup_repository
+
+    def _resolve_field(self, field: Optional[str]) -> str:
+        """요청 필드 검증 (미지정 시 센서 기본 필드)"""
+        if not self.spec.value_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{self.spec.sensor_type} 센서는 집계할 숫자 측정값이 없습니다"
+            )
+        if field is None:
+            return self.spec.default_value_field
+        if field not in self.spec.value_fields:
+            raise HTTPException(
+                status_code=400,
+                detail=f"지원하지 않는 field입니다: {field} (지원: {', '.join(self.spec.value_fields)})"
+            )
+        return field
+
+    async def _query_buckets(
+        self,
+        field: str,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        width: timedelta
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """롤업 계층을 자동 선택하여 버킷 조회 (버킷 목록, 사용한 계층)"""
+        selected = select_rollup_tier(width) if self.sensor_rollup_repository is not None else None
+        watermark = None
+        if selected is not None:
+            watermark = await self.sensor_rollup_repository.get_watermark(self.spec.sensor_type)
+        if watermark is None:
+            buckets = await self.sensor_bucket_repository.get_buckets(
+                self.spec.model, field, device_id, start_time, end_time, width
+            )
+            return buckets, "raw"
+
+        # 롤업 구간: 계층 단위로 정렬되고 워터마크 이전인 [rollup_start, rollup_end)
+        tier, unit = selected
+        start, end = as_utc(start_time), as_utc(end_time)
+        rollup_start = ceil_time(start, unit)
+        rollup_end = floor_time(min(end, as_utc(watermark)), unit)
+        if rollup_start >= rollup_end:
+            buckets = await self.sensor_bucket_repository.get_buckets(
+                self.spec.model, field, device_id, start_time, end_time, width
+            )
+            return buckets, "raw"
+
+        buckets = await self.sensor_rollup_repository.get_buckets(
+            tier, self.spec.sensor_type, field, device_id, rollup_start, rollup_end, width
+        )
+        # 롤업 경계에 걸친 앞/뒤 구간은 원시 테이블에서 집계
+        if start < rollup_start:
+            buckets += await self.sensor_bucket_repository.get_buckets(
+                self.spec.model, field, device_id, start, rollup_start - RAW_END_EPSILON, width
+            )
+        if rollup_end <= end:
+            buckets += await self.sensor_bucket_repository.get_buckets(
+                self.spec.model, field, device_id, rollup_end, end, width
+            )
+        return merge_buckets(buckets), tier
+
+    async def get_buckets(
+        self,
+        device_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        interval: str = "5m",
+        field: Optional[str] = None,
+        points: Optional[int] = None
+    ) -> SensorBucketResponse:
+        field = self._resolve_field(field)
+        if end_time <= start_time:
+            raise HTTPException(status_code=400, detail="end_time은 start_time보다 이후여야 합니다")
+
+        span = end_time - start_time
+        if points is not None:
+            # LTTB 입력은 원시 행 대신 목표 포인트 수의 배수만큼의 버킷 평균
+            width = max(span / (points * LTTB_OVERSAMPLING), MIN_LTTB_WIDTH)
+            # 긴 기간은 간격을 롤업 계층 단위로 맞춰 롤업에서 읽도록 함
+            for _, unit in ROLLUP_TIER_UNITS:
+                if width >= unit:
+                    width = unit * int(width / unit)
+                    break
+        else:
+            if interval not in BUCKET_INTERVALS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"지원하지 않는 interval입니다: {interval} (지원: {', '.join(BUCKET_INTERVALS)})"
+                )
+            width = BUCKET_INTERVALS[interval]
+            if span / width > MAX_BUCKETS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"버킷 수가 {MAX_BUCKETS}개를 초과합니다. 더 큰 interval이나 points를 사용하세요"
+                )
+
+        try:
+            buckets, tier = await self._query_buckets(field, device_id, start_time, end_time, width)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"버킷 집계 조회 실패: {str(e)}")
+
+        response = SensorBucketResponse(
+            sensor_type=self.spec.sensor_type,
+            device_id=device_id,
+            field=field,
+            interval=None if points is not None else interval,
+            start_time=start_time,
+            end_time=end_time,
+            tier=tier
+        )
+        if points is None:
+            response.buckets = [SensorBucket(**bucket) for bucket in buckets]
+            return response
+
+        series = [(bucket["time"], bucket["avg"]) for bucket in buckets if bucket["avg"] is not None]
+        response.points = [SensorPoint(time=time, value=value) for time, value in lttb(series, points)]
+        return response
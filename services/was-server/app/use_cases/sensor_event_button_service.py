@@ -7,6 +7,8 @@ from app.api.v1.schemas import (
     SensorEventButtonCreate, SensorEventButtonUpdate,
     SensorEventButtonResponse, SensorEventButtonListResponse
 )
+from app.infrastructure.pagination import next_cursor
+from app.interfaces.pagination import Cursor
 
 
 class SensorEventButtonService(ISensorEventButtonService):
@@ -97,10 +99,10 @@ class SensorEventButtonService(ISensorEventButtonService):
         return await self.button_event_repository.delete_button_event(time, device_id)
     
     async def get_all_button_events(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> SensorEventButtonListResponse:
         """전체 버튼 이벤트 목록 조회 (페이지네이션)"""
-        events = await self.button_event_repository.get_all_button_events(skip, limit)
+        events = await self.button_event_repository.get_all_button_events(skip, limit, cursor)
         total = len(events)  # 실제로는 전체 개수를 별도로 조회해야 함
         
         return SensorEventButtonListResponse(
@@ -108,7 +110,8 @@ class SensorEventButtonService(ISensorEventButtonService):
             total=total,
             page=skip // limit + 1 if limit > 0 else 1,
             size=limit,
-            pages=(total + limit - 1) // limit if limit > 0 else 1
+            pages=(total + limit - 1) // limit if limit > 0 else 1,
+            next_cursor=next_cursor(events, limit, "device_id")
         )
     
     async def get_crisis_events(
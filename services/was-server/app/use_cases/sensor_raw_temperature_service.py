@@ -7,6 +7,8 @@ from app.api.v1.schemas import (
     SensorRawTemperatureCreate, SensorRawTemperatureUpdate,
     SensorRawTemperatureResponse, SensorRawTemperatureListResponse
 )
+from app.infrastructure.pagination import next_cursor
+from app.interfaces.pagination import Cursor
 
 
 class SensorRawTemperatureService(ISensorRawTemperatureService):
@@ -96,10 +98,10 @@ class SensorRawTemperatureService(ISensorRawTemperatureService):
         return await self.temperature_repository.delete_temperature_data(time, device_id)
     
     async def get_all_temperature_data(
-        self, skip: int = 0, limit: int = 100
+        self, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
     ) -> SensorRawTemperatureListResponse:
         """전체 온도 데이터 목록 조회 (페이지네이션)"""
-        temperatures = await self.temperature_repository.get_all_temperature_data(skip, limit)
+        temperatures = await self.temperature_repository.get_all_temperature_data(skip, limit, cursor)
         total = len(temperatures)  # 실제로는 전체 개수를 별도로 조회해야 함
         
         return SensorRawTemperatureListResponse(
@@ -107,7 +109,8 @@ class SensorRawTemperatureService(ISensorRawTemperatureService):
             total=total,
             page=skip // limit + 1 if limit > 0 else 1,
             size=limit,
-            pages=(total + limit - 1) // limit if limit > 0 else 1
+            pages=(total + limit - 1) // limit if limit > 0 else 1,
+            next_cursor=next_cursor(temperatures, limit, "device_id")
         )
     
     async def get_average_temperature_by_device(
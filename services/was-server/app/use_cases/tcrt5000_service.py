@@ -5,7 +5,7 @@ Clean Architecture 원칙에 따라 TCRT5000 센서 데이터에 대한 비즈
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 
 from app.interfaces.services.sensor_service_interface import ITCRT5000Service
@@ -15,6 +15,7 @@ from app.api.v1.schemas import (
     SensorRawTCRT5000Update,
     SensorRawTCRT5000Response
 )
+from app.interfaces.pagination import Cursor
 
 
 class TCRT5000Service(ITCRT5000Service):
@@ -71,8 +72,9 @@ class TCRT5000Service(ITCRT5000Service):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
-    ) -> List[SensorRawTCRT5000Response]:
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """TCRT5000 센서 데이터 목록 조회"""
         try:
             # 비즈니스 로직 검증
@@ -86,7 +88,8 @@ class TCRT5000Service(ITCRT5000Service):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit_count=limit
+                limit_count=limit,
+                cursor=cursor
             )
             return data_list
             
@@ -146,6 +149,8 @@ class TCRT5000Service(ITCRT5000Service):
             stats = await self.tcrt5000_repository.get_statistics(device_id, start_time, end_time)
             return stats
             
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"TCRT5000 센서 통계 조회 실패: {str(e)}")
     
@@ -160,6 +165,8 @@ class TCRT5000Service(ITCRT5000Service):
             stats = await self.tcrt5000_repository.get_proximity_statistics(device_id, start_time, end_time)
             return stats
             
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"근접 감지 통계 조회 실패: {str(e)}")
     
@@ -5,7 +5,7 @@ Clean Architecture 원칙에 따라 Ultrasonic 센서 데이터에 대한 비즈
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 
 from app.interfaces.services.sensor_service_interface import IUltrasonicService
@@ -15,6 +15,7 @@ from app.api.v1.schemas import (
     SensorRawUltrasonicUpdate,
     SensorRawUltrasonicResponse
 )
+from app.interfaces.pagination import Cursor
 
 
 class UltrasonicService(IUltrasonicService):
@@ -71,8 +72,9 @@ class UltrasonicService(IUltrasonicService):
         device_id: Optional[str] = None,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
-        limit: int = 100
-    ) -> List[SensorRawUltrasonicResponse]:
+        limit: int = 100,
+        cursor: Optional[Cursor] = None
+    ) -> List[Dict[str, Any]]:
         """Ultrasonic 센서 데이터 목록 조회"""
         try:
             # 비즈니스 로직 검증
@@ -86,7 +88,8 @@ class UltrasonicService(IUltrasonicService):
                 device_id=device_id,
                 start_time=start_time,
                 end_time=end_time,
-                limit_count=limit
+                limit_count=limit,
+                cursor=cursor
             )
             return data_list
             
@@ -149,6 +152,8 @@ class UltrasonicService(IUltrasonicService):
             stats = await self.ultrasonic_repository.get_statistics(device_id, start_time, end_time)
             return stats
             
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Ultrasonic 센서 통계 조회 실패: {str(e)}")
     
@@ -163,6 +168,8 @@ class UltrasonicService(IUltrasonicService):
             stats = await self.ultrasonic_repository.get_distance_statistics(device_id, start_time, end_time)
             return stats
             
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"거리 측정 통계 조회 실패: {str(e)}")
     
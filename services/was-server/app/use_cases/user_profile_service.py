@@ -6,6 +6,7 @@ from app.domain.entities.user_profile import UserProfile
 from app.interfaces.services.user_profile_service_interface import IUserProfileService
 from app.interfaces.repositories.user_profile_repository import IUserProfileRepository
 from app.api.v1.schemas import UserProfileCreate, UserProfileUpdate, UserProfileResponse
+from app.infrastructure.read_cache import cached, read_cache
 
 
 class UserProfileService(IUserProfileService):
@@ -32,6 +33,7 @@ class UserProfileService(IUserProfileService):
         
         # 리포지토리를 통해 저장
         created_profile = await self.profile_repository.create_profile(profile)
+        await read_cache.invalidate(f"profiles:{user_id}")
         
         # 응답 스키마로 변환
         return UserProfileResponse(
@@ -47,6 +49,12 @@ class UserProfileService(IUserProfileService):
             updated_at=created_profile.updated_at
         )
     
+    @cached(
+        "user_profiles.get",
+        Optional[UserProfileResponse],
+        group=lambda user_id, **_: f"profiles:{user_id}",
+        key=lambda user_id, **_: user_id
+    )
     async def get_profile_by_user_id(self, user_id: UUID) -> Optional[UserProfileResponse]:
         """사용자 ID로 프로필을 조회합니다."""
         profile = await self.profile_repository.get_profile_by_user_id(user_id)
@@ -84,6 +92,7 @@ class UserProfileService(IUserProfileService):
         
         # 리포지토리를 통해 업데이트
         updated_profile = await self.profile_repository.update_profile(user_id, update_data)
+        await read_cache.invalidate(f"profiles:{user_id}")
         
         if updated_profile is None:
             return None
@@ -104,7 +113,9 @@ class UserProfileService(IUserProfileService):
     
     async def delete_profile(self, user_id: UUID) -> bool:
         """사용자 프로필을 삭제합니다."""
-        return await self.profile_repository.delete_profile(user_id)
+        deleted = await self.profile_repository.delete_profile(user_id)
+        await read_cache.invalidate(f"profiles:{user_id}")
+        return deleted
     
     async def get_profiles_by_gender(self, gender: str) -> List[UserProfileResponse]:
         """특정 성별의 프로필들을 조회합니다."""
@@ -6,6 +6,7 @@ from app.domain.entities.user_relationship import UserRelationship
 from app.interfaces.services.user_relationship_service_interface import IUserRelationshipService
 from app.interfaces.repositories.user_relationship_repository import IUserRelationshipRepository
 from app.api.v1.schemas import UserRelationshipCreate, UserRelationshipUpdate, UserRelationshipResponse
+from app.infrastructure.read_cache import cached, read_cache
 
 
 class UserRelationshipService(IUserRelationshipService):
@@ -29,6 +30,7 @@ class UserRelationshipService(IUserRelationshipService):
         
         # 리포지토리를 통해 저장
         created_relationship = await self.relationship_repository.create_relationship(relationship)
+        await read_cache.invalidate("relationships")
         
         # 응답 스키마로 변환
         return UserRelationshipResponse(
@@ -41,6 +43,12 @@ class UserRelationshipService(IUserRelationshipService):
             updated_at=created_relationship.updated_at
         )
     
+    @cached(
+        "user_relationships.get",
+        Optional[UserRelationshipResponse],
+        group=lambda **_: "relationships",
+        key=lambda relationship_id, **_: relationship_id
+    )
     async def get_relationship_by_id(self, relationship_id: UUID) -> Optional[UserRelationshipResponse]:
         """ID로 사용자 관계를 조회합니다."""
         relationship = await self.relationship_repository.get_relationship_by_id(relationship_id)
@@ -58,6 +66,12 @@ class UserRelationshipService(IUserRelationshipService):
             updated_at=relationship.updated_at
         )
     
+    @cached(
+        "user_relationships.by_user",
+        List[UserRelationshipResponse],
+        group=lambda **_: "relationships",
+        key=lambda user_id, as_subject, **_: [user_id, as_subject]
+    )
     async def get_relationships_by_user(self, user_id: UUID, as_subject: bool = True) -> List[UserRelationshipResponse]:
         """사용자와 관련된 관계들을 조회합니다."""
         relationships = await self.relationship_repository.get_relationships_by_user(user_id, as_subject)
@@ -95,6 +109,7 @@ class UserRelationshipService(IUserRelationshipService):
     async def update_relationship_status(self, relationship_id: UUID, status: str) -> Optional[UserRelationshipResponse]:
         """관계 상태를 업데이트합니다."""
         updated_relationship = await self.relationship_repository.update_relationship_status(relationship_id, status)
+        await read_cache.invalidate("relationships")
         
         if updated_relationship is None:
             return None
@@ -111,7 +126,9 @@ class UserRelationshipService(IUserRelationshipService):
     
     async def delete_relationship(self, relationship_id: UUID) -> bool:
         """사용자 관계를 삭제합니다."""
-        return await self.relationship_repository.delete_relationship(relationship_id)
+        deleted = await self.relationship_repository.delete_relationship(relationship_id)
+        await read_cache.invalidate("relationships")
+        return deleted
     
     async def get_all_relationships(self, skip: int = 0, limit: int = 100) -> List[UserRelationshipResponse]:
         """모든 사용자 관계를 조회합니다."""
@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from app.interfaces.services.user_service_interface import IUserService
 from app.interfaces.repositories.user_repository import IUserRepository
 from app.domain.entities.user import User
+from app.infrastructure.read_cache import read_cache
 
 
 class UserService(IUserService):
@@ -40,7 +41,9 @@ class UserService(IUserService):
         )
         
         # 리포지토리를 통한 사용자 생성
-        return await self.user_repository.create(user)
+        created_user = await self.user_repository.create(user)
+        await read_cache.invalidate("users")
+        return created_user
     
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """ID로 사용자 조회"""
@@ -92,7 +95,9 @@ class UserService(IUserService):
         if phone:
             update_data["phone_number"] = phone
         
-        return await self.user_repository.update(str(user_id), update_data)
+        updated_user = await self.user_repository.update(str(user_id), update_data)
+        await read_cache.invalidate("users")
+        return updated_user
     
     async def change_user_role(self, user_id: UUID, new_role: str) -> User:
         """사용자 역할 변경"""
@@ -108,7 +113,9 @@ class UserService(IUserService):
         existing_user.user_role = new_role
         
         # 리포지토리를 통한 업데이트
-        return await self.user_repository.update(str(user_id), {"user_role": new_role})
+        updated_user = await self.user_repository.update(str(user_id), {"user_role": new_role})
+        await read_cache.invalidate("users")
+        return updated_user
     
     async def delete_user(self, user_id: UUID) -> bool:
         """사용자 삭제"""
@@ -119,6 +126,7 @@ class UserService(IUserService):
         
         # 리포지토리를 통한 삭제
         await self.user_repository.delete(str(user_id))
+        await read_cache.invalidate("users")
         return True
     
     async def validate_user_permissions(self, user: User, required_role: str) -> bool:
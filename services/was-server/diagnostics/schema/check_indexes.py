@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+인덱스 진단 스크립트
+
+테이블별로 다음을 보고합니다.
+- 관리 인덱스 중 아직 생성되지 않은 인덱스 (maintenance/database/create_managed_indexes.py로 생성)
+- 통계 초기화 이후 한 번도 스캔되지 않은 인덱스 (기본 키/유니크 제외)
+- 행이 많은데 순차 스캔이 인덱스 스캔보다 많은 테이블
+- pg_stat_statements가 설치되어 있으면 테이블별 총 실행 시간 상위 쿼리
+"""
+
+import asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.managed_indexes import build_index_report
+
+# 테이블별로 보여줄 상위 쿼리 수
+TOP_STATEMENTS = 3
+
+EXISTING_INDEXES_SQL = """
+    SELECT tablename, indexname FROM pg_indexes WHERE schemaname = current_schema()
+"""
+
+INDEX_STATS_SQL = """
+    SELECT s.relname, s.indexrelname, s.idx_scan, i.indisprimary AS is_primary,
+           i.indisunique AS is_unique, pg_relation_size(s.indexrelid) AS size_bytes
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.schemaname = current_schema()
+"""
+
+TABLE_STATS_SQL = """
+    SELECT relname, seq_scan, idx_scan, n_live_tup
+    FROM pg_stat_user_tables
+    WHERE schemaname = current_schema()
+"""
+
+STATEMENTS_SQL = """
+    SELECT query, calls, total_exec_time, mean_exec_time
+    FROM pg_stat_statements
+    WHERE query ILIKE :pattern
+    ORDER BY total_exec_time DESC
+    LIMIT :limit
+"""
+
+
+async def fetch_rows(session, sql: str, **params) -> list:
+    result = await session.execute(text(sql), params)
+    return [dict(row) for row in result.mappings().all()]
+
+
+async def check_indexes():
+    """테이블별 인덱스 진단 결과를 출력합니다."""
+    async with AsyncSessionLocal() as session:
+        report = build_index_report(
+            await fetch_rows(session, EXISTING_INDEXES_SQL),
+            await fetch_rows(session, INDEX_STATS_SQL),
+            await fetch_rows(session, TABLE_STATS_SQL)
+        )
+
+        has_statements = bool(await fetch_rows(
+            session, "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"
+        ))
+        if not has_statements:
+            print("⚠️ pg_stat_statements 확장이 없어 쿼리 통계는 생략합니다.")
+
+        print("🔍 인덱스 진단 결과")
+        print("=" * 60)
+        for table_name in sorted(report):
+            entry = report[table_name]
+            print(f"\n📋 {table_name}")
+            for name in entry["missing"]:
+                print(f"  ❌ 누락된 관리 인덱스: {name}")
+            for unused in entry["unused"]:
+                label = " (관리 인덱스)" if unused["managed"] else ""
+                print(f"  ⚠️ 미사용 인덱스: {unused['index']}{label} - {unused['size_bytes'] / 1024:.1f} KB")
+            if entry["seq_scan_heavy"]:
+                print("  ⚠️ 순차 스캔이 인덱스 스캔보다 많습니다")
+            if has_statements:
+                statements = await fetch_rows(
+                    session, STATEMENTS_SQL, pattern=f"%{table_name}%", limit=TOP_STATEMENTS
+                )
+                for row in statements:
+                    query = " ".join(row["query"].split())[:120]
+                    print(
+                        f"  ⏱️ {row['total_exec_time']:.0f} ms / {row['calls']}회 "
+                        f"(평균 {row['mean_exec_time']:.1f} ms): {query}"
+                    )
+
+        if not report:
+            print("✅ 보고할 항목이 없습니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(check_indexes())
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+원시 센서 데이터 아카이브 스크립트
+
+ARCHIVE_HOT_DAYS보다 오래된 원시 센서 행을 테이블별로 ARCHIVE_DIR 아래 Parquet 파일(센서/일/디바이스)로 옮기고
+Postgres에서 삭제합니다. 주기 실행(cron 등)하며, 조회 API가 아카이브를 함께 읽도록 ARCHIVE_ENABLED=true로 설정합니다.
+(앱과 같은 ARCHIVE_DIR을 사용해야 합니다)
+"""
+
+import asyncio
+
+from app.infrastructure.archive_store import ARCHIVED_MODELS, archive_store
+from app.infrastructure.database import AsyncSessionLocal
+
+
+async def archive_raw_data():
+    """아카이브 대상 테이블의 오래된 행을 옮깁니다."""
+    for model in ARCHIVED_MODELS:
+        try:
+            moved = await archive_store.archive_model(AsyncSessionLocal, model)
+            print(f"✅ {model.__tablename__} 아카이브 완료 ({moved}행)")
+        except Exception as e:
+            print(f"❌ {model.__tablename__} 아카이브 중 오류: {e}")
+
+
+if __name__ == "__main__":
+    asyncio.run(archive_raw_data())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+디바이스 최신 측정값 테이블 생성 스크립트
+
+device_latest 테이블을 생성하고(이미 있으면 유지) 원본 테이블별 디바이스 최신 행으로 채웁니다.
+생성 후 LATEST_VALUES_ENABLED=true로 활성화합니다. 다시 실행하면 전체를 다시 백필합니다.
+"""
+
+import asyncio
+from sqlalchemy import text
+
+import app.main  # noqa: F401  (모듈 임포트 순서 보장)
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.device_latest import TRACKED_MODELS, refresh_statements
+
+DEVICE_LATEST_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS device_latest (
+        source_table VARCHAR(64) NOT NULL,
+        device_id VARCHAR(64) NOT NULL,
+        time TIMESTAMP WITH TIME ZONE NOT NULL,
+        payload JSONB NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE,
+        PRIMARY KEY (source_table, device_id)
+    )
+"""
+
+
+async def create_device_latest_table():
+    """device_latest 테이블을 생성하고 백필합니다."""
+    async with AsyncSessionLocal() as session:
+        try:
+            await session.execute(text(DEVICE_LATEST_TABLE_DDL))
+            for model in TRACKED_MODELS:
+                for statement in refresh_statements(model):
+                    await session.execute(statement)
+                print(f"  - {model.__tablename__} 백필 완료")
+            await session.commit()
+            print("✅ device_latest 테이블 생성 및 백필 완료!")
+        except Exception as e:
+            print(f"❌ device_latest 테이블 생성 중 오류: {e}")
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(create_device_latest_table())
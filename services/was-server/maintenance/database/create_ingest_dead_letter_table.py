@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+write-behind 수집 데드레터 테이블 생성 스크립트
+
+플러시에서 제약 조건 위반 등으로 거부된 행을 보관하는 ingest_dead_letter 테이블을 생성합니다. (이미 있으면 유지)
+INGEST_WRITE_BEHIND=true로 사용하기 전에 실행합니다.
+"""
+
+import asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database import AsyncSessionLocal
+
+DEAD_LETTER_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS ingest_dead_letter (
+        id BIGSERIAL PRIMARY KEY,
+        table_name VARCHAR(64) NOT NULL,
+        payload JSONB NOT NULL,
+        error TEXT NOT NULL,
+        failed_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )
+"""
+
+DEAD_LETTER_INDEX_DDL = """
+    CREATE INDEX IF NOT EXISTS ix_ingest_dead_letter_table_failed_at
+    ON ingest_dead_letter (table_name, failed_at)
+"""
+
+
+async def create_ingest_dead_letter_table():
+    """데드레터 테이블을 생성합니다."""
+    async with AsyncSessionLocal() as session:
+        try:
+            await session.execute(text(DEAD_LETTER_TABLE_DDL))
+            await session.execute(text(DEAD_LETTER_INDEX_DDL))
+            await session.commit()
+            print("✅ ingest_dead_letter 테이블 생성 완료!")
+        except Exception as e:
+            print(f"❌ 데드레터 테이블 생성 중 오류: {e}")
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(create_ingest_dead_letter_table())
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+시계열 테이블 관리 인덱스 생성 스크립트
+
+app/infrastructure/managed_indexes.py에 선언한 인덱스를 생성합니다. (이미 있으면 유지)
+적재를 막지 않도록 CREATE INDEX CONCURRENTLY로 만들며, 이 문장은 트랜잭션 안에서 실행할 수 없으므로
+AUTOCOMMIT 연결을 사용합니다. 중단되어 INVALID로 남은 인덱스는 삭제 후 다시 실행하세요.
+파티션 테이블은 CONCURRENTLY를 지원하지 않으므로 일반 CREATE INDEX로 만듭니다.
+(파티션에 같은 인덱스가 이미 있으면 새로 만들지 않고 연결됩니다)
+"""
+
+import asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database import async_engine
+from app.infrastructure.managed_indexes import MANAGED_INDEXES
+
+
+async def create_managed_indexes():
+    """관리 인덱스를 하나씩 생성합니다."""
+    async with async_engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        result = await connection.execute(text(
+            "SELECT c.relname FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid"
+        ))
+        partitioned = set(result.scalars().all())
+        for index in MANAGED_INDEXES:
+            try:
+                await connection.execute(text(index.ddl(concurrently=index.table_name not in partitioned)))
+                print(f"✅ {index.table_name}.{index.name} 인덱스 생성 완료")
+            except Exception as e:
+                print(f"❌ {index.table_name}.{index.name} 생성 중 오류: {e}")
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(create_managed_indexes())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+raw_payload 핫 키 생성 컬럼 생성 스크립트
+
+app/infrastructure/payload_columns.py에 선언한 키마다 STORED 생성 컬럼과 (device_id, 컬럼) 부분 인덱스를
+생성합니다. (이미 있으면 유지) 생성 후 PAYLOAD_COLUMNS_ENABLED=true로 활성화합니다.
+
+주의: STORED 생성 컬럼 추가는 테이블 전체를 다시 쓰며 그동안 테이블 잠금을 잡습니다.
+적재가 적은 시간에 실행하세요.
+"""
+
+import asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.payload_columns import PAYLOAD_COLUMNS
+
+
+async def create_payload_columns():
+    """생성 컬럼과 인덱스를 테이블별 트랜잭션으로 생성합니다."""
+    for item in PAYLOAD_COLUMNS:
+        async with AsyncSessionLocal() as session:
+            try:
+                await session.execute(text(item.column_ddl()))
+                await session.execute(text(item.index_ddl()))
+                await session.commit()
+                print(f"✅ {item.table_name}.{item.key} 생성 컬럼/인덱스 생성 완료")
+            except Exception as e:
+                print(f"❌ {item.table_name}.{item.key} 생성 중 오류: {e}")
+                await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(create_payload_columns())
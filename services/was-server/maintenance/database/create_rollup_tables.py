@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+센서 롤업 테이블 생성 스크립트
+
+시간/일 단위 롤업 테이블, 워터마크 테이블, 재계산 대기 시간 버킷 테이블을 생성합니다. (이미 있으면 유지)
+생성 후 ROLLUP_ENABLED=true로 롤업 작업을 활성화합니다.
+"""
+
+import asyncio
+from sqlalchemy import text
+
+from app.infrastructure.database import AsyncSessionLocal
+
+ROLLUP_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        sensor_type VARCHAR(64) NOT NULL,
+        field VARCHAR(64) NOT NULL,
+        device_id VARCHAR(64) NOT NULL,
+        bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+        value_count BIGINT NOT NULL,
+        value_min DOUBLE PRECISION,
+        value_max DOUBLE PRECISION,
+        value_sum DOUBLE PRECISION,
+        last_value DOUBLE PRECISION,
+        last_time TIMESTAMP WITH TIME ZONE,
+        PRIMARY KEY (sensor_type, field, device_id, bucket)
+    )
+"""
+
+WATERMARK_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS sensor_rollup_watermark (
+        sensor_type VARCHAR(64) PRIMARY KEY,
+        watermark TIMESTAMP WITH TIME ZONE NOT NULL,
+        updated_at TIMESTAMP WITH TIME ZONE
+    )
+"""
+
+DIRTY_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS sensor_rollup_dirty (
+        sensor_type VARCHAR(64) NOT NULL,
+        bucket TIMESTAMP WITH TIME ZONE NOT NULL,
+        PRIMARY KEY (sensor_type, bucket)
+    )
+"""
+
+
+async def create_rollup_tables():
+    """롤업 테이블들을 생성합니다."""
+    async with AsyncSessionLocal() as session:
+        try:
+            for table in ("sensor_rollup_hourly", "sensor_rollup_daily"):
+                await session.execute(text(ROLLUP_TABLE_DDL.format(table=table)))
+            await session.execute(text(WATERMARK_TABLE_DDL))
+            await session.execute(text(DIRTY_TABLE_DDL))
+            await session.commit()
+            print("✅ 센서 롤업 테이블 생성 완료!")
+        except Exception as e:
+            print(f"❌ 롤업 테이블 생성 중 오류: {e}")
+            await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(create_rollup_tables())
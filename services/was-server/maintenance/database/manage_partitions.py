@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+파티션 사전 생성/만료 처리 스크립트
+
+파티션으로 변환된 테이블마다 앞으로 PARTITION_PREMAKE개 주기의 파티션을 만들고,
+PARTITION_RETENTION_MONTHS가 지난 파티션을 PARTITION_EXPIRE_ACTION(detach/drop)에 따라 처리합니다.
+(ARCHIVE_ENABLED이면 원시 센서 테이블은 아카이브 워터마크 이전 파티션만 삭제하므로 같은 ARCHIVE_DIR로 실행합니다)
+파티션 생성/분리는 테이블 소유자 권한이 필요하므로 소유자 계정으로 주기 실행(cron 등)합니다.
+(앱 계정이 테이블을 소유하면 PARTITIONING_ENABLED=true로 앱 안에서 같은 작업을 실행할 수 있습니다)
+"""
+
+import asyncio
+
+from app.infrastructure.partition_manager import partition_manager
+
+
+async def manage_partitions():
+    """파티션 관리 작업을 1회 실행합니다."""
+    summary = await partition_manager.run_once()
+    for table_name, result in summary.items():
+        expired = ", ".join(result["expired"]) or "없음"
+        print(f"✅ {table_name}: 파티션 {result['created']}개 생성, 만료 처리: {expired}")
+    if partition_manager.failed_runs:
+        print(f"❌ {partition_manager.failed_runs}개 테이블 처리 실패 (로그 확인)")
+
+
+if __name__ == "__main__":
+    asyncio.run(manage_partitions())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+시계열 테이블 파티션 변환 스크립트
+
+원시/엣지/액추에이터/스냅샷 테이블을 time 기준 RANGE 파티션 테이블로 변환합니다. (이미 변환된 테이블은 건너뜀)
+테이블마다 한 트랜잭션에서 다음을 수행하며 기존 행은 다시 쓰지 않습니다.
+
+1. 기존 테이블을 <테이블>_legacy로, 인덱스를 <인덱스>_legacy로 이름 변경
+2. 같은 컬럼/기본 키/외래 키의 파티션 테이블 생성
+3. 기존 테이블을 `MINVALUE ~ 다음 주기 시작` 파티션으로 연결 (CHECK 제약으로 검증 스캔 1회)
+4. 현재 주기부터 PARTITION_PREMAKE개 주기 뒤까지 파티션 생성
+
+변환 중에는 테이블 잠금을 잡으므로 적재가 적은 시간에 실행하세요. 변환 후에는
+create_managed_indexes.py, create_payload_columns.py(사용 시)를 다시 실행해 부모 테이블에 인덱스를 만들고
+(기존 파티션의 같은 인덱스는 새로 만들지 않고 연결됩니다), grant_permissions_to_svc_app.sql을 다시 실행합니다.
+파티션 생성/만료는 테이블 소유자 권한이 필요하므로 manage_partitions.py를 같은 계정으로 주기 실행합니다.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.partition_manager import (
+    add_months, partition_manager, partitioned_tables, period_start
+)
+
+# 설정 가져오기
+settings = get_settings()
+
+
+def legacy_name(name: str) -> str:
+    """기존 테이블/인덱스의 변경 이름 (PostgreSQL 식별자 길이 63자 이내)"""
+    return f"{name[:56]}_legacy"
+
+
+def foreign_key_ddl(table) -> list:
+    """모델에 선언된 외래 키 생성 DDL"""
+    statements = []
+    for constraint in table.foreign_key_constraints:
+        columns = ", ".join(column.name for column in constraint.columns)
+        referred = constraint.elements[0].column.table.name
+        referred_columns = ", ".join(element.column.name for element in constraint.elements)
+        statements.append(
+            f"ALTER TABLE {table.name} ADD FOREIGN KEY ({columns}) REFERENCES {referred} ({referred_columns})"
+        )
+    return statements
+
+
+async def partition_table(session, table, now: datetime):
+    """테이블 하나를 파티션 테이블로 변환합니다."""
+    legacy = legacy_name(table.name)
+    bound = add_months(period_start(now, settings.PARTITION_INTERVAL_MONTHS), settings.PARTITION_INTERVAL_MONTHS)
+    key_columns = ", ".join(column.name for column in table.primary_key.columns)
+
+    result = await session.execute(
+        text("SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = :table_name"),
+        {"table_name": table.name}
+    )
+    index_names = result.scalars().all()
+
+    await session.execute(text(f"ALTER TABLE {table.name} RENAME TO {legacy}"))
+    for index_name in index_names:
+        await session.execute(text(f"ALTER INDEX {index_name} RENAME TO {legacy_name(index_name)}"))
+
+    await session.execute(text(
+        f"CREATE TABLE {table.name} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS) "
+        f"PARTITION BY RANGE (time)"
+    ))
+    await session.execute(text(f"ALTER TABLE {table.name} ADD CONSTRAINT {table.name}_pkey PRIMARY KEY ({key_columns})"))
+    for statement in foreign_key_ddl(table):
+        await session.execute(text(statement))
+
+    # CHECK 제약이 있으면 ATTACH 시 범위 검증 스캔을 다시 하지 않습니다.
+    await session.execute(text(
+        f"ALTER TABLE {legacy} ADD CONSTRAINT {legacy}_time_bound CHECK (time IS NOT NULL AND time < '{bound.isoformat()}')"
+    ))
+    await session.execute(text(
+        f"ALTER TABLE {table.name} ATTACH PARTITION {legacy} FOR VALUES FROM (MINVALUE) TO ('{bound.isoformat()}')"
+    ))
+    await session.execute(text(f"ALTER TABLE {legacy} DROP CONSTRAINT {legacy}_time_bound"))
+
+    return await partition_manager.create_partitions(session, table.name, now)
+
+
+async def partition_tables():
+    """대상 테이블들을 테이블별 트랜잭션으로 변환합니다."""
+    now = datetime.now(timezone.utc)
+    for table in partitioned_tables():
+        async with AsyncSessionLocal() as session:
+            try:
+                if await partition_manager.is_partitioned(session, table.name):
+                    print(f"⏭️ {table.name} 이미 파티션 테이블입니다")
+                    continue
+                created = await partition_table(session, table, now)
+                await session.commit()
+                print(f"✅ {table.name} 파티션 변환 완료 (새 파티션 {created}개)")
+            except Exception as e:
+                print(f"❌ {table.name} 변환 중 오류: {e}")
+                await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(partition_tables())
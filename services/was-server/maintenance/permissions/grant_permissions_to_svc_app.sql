@@ -36,6 +36,13 @@ GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE actuator_log_servo TO svc_app;
 GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE devices TO svc_app;
 GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE device_rtc_status TO svc_app;
 GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE alembic_version TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE sensor_rollup_hourly TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE sensor_rollup_daily TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE sensor_rollup_watermark TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE sensor_rollup_dirty TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE device_latest TO svc_app;
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE ingest_dead_letter TO svc_app;
+GRANT USAGE, SELECT ON SEQUENCE ingest_dead_letter_id_seq TO svc_app;
 
 -- 7. 권한 부여 확인
 SELECT 
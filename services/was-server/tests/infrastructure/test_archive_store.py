@@ -0,0 +1,111 @@
+"""
+원시 센서 데이터 Parquet 아카이브 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.archive_store import ArchiveRangeError, ArchiveStore, merge_rows
+from app.infrastructure.models import SensorRawMQ5
+
+UTC = timezone.utc
+
+
+def row(day: int, hour: int, device_id: str = "mq5_001", ppm: float = 1.0) -> dict:
+    return {"time": datetime(2025, 1, day, hour, tzinfo=UTC), "device_id": device_id, "raw_payload": {"ppm_value": ppm}}
+
+
+class RecordingSession:
+    """실행한 문장과 파라미터를 기록하는 세션"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, statement, params=None):
+        self.calls.append((statement, params))
+
+
+class TestArchiveStore:
+    """원시 센서 데이터 Parquet 아카이브 테스트 클래스"""
+
+    def test_merge_rows_is_idempotent(self):
+        """같은 (time, device_id) 행을 다시 옮겨도 중복되지 않고 새 값으로 교체"""
+        # Given
+        existing = [row(1, 2), row(1, 1)]
+
+        # When
+        merged = merge_rows(existing, [row(1, 2, ppm=9.0), row(1, 3)])
+
+        # Then
+        assert [item["time"].hour for item in merged] == [1, 2, 3]
+        assert merged[1]["raw_payload"] == {"ppm_value": 9.0}
+
+    def test_list_is_not_filled_outside_archived_range(self, tmp_path):
+        """워터마크 이후 구간만 조회하면 아카이브를 읽지 않음"""
+        # Given
+        store = ArchiveStore(str(tmp_path), enabled=True)
+        store.set_watermark(SensorRawMQ5.__tablename__, datetime(2025, 1, 1, tzinfo=UTC))
+
+        # When / Then
+        assert store.covers(SensorRawMQ5, datetime(2025, 1, 2)) is False
+        assert store.covers(SensorRawMQ5, datetime(2024, 12, 31)) is True
+        assert store.covers(SensorRawMQ5, None) is True
+        assert ArchiveStore(str(tmp_path), enabled=False).covers(SensorRawMQ5, None) is False
+
+    def test_parquet_round_trip_and_list_fill(self, tmp_path):
+        """센서/일/디바이스 파일에 기록한 행을 DB 목록 뒤에 시간 역순으로 이어서 채움"""
+        pytest.importorskip("pyarrow")
+
+        # Given
+        store = ArchiveStore(str(tmp_path), enabled=True)
+        store.write_day("sensor_raw_mq5", datetime(2025, 1, 1, tzinfo=UTC), [row(1, 1), row(1, 5, "mq5/002")])
+        store.write_day("sensor_raw_mq5", datetime(2025, 1, 2, tzinfo=UTC), [row(2, 3)])
+        store.set_watermark("sensor_raw_mq5", datetime(2025, 1, 3, tzinfo=UTC))
+        hot = [row(5, 0)]
+
+        # When
+        items = asyncio.run(store.fill_rows(SensorRawMQ5, hot, None, None, None, limit=3))
+
+        # Then
+        assert [(item["time"].day, item["time"].hour) for item in items] == [(5, 0), (2, 3), (1, 5)]
+        assert items[2]["device_id"] == "mq5/002"
+        assert items[1]["raw_payload"] == {"ppm_value": 1.0}
+
+    def test_stats_source_rejects_unbounded_archive_range(self, tmp_path):
+        """통계가 아카이브 구간에 걸치면 start_time 없이 또는 최대 일수를 넘겨 전체 아카이브를 적재하지 않음"""
+        # Given: 2025-01-03 이전이 아카이브된 저장소 (DB 세션은 사용되지 않아야 함)
+        store = ArchiveStore(str(tmp_path), enabled=True, stats_max_days=7)
+        store.set_watermark("sensor_raw_mq5", datetime(2025, 1, 3, tzinfo=UTC))
+
+        # When / Then
+        with pytest.raises(ArchiveRangeError):
+            asyncio.run(store.source(None, SensorRawMQ5, "mq5_001"))
+        with pytest.raises(ArchiveRangeError):
+            asyncio.run(store.source(None, SensorRawMQ5, "mq5_001", datetime(2024, 12, 1, tzinfo=UTC)))
+        # 아카이브 밖 구간은 제한 없이 원본 모델 그대로
+        assert asyncio.run(store.source(None, SensorRawMQ5, "mq5_001", datetime(2025, 1, 5, tzinfo=UTC))) is SensorRawMQ5
+
+    def test_stats_source_loads_archive_in_one_array_insert(self, tmp_path):
+        """아카이브 행은 JSON 문자열 그대로 임시 테이블에 INSERT 한 번으로 적재하고, 행 수 제한을 넘으면 거부"""
+        pytest.importorskip("pyarrow")
+
+        # Given: 2025-01-01에 2행이 아카이브된 저장소
+        store = ArchiveStore(str(tmp_path), enabled=True, stats_max_rows=2)
+        store.write_day("sensor_raw_mq5", datetime(2025, 1, 1, tzinfo=UTC), [row(1, 1), row(1, 2, ppm=2.0)])
+        store.set_watermark("sensor_raw_mq5", datetime(2025, 1, 2, tzinfo=UTC))
+        session = RecordingSession()
+
+        # When
+        asyncio.run(store.source(session, SensorRawMQ5, "mq5_001", datetime(2025, 1, 1, tzinfo=UTC)))
+
+        # Then: CREATE TEMPORARY TABLE + 배열 파라미터 INSERT 한 번
+        assert len(session.calls) == 2
+        statement, params = session.calls[1]
+        assert "unnest" in str(statement)
+        assert params["payloads"] == ['{"ppm_value": 2.0}', '{"ppm_value": 1.0}']
+        store.stats_max_rows = 1
+        with pytest.raises(ArchiveRangeError):
+            asyncio.run(store.source(session, SensorRawMQ5, "mq5_001", datetime(2025, 1, 1, tzinfo=UTC)))
@@ -0,0 +1,87 @@
+"""
+압축 수집 프레임 코덱 테스트
+
+msgpack 본문이 Pydantic 없이 테이블별 INSERT 행으로 변환되는지 검증합니다.
+"""
+
+from datetime import datetime, timezone
+
+import msgpack
+import pytest
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.compact_codec import COMPACT_CODES, CompactDecodeError, decode_frames, unpack_body
+from app.infrastructure.payload_columns import PAYLOAD_COLUMNS
+from app.infrastructure.sensor_registry import get_sensor_spec
+
+
+class TestCompactCodec:
+    """압축 수집 프레임 코덱 테스트 클래스"""
+
+    def test_decode_msgpack_into_insert_rows(self):
+        """센서 코드와 epoch 밀리초가 테이블 행으로 변환"""
+        # Given
+        body = msgpack.packb({
+            "d": ["user_MQ5_Gas_Sensor_1", "user_LM35_1"],
+            "f": [[0x01, 1700000000000, 0, 153.5], [0x06, 1700000000250, 1, 23.5]]
+        })
+
+        # When
+        groups, errors = decode_frames(unpack_body(body, "application/msgpack"))
+
+        # Then
+        assert errors == []
+        _, indexes, rows = groups["mq5"]
+        assert indexes == [0]
+        assert rows[0]["time"] == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+        assert rows[0]["device_id"] == "user_MQ5_Gas_Sensor_1"
+        assert rows[0]["raw_payload"] == {"gas_level": 153.5}
+        # 테이블 컬럼에 해당하는 값은 컬럼으로 기록
+        assert groups["sensor-raw-temperatures"][2][0]["temperature_celsius"] == 23.5
+
+    def test_rfid_in_and_out_share_table(self):
+        """RFID_Out(0x03)와 RFID_In(0x13)은 같은 테이블에 위치만 다르게 기록"""
+        # Given
+        document = {"d": ["rfid_1"], "f": [[0x03, 1, 0, 42], [0x13, 2, 0, 42]]}
+
+        # When
+        groups, _ = decode_frames(document)
+
+        # Then
+        locations = [row["raw_payload"]["reader_location"] for row in groups["rfid"][2]]
+        assert locations == ["main_entrance_out", "main_entrance_in"]
+
+    def test_invalid_frames_are_reported_by_index(self):
+        """알 수 없는 코드와 잘못된 디바이스 인덱스는 프레임 단위로 거부"""
+        # Given
+        document = {"d": ["dev"], "f": [[0x0A, 1, 0], [0x01, 1, 5, 1.0], [0x01, 1, 0, 1.0]]}
+
+        # When
+        groups, errors = decode_frames(document)
+
+        # Then
+        assert [index for index, _ in errors] == [0, 1]
+        assert groups["mq5"][1] == [2]
+
+    def test_malformed_document_raises(self):
+        """프레임 목록이 없으면 본문 전체를 거부"""
+        # Given / When / Then
+        with pytest.raises(CompactDecodeError):
+            decode_frames({"d": []})
+
+    def test_every_field_is_column_or_known_payload_key(self):
+        """모든 코드 필드는 테이블 컬럼이거나 레지스트리/응답 스키마가 읽는 raw_payload 키"""
+        # Given
+        payload_keys = {(item.table_name, item.key) for item in PAYLOAD_COLUMNS}
+
+        # When
+        unknown = []
+        for entry in COMPACT_CODES.values():
+            spec = get_sensor_spec(entry.sensor_type)
+            columns = spec.model.__table__.columns.keys()
+            for name in entry.fields:
+                if name not in columns and name not in spec.value_fields and (spec.table_name, name) not in payload_keys:
+                    unknown.append((entry.code, name))
+
+        # Then
+        assert unknown == []
@@ -0,0 +1,109 @@
+"""
+디바이스 최신 측정값 저장소 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.device_latest import build_instance, latest_entries, row_payload
+from app.infrastructure.models import ActuatorLogRelay, SensorRawDHT, SensorRawMQ5
+from app.infrastructure.repositories.latest_readings_repository import LatestReadingsRepository
+
+NOW = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+class StubLatestReadingsRepository(LatestReadingsRepository):
+    """device_latest 조회 결과와 원본 테이블 조회 결과를 고정한 리포지토리"""
+
+    def __init__(self, latest, devices, untracked_tables, source_rows):
+        super().__init__(session_factory=None)
+        self.latest = latest
+        self.devices = devices
+        self.untracked_tables = untracked_tables
+        self.source_rows = source_rows
+        self.source_calls = []
+
+    async def _fetch(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        if "tracked_tables" in sql:
+            return [{"source_table": name} for name in self.untracked_tables]
+        if sql.startswith("SELECT devices.device_id"):
+            return [{"device_id": device_id} for device_id in self.devices]
+        return [dict(row) for row in self.latest]
+
+    async def _fetch_from_sources(self, models, device_ids):
+        tables = {model.__tablename__ for model in models}
+        self.source_calls.append((sorted(tables), device_ids if isinstance(device_ids, list) else "user"))
+        return [row for row in self.source_rows if row["source_table"] in tables]
+
+
+class TestDeviceLatest:
+    """디바이스 최신 측정값 저장소 테스트 클래스"""
+
+    def test_latest_entries_keep_newest_row_per_device(self):
+        """한 배치에서 디바이스별 가장 최근 행만 남김"""
+        # Given: r1 두 행(순서 뒤섞임), r2 한 행
+        rows = [
+            {"time": datetime(2025, 1, 1, 2), "device_id": "r1", "state": "off"},
+            {"time": datetime(2025, 1, 1, 1), "device_id": "r1", "state": "on"},
+            {"time": datetime(2025, 1, 1, 0), "device_id": "r2", "state": "on"},
+        ]
+
+        # When
+        entries = {entry["device_id"]: entry for entry in latest_entries(ActuatorLogRelay.__table__, rows, NOW)}
+
+        # Then: naive 시각은 UTC로 기록하고 빠진 컬럼은 기본값으로 채움
+        assert set(entries) == {"r1", "r2"}
+        assert entries["r1"]["time"] == datetime(2025, 1, 1, 2, tzinfo=timezone.utc)
+        assert entries["r1"]["payload"]["state"] == "off"
+        assert entries["r1"]["payload"]["channel"] == 1
+
+    def test_payload_round_trip(self):
+        """payload로 원본 모델 인스턴스를 같은 타입으로 복원"""
+        # Given
+        row = {
+            "time": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "device_id": "dht_001",
+            "temperature": Decimal("21.50"),
+            "raw_payload": {"humidity": 40},
+        }
+
+        # When
+        instance = build_instance(SensorRawDHT, row_payload(SensorRawDHT.__table__, row))
+
+        # Then
+        assert instance.time == row["time"]
+        assert instance.temperature == Decimal("21.5")
+        assert instance.humidity is None
+        assert instance.raw_payload == {"humidity": 40}
+
+    def test_latest_rows_fall_back_for_untracked_devices_and_tables(self, monkeypatch):
+        """device_latest에 없는 디바이스와 테이블만 원본 테이블에서 보충"""
+        # Given: mq5_001만 device_latest에 있고, mq5_002는 백필 전, DHT 테이블은 항목 없음
+        monkeypatch.setattr("app.infrastructure.repositories.latest_readings_repository.device_latest_store.enabled", True)
+        mq5, dht = SensorRawMQ5.__tablename__, SensorRawDHT.__tablename__
+        repository = StubLatestReadingsRepository(
+            latest=[{"source_table": mq5, "device_id": "mq5_001", "time": NOW, "payload": {}}],
+            devices=["mq5_001", "mq5_002"],
+            untracked_tables=[dht],
+            source_rows=[
+                {"source_table": mq5, "device_id": "mq5_001", "time": NOW, "payload": {}},
+                {"source_table": mq5, "device_id": "mq5_002", "time": NOW, "payload": {}},
+                {"source_table": dht, "device_id": "mq5_001", "time": NOW, "payload": {}},
+            ]
+        )
+
+        # When
+        rows = asyncio.run(repository.get_latest_rows(uuid4()))
+
+        # Then: 미추적 디바이스는 전체 테이블, 미추적 테이블은 사용자 디바이스 전체, 중복 없이 병합
+        assert ([dht], "user") in repository.source_calls
+        assert any(device_ids == ["mq5_002"] for _, device_ids in repository.source_calls)
+        assert sorted((row["source_table"], row["device_id"]) for row in rows) == sorted([
+            (mq5, "mq5_001"), (mq5, "mq5_002"), (dht, "mq5_001")
+        ])
@@ -0,0 +1,99 @@
+"""
+디바이스 레지스트리 캐시 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.api.v1.schemas import BatchItemResult
+from app.infrastructure.device_registry import DeviceRegistryCache, parse_location_label
+from app.use_cases.sensor_batch_service import resolve_device
+
+
+class TestDeviceRegistry:
+    """디바이스 레지스트리 캐시 테스트 클래스"""
+
+    @pytest.fixture
+    def registry(self):
+        return DeviceRegistryCache(session_factory=None, refresh_interval_sec=0)
+
+    def test_parse_location_label(self):
+        """`위치 - 센서 이름` 형식 분리"""
+        assert parse_location_label("Kitchen - 무게 센서 로드셀") == ("Kitchen", "무게 센서 로드셀")
+        assert parse_location_label("Living Room") == ("Living Room", None)
+        assert parse_location_label(None) == (None, None)
+
+    def test_put_get_invalidate(self, registry):
+        """생성/수정 시 갱신, 삭제 시 제거"""
+        # Given: 등록된 디바이스
+        registry.put("dev-1", "user-1", "Bedroom - LM35 온도센서")
+
+        # When / Then: DB 조회 없이 컨텍스트 반환
+        context = registry.get("dev-1")
+        assert (context.user_id, context.location, context.role) == ("user-1", "Bedroom", "LM35 온도센서")
+
+        registry.put("dev-1", None, "Kitchen - LM35 온도센서")
+        assert registry.get("dev-1").location == "Kitchen"
+        assert registry.get("dev-1").user_id is None
+
+        registry.invalidate("dev-1")
+        assert registry.get("dev-1") is None
+        assert registry.stats()["misses"] == 1
+
+    def test_resolve_device_skips_when_not_loaded(self, monkeypatch, registry):
+        """레지스트리가 적재되지 않았으면 검증을 건너뜀"""
+        monkeypatch.setattr("app.use_cases.sensor_batch_service.device_registry", registry)
+        result = BatchItemResult(index=0, status="created", device_id="unknown")
+
+        assert resolve_device(result) is True
+        assert result.status == "created"
+
+    def test_resolve_device_rejects_unknown_and_attaches_context(self, monkeypatch, registry):
+        """미등록 디바이스는 invalid, 등록 디바이스는 사용자/위치 컨텍스트 기록"""
+        # Given: 적재된 레지스트리
+        monkeypatch.setattr("app.use_cases.sensor_batch_service.device_registry", registry)
+        registry.loaded = True
+        registry.put("dev-1", "user-1", "Entrance - PIR 모션 인식센서")
+
+        # When
+        unknown = BatchItemResult(index=0, status="created", device_id="ghost")
+        known = BatchItemResult(index=1, status="created", device_id="dev-1")
+
+        # Then
+        assert resolve_device(unknown) is False
+        assert unknown.status == "invalid"
+        assert resolve_device(known) is True
+        assert (known.user_id, known.location, known.role) == ("user-1", "Entrance", "PIR 모션 인식센서")
+
+    def test_resolve_missing_looks_up_device_registered_by_another_worker(self):
+        """캐시에 없는 디바이스는 DB에서 한 번에 조회하고, DB에도 없으면 잠시 다시 조회하지 않음"""
+        # Given: 다른 워커에서 등록되어 이 워커 캐시에는 없는 디바이스
+        queries = []
+
+        class Result:
+            def all(self):
+                return [("dev-new", "user-1", "Kitchen - MQ5 가스센서")]
+
+        class Session:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+            async def execute(self, statement):
+                queries.append(statement)
+                return Result()
+
+        registry = DeviceRegistryCache(session_factory=Session, refresh_interval_sec=0, miss_ttl_sec=60)
+        registry.loaded = True
+
+        # When
+        asyncio.run(registry.resolve_missing(["dev-new", "ghost", None]))
+        asyncio.run(registry.resolve_missing(["dev-new", "ghost"]))
+
+        # Then: 한 번만 조회, 등록 디바이스는 캐시에 추가
+        assert len(queries) == 1
+        assert registry.get("dev-new").user_id == "user-1"
+        assert registry.get("ghost") is None
@@ -0,0 +1,177 @@
+"""
+대량 내보내기 테스트
+"""
+
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.archive_store import ArchiveStore
+from app.infrastructure.repositories.export_repository import EXPORT_TABLES, ExportRepository
+from app.use_cases.export_service import ExportService
+
+UTC = timezone.utc
+
+
+class InMemoryExportRepository(ExportRepository):
+    """메모리 행을 묶음으로 내보내는 리포지토리"""
+
+    def __init__(self, rows):
+        super().__init__(session_factory=None)
+        self.rows = rows
+        self.user_ids = []
+
+    async def stream_batches(self, table_name, start_time, end_time, owner_id, batch_size, user_id=None):
+        self.user_ids.append(user_id)
+        for index in range(0, len(self.rows), batch_size):
+            yield self.rows[index:index + batch_size]
+
+
+class CapturingSession:
+    """서버 측 커서로 실행한 문장만 기록하고 빈 결과를 돌려주는 세션"""
+
+    statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def stream(self, statement):
+        self.statements.append(statement)
+        return self
+
+    async def partitions(self, size):
+        for rows in []:
+            yield rows
+
+
+class RowsSession(CapturingSession):
+    """서버 측 커서 결과로 주어진 행을 돌려주는 세션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    def __aiter__(self):
+        return self._rows()
+
+    async def _rows(self):
+        for row in self.rows:
+            yield row
+
+
+async def collect(body) -> bytes:
+    return b"".join([chunk async for chunk in body])
+
+
+class TestExport:
+    """대량 내보내기 테스트 클래스"""
+
+    def test_export_tables_are_time_series_tables(self):
+        """(time, 소유자) 기본 키 테이블만 내보내기 대상"""
+        # Then
+        assert "sensor_raw_mq5" in EXPORT_TABLES
+        assert "home_state_snapshots" in EXPORT_TABLES
+        assert "users" not in EXPORT_TABLES
+
+    def test_csv_export_streams_all_batches(self):
+        """CSV는 헤더 1번과 모든 묶음의 행을 순서대로 내보냄"""
+        # Given
+        rows = [
+            (datetime(2025, 1, 1, hour, tzinfo=UTC), "mq5_001", {"ppm_value": hour})
+            for hour in range(5)
+        ]
+        repository = InMemoryExportRepository(rows)
+        service = ExportService(repository, batch_size=2)
+
+        # When
+        export = asyncio.run(service.export_table("sensor_raw_mq5", "csv", device_id="mq5_001"))
+        lines = list(csv.reader(io.StringIO(asyncio.run(collect(export.body)).decode("utf-8"))))
+
+        # Then
+        assert export.media_type.startswith("text/csv")
+        assert export.filename.endswith(".csv")
+        assert lines[0] == [name for name, _ in repository.get_columns("sensor_raw_mq5")]
+        assert len(lines) == 6
+        assert lines[3][1] == "mq5_001" and lines[3][2] == '{"ppm_value": 2}'
+
+    def test_invalid_requests_fail_before_streaming(self):
+        """알 수 없는 테이블/형식, 잘못된 소유자 키와 기간은 스트리밍 전에 오류"""
+        # Given
+        service = ExportService(InMemoryExportRepository([]))
+        start, end = datetime(2025, 1, 2, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC)
+
+        # When / Then
+        for kwargs, status in [
+            ({"table_name": "users", "export_format": "csv"}, 404),
+            ({"table_name": "sensor_raw_mq5", "export_format": "xlsx"}, 400),
+            ({"table_name": "home_state_snapshots", "export_format": "csv", "device_id": "mq5_001"}, 400),
+            ({"table_name": "sensor_raw_mq5", "export_format": "csv", "start_time": start, "end_time": end}, 400),
+        ]:
+            with pytest.raises(HTTPException) as error:
+                asyncio.run(service.export_table(**kwargs))
+            assert error.value.status_code == status
+
+    def test_user_id_on_device_table_filters_user_devices(self):
+        """디바이스 테이블의 user_id는 400 대신 사용자 디바이스 조건으로 변환"""
+        # Given
+        user_id = uuid4()
+        repository = InMemoryExportRepository([])
+        service = ExportService(repository)
+        CapturingSession.statements = []
+
+        # When
+        export = asyncio.run(service.export_table("sensor_raw_mq5", "csv", user_id=user_id))
+        asyncio.run(collect(export.body))
+        asyncio.run(collect(ExportRepository(CapturingSession).stream_batches(
+            "sensor_raw_mq5", None, None, None, 100, user_id=user_id
+        )))
+
+        # Then
+        assert repository.user_ids == [user_id]
+        sql = str(CapturingSession.statements[0].compile(dialect=postgresql.dialect()))
+        assert "sensor_raw_mq5.device_id IN (SELECT devices.device_id" in sql
+
+    def test_archived_rows_are_merged_before_hot_rows(self, tmp_path):
+        """워터마크 이전 구간은 아카이브 행을 DB 행과 (time, device_id) 순으로 병합해 내보냄"""
+        # Given
+        pytest.importorskip("pyarrow")
+        day = datetime(2025, 1, 1, tzinfo=UTC)
+        archive = ArchiveStore(str(tmp_path), enabled=True)
+        archive.write_day("sensor_raw_mq5", day, [
+            {"time": day + timedelta(hours=hour), "device_id": device_id, "raw_payload": {"ppm_value": hour}}
+            for hour in (1, 3)
+            for device_id in ("mq5_001", "mq5_002")
+        ])
+        archive.set_watermark("sensor_raw_mq5", day + timedelta(days=1))
+        hot_rows = [
+            (day + timedelta(hours=2), "mq5_001", {"ppm_value": 2}),
+            (day + timedelta(days=2), "mq5_001", {"ppm_value": 48}),
+        ]
+        repository = ExportRepository(lambda: RowsSession(hot_rows), archive=archive)
+
+        # When
+        async def export():
+            return [batch async for batch in repository.stream_batches(
+                "sensor_raw_mq5", day, None, "mq5_001", 2
+            )]
+        batches = asyncio.run(export())
+
+        # Then
+        assert [len(batch) for batch in batches] == [2, 2]
+        rows = [row for batch in batches for row in batch]
+        assert [(row[0] - day, row[1], row[2]["ppm_value"]) for row in rows] == [
+            (timedelta(hours=1), "mq5_001", 1),
+            (timedelta(hours=2), "mq5_001", 2),
+            (timedelta(hours=3), "mq5_001", 3),
+            (timedelta(days=2), "mq5_001", 48),
+        ]
@@ -0,0 +1,106 @@
+"""
+write-behind 수집 큐 플러시 실패 처리 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure import ingest_queue as ingest_queue_module
+from app.infrastructure.ingest_queue import WriteBehindQueue
+from app.infrastructure.models import SensorRawMQ5
+
+
+class FakeSession:
+    """데드레터로 추가된 객체를 기록하는 세션"""
+
+    def __init__(self, added):
+        self.added = added
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def add_all(self, items):
+        self.added.extend(items)
+
+    async def commit(self):
+        pass
+
+
+class FlakyRepository:
+    """지정한 오류를 차례로 발생시키고, 거부 디바이스 행이 섞이면 IntegrityError"""
+
+    failures = []
+    rejected_devices = set()
+    written = []
+
+    def __init__(self, db):
+        self.db = db
+
+    async def upsert_many(self, model, rows, on_conflict="nothing"):
+        if FlakyRepository.failures:
+            raise FlakyRepository.failures.pop(0)
+        if any(row["device_id"] in FlakyRepository.rejected_devices for row in rows):
+            raise IntegrityError("INSERT", {}, Exception("foreign key violation"))
+        FlakyRepository.written.extend(row["device_id"] for row in rows)
+        return [True] * len(rows)
+
+
+def make_queue(monkeypatch, added):
+    """가짜 리포지토리/세션을 쓰는 큐 (백오프 없이 재시도)"""
+    FlakyRepository.failures = []
+    FlakyRepository.rejected_devices = set()
+    FlakyRepository.written = []
+    monkeypatch.setattr(ingest_queue_module, "BulkInsertRepository", FlakyRepository)
+    queue = WriteBehindQueue(session_factory=lambda: FakeSession(added), retry_base_ms=0, retry_max_ms=0)
+    return queue
+
+
+def mq5_rows(*device_ids):
+    time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [{"time": time, "device_id": device_id, "raw_payload": {"gas_level": 1}} for device_id in device_ids]
+
+
+class TestWriteBehindFlushFailures:
+    """write-behind 플러시 실패 처리 테스트 클래스"""
+
+    def test_transient_failure_requeues_rows(self, monkeypatch):
+        """일시적 오류면 행을 버퍼에 되돌리고 다음 플러시에서 기록"""
+        # Given
+        added = []
+        queue = make_queue(monkeypatch, added)
+        FlakyRepository.failures = [OperationalError("INSERT", {}, Exception("connection reset"))]
+        queue._buffers["sensor_raw_mq5"] = (SensorRawMQ5, mq5_rows("mq5_001", "mq5_002"))
+
+        # When
+        asyncio.run(queue._flush_table("sensor_raw_mq5"))
+        retrying = queue.metrics()["retrying_tables"]
+        asyncio.run(queue._flush_table("sensor_raw_mq5"))
+
+        # Then
+        assert retrying == ["sensor_raw_mq5"]
+        assert FlakyRepository.written == ["mq5_001", "mq5_002"]
+        assert queue.metrics()["retrying_tables"] == []
+        assert (queue.retried_rows_total, queue.failed_rows_total, added) == (2, 0, [])
+
+    def test_constraint_error_dead_letters_only_rejected_rows(self, monkeypatch):
+        """제약 조건 오류면 행 단위로 다시 기록하고 거부된 행만 데드레터로 보관"""
+        # Given: 삭제된 디바이스 행이 섞인 버퍼
+        added = []
+        queue = make_queue(monkeypatch, added)
+        FlakyRepository.rejected_devices = {"deleted_device"}
+        queue._buffers["sensor_raw_mq5"] = (SensorRawMQ5, mq5_rows("mq5_001", "deleted_device", "mq5_002"))
+
+        # When
+        asyncio.run(queue._flush_table("sensor_raw_mq5"))
+
+        # Then
+        assert FlakyRepository.written == ["mq5_001", "mq5_002"]
+        assert [(item.table_name, item.payload["device_id"]) for item in added] == [("sensor_raw_mq5", "deleted_device")]
+        assert added[0].error.startswith("IntegrityError")
+        assert (queue.dead_letter_rows_total, queue.failed_rows_total) == (1, 0)
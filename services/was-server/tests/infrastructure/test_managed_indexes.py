@@ -0,0 +1,52 @@
+"""
+시계열 테이블 관리 인덱스 테스트
+"""
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.managed_indexes import MANAGED_INDEXES, ManagedIndex, build_index_report
+
+
+class TestManagedIndexes:
+    """시계열 테이블 관리 인덱스 테스트 클래스"""
+
+    def test_time_series_tables_get_owner_time_and_brin_indexes(self):
+        """기본 키가 (time, 소유자)인 테이블에 소유자별 시간 역순 인덱스, 원시 테이블에 BRIN 인덱스 선언"""
+        # Given / When
+        indexes = {index.name: index for index in MANAGED_INDEXES}
+
+        # Then
+        assert indexes["ix_sensor_raw_mq5_device_id_time"].columns == "device_id, time DESC"
+        assert indexes["brin_sensor_raw_mq5_time"].method == "brin"
+        assert indexes["ix_home_state_snapshots_user_id_time"].columns == "user_id, time DESC"
+        assert "brin_sensor_edge_pir_time" not in indexes
+        assert indexes["ix_home_state_snapshots_alert_user_time"].ddl(concurrently=False) == (
+            "CREATE INDEX IF NOT EXISTS ix_home_state_snapshots_alert_user_time ON home_state_snapshots "
+            "USING btree (user_id, time DESC) WHERE alert_level IN ('Warning', 'Emergency')"
+        )
+
+    def test_report_lists_missing_unused_and_seq_scan_heavy_tables(self):
+        """누락된 관리 인덱스, 미사용 인덱스, 순차 스캔 위주 테이블을 테이블별로 보고"""
+        # Given
+        managed = [
+            ManagedIndex("ix_t_device_id_time", "t", "device_id, time DESC"),
+            ManagedIndex("brin_t_time", "t", "time", method="brin"),
+        ]
+        existing = [{"tablename": "t", "indexname": "ix_t_device_id_time"}]
+        index_stats = [
+            {"relname": "t", "indexrelname": "t_pkey", "idx_scan": 0, "is_primary": True, "is_unique": True, "size_bytes": 8192},
+            {"relname": "t", "indexrelname": "ix_t_device_id_time", "idx_scan": 0, "is_primary": False, "is_unique": False, "size_bytes": 8192},
+            {"relname": "u", "indexrelname": "ix_u_used", "idx_scan": 5, "is_primary": False, "is_unique": False, "size_bytes": 8192},
+        ]
+        table_stats = [
+            {"relname": "t", "seq_scan": 50, "idx_scan": 10, "n_live_tup": 100000},
+            {"relname": "u", "seq_scan": 50, "idx_scan": 10, "n_live_tup": 10},
+        ]
+
+        # When
+        report = build_index_report(existing, index_stats, table_stats, managed)
+
+        # Then
+        assert set(report) == {"t"}
+        assert report["t"]["missing"] == ["brin_t_time"]
+        assert report["t"]["unused"] == [{"index": "ix_t_device_id_time", "size_bytes": 8192, "managed": True}]
+        assert report["t"]["seq_scan_heavy"] is True
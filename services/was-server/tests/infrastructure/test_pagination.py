@@ -0,0 +1,70 @@
+"""
+Keyset(커서) 페이지네이션 테스트
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.models import HomeStateSnapshot, SensorRawMQ5
+from app.infrastructure.pagination import apply_keyset, decode_cursor, encode_cursor, next_cursor
+
+
+class TestPagination:
+    """Keyset 페이지네이션 테스트 클래스"""
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩/디코딩 왕복"""
+        # Given: 마지막 행의 (time, device_id)
+        time = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+        # When: 인코딩 후 디코딩
+        cursor = encode_cursor(time, "mq5-01")
+
+        # Then: 원래 값으로 복원
+        assert decode_cursor(cursor) == (time, "mq5-01")
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    def test_next_cursor_only_for_full_page(self):
+        """페이지가 가득 찼을 때만 다음 커서 반환"""
+        # Given: 시간 역순 두 행
+        rows = [
+            SimpleNamespace(time=datetime(2025, 1, 1, 0, 1), device_id="b"),
+            SimpleNamespace(time=datetime(2025, 1, 1, 0, 0), device_id="a"),
+        ]
+
+        # When / Then: limit보다 적으면 마지막 페이지
+        assert next_cursor(rows, limit=3) is None
+        assert decode_cursor(next_cursor(rows, limit=2)) == (rows[-1].time, "a")
+
+    def test_apply_keyset_row_value_seek(self):
+        """(time, key) 행 값 비교와 기본 키 순서 정렬"""
+        # Given: 커서
+        cursor = (datetime(2025, 1, 1), "mq5-01")
+
+        # When: keyset 조건 적용
+        sql = str(apply_keyset(select(SensorRawMQ5), SensorRawMQ5.time, SensorRawMQ5.device_id, cursor)
+                  .compile(dialect=postgresql.dialect()))
+
+        # Then: OFFSET 없이 행 값 비교로 탐색
+        assert "(sensor_raw_mq5.time, sensor_raw_mq5.device_id) < (" in sql
+        assert "ORDER BY sensor_raw_mq5.time DESC, sensor_raw_mq5.device_id DESC" in sql
+        assert "OFFSET" not in sql
+
+    def test_apply_keyset_uuid_key(self):
+        """UUID 키 커서는 컬럼 타입으로 바인딩"""
+        user_id = uuid4()
+        query = apply_keyset(
+            select(HomeStateSnapshot), HomeStateSnapshot.time, HomeStateSnapshot.user_id,
+            (datetime(2025, 1, 1), str(user_id))
+        )
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert user_id in params.values()
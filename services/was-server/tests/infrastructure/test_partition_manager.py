@@ -0,0 +1,98 @@
+"""
+시계열 테이블 파티션 관리 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.archive_store import ArchiveStore
+from app.infrastructure.partition_manager import (
+    PartitionManager, expired_partitions, parse_upper_bound, partitioned_tables, period_start, plan_partitions
+)
+
+UTC = timezone.utc
+
+
+class RecordingDb:
+    """실행한 DDL 문자열을 기록하는 세션"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+
+
+class TestPartitionManager:
+    """시계열 테이블 파티션 관리 테스트 클래스"""
+
+    def test_target_tables(self):
+        """원시/엣지/액추에이터/스냅샷 테이블만 파티션 대상"""
+        # Given / When
+        names = {table.name for table in partitioned_tables()}
+
+        # Then
+        assert {"sensor_raw_mq5", "sensor_edge_pir", "actuator_log_relay", "home_state_snapshots"} <= names
+        assert "devices" not in names
+        assert "sensor_rollup_hourly" not in names
+
+    def test_plan_continues_from_latest_bound(self):
+        """기존 파티션의 가장 큰 상한부터 현재 주기 이후 premake개 주기까지 이어서 생성"""
+        # Given: 기존 테이블이 2025-02-01까지의 파티션으로 연결됨, 현재 2025-03-15
+        upper_bounds = [datetime(2025, 2, 1, tzinfo=UTC), None]
+        now = datetime(2025, 3, 15, tzinfo=UTC)
+
+        # When
+        ranges = plan_partitions(upper_bounds, now, interval_months=1, premake=2)
+
+        # Then: 2월, 3월(현재), 4월, 5월
+        assert [start.month for start, _ in ranges] == [2, 3, 4, 5]
+        assert ranges[-1][1] == datetime(2025, 6, 1, tzinfo=UTC)
+        assert plan_partitions([datetime(2025, 6, 1, tzinfo=UTC)], now, premake=2) == []
+
+    def test_quarterly_periods_and_retention(self):
+        """분기 주기 정렬과 보존 기간이 지난 파티션 선별"""
+        # Given
+        now = datetime(2025, 8, 20, 9, tzinfo=UTC)
+        partitions = [
+            ("t_legacy", parse_upper_bound("FOR VALUES FROM (MINVALUE) TO ('2025-01-01 09:00:00+09')")),
+            ("t_p202501", parse_upper_bound("FOR VALUES FROM ('2025-01-01 00:00:00+00') TO ('2025-04-01 00:00:00+00')")),
+            ("t_p202504", parse_upper_bound("FOR VALUES FROM ('2025-04-01 00:00:00+00') TO ('2025-07-01 00:00:00+00')")),
+            ("t_default", parse_upper_bound("DEFAULT")),
+        ]
+
+        # When
+        expired = expired_partitions(partitions, now, interval_months=3, retention_months=3)
+
+        # Then: 보존 시작은 2025-04-01 (현재 분기 시작 2025-07-01 - 3개월)
+        assert period_start(now, 3) == datetime(2025, 7, 1, tzinfo=UTC)
+        assert partitions[0][1] == datetime(2025, 1, 1, tzinfo=UTC)
+        assert expired == ["t_legacy", "t_p202501"]
+        assert expired_partitions(partitions, now, interval_months=3, retention_months=0) == []
+
+    def test_drop_waits_for_archive_watermark(self, tmp_path, monkeypatch):
+        """아카이브 사용 시 워터마크 이후 행이 있는 만료 파티션은 삭제하지 않음"""
+        # Given: 2025-03-01까지 아카이브된 sensor_raw_mq5와 아카이브 대상이 아닌 sensor_edge_pir
+        archive = ArchiveStore(str(tmp_path), enabled=True)
+        archive.set_watermark("sensor_raw_mq5", datetime(2025, 3, 1, tzinfo=UTC))
+        manager = PartitionManager(None, table_names=[], retention_months=3, expire_action="drop", archive=archive)
+
+        async def partitions(db, table_name):
+            return [
+                (f"{table_name}_p202502", datetime(2025, 3, 1, tzinfo=UTC)),
+                (f"{table_name}_p202503", datetime(2025, 4, 1, tzinfo=UTC)),
+            ]
+
+        monkeypatch.setattr(manager, "_partitions", partitions)
+        db = RecordingDb()
+        now = datetime(2025, 8, 20, tzinfo=UTC)
+
+        # When
+        raw = asyncio.run(manager.expire_partitions(db, "sensor_raw_mq5", now))
+        edge = asyncio.run(manager.expire_partitions(db, "sensor_edge_pir", now))
+
+        # Then: 원시 테이블은 아카이브된 2월 파티션만, 엣지 테이블은 보존 기간대로 삭제
+        assert raw == ["sensor_raw_mq5_p202502"]
+        assert edge == ["sensor_edge_pir_p202502", "sensor_edge_pir_p202503"]
+        assert "DROP TABLE sensor_raw_mq5_p202503" not in db.statements
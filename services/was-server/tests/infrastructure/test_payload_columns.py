@@ -0,0 +1,44 @@
+"""
+raw_payload 생성 컬럼 테스트
+"""
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.api.v1.schemas import SensorRawMQ5Response, SensorRawRFIDResponse
+from app.infrastructure.models import SensorRawMQ5
+from app.infrastructure.payload_columns import PayloadColumn
+
+
+class TestPayloadColumns:
+    """raw_payload 생성 컬럼 테스트 클래스"""
+
+    def test_column_and_index_ddl(self):
+        """숫자 키는 JSON 숫자일 때만 값을 갖는 생성 컬럼과 부분 인덱스로 선언"""
+        # Given
+        item = PayloadColumn(SensorRawMQ5, "gas_level")
+
+        # When
+        column_ddl, index_ddl = item.column_ddl(), item.index_ddl()
+
+        # Then
+        assert "ADD COLUMN IF NOT EXISTS gas_level double precision" in column_ddl
+        assert "jsonb_typeof(raw_payload -> 'gas_level') = 'number'" in column_ddl
+        assert column_ddl.endswith("STORED")
+        assert index_ddl == (
+            "CREATE INDEX IF NOT EXISTS ix_sensor_raw_mq5_gas_level ON sensor_raw_mq5 "
+            "(device_id, gas_level) WHERE gas_level IS NOT NULL"
+        )
+
+    def test_response_exposes_typed_payload_fields(self):
+        """응답 스키마가 raw_payload 핫 키를 타입이 있는 필드로 노출"""
+        # Given
+        base = {"time": "2025-01-01T00:00:00Z", "device_id": "dev_001"}
+
+        # When
+        mq5 = SensorRawMQ5Response(**base, raw_payload={"gas_level": 120})
+        invalid = SensorRawMQ5Response(**base, raw_payload={"gas_level": True})
+        rfid = SensorRawRFIDResponse(**base, raw_payload={"card_id": "A1B2"})
+
+        # Then
+        assert mq5.gas_level == 120.0
+        assert invalid.gas_level is None
+        assert rfid.card_id == "A1B2"
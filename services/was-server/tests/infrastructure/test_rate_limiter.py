@@ -0,0 +1,131 @@
+"""
+수집 속도 제한기 테스트
+"""
+
+import asyncio
+
+import pytest
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.rate_limiter import IngestRateLimiter
+from app.use_cases.ingest_service import IngestService
+
+
+class FakeClock:
+    """테스트용 단조 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestIngestRateLimiter:
+    """수집 속도 제한기 테스트 클래스"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def limiter(self, clock):
+        return IngestRateLimiter(
+            device_rate=10.0, device_burst=20.0,
+            sensor_type_rate=100.0, sensor_type_burst=1000.0,
+            clock=clock
+        )
+
+    def test_burst_then_reject_with_retry_after(self, limiter):
+        """버스트를 모두 쓰면 거부되고 부족한 토큰만큼의 대기 시간을 반환"""
+        # Given: 버스트(20)만큼 허용된 디바이스
+        assert limiter.acquire([("dev-1", "mq5")] * 20) == 0
+
+        # When: 추가 측정값 5건 요청
+        retry_after = limiter.acquire([("dev-1", "mq5")] * 5)
+
+        # Then: 5 토큰 / 초당 10 = 0.5초 후 재시도, 드롭 카운터 증가
+        assert retry_after == pytest.approx(0.5)
+        assert limiter.device_drops == {"dev-1": 5}
+        assert limiter.dropped_readings == 5
+
+    def test_refill_over_time(self, limiter, clock):
+        """시간이 지나면 토큰이 보충되어 다시 허용"""
+        # Given: 버스트를 모두 쓴 디바이스
+        limiter.acquire([("dev-1", "mq5")] * 20)
+
+        # When: 0.5초 경과
+        clock.now += 0.5
+
+        # Then: 5건은 허용, 그 다음은 거부
+        assert limiter.acquire([("dev-1", "mq5")] * 5) == 0
+        assert limiter.acquire([("dev-1", "mq5")]) > 0
+
+    def test_devices_are_isolated(self, limiter):
+        """한 디바이스가 한도를 넘어도 다른 디바이스는 영향 없음"""
+        # Given: 한도를 넘긴 디바이스
+        limiter.acquire([("noisy", "mq5")] * 20)
+        assert limiter.acquire([("noisy", "mq5")]) > 0
+
+        # When / Then: 다른 디바이스는 허용
+        assert limiter.acquire([("quiet", "mq5")]) == 0
+
+    def test_sensor_type_limit_rejects_without_consuming_device_tokens(self, limiter):
+        """센서 타입 한도로 거부되면 디바이스 버킷도 차감하지 않음"""
+        # Given: 센서 타입 버킷을 여러 디바이스로 모두 소모
+        for index in range(50):
+            assert limiter.acquire([(f"dev-{index}", "sound")] * 20) == 0
+
+        # When: 새 디바이스가 같은 센서 타입으로 요청
+        assert limiter.acquire([("fresh", "sound")] * 10) > 0
+
+        # Then: 새 디바이스의 토큰은 그대로이므로 다른 센서 타입으로 버스트 전체 허용
+        assert limiter.acquire([("fresh", "mq7")] * 20) == 0
+        assert limiter.sensor_type_drops == {"sound": 10}
+
+    def test_request_larger_than_burst_admitted_only_when_full(self, limiter, clock):
+        """버스트보다 큰 요청은 버킷이 가득 찼을 때만 허용되고 버킷을 비움"""
+        # Given / When: 버스트보다 큰 배치
+        assert limiter.acquire([("gateway", "mq5")] * 100) == 0
+
+        # Then: 버킷이 다시 가득 찰 때(2초)까지 거부
+        assert limiter.acquire([("gateway", "mq5")] * 100) == pytest.approx(2.0)
+        clock.now += 2.0
+        assert limiter.acquire([("gateway", "mq5")] * 100) == 0
+
+
+class FakeBulkInsertRepository:
+    """모든 행을 삽입(True)으로 처리하는 리포지토리"""
+
+    def __init__(self):
+        self.rows = []
+
+    async def upsert_many(self, model, rows, on_conflict="nothing"):
+        self.rows.extend(rows)
+        return [True] * len(rows)
+
+
+class TestIngestStreamRateLimit:
+    """NDJSON 스트리밍 적재 속도 제한 테스트 클래스"""
+
+    def test_stream_flush_over_budget_is_not_persisted(self, monkeypatch):
+        """미들웨어를 거치지 않는 스트림도 적재 버퍼마다 디바이스 한도를 적용"""
+        # Given: 버스트 2건인 디바이스 한도와 2줄마다 적재하는 스트림
+        limiter = IngestRateLimiter(device_rate=0.5, device_burst=2.0, clock=FakeClock())
+        monkeypatch.setattr("app.use_cases.ingest_service.ingest_rate_limiter", limiter)
+        monkeypatch.setattr("app.use_cases.ingest_service.STREAM_FLUSH_ROWS", 2)
+        repository = FakeBulkInsertRepository()
+        lines = b"".join(
+            b'{"sensor_type": "mq5", "device_id": "mq5_001", "time": "2025-01-01T00:00:0%dZ"}\n' % i
+            for i in range(4)
+        )
+
+        async def chunks():
+            yield lines
+
+        # When
+        summary = asyncio.run(IngestService(repository).ingest_stream(chunks()))
+
+        # Then: 첫 버퍼만 적재되고 두 번째 버퍼는 재전송 대기 시간과 함께 보고
+        assert (summary.created, summary.rate_limited, len(repository.rows)) == (2, 2, 2)
+        assert summary.retry_after == 4.0
@@ -0,0 +1,128 @@
+"""
+Redis 읽기 캐시 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List, Optional
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.api.v1.schemas import ReadCacheEndpointStats
+from app.infrastructure import read_cache as read_cache_module
+from app.infrastructure.device_latest import LatestCacheInvalidator
+from app.infrastructure.models import SensorRawMQ5
+from app.infrastructure.read_cache import ReadCache, cached
+
+
+class MemoryBackend:
+    """Redis 대신 딕셔너리에 보관하는 캐시 저장소"""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl_sec):
+        self.values[key] = value
+        return True
+
+    async def incr_many(self, keys):
+        for key in keys:
+            self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return [int(self.values[key]) for key in keys]
+
+
+class BrokenBackend:
+    """연결할 수 없는 캐시 저장소"""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+
+class RecordingCache:
+    """무효화 요청된 디바이스를 기록하는 캐시"""
+
+    def __init__(self):
+        self.invalidated = []
+
+    async def invalidate_devices(self, device_ids):
+        self.invalidated.append(set(device_ids))
+
+
+class TestReadCache:
+    """Redis 읽기 캐시 테스트 클래스"""
+
+    def test_hit_after_miss_and_miss_after_invalidation(self, monkeypatch):
+        """두 번째 조회는 캐시에서 복원하고, 그룹 무효화 후에는 다시 로드"""
+        # Given
+        cache = ReadCache(MemoryBackend(), enabled=True)
+        monkeypatch.setattr(read_cache_module, "read_cache", cache)
+        calls = []
+
+        @cached(
+            "profiles.get",
+            Optional[List[ReadCacheEndpointStats]],
+            group=lambda user_id, **_: f"profiles:{user_id}",
+            key=lambda user_id, **_: user_id
+        )
+        async def load(user_id: str):
+            calls.append(user_id)
+            return [ReadCacheEndpointStats(hits=len(calls), misses=0, errors=0, hit_ratio=1.0)]
+
+        # When
+        first = asyncio.run(load("u1"))
+        second = asyncio.run(load("u1"))
+        asyncio.run(cache.invalidate("profiles:u1"))
+        third = asyncio.run(load(user_id="u1"))
+
+        # Then
+        assert calls == ["u1", "u1"]
+        assert second == first and isinstance(second[0], ReadCacheEndpointStats)
+        assert third[0].hits == 2
+        assert cache.stats()["endpoints"]["profiles.get"] == {"hits": 1, "misses": 2, "errors": 0, "hit_ratio": 0.3333}
+
+    def test_backend_failure_falls_back_to_loader(self):
+        """Redis 오류 시 DB 결과를 그대로 반환하고 재시도 대기 동안 캐시를 건너뜀"""
+        # Given
+        cache = ReadCache(BrokenBackend(), enabled=True, retry_sec=60)
+
+        async def loader():
+            return {"value": 1}
+
+        # When
+        first = asyncio.run(cache.get_or_load("users.get", "users", "u1", loader, dict))
+        second = asyncio.run(cache.get_or_load("users.get", "users", "u1", loader, dict))
+
+        # Then
+        assert first == second == {"value": 1}
+        assert cache.stats()["available"] is False
+        assert cache.stats()["endpoints"]["users.get"]["errors"] == 1
+
+    def test_orm_writes_invalidate_latest_cache_after_commit(self):
+        """ORM으로 수정/삭제한 측정값 디바이스는 커밋 후 무효화하고, 롤백되면 버림"""
+        # Given: 수정된 MQ5 행과 삭제된 MQ5 행이 있는 세션
+        cache = RecordingCache()
+        invalidator = LatestCacheInvalidator(cache=cache)
+        time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        session = SimpleNamespace(
+            new=[],
+            dirty=[SensorRawMQ5(time=time, device_id="mq5_001")],
+            deleted=[SensorRawMQ5(time=time, device_id="mq5_002")],
+            info={}
+        )
+
+        async def commit():
+            invalidator._after_flush(session, None)
+            invalidator._after_commit(session)
+            await asyncio.gather(*invalidator._tasks)
+
+        # When
+        asyncio.run(commit())
+        invalidator._after_flush(session, None)
+        invalidator._after_rollback(session)
+
+        # Then
+        assert cache.invalidated == [{"mq5_001", "mq5_002"}]
+        assert session.info == {}
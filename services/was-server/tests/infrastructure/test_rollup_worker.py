@@ -0,0 +1,182 @@
+"""
+센서 롤업 작업 테스트
+
+워터마크 기반 증분 갱신과 늦게 도착한 시간 버킷 재계산을 검증합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.dialects import postgresql
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.infrastructure.models import SensorRollupDirty
+from app.infrastructure.rollup_worker import RollupDirtyListener, SensorRollupWorker, hour_ranges
+from app.infrastructure.sensor_registry import get_sensor_spec
+
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class InMemoryRollupRepository:
+    """갱신 구간만 기록하는 메모리 롤업 리포지토리"""
+
+    def __init__(self, data_start=None):
+        self.data_start = data_start
+        self.watermark = None
+        self.dirty = []
+        self.hourly = []
+        self.daily = []
+
+    async def try_lock(self, sensor_type):
+        return True
+
+    async def get_watermark(self, sensor_type):
+        return self.watermark
+
+    async def set_watermark(self, sensor_type, watermark):
+        self.watermark = watermark
+
+    async def pop_dirty_hours(self, sensor_type, limit):
+        hours, self.dirty = self.dirty[:limit], self.dirty[limit:]
+        return hours
+
+    async def get_data_start(self, model):
+        return self.data_start
+
+    async def refresh_hourly(self, spec, start_time, end_time):
+        self.hourly.append((start_time, end_time))
+        return 0
+
+    async def refresh_daily(self, sensor_type, start_time, end_time):
+        self.daily.append((start_time, end_time))
+        return 0
+
+
+class RecordingSession:
+    """실행한 문장만 기록하는 세션"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+class FlushedSession:
+    """flush된 ORM 객체 목록과 같은 연결에서 실행한 문장을 기록하는 동기 세션"""
+
+    def __init__(self, new=(), dirty=(), deleted=()):
+        self.new, self.dirty, self.deleted = list(new), list(dirty), list(deleted)
+        self.statements = []
+
+    def connection(self):
+        return self
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+
+class TestSensorRollupWorker:
+    """센서 롤업 작업 테스트 클래스"""
+
+    def make_worker(self):
+        spec = get_sensor_spec("edge-pir")
+        return spec, SensorRollupWorker(None, specs=[spec], late_window_hours=2, max_hours_per_run=24, enabled=True)
+
+    def test_first_run_starts_from_data_and_is_bounded(self):
+        """첫 실행은 가장 이른 데이터부터 max_hours_per_run 시간까지 갱신"""
+        # Given: 이틀 전부터 데이터가 있는 테이블
+        spec, worker = self.make_worker()
+        repository = InMemoryRollupRepository(data_start=T0 + timedelta(minutes=17))
+
+        # When
+        hours = asyncio.run(worker.refresh_sensor(repository, spec, T0 + timedelta(days=2, minutes=5)))
+
+        # Then: 첫 24시간만 갱신하고 워터마크 전진
+        assert hours == 24
+        assert repository.hourly == [(T0, T0 + timedelta(days=1))]
+        assert repository.daily == [(T0, T0 + timedelta(days=1))]
+        assert repository.watermark == T0 + timedelta(days=1)
+
+    def test_incremental_run_rechecks_late_window_only(self):
+        """이후 실행은 워터마크 - 지연 허용 시간부터 현재 시간 버킷까지 갱신"""
+        # Given: 워터마크가 현재 시간 버킷
+        spec, worker = self.make_worker()
+        now = T0 + timedelta(hours=10, minutes=30)
+        repository = InMemoryRollupRepository()
+        repository.watermark = T0 + timedelta(hours=10)
+
+        # When
+        asyncio.run(worker.refresh_sensor(repository, spec, now))
+
+        # Then: 08:00 ~ 11:00 (진행 중인 10시 버킷 포함), 워터마크는 현재 시간 버킷 시작
+        assert repository.hourly == [(T0 + timedelta(hours=8), T0 + timedelta(hours=11))]
+        assert repository.watermark == T0 + timedelta(hours=10)
+
+    def test_late_rows_recompute_only_their_buckets(self):
+        """지연 허용 시간보다 늦게 도착한 행은 해당 시간 버킷만 재계산"""
+        # Given: 한 번 갱신된 상태
+        spec, worker = self.make_worker()
+        now = T0 + timedelta(hours=10, minutes=30)
+        repository = InMemoryRollupRepository()
+        repository.watermark = T0 + timedelta(hours=10)
+        asyncio.run(worker.refresh_sensor(repository, spec, now))
+        repository.hourly.clear()
+
+        # When: 다른 워커 프로세스가 03시 행(늦게 도착)을 적재하고 대기 버킷을 꺼낸 실행
+        repository.dirty.append(T0 + timedelta(hours=3))
+        asyncio.run(worker.refresh_sensor(repository, spec, now))
+
+        # Then: 정규 구간 + 03시 버킷 하나
+        assert (T0 + timedelta(hours=3), T0 + timedelta(hours=4)) in repository.hourly
+        assert len(repository.hourly) == 2
+        assert worker.late_hours == 1
+        assert repository.dirty == []
+
+    def test_mark_dirty_records_only_late_hours_in_ingest_transaction(self):
+        """지연 허용 시간 이전 행만 적재 세션에 대기 버킷 INSERT를 실행"""
+        # Given
+        spec, worker = self.make_worker()
+        now = T0 + timedelta(hours=10, minutes=30)
+        session = RecordingSession()
+
+        # When: 현재 행만 적재 / 03시 행과 현재 행 적재
+        asyncio.run(worker.mark_dirty(session, spec.model, [{"time": now}], now=now))
+        realtime_statements = len(session.statements)
+        asyncio.run(worker.mark_dirty(
+            session, spec.model, [{"time": datetime(2025, 1, 1, 3, 10)}, {"time": now}], now=now
+        ))
+
+        # Then: 실시간 적재는 문장 없음, 늦은 행은 03시 버킷 하나를 DB 워터마크와 비교해 기록
+        assert realtime_statements == 0
+        compiled = session.statements[0].compile(dialect=postgresql.dialect())
+        assert "INSERT INTO sensor_rollup_dirty" in str(compiled)
+        assert "sensor_rollup_watermark" in str(compiled)
+        assert T0 + timedelta(hours=3) in compiled.params.values()
+
+    def test_orm_update_and_delete_mark_hours_dirty_on_flush(self):
+        """ORM으로 수정/삭제한 롤업 완료 구간의 행은 flush 시 같은 연결로 대기 버킷 기록"""
+        # Given: 03시 행 삭제, 05시 행 수정, 롤업 대상이 아닌 모델
+        spec, worker = self.make_worker()
+        listener = RollupDirtyListener(worker)
+        session = FlushedSession(
+            dirty=[spec.model(time=T0 + timedelta(hours=5, minutes=1), device_id="pir_001")],
+            deleted=[spec.model(time=T0 + timedelta(hours=3, minutes=2), device_id="pir_001")],
+            new=[SensorRollupDirty(sensor_type="edge-pir", bucket=T0)]
+        )
+
+        # When
+        listener._after_flush(session, None)
+
+        # Then: 두 버킷을 한 문장으로 기록
+        assert len(session.statements) == 1
+        params = session.statements[0].compile(dialect=postgresql.dialect()).params.values()
+        assert T0 + timedelta(hours=3) in params and T0 + timedelta(hours=5) in params
+
+    def test_hour_ranges_merges_contiguous_hours(self):
+        """연속된 시간 버킷은 한 구간으로 병합"""
+        hours = [T0, T0 + timedelta(hours=1), T0 + timedelta(hours=5)]
+        assert hour_ranges(hours) == [
+            (T0, T0 + timedelta(hours=2)),
+            (T0 + timedelta(hours=5), T0 + timedelta(hours=6)),
+        ]
@@ -0,0 +1,61 @@
+"""
+Core 행 목록 조회 경로 테스트
+"""
+
+from datetime import datetime, timezone
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.api.v1.schemas import SensorRawMQ5Response, SensorRawRFIDResponse
+from app.infrastructure.models import SensorRawMQ5, SensorRawRFID
+from app.infrastructure.pagination import NEXT_CURSOR_HEADER, decode_cursor, set_next_cursor
+from app.infrastructure.row_reader import RowListResponse, row_builder
+
+UTC = timezone.utc
+
+
+def orm_body(response_model, model, rows: List[dict]) -> bytes:
+    """기존 경로 응답 본문 (ORM 인스턴스 -> from_orm -> response_model 직렬화)"""
+    items = [response_model.from_orm(model(**row)) for row in rows]
+    return JSONResponse(jsonable_encoder(items)).body
+
+
+class TestRowReader:
+    """Core 행 목록 조회 경로 테스트 클래스"""
+
+    def test_mq5_rows_render_same_body_as_orm_path(self):
+        """숫자 핫 키는 JSON 숫자일 때만 채우고 응답 본문이 기존 경로와 같음"""
+        # Given
+        rows = [
+            {"time": datetime(2025, 1, 1, 9, 30, tzinfo=UTC), "device_id": "mq5_001", "raw_payload": {"gas_level": 12}},
+            {"time": datetime(2025, 1, 1, 9, 29, 1, 500, tzinfo=UTC), "device_id": "mq5_001", "raw_payload": {"gas_level": "high"}},
+            {"time": datetime(2025, 1, 1, 9, 28), "device_id": "mq5_002", "raw_payload": None},
+        ]
+
+        # When
+        build = row_builder(SensorRawMQ5, SensorRawMQ5Response)
+        body = RowListResponse([build(row) for row in rows]).body
+
+        # Then
+        assert body == orm_body(SensorRawMQ5Response, SensorRawMQ5, rows)
+
+    def test_rfid_text_key_and_next_cursor_header(self):
+        """텍스트 핫 키(객체 값은 JSON 문자열)와 다음 페이지 커서 헤더"""
+        # Given
+        rows = [
+            {"time": datetime(2025, 1, 1, 9, 30, tzinfo=UTC), "device_id": "rfid_001", "raw_payload": {"card_id": "카드-01"}},
+            {"time": datetime(2025, 1, 1, 9, 29, tzinfo=UTC), "device_id": "rfid_001", "raw_payload": {"card_id": {"uid": 7}}},
+        ]
+
+        # When
+        build = row_builder(SensorRawRFID, SensorRawRFIDResponse)
+        items = [build(row) for row in rows]
+        response = RowListResponse(items)
+        set_next_cursor(response, items, limit=2)
+
+        # Then
+        assert response.body == orm_body(SensorRawRFIDResponse, SensorRawRFID, rows)
+        assert decode_cursor(response.headers[NEXT_CURSOR_HEADER]) == (rows[-1]["time"], "rfid_001")
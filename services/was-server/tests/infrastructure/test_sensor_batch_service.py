@@ -0,0 +1,71 @@
+"""
+센서 단건/배치 멱등 적재 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.api.v1.schemas import SensorRawMQ5Create, SensorRawMQ5Response
+from app.infrastructure.models import SensorRawMQ5
+from app.use_cases.sensor_batch_service import SensorBatchService
+
+
+class FakeBulkInsertRepository:
+    """이미 적재된 기본 키는 None(무시), 새 키는 True(삽입)를 돌려주는 리포지토리"""
+
+    def __init__(self):
+        self.keys = set()
+        self.calls = []
+
+    async def upsert_many(self, model, rows, on_conflict="nothing"):
+        self.calls.append(on_conflict)
+        outcomes = []
+        for row in rows:
+            key = (row["time"], row["device_id"])
+            outcomes.append(None if key in self.keys else True)
+            self.keys.add(key)
+        return outcomes
+
+    async def insert_returning(self, model, row):
+        outcome = (await self.upsert_many(model, [row]))[0]
+        # RETURNING처럼 DB에서 정규화된 저장 행을 돌려줌
+        return {**row, "time": row["time"].astimezone(timezone.utc)} if outcome else None
+
+
+class TestSensorBatchService:
+    """센서 단건/배치 멱등 적재 테스트 클래스"""
+
+    def test_create_one_reports_retry_as_duplicate(self):
+        """같은 (time, device_id) 단건을 재전송하면 오류 대신 duplicate"""
+        # Given
+        repository = FakeBulkInsertRepository()
+        service = SensorBatchService(repository, SensorRawMQ5, SensorRawMQ5Create)
+        data = SensorRawMQ5Create(
+            time=datetime(2025, 1, 1, tzinfo=timezone.utc), device_id="mq5_001", raw_payload={"gas_level": 150}
+        )
+
+        # When
+        first, stored = asyncio.run(service.create_one(data))
+        retry, duplicate = asyncio.run(service.create_one(data))
+
+        # Then
+        assert (first.status, retry.status) == ("created", "duplicate")
+        assert repository.calls == ["nothing", "nothing"]
+        # 생성 응답은 요청 본문이 아니라 저장된 행으로 구성
+        assert SensorRawMQ5Response.parse_obj(stored).gas_level == 150
+        assert duplicate is None
+
+    def test_create_batch_is_idempotent_by_default(self):
+        """on_conflict를 지정하지 않아도 재전송된 배치 항목은 duplicate"""
+        # Given
+        repository = FakeBulkInsertRepository()
+        service = SensorBatchService(repository, SensorRawMQ5, SensorRawMQ5Create)
+        items = [{"time": "2025-01-01T00:00:00+00:00", "device_id": "mq5_001"}]
+
+        # When
+        asyncio.run(service.create_batch(items))
+        response = asyncio.run(service.create_batch(items))
+
+        # Then
+        assert (response.created, response.duplicates, response.failed) == (0, 1, 0)
@@ -0,0 +1,51 @@
+"""
+시간 버킷 다운샘플링 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import app.api.v1.schemas  # noqa: F401  (use_cases 임포트 전 스키마 로드)
+from app.infrastructure.sensor_registry import get_sensor_spec
+from app.use_cases.sensor_bucket_service import lttb
+
+
+class TestSensorBuckets:
+    """시간 버킷 다운샘플링 테스트 클래스"""
+
+    def series(self, count: int):
+        start = datetime(2025, 1, 1)
+        return [(start + timedelta(minutes=i), float(i % 10)) for i in range(count)]
+
+    def test_lttb_keeps_endpoints_and_threshold(self):
+        """LTTB는 첫/마지막 포인트를 유지하고 목표 개수로 줄임"""
+        # Given: 1000개 포인트
+        points = self.series(1000)
+
+        # When: 50개로 다운샘플링
+        sampled = lttb(points, 50)
+
+        # Then
+        assert len(sampled) == 50
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+        assert [time for time, _ in sampled] == sorted(time for time, _ in sampled)
+
+    def test_lttb_keeps_spike(self):
+        """평탄한 구간의 급격한 값은 선택됨"""
+        # Given: 한 포인트만 튀는 시계열
+        points = [(time, 0.0) for time, _ in self.series(300)]
+        points[150] = (points[150][0], 100.0)
+
+        # When / Then
+        assert points[150] in lttb(points, 20)
+
+    def test_lttb_short_series_unchanged(self):
+        """목표보다 적은 포인트는 그대로 반환"""
+        points = self.series(10)
+        assert lttb(points, 50) == points
+
+    def test_default_value_field(self):
+        """센서별 기본 측정값 필드"""
+        assert get_sensor_spec("mq5").default_value_field == "gas_level"
+        assert get_sensor_spec("mq7").default_value_field == "co_level"
+        assert get_sensor_spec("rfid").default_value_field is None
@@ -0,0 +1,48 @@
+"""
+센서 타입 레지스트리 테스트
+
+통합 수집 엔드포인트가 사용하는 센서 타입 -> ORM 모델 매핑을 검증합니다.
+"""
+
+from app.infrastructure.models import SensorEdgePIR, SensorRawMQ5, SensorRawTemperature
+from app.infrastructure.sensor_registry import SENSOR_TYPE_SPECS, get_sensor_spec
+
+
+class TestSensorRegistry:
+    """센서 타입 레지스트리 테스트 클래스"""
+
+    def test_lookup_by_router_prefix(self):
+        """라우터 prefix와 같은 이름으로 조회"""
+        # Given / When
+        spec = get_sensor_spec("mq5")
+
+        # Then
+        assert spec is not None
+        assert spec.model is SensorRawMQ5
+        assert spec.table_name == "sensor_raw_mq5"
+
+    def test_lookup_ignores_case_and_separators(self):
+        """디바이스 컨트롤러 표기(EdgePIR)와 prefix 표기(edge-pir)가 같은 타입으로 조회"""
+        # Given / When / Then
+        assert get_sensor_spec("EdgePIR").model is SensorEdgePIR
+        assert get_sensor_spec("edge_pir").model is SensorEdgePIR
+        assert get_sensor_spec("edge-pir").model is SensorEdgePIR
+
+    def test_lookup_by_alias(self):
+        """별칭으로 조회"""
+        # Given / When / Then
+        assert get_sensor_spec("lm35").model is SensorRawTemperature
+
+    def test_unknown_type_returns_none(self):
+        """미등록 타입은 None"""
+        # Given / When / Then
+        assert get_sensor_spec("unknown") is None
+        assert get_sensor_spec("") is None
+
+    def test_every_table_registered_once(self):
+        """한 테이블은 하나의 센서 타입에만 매핑"""
+        # Given
+        tables = [spec.table_name for spec in SENSOR_TYPE_SPECS]
+
+        # Then
+        assert len(tables) == len(set(tables))
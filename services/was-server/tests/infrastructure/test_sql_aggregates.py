@@ -0,0 +1,53 @@
+"""
+SQL 집계 헬퍼 테스트
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import and_, select
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.models import SensorRawUltrasonic
+from app.infrastructure.sql_aggregates import (
+    count_if,
+    payload_bool,
+    payload_number,
+    range_conditions,
+    summary,
+    summary_columns,
+)
+
+
+class TestSqlAggregates:
+    """SQL 집계 헬퍼 테스트 클래스"""
+
+    def compile(self, query) -> str:
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_summary_query_is_single_aggregate_row(self):
+        """요약 통계가 집계 한 번으로 컴파일됨"""
+        # Given: raw_payload 숫자/불리언 필드
+        distance = payload_number(SensorRawUltrasonic, "distance_cm")
+        valid = payload_bool(SensorRawUltrasonic, "measurement_valid")
+
+        # When: 요약 쿼리 생성
+        sql = self.compile(
+            select(*summary_columns(distance, "distance", median=True), count_if(valid).label("valid_count"))
+            .where(and_(*range_conditions(SensorRawUltrasonic, "us-01")))
+        )
+
+        # Then: 행 목록 대신 집계식만 조회
+        assert "jsonb_typeof" in sql
+        assert "percentile_cont" in sql and "WITHIN GROUP" in sql
+        assert "count(*) FILTER (WHERE" in sql
+        assert "sensor_raw_ultrasonic.time" not in sql.split("FROM")[0]
+
+    def test_summary_converts_row(self):
+        """집계 행을 min/max/avg 딕셔너리로 변환"""
+        # Given: Decimal 평균이 포함된 집계 행
+        row = SimpleNamespace(value_count=2, value_min=1, value_max=3, value_avg=Decimal("2.5"))
+
+        # When / Then: 값이 있으면 변환, 없으면 empty
+        assert summary(row, "value", with_count=True) == {"count": 2, "min": 1, "max": 3, "avg": 2.5}
+        assert summary(SimpleNamespace(value_count=0), "value", empty={}) == {}
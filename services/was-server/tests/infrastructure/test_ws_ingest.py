@@ -0,0 +1,105 @@
+"""
+WebSocket 수집 디바이스 권한 테스트
+"""
+
+import asyncio
+
+import msgpack
+from fastapi import HTTPException
+
+import app.api.v1.schemas  # noqa: F401  (레지스트리 임포트 전 스키마 로드)
+from app.api.v1 import ws_ingest
+from app.api.v1.schemas import BatchCreateResponse
+from app.api.v1.ws_ingest import _IngestSession, foreign_devices
+from app.infrastructure.device_registry import DeviceRegistryCache
+
+
+class FakeWebSocket:
+    """전송한 메시지를 기록하는 WebSocket"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+
+class FakeSession:
+    """적재 서비스에 넘기기만 하는 DB 세션"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeIngestService:
+    """JSON 프레임은 모두 생성, 압축 문서는 요청 단위 오류로 거부"""
+
+    async def ingest(self, frames, on_conflict):
+        return BatchCreateResponse(total=len(frames), created=len(frames), failed=0, results=[])
+
+    async def ingest_compact(self, body, content_type, on_conflict):
+        raise HTTPException(status_code=400, detail="압축 문서를 적재할 수 없습니다")
+
+
+def session_with_fakes(monkeypatch) -> _IngestSession:
+    """가짜 WebSocket/세션/서비스를 쓰는 수집 세션 (권한·속도 제한 통과)"""
+    async def no_foreign(subject, device_ids):
+        return []
+
+    monkeypatch.setattr(ws_ingest, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(ws_ingest.container, "get_ingest_service", lambda db: FakeIngestService())
+    monkeypatch.setattr(ws_ingest, "foreign_devices", no_foreign)
+    monkeypatch.setattr(ws_ingest.ingest_rate_limiter, "enabled", False)
+    return _IngestSession(FakeWebSocket(), "user-1", "nothing")
+
+
+class TestWsIngestOwnership:
+    """WebSocket 수집 디바이스 권한 테스트 클래스"""
+
+    def test_only_subject_device_or_owned_devices_are_allowed(self, monkeypatch):
+        """토큰 주체 자신과 주체 사용자에게 할당된 디바이스만 허용"""
+        # Given: user-1에게 할당된 디바이스와 다른 사용자의 디바이스
+        registry = DeviceRegistryCache(session_factory=None, refresh_interval_sec=0)
+        registry.loaded = True
+        registry.put("user-1_MQ5_Gas_Sensor_1", "user-1", "Kitchen - MQ5 가스센서")
+        registry.put("user-2_MQ5_Gas_Sensor_1", "user-2", "Kitchen - MQ5 가스센서")
+        monkeypatch.setattr("app.api.v1.ws_ingest.device_registry", registry)
+        monkeypatch.setattr(registry, "resolve_missing", lambda device_ids: asyncio.sleep(0))
+
+        # When
+        owned = asyncio.run(foreign_devices("user-1", ["user-1_MQ5_Gas_Sensor_1", None]))
+        device_token = asyncio.run(foreign_devices("user-2_MQ5_Gas_Sensor_1", ["user-2_MQ5_Gas_Sensor_1"]))
+        other = asyncio.run(foreign_devices("user-1", ["user-2_MQ5_Gas_Sensor_1", "unknown"]))
+
+        # Then
+        assert owned == []
+        assert device_token == []
+        assert other == ["unknown", "user-2_MQ5_Gas_Sensor_1"]
+
+
+class TestWsIngestAck:
+    """WebSocket 수집 ack 누적 위치(through) 테스트 클래스"""
+
+    def test_through_counts_flushed_rejected_and_skips_unparsed_messages(self, monkeypatch):
+        """적재된 프레임과 요청 단위로 거부된 문서의 프레임은 through에 포함, 해석 불가 메시지는 제외"""
+        # Given
+        session = session_with_fakes(monkeypatch)
+        frames = '[{"sensor_type": "mq5", "device_id": "d1"}, {"sensor_type": "mq5", "device_id": "d1"}]'
+        document = msgpack.packb({"d": ["d1"], "f": [[0x01, 1, 0, 1.0], [0x01, 2, 0, 2.0], [0x01, 3, 0, 3.0]]})
+
+        async def scenario():
+            await session.handle_text(frames)
+            await session.flush()
+            await session.handle_bytes(document)
+            await session.handle_text("not json")
+
+        # When
+        asyncio.run(scenario())
+
+        # Then
+        sent = session.websocket.sent
+        assert [(message["type"], message["through"]) for message in sent] == [("ack", 2), ("error", 5), ("error", 5)]
+        assert sent[0]["created"] == 2
@@ -271,5 +271,60 @@ class TestUsersAPIErrorHandling(TestUsersAPI):
         assert response2.status_code in [201, 400, 409, 500]
 
 
+class TestUsersPagination:
+    """사용자 목록 DB 측 페이지네이션 테스트 클래스"""
+
+    @pytest.fixture
+    def repository(self):
+        """메모리 리포지토리로 사용자 25명 준비"""
+        import asyncio
+        from app.api.v1.users import get_user_repository
+        from app.domain.entities.user import User
+        from app.infrastructure.repositories.memory_user_repository import MemoryUserRepository
+
+        repository = MemoryUserRepository()
+        for index in range(25):
+            role = "admin" if index % 5 == 0 else "family"
+            asyncio.run(repository.create(User(user_name=f"사용자{index}", user_role=role)))
+        app.dependency_overrides[get_user_repository] = lambda: repository
+        yield repository
+        app.dependency_overrides.pop(get_user_repository, None)
+
+    def test_page_and_count(self, repository):
+        """페이지는 크기만큼, 전체 개수는 필터 기준"""
+        client = TestClient(app)
+
+        # When: 3페이지(10개 단위) 조회
+        data = client.get("/api/users/list", params={"page": 3, "size": 10}).json()
+
+        # Then: 남은 5명과 전체 25명
+        assert len(data["users"]) == 5
+        assert data["total"] == 25
+        assert data["next_after"] is None
+
+        # 역할 필터도 개수에 반영 (작은 테이블은 추정을 요청해도 정확한 값)
+        data = client.get("/api/users/list", params={"role": "admin", "count": "estimated"}).json()
+        assert data["total"] == 5
+        assert data["total_estimated"] is False
+
+        # 알 수 없는 역할 값은 리포지토리에 도달하기 전에 거부
+        response = client.get("/api/users/list", params={"role": "admin' OR '1'='1", "count": "estimated"})
+        assert response.status_code == 422
+
+    def test_keyset_after(self, repository):
+        """next_after로 이어 읽으면 page 순회와 같은 결과"""
+        client = TestClient(app)
+
+        # Given: 첫 페이지
+        first = client.get("/api/users/list", params={"size": 10}).json()
+
+        # When: next_after로 다음 페이지 조회
+        second = client.get("/api/users/list", params={"size": 10, "after": first["next_after"]}).json()
+
+        # Then: page=2와 동일
+        by_page = client.get("/api/users/list", params={"size": 10, "page": 2}).json()
+        assert [u["user_id"] for u in second["users"]] == [u["user_id"] for u in by_page["users"]]
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"]) 
\ No newline at end of file
+    pytest.main([__file__, "-v"]) 
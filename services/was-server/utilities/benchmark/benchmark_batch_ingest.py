@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+배치 수집 벤치마크 스크립트
+
+단건 `/create` 반복 호출과 `/create-batch` 호출의 초당 적재 행 수를 비교합니다.
+실행 중인 WAS 서버가 필요합니다.
+
+사용 예:
+    python utilities/benchmark/benchmark_batch_ingest.py --sensor mq5 --rows 2000 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+
+def build_rows(device_id: str, rows: int, start: datetime) -> List[Dict[str, Any]]:
+    """벤치마크용 센서 데이터 생성 (시간 키가 겹치지 않도록 1ms 간격)"""
+    return [
+        {
+            "time": (start + timedelta(milliseconds=i)).isoformat(),
+            "device_id": device_id,
+            "raw_payload": {"seq": i, "analog_value": 500 + (i % 100)}
+        }
+        for i in range(rows)
+    ]
+
+
+async def run_single(client: httpx.AsyncClient, url: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """단건 `/create` 반복 호출"""
+    ok = 0
+    started = time.perf_counter()
+    for row in rows:
+        response = await client.post(f"{url}/create", json=row)
+        if response.status_code == 200:
+            ok += 1
+    elapsed = time.perf_counter() - started
+    return {"mode": "single", "rows": len(rows), "ok": ok, "elapsed_s": elapsed}
+
+
+async def run_batch(
+    client: httpx.AsyncClient, url: str, rows: List[Dict[str, Any]], batch_size: int
+) -> Dict[str, Any]:
+    """`/create-batch` 호출"""
+    ok = 0
+    started = time.perf_counter()
+    for start in range(0, len(rows), batch_size):
+        response = await client.post(f"{url}/create-batch", json=rows[start:start + batch_size])
+        if response.status_code == 200:
+            ok += response.json().get("created", 0)
+    elapsed = time.perf_counter() - started
+    return {"mode": f"batch({batch_size})", "rows": len(rows), "ok": ok, "elapsed_s": elapsed}
+
+
+def print_result(result: Dict[str, Any]):
+    """결과 출력"""
+    rate = result["ok"] / result["elapsed_s"] if result["elapsed_s"] > 0 else 0.0
+    print(
+        f"{result['mode']:>14} | rows={result['rows']:>6} | ok={result['ok']:>6} | "
+        f"{result['elapsed_s']:8.2f}s | {rate:10.1f} rows/s"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="단건/배치 적재 처리량 비교")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--sensor", default="mq5", help="라우터 경로 (예: mq5, cds, edge-pir)")
+    parser.add_argument("--device-id", default="benchmark_device_1")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    url = f"{args.base_url}/api/{args.sensor}"
+    # 두 실행의 시간 키가 겹치지 않도록 시작 시각을 분리
+    base = datetime.now(timezone.utc)
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        single = await run_single(client, url, build_rows(args.device_id, args.rows, base))
+        batch = await run_batch(
+            client, url, build_rows(args.device_id, args.rows, base + timedelta(hours=1)), args.batch_size
+        )
+
+    print(f"📊 {url} 적재 벤치마크")
+    print_result(single)
+    print_result(batch)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
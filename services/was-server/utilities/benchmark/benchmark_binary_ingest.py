@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+압축(msgpack/CBOR) 수집 벤치마크 스크립트
+
+같은 측정값을 JSON 프레임과 압축 프레임으로 인코딩해 다음을 비교합니다.
+- 본문 크기 (bytes/reading)
+- 서버 측 디코딩 CPU 시간 (us/reading): JSON은 json 파싱 + Pydantic 검증,
+  압축 형식은 역직렬화 + INSERT 행 변환 (DB 적재 제외, 서버 없이 측정)
+- --base-url 지정 시 실행 중인 서버의 `/api/ingest` 왕복 시간
+
+사용 예:
+    python utilities/benchmark/benchmark_binary_ingest.py --readings 1000
+    python utilities/benchmark/benchmark_binary_ingest.py --readings 1000 --base-url http://localhost:8000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+import msgpack
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import app.main  # noqa: F401  (라우터/스키마 순환 import 초기화)
+from app.api.v1.schemas import IngestRequest
+from app.infrastructure.compact_codec import decode_frames, unpack_body
+from app.infrastructure.sensor_registry import get_sensor_spec
+
+DEVICE_ID = "10fa45f2-f375-41c9-a62a-093efcd01bd3_MQ5_Gas_Sensor_1"
+
+
+def build_payloads(readings: int) -> Dict[str, bytes]:
+    """같은 측정값을 JSON / msgpack / CBOR로 인코딩"""
+    start = datetime.now(timezone.utc).replace(microsecond=0)
+    json_frames: List[Dict[str, Any]] = []
+    compact_frames: List[List[Any]] = []
+
+    for i in range(readings):
+        ts = start + timedelta(milliseconds=i)
+        gas_level = 100.0 + (i % 50) * 0.5
+        json_frames.append({
+            "sensor_type": "mq5",
+            "time": ts.isoformat(),
+            "device_id": DEVICE_ID,
+            "raw_payload": {"gas_level": gas_level}
+        })
+        compact_frames.append([0x01, int(ts.timestamp() * 1000), 0, gas_level])
+
+    compact = {"d": [DEVICE_ID], "f": compact_frames}
+    payloads = {
+        "application/json": json.dumps({"frames": json_frames}).encode(),
+        "application/msgpack": msgpack.packb(compact),
+    }
+    try:
+        import cbor2
+        payloads["application/cbor"] = cbor2.dumps(compact)
+    except ImportError:
+        pass
+    return payloads
+
+
+def decode_json(body: bytes) -> int:
+    """JSON 경로: 파싱 + 프레임별 Pydantic 검증"""
+    request = IngestRequest.parse_raw(body)
+    rows = 0
+    for frame in request.frames:
+        spec = get_sensor_spec(frame["sensor_type"])
+        spec.create_schema.parse_obj({k: v for k, v in frame.items() if k != "sensor_type"}).dict()
+        rows += 1
+    return rows
+
+
+def decode_compact(body: bytes, content_type: str) -> int:
+    """압축 경로: 역직렬화 + INSERT 행 변환"""
+    groups, _ = decode_frames(unpack_body(body, content_type))
+    return sum(len(rows) for _, _, rows in groups.values())
+
+
+def measure_cpu(payloads: Dict[str, bytes], readings: int, rounds: int) -> Dict[str, float]:
+    """형식별 디코딩 CPU 시간 (us/reading)"""
+    results = {}
+    for content_type, body in payloads.items():
+        started = time.process_time()
+        for _ in range(rounds):
+            if content_type == "application/json":
+                decode_json(body)
+            else:
+                decode_compact(body, content_type)
+        results[content_type] = (time.process_time() - started) / (rounds * readings) * 1_000_000
+    return results
+
+
+def measure_server(base_url: str, payloads: Dict[str, bytes]) -> Dict[str, float]:
+    """서버 `/api/ingest` 왕복 시간 (ms)"""
+    results = {}
+    with httpx.Client(base_url=base_url, timeout=60.0) as client:
+        for content_type, body in payloads.items():
+            started = time.perf_counter()
+            response = client.post("/api/ingest", content=body, headers={"content-type": content_type})
+            results[content_type] = (time.perf_counter() - started) * 1000
+            print(f"   {content_type}: HTTP {response.status_code}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON / msgpack / CBOR 수집 비교")
+    parser.add_argument("--readings", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--base-url", default=None, help="지정 시 서버 왕복 시간도 측정")
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.readings)
+    cpu = measure_cpu(payloads, args.readings, args.rounds)
+    baseline_size = len(payloads["application/json"])
+    baseline_cpu = cpu["application/json"]
+
+    print(f"📊 수집 형식 비교 ({args.readings} readings, {args.rounds} rounds)")
+    print(f"{'content-type':>20} | {'bytes':>9} | {'B/reading':>9} | {'size x':>6} | {'us/reading':>10} | {'cpu x':>6}")
+    for content_type, body in payloads.items():
+        print(
+            f"{content_type:>20} | {len(body):>9} | {len(body) / args.readings:>9.1f} | "
+            f"{baseline_size / len(body):>6.1f} | {cpu[content_type]:>10.2f} | {baseline_cpu / cpu[content_type]:>6.1f}"
+        )
+
+    if args.base_url:
+        print(f"\n🌐 {args.base_url}/api/ingest 왕복 시간")
+        for content_type, elapsed in measure_server(args.base_url, payloads).items():
+            print(f"{content_type:>20} | {elapsed:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+동시성 벤치마크 스크립트
+
+동시 클라이언트 수(기본 1, 16, 128)별로 일정 시간 동안 요청을 보내
+초당 처리 요청 수(requests/sec)와 지연 분포를 측정합니다.
+실행 중인 WAS 서버가 필요하며, 변경 전/후 커밋에서 각각 실행해 결과를 비교합니다.
+
+사용 예:
+    python utilities/benchmark/benchmark_concurrency.py --path "/api/mq5/list?limit_count=20"
+    python utilities/benchmark/benchmark_concurrency.py --mode write --sensor mq5 --levels 1,16,128
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+
+class ConcurrencyBenchmark:
+    """동시성 벤치마크"""
+
+    def __init__(self, base_url: str, mode: str, path: str, sensor: str, device_id: str):
+        self.base_url = base_url
+        self.mode = mode
+        self.path = path
+        self.sensor = sensor
+        self.device_id = device_id
+        # 쓰기 모드에서 (time, device_id) 키가 겹치지 않도록 전역 시퀀스 사용
+        self._sequence = itertools.count()
+        self._base_time = datetime.now(timezone.utc)
+
+    async def _request(self, client: httpx.AsyncClient) -> int:
+        """요청 1건 전송"""
+        if self.mode == "write":
+            seq = next(self._sequence)
+            payload = {
+                "time": (self._base_time + timedelta(microseconds=seq)).isoformat(),
+                "device_id": self.device_id,
+                "raw_payload": {"seq": seq}
+            }
+            response = await client.post(f"/api/{self.sensor}/create", json=payload)
+        else:
+            response = await client.get(self.path)
+        return response.status_code
+
+    async def _worker(self, client: httpx.AsyncClient, deadline: float, latencies: List[float], errors: List[int]):
+        """마감 시각까지 요청을 반복하는 클라이언트"""
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await self._request(client)
+            except httpx.HTTPError:
+                status = 0
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status >= 400 or status == 0:
+                errors.append(status)
+
+    async def run_level(self, clients: int, duration: float) -> Dict[str, Any]:
+        """동시 클라이언트 수 하나에 대한 측정"""
+        latencies: List[float] = []
+        errors: List[int] = []
+        limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=30.0, limits=limits) as client:
+            started = time.perf_counter()
+            deadline = started + duration
+            await asyncio.gather(*[
+                self._worker(client, deadline, latencies, errors) for _ in range(clients)
+            ])
+            elapsed = time.perf_counter() - started
+
+        ordered = sorted(latencies) or [0.0]
+        return {
+            "clients": clients,
+            "requests": len(latencies),
+            "errors": len(errors),
+            "rps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": statistics.median(ordered),
+            "p95_ms": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="동시 클라이언트 수별 처리량 측정")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--mode", choices=["read", "write"], default="read")
+    parser.add_argument("--path", default="/api/mq5/list?limit_count=20", help="read 모드에서 호출할 경로")
+    parser.add_argument("--sensor", default="mq5", help="write 모드에서 사용할 라우터 경로")
+    parser.add_argument("--device-id", default="benchmark_device_1")
+    parser.add_argument("--levels", default="1,16,128", help="쉼표로 구분한 동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초)")
+    args = parser.parse_args()
+
+    benchmark = ConcurrencyBenchmark(args.base_url, args.mode, args.path, args.sensor, args.device_id)
+    target = args.path if args.mode == "read" else f"/api/{args.sensor}/create"
+
+    print(f"📊 동시성 벤치마크: {args.mode} {target} ({args.duration}s/단계)")
+    print(f"{'clients':>8} | {'requests':>8} | {'errors':>6} | {'req/s':>9} | {'p50 ms':>8} | {'p95 ms':>8}")
+    for clients in [int(level) for level in args.levels.split(",")]:
+        result = await benchmark.run_level(clients, args.duration)
+        print(
+            f"{result['clients']:>8} | {result['requests']:>8} | {result['errors']:>6} | "
+            f"{result['rps']:>9.1f} | {result['p50_ms']:>8.1f} | {result['p95_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
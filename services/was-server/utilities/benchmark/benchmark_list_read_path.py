@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+원시 센서 목록 조회 경로 벤치마크 스크립트
+
+기존 ORM 경로(ORM 인스턴스 -> from_orm -> response_model 직렬화)와
+Core 행 경로(딕셔너리 행 -> RowListResponse 한 번에 직렬화)의 목록 1회 처리 시간을 비교합니다.
+
+- 기본: DB 없이 합성 행으로 행 변환 + JSON 직렬화 비용만 측정합니다.
+- `--db`: .env의 PostgreSQL에서 실제 조회까지 포함하여 측정합니다 (테이블에 데이터가 있어야 함).
+
+사용 예:
+    python utilities/benchmark/benchmark_list_read_path.py --rows 1000 --repeat 50
+    python utilities/benchmark/benchmark_list_read_path.py --db --sensor mq5 --rows 1000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+import app.api.v1.schemas as schemas  # noqa: E402
+from app.infrastructure import models  # noqa: E402
+from app.infrastructure.pagination import apply_keyset  # noqa: E402
+from app.infrastructure.row_reader import RowListResponse, fetch_list_rows, row_builder  # noqa: E402
+
+# 센서 -> (ORM 모델, 응답 스키마)
+SENSORS = {
+    "loadcell": (models.SensorRawLoadCell, schemas.SensorRawLoadCellResponse),
+    "mq5": (models.SensorRawMQ5, schemas.SensorRawMQ5Response),
+    "mq7": (models.SensorRawMQ7, schemas.SensorRawMQ7Response),
+    "rfid": (models.SensorRawRFID, schemas.SensorRawRFIDResponse),
+    "sound": (models.SensorRawSound, schemas.SensorRawSoundResponse),
+    "tcrt5000": (models.SensorRawTCRT5000, schemas.SensorRawTCRT5000Response),
+    "ultrasonic": (models.SensorRawUltrasonic, schemas.SensorRawUltrasonicResponse),
+}
+
+
+def build_rows(model, rows: int) -> List[Dict[str, Any]]:
+    """합성 행 생성 (시간 역순, 테이블 컬럼만)"""
+    start = datetime.now(timezone.utc)
+    columns = model.__table__.columns.keys()
+    result = []
+    for i in range(rows):
+        row = {name: None for name in columns}
+        row.update({
+            "time": start - timedelta(milliseconds=i),
+            "device_id": f"bench_{i % 4:03d}",
+            "raw_payload": {"seq": i, "gas_level": 100 + i % 50, "co_level": 20 + i % 10, "card_id": f"card-{i % 8}", "analog_value": i % 1024}
+        })
+        result.append(row)
+    return result
+
+
+def orm_path(model, response_model, rows: List[Dict[str, Any]]) -> bytes:
+    """기존 경로: ORM 인스턴스 -> from_orm -> response_model 검증 -> JSON"""
+    items = [response_model.from_orm(model(**row)) for row in rows]
+    validated = [response_model.validate(item) for item in items]
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def core_path(model, response_model, rows: List[Dict[str, Any]]) -> bytes:
+    """Core 행 경로: 응답 필드 딕셔너리 -> RowListResponse"""
+    build = row_builder(model, response_model)
+    return RowListResponse([build(row) for row in rows]).body
+
+
+def measure(repeat: int, run: Callable[[], Any]) -> Dict[str, float]:
+    """repeat회 실행한 소요 시간(ms)의 중앙값/p95"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"p50_ms": statistics.median(samples), "p95_ms": samples[int(len(samples) * 0.95) - 1]}
+
+
+async def measure_db(repeat: int, run) -> Dict[str, float]:
+    """비동기 조회를 repeat회 실행한 소요 시간(ms)의 중앙값/p95"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {"p50_ms": statistics.median(samples), "p95_ms": samples[int(len(samples) * 0.95) - 1]}
+
+
+async def db_benchmark(model, response_model, rows: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    """DB 조회까지 포함한 비교"""
+    from app.infrastructure.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        async def orm_run():
+            query = apply_keyset(select(model), model.time, model.device_id, None).limit(rows)
+            result = await db.execute(query)
+            items = [response_model.from_orm(item) for item in result.scalars().all()]
+            return JSONResponse(jsonable_encoder([response_model.validate(item) for item in items])).body
+
+        async def core_run():
+            items = await fetch_list_rows(db, model, response_model, limit=rows)
+            return RowListResponse(items).body
+
+        fetched = len(await fetch_list_rows(db, model, response_model, limit=rows))
+        print(f"조회 행 수: {fetched}")
+        return {"orm": await measure_db(repeat, orm_run), "core": await measure_db(repeat, core_run)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원시 센서 목록 조회 경로 비교")
+    parser.add_argument("--sensor", choices=sorted(SENSORS), default="mq5", help="센서 종류")
+    parser.add_argument("--rows", type=int, default=1000, help="목록 1회 행 수 (limit)")
+    parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    parser.add_argument("--db", action="store_true", help="PostgreSQL 조회까지 포함하여 측정")
+    args = parser.parse_args()
+
+    model, response_model = SENSORS[args.sensor]
+    if args.db:
+        results = asyncio.run(db_benchmark(model, response_model, args.rows, args.repeat))
+    else:
+        rows = build_rows(model, args.rows)
+        assert orm_path(model, response_model, rows) == core_path(model, response_model, rows), "응답 본문이 다릅니다"
+        results = {
+            "orm": measure(args.repeat, lambda: orm_path(model, response_model, rows)),
+            "core": measure(args.repeat, lambda: core_path(model, response_model, rows)),
+        }
+
+    print(f"📊 {args.sensor} 목록 조회 ({args.rows}행, {args.repeat}회, {'DB 포함' if args.db else '합성 행'})")
+    print(f"{'path':>6} | {'p50 ms':>9} | {'p95 ms':>9}")
+    for path, result in results.items():
+        print(f"{path:>6} | {result['p50_ms']:>9.2f} | {result['p95_ms']:>9.2f}")
+    print(f"speedup(p50): {results['orm']['p50_ms'] / results['core']['p50_ms']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Redis 클라이언트 마이크로 벤치마크 스크립트
+
+기존 동기 RedisClient(명령마다 PING)와 비동기 AsyncRedisClient(공유 연결 풀)의
+GET/SET 초당 처리 수(ops/sec)를 측정합니다. 비동기 클라이언트는 동시 실행과 mget/mset 묶음 명령도 함께 측정합니다.
+실행 중인 Redis가 필요하며(.env의 REDIS_HOST/REDIS_PORT/REDIS_DB), `bench:redis:` 접두사 키를 쓰고 마지막에 지웁니다.
+
+사용 예:
+    python utilities/benchmark/benchmark_redis_client.py
+    python utilities/benchmark/benchmark_redis_client.py --ops 20000 --concurrency 64 --batch 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from app.infrastructure.async_redis_client import AsyncRedisClient  # noqa: E402
+
+KEY_PREFIX = "bench:redis:"
+
+
+def sync_benchmark(ops: int) -> Dict[str, float]:
+    """기존 동기 클라이언트 (명령마다 is_connected() PING)"""
+    from app.infrastructure.redis_client import RedisClient
+
+    client = RedisClient()
+    results = {}
+
+    started = time.perf_counter()
+    for index in range(ops):
+        client.set(f"{KEY_PREFIX}{index}", "x")
+    results["set"] = ops / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for index in range(ops):
+        client.get(f"{KEY_PREFIX}{index}")
+    results["get"] = ops / (time.perf_counter() - started)
+
+    client.close()
+    return results
+
+
+async def measure(ops: int, concurrency: int, operation: Callable[[int], Awaitable]) -> float:
+    """ops개의 작업을 concurrency개 작업자로 나누어 실행하고 ops/sec 반환"""
+    counter = iter(range(ops))
+
+    async def worker():
+        for index in counter:
+            await operation(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return ops / (time.perf_counter() - started)
+
+
+async def async_benchmark(ops: int, concurrency: int, batch: int) -> Dict[str, float]:
+    """비동기 클라이언트 (공유 연결 풀, 묶음 명령)"""
+    client = AsyncRedisClient(max_connections=max(concurrency, 1))
+    results = {}
+
+    results["set"] = await measure(ops, 1, lambda index: client.set(f"{KEY_PREFIX}{index}", "x"))
+    results["get"] = await measure(ops, 1, lambda index: client.get(f"{KEY_PREFIX}{index}"))
+    results[f"set x{concurrency}"] = await measure(ops, concurrency, lambda index: client.set(f"{KEY_PREFIX}{index}", "x"))
+    results[f"get x{concurrency}"] = await measure(ops, concurrency, lambda index: client.get(f"{KEY_PREFIX}{index}"))
+
+    batches = [list(range(start, min(start + batch, ops))) for start in range(0, ops, batch)]
+    started = time.perf_counter()
+    for indexes in batches:
+        await client.mset({f"{KEY_PREFIX}{index}": "x" for index in indexes})
+    results[f"mset /{batch}"] = ops / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for indexes in batches:
+        await client.mget([f"{KEY_PREFIX}{index}" for index in indexes])
+    results[f"mget /{batch}"] = ops / (time.perf_counter() - started)
+
+    keys: List[str] = [f"{KEY_PREFIX}{index}" for index in range(ops)]
+    for start in range(0, len(keys), 1000):
+        await client.delete(*keys[start:start + 1000])
+    await client.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis 클라이언트 ops/sec 비교")
+    parser.add_argument("--ops", type=int, default=10000, help="측정 항목별 명령 수")
+    parser.add_argument("--concurrency", type=int, default=32, help="비동기 동시 실행 작업자 수")
+    parser.add_argument("--batch", type=int, default=100, help="mget/mset 한 번에 묶을 키 수")
+    parser.add_argument("--skip-sync", action="store_true", help="기존 동기 클라이언트 측정 생략")
+    args = parser.parse_args()
+
+    print(f"📊 Redis 클라이언트 벤치마크 ({args.ops} ops/항목)")
+    print(f"{'client':>12} | {'operation':>12} | {'ops/sec':>10}")
+    if not args.skip_sync:
+        for operation, rate in sync_benchmark(args.ops).items():
+            print(f"{'sync':>12} | {operation:>12} | {rate:>10.0f}")
+    for operation, rate in asyncio.run(async_benchmark(args.ops, args.concurrency, args.batch)).items():
+        print(f"{'async pool':>12} | {operation:>12} | {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()